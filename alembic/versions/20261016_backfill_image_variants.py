@@ -0,0 +1,52 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""backfill_game_image_variants
+
+Revision ID: 20261016_backfill_image_variants
+Revises: 20261016_game_participant_counts
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from shared.utils.image_variant_backfill import backfill_image_variants
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_backfill_image_variants"
+down_revision: str | None = "20261016_game_participant_counts"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Render thumbnail/banner variants for images stored before variants existed.
+
+    20261016_game_image_variants only created the table, so older images had
+    no variants and ?size= requests for them were served the full original.
+    """
+    backfill_image_variants(op.get_bind())
+
+
+def downgrade() -> None:
+    """No-op: backfilled variants are indistinguishable from uploaded ones."""
@@ -0,0 +1,59 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""add_game_image_variants
+
+Revision ID: 20261016_game_image_variants
+Revises: 20261016_game_session_version
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_game_image_variants"
+down_revision: str | None = "20261016_game_session_version"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create game_image_variants for the pre-rendered display sizes of each image."""
+    op.create_table(
+        "game_image_variants",
+        sa.Column("image_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("variant", sa.String(length=20), nullable=False),
+        sa.Column("image_data", sa.LargeBinary(), nullable=False),
+        sa.Column("mime_type", sa.String(length=50), nullable=False),
+        sa.ForeignKeyConstraint(["image_id"], ["game_images.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("image_id", "variant"),
+    )
+
+
+def downgrade() -> None:
+    """Drop game_image_variants."""
+    op.drop_table("game_image_variants")
@@ -0,0 +1,78 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""add_game_list_indexes
+
+Revision ID: 20261016_game_list_indexes
+Revises: 20261016_reminder_deliveries
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_game_list_indexes"
+down_revision: str | None = "20261016_reminder_deliveries"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must stay identical to _LIST_SORT_RANK / _LIST_SORT_AT in
+# services/api/services/games.py or the planner will not match the index.
+_LIST_SORT_RANK_SQL = (
+    "CASE WHEN (status = 'SCHEDULED') THEN 0 "
+    "WHEN (status = 'IN_PROGRESS') THEN 1 "
+    "WHEN (status = 'COMPLETED') THEN 2 "
+    "WHEN (status = 'CANCELLED') THEN 3 "
+    "WHEN (status = 'ARCHIVED') THEN 4 "
+    "ELSE 99 END"
+)
+_LIST_SORT_AT_SQL = (
+    "CASE WHEN (status IN ('COMPLETED', 'CANCELLED', 'ARCHIVED')) "
+    "THEN -EXTRACT(epoch FROM scheduled_at) "
+    "ELSE EXTRACT(epoch FROM scheduled_at) END"
+)
+
+
+def upgrade() -> None:
+    """Add indexes backing list_games filtering, ordering and keyset paging."""
+    op.create_index(
+        "ix_game_sessions_guild_status_scheduled",
+        "game_sessions",
+        ["guild_id", "status", "scheduled_at"],
+    )
+    op.execute(
+        "CREATE INDEX ix_game_sessions_list_order ON game_sessions "
+        f"(guild_id, ({_LIST_SORT_RANK_SQL}), ({_LIST_SORT_AT_SQL}), id)"
+    )
+    op.create_index(
+        "ix_game_participants_user_game",
+        "game_participants",
+        ["user_id", "game_session_id"],
+    )
+
+
+def downgrade() -> None:
+    """Remove list_games indexes."""
+    op.drop_index("ix_game_participants_user_game", table_name="game_participants")
+    op.drop_index("ix_game_sessions_list_order", table_name="game_sessions")
+    op.drop_index("ix_game_sessions_guild_status_scheduled", table_name="game_sessions")
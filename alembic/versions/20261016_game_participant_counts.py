@@ -0,0 +1,164 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""add_game_participant_counts
+
+Revision ID: 20261016_game_participant_counts
+Revises: 20261016_game_image_variants
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_game_participant_counts"
+down_revision: str | None = "20261016_game_image_variants"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Mirrors partition_participants() in shared/utils/participant_sorting.py:
+# placeholders count, max_players falls back to DEFAULT_MAX_PLAYERS (10), and
+# HOST_SELECTED_WITH_WAITLIST only confirms HOST_ADDED (8000) participants.
+# VOLATILE so each call counts with a fresh snapshot after the game row lock.
+_COUNTS_FUNC = """
+CREATE OR REPLACE FUNCTION game_participant_counts(
+    p_game_id text,
+    p_max_players integer,
+    p_signup_method text,
+    OUT confirmed integer,
+    OUT waitlist integer
+) LANGUAGE plpgsql VOLATILE AS $$
+DECLARE
+    total integer;
+    host_added integer;
+    capacity integer := COALESCE(NULLIF(p_max_players, 0), 10);
+BEGIN
+    SELECT count(*), count(*) FILTER (WHERE position_type = 8000)
+    INTO total, host_added
+    FROM game_participants
+    WHERE game_session_id = p_game_id;
+
+    IF p_signup_method = 'HOST_SELECTED_WITH_WAITLIST' THEN
+        confirmed := LEAST(host_added, capacity);
+    ELSE
+        confirmed := LEAST(total, capacity);
+    END IF;
+    waitlist := total - confirmed;
+END;
+$$;
+"""
+
+# Locks the game row before counting so concurrent joins to one game queue
+# up here and each recount sees every previously committed participant.
+_PARTICIPANT_TRIGGER_FUNC = """
+CREATE OR REPLACE FUNCTION refresh_game_participant_counts()
+RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    affected_game_id text;
+    game_max_players integer;
+    game_signup_method text;
+    counts record;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        affected_game_id := OLD.game_session_id;
+    ELSE
+        affected_game_id := NEW.game_session_id;
+    END IF;
+
+    SELECT max_players, signup_method INTO game_max_players, game_signup_method
+    FROM game_sessions WHERE id = affected_game_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    SELECT * INTO counts
+    FROM game_participant_counts(affected_game_id, game_max_players, game_signup_method);
+    UPDATE game_sessions
+    SET confirmed_count = counts.confirmed, waitlist_count = counts.waitlist
+    WHERE id = affected_game_id;
+    RETURN NULL;
+END;
+$$;
+"""
+
+_PARTICIPANT_TRIGGER = """
+CREATE TRIGGER game_participants_refresh_counts
+AFTER INSERT OR DELETE OR UPDATE OF position_type ON game_participants
+FOR EACH ROW EXECUTE FUNCTION refresh_game_participant_counts();
+"""
+
+_CAPACITY_TRIGGER_FUNC = """
+CREATE OR REPLACE FUNCTION recount_game_participants_on_capacity_change()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    SELECT confirmed, waitlist INTO NEW.confirmed_count, NEW.waitlist_count
+    FROM game_participant_counts(NEW.id, NEW.max_players, NEW.signup_method);
+    RETURN NEW;
+END;
+$$;
+"""
+
+_CAPACITY_TRIGGER = """
+CREATE TRIGGER game_sessions_recount_participants
+BEFORE UPDATE OF max_players, signup_method ON game_sessions
+FOR EACH ROW EXECUTE FUNCTION recount_game_participants_on_capacity_change();
+"""
+
+_BACKFILL = """
+UPDATE game_sessions
+SET (confirmed_count, waitlist_count) = (
+    SELECT confirmed, waitlist FROM game_participant_counts(id, max_players, signup_method)
+)
+"""
+
+
+def upgrade() -> None:
+    """Add maintained confirmed/waitlist counters to game_sessions."""
+    op.add_column(
+        "game_sessions",
+        sa.Column("confirmed_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "game_sessions",
+        sa.Column("waitlist_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute(_COUNTS_FUNC)
+    op.execute(_BACKFILL)
+    op.execute(_PARTICIPANT_TRIGGER_FUNC)
+    op.execute(_PARTICIPANT_TRIGGER)
+    op.execute(_CAPACITY_TRIGGER_FUNC)
+    op.execute(_CAPACITY_TRIGGER)
+
+
+def downgrade() -> None:
+    """Remove the participant counters and the triggers maintaining them."""
+    op.execute("DROP TRIGGER IF EXISTS game_sessions_recount_participants ON game_sessions")
+    op.execute("DROP TRIGGER IF EXISTS game_participants_refresh_counts ON game_participants")
+    op.execute("DROP FUNCTION IF EXISTS recount_game_participants_on_capacity_change()")
+    op.execute("DROP FUNCTION IF EXISTS refresh_game_participant_counts()")
+    op.execute("DROP FUNCTION IF EXISTS game_participant_counts(text, integer, text)")
+    op.drop_column("game_sessions", "waitlist_count")
+    op.drop_column("game_sessions", "confirmed_count")
@@ -0,0 +1,65 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""add_reminder_deliveries
+
+Revision ID: 20261016_reminder_deliveries
+Revises: 20261016_bot_action_queue_lease
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_reminder_deliveries"
+down_revision: str | None = "20261016_bot_action_queue_lease"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create reminder_deliveries so reminder fan-out retries skip delivered DMs."""
+    op.create_table(
+        "reminder_deliveries",
+        sa.Column("notification_id", sa.String(length=36), nullable=False),
+        sa.Column("discord_id", sa.String(length=20), nullable=False),
+        sa.Column(
+            "delivered_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["notification_id"],
+            ["notification_schedule.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("notification_id", "discord_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop reminder_deliveries."""
+    op.drop_table("reminder_deliveries")
@@ -34,3 +34,19 @@ export async function mintCalendarExportToken(gameId: string): Promise<string> {
 export function buildCalendarExportUrl(token: string): string {
   return `/api/v1/public/calendar/${token}.ics`;
 }
+
+/**
+ * Mints a long-lived token for the caller's subscribable calendar feed,
+ * covering every game they host or joined, optionally limited to one guild.
+ */
+export async function mintCalendarFeedToken(guildId?: string): Promise<string> {
+  const response = await apiClient.post<{ token: string }>('/api/v1/export/feed/token', null, {
+    params: guildId ? { guild_id: guildId } : undefined,
+  });
+  return response.data.token;
+}
+
+/** Builds the absolute URL a calendar app subscribes to for a feed token. */
+export function buildCalendarFeedUrl(token: string): string {
+  return `${window.location.origin}/api/v1/public/calendar/feed/${token}.ics`;
+}
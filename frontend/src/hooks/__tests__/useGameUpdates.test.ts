@@ -91,7 +91,7 @@ describe('useGameUpdates', () => {
       data: JSON.stringify(eventData),
     });
 
-    expect(onUpdate).toHaveBeenCalledWith('game-456');
+    expect(onUpdate).toHaveBeenCalledWith('game-456', eventData);
   });
 
   it('does not call onUpdate when guild_id does not match', () => {
@@ -115,7 +115,7 @@ describe('useGameUpdates', () => {
 
     triggerMessage(eventData);
 
-    expect(onUpdate).toHaveBeenCalledWith('game-456');
+    expect(onUpdate).toHaveBeenCalledWith('game-456', eventData);
   });
 
   it('does not call onUpdate for non-game_updated events', () => {
@@ -19,16 +19,11 @@
 // SOFTWARE.
 
 import { useEffect, useRef, useState } from 'react';
-
-interface GameUpdateEvent {
-  type: string;
-  game_id: string;
-  guild_id: string;
-}
+import { GameUpdateEvent } from '../types';
 
 export function useGameUpdates(
   guildId: string | undefined,
-  onUpdate: (gameId: string) => void
+  onUpdate: (gameId: string, event: GameUpdateEvent) => void
 ): void {
   const onUpdateRef = useRef(onUpdate);
   const [reconnectTrigger, setReconnectTrigger] = useState(0);
@@ -62,7 +57,7 @@ export function useGameUpdates(
 
         if (data.type === 'game_updated') {
           if (!guildId || data.guild_id === guildId) {
-            onUpdateRef.current(data.game_id);
+            onUpdateRef.current(data.game_id, data);
           }
         }
       } catch (error) {
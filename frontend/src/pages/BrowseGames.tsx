@@ -33,9 +33,10 @@ import {
 } from '@mui/material';
 import { useParams } from 'react-router';
 import { apiClient } from '../api/client';
-import { GameSession, GameListResponse } from '../types';
+import { GameSession, GameListResponse, GameUpdateEvent } from '../types';
 import { GameCard } from '../components/GameCard';
 import { useGameUpdates } from '../hooks/useGameUpdates';
+import { applyGameUpdate } from '../utils/gameUpdates';
 
 const PAGE_SIZE = 25;
 
@@ -56,7 +57,16 @@ export const BrowseGames: FC = () => {
     );
   };
 
-  const handleSSEUpdate = async (gameId: string) => {
+  const handleSSEUpdate = async (gameId: string, event: GameUpdateEvent) => {
+    const current = games.find((game) => game.id === gameId);
+    if (!current) {
+      return;
+    }
+    const patched = applyGameUpdate(current, event);
+    if (patched) {
+      handleGameUpdate(patched);
+      return;
+    }
     try {
       const response = await apiClient.get<GameSession>(`/api/v1/games/${gameId}`);
       handleGameUpdate(response.data);
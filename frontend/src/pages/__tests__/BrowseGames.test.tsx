@@ -23,7 +23,7 @@ import { render, screen, waitFor } from '@testing-library/react';
 import { MemoryRouter, Route, Routes } from 'react-router';
 import { BrowseGames } from '../BrowseGames';
 import { apiClient } from '../../api/client';
-import { GameSession, ParticipantType } from '../../types';
+import { GameSession, GameUpdateEvent, ParticipantType } from '../../types';
 import { AuthContext } from '../../contexts/AuthContext';
 
 vi.mock('../../api/client', () => ({
@@ -85,7 +85,7 @@ describe('BrowseGames - SSE Integration', () => {
 
   it('fetches and updates game when SSE event received', async () => {
     const updatedGame = { ...mockGame, participant_count: 4 };
-    let sseCallback: ((gameId: string) => void) | undefined;
+    let sseCallback: ((gameId: string, event: GameUpdateEvent) => void) | undefined;
 
     vi.mocked(apiClient.get)
       .mockResolvedValueOnce({
@@ -118,23 +118,19 @@ describe('BrowseGames - SSE Integration', () => {
       params: expect.objectContaining({ guild_id: 'guild-1', status: ['SCHEDULED'] }),
     });
 
-    sseCallback!('game-1');
+    sseCallback!('game-1', { type: 'game_updated', game_id: 'game-1', guild_id: 'guild-1' });
 
     await waitFor(() => {
       expect(apiClient.get).toHaveBeenCalledWith('/api/v1/games/game-1');
     });
   });
 
-  it('handles SSE update for game not in current list gracefully', async () => {
-    let sseCallback: ((gameId: string) => void) | undefined;
+  it('ignores SSE update for game not in current list', async () => {
+    let sseCallback: ((gameId: string, event: GameUpdateEvent) => void) | undefined;
 
-    vi.mocked(apiClient.get)
-      .mockResolvedValueOnce({
-        data: { games: [mockGame], total: 1, limit: 25, offset: 0 },
-      })
-      .mockResolvedValueOnce({
-        data: { ...mockGame, id: 'game-2' },
-      });
+    vi.mocked(apiClient.get).mockResolvedValueOnce({
+      data: { games: [mockGame], total: 1, limit: 25, offset: 0 },
+    });
 
     const { useGameUpdates } = await import('../../hooks/useGameUpdates');
     vi.mocked(useGameUpdates).mockImplementation((_guildId, callback) => {
@@ -155,11 +151,51 @@ describe('BrowseGames - SSE Integration', () => {
       expect(screen.getByText('D&D Adventure')).toBeInTheDocument();
     });
 
-    sseCallback!('game-2');
+    sseCallback!('game-2', { type: 'game_updated', game_id: 'game-2', guild_id: 'guild-1' });
+
+    expect(apiClient.get).toHaveBeenCalledTimes(1);
+    expect(apiClient.get).not.toHaveBeenCalledWith('/api/v1/games/game-2');
+  });
+
+  it('applies SSE delta without refetching when version is next', async () => {
+    let sseCallback: ((gameId: string, event: GameUpdateEvent) => void) | undefined;
+
+    vi.mocked(apiClient.get).mockResolvedValueOnce({
+      data: { games: [{ ...mockGame, version: 1 }], total: 1, limit: 25, offset: 0 },
+    });
+
+    const { useGameUpdates } = await import('../../hooks/useGameUpdates');
+    vi.mocked(useGameUpdates).mockImplementation((_guildId, callback) => {
+      sseCallback = callback;
+    });
+
+    render(
+      <AuthContext.Provider value={mockAuthContext}>
+        <MemoryRouter initialEntries={['/browse/guild-1']}>
+          <Routes>
+            <Route path="/browse/:guildId" element={<BrowseGames />} />
+          </Routes>
+        </MemoryRouter>
+      </AuthContext.Provider>
+    );
 
     await waitFor(() => {
-      expect(apiClient.get).toHaveBeenCalledWith('/api/v1/games/game-2');
+      expect(screen.getByText('D&D Adventure')).toBeInTheDocument();
     });
+
+    sseCallback!('game-1', {
+      type: 'game_updated',
+      game_id: 'game-1',
+      guild_id: 'guild-1',
+      version: 2,
+      updated_at: mockGame.updated_at,
+      status: 'SCHEDULED',
+      participant_count: 4,
+      participants: [],
+      confirmed_participant_ids: [],
+    });
+
+    expect(apiClient.get).toHaveBeenCalledTimes(1);
   });
 });
 
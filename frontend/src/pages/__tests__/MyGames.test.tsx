@@ -24,7 +24,7 @@ import userEvent from '@testing-library/user-event';
 import { BrowserRouter } from 'react-router';
 import { MyGames } from '../MyGames';
 import { AuthContext } from '../../contexts/AuthContext';
-import { CurrentUser, Guild, GameListResponse } from '../../types';
+import { CurrentUser, Guild, GameListResponse, GameUpdateEvent } from '../../types';
 import { apiClient } from '../../api/client';
 
 const mockNavigate = vi.fn();
@@ -221,7 +221,7 @@ describe('MyGames - SSE Integration', () => {
   });
 
   it('updates hosted game when SSE event received', async () => {
-    let sseCallback: ((gameId: string) => void) | undefined;
+    let sseCallback: ((gameId: string, event: GameUpdateEvent) => void) | undefined;
     const updatedGame = { ...mockHostedGame, participant_count: 3 };
 
     vi.mocked(apiClient.get)
@@ -249,7 +249,7 @@ describe('MyGames - SSE Integration', () => {
       expect(screen.getByText('Hosted Game')).toBeInTheDocument();
     });
 
-    sseCallback!('game-1');
+    sseCallback!('game-1', { type: 'game_updated', game_id: 'game-1', guild_id: 'guild-1' });
 
     await waitFor(() => {
       expect(apiClient.get).toHaveBeenCalledTimes(6);
@@ -260,7 +260,7 @@ describe('MyGames - SSE Integration', () => {
   });
 
   it('updates joined game when SSE event received', async () => {
-    let sseCallback: ((gameId: string) => void) | undefined;
+    let sseCallback: ((gameId: string, event: GameUpdateEvent) => void) | undefined;
     const updatedGame = { ...mockJoinedGame, participant_count: 4 };
 
     vi.mocked(apiClient.get)
@@ -288,7 +288,7 @@ describe('MyGames - SSE Integration', () => {
       expect(screen.getByText('Joined Game')).toBeInTheDocument();
     });
 
-    sseCallback!('game-2');
+    sseCallback!('game-2', { type: 'game_updated', game_id: 'game-2', guild_id: 'guild-1' });
 
     await waitFor(() => {
       expect(apiClient.get).toHaveBeenCalledTimes(6);
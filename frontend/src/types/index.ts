@@ -126,6 +126,20 @@ export interface GameSession {
   where_display?: string | null;
   recur_rule?: string | null;
   display_status?: string;
+  version?: number;
+}
+
+export interface GameUpdateEvent {
+  type: string;
+  game_id: string;
+  guild_id: string;
+  version?: number;
+  updated_at?: string;
+  status?: GameSession['status'];
+  max_players?: number;
+  participant_count?: number;
+  participants?: Participant[];
+  confirmed_participant_ids?: string[];
 }
 
 export interface Participant {
@@ -145,6 +159,7 @@ export interface GameListResponse {
   total: number;
   limit: number;
   offset: number;
+  next_cursor?: string | null;
 }
 
 export interface AuthTokens {
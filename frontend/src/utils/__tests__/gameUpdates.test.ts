@@ -0,0 +1,89 @@
+// Copyright 2026 Bret McKee
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in all
+// copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+// SOFTWARE.
+
+import { describe, it, expect } from 'vitest';
+import { applyGameUpdate } from '../gameUpdates';
+import { GameSession, GameUpdateEvent, Participant, ParticipantType } from '../../types';
+
+const participant = (id: string): Participant => ({
+  id,
+  game_session_id: 'game-1',
+  user_id: `user-${id}`,
+  discord_id: `discord-${id}`,
+  display_name: `Player ${id}`,
+  avatar_url: null,
+  joined_at: '2026-01-01T00:00:00Z',
+  position_type: ParticipantType.SELF_ADDED,
+  position: 0,
+});
+
+const game = {
+  id: 'game-1',
+  status: 'SCHEDULED',
+  max_players: 1,
+  participant_count: 0,
+  updated_at: '2026-01-01T00:00:00Z',
+  version: 3,
+} as GameSession;
+
+const delta = (overrides: Partial<GameUpdateEvent> = {}): GameUpdateEvent => ({
+  type: 'game_updated',
+  game_id: 'game-1',
+  guild_id: 'guild-1',
+  version: 4,
+  updated_at: '2026-01-01T00:00:00Z',
+  status: 'SCHEDULED',
+  max_players: 1,
+  participant_count: 1,
+  participants: [participant('a'), participant('b')],
+  confirmed_participant_ids: ['a'],
+  ...overrides,
+});
+
+describe('applyGameUpdate', () => {
+  it('applies the next version and splits confirmed and waitlist participants', () => {
+    const patched = applyGameUpdate(game, delta());
+
+    expect(patched?.version).toBe(4);
+    expect(patched?.participant_count).toBe(1);
+    expect(patched?.confirmed_participants?.map((p) => p.id)).toEqual(['a']);
+    expect(patched?.waitlist_participants?.map((p) => p.id)).toEqual(['b']);
+  });
+
+  it('returns the game unchanged for an event that is not newer', () => {
+    expect(applyGameUpdate(game, delta({ version: 3 }))).toBe(game);
+  });
+
+  it('requests a refetch on a version gap', () => {
+    expect(applyGameUpdate(game, delta({ version: 5 }))).toBeNull();
+  });
+
+  it('requests a refetch when other game fields changed', () => {
+    expect(applyGameUpdate(game, delta({ updated_at: '2026-01-02T00:00:00Z' }))).toBeNull();
+  });
+
+  it('requests a refetch when the event has no participant data', () => {
+    expect(applyGameUpdate(game, delta({ participants: undefined }))).toBeNull();
+  });
+
+  it('requests a refetch when the cached game has no version', () => {
+    expect(applyGameUpdate({ ...game, version: undefined }, delta())).toBeNull();
+  });
+});
@@ -0,0 +1,62 @@
+// Copyright 2026 Bret McKee
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in all
+// copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+// SOFTWARE.
+
+import { GameSession, GameUpdateEvent } from '../types';
+
+/**
+ * Applies a game_updated SSE delta to a cached game.
+ *
+ * @param game - The game as last fetched or patched
+ * @param event - The game_updated event from the SSE stream
+ * @returns The patched game, the same game if the event is not newer, or null
+ * when the game must be refetched
+ *
+ * Rules:
+ * - Refetch when the event has no participant data (role-restricted games)
+ * - Refetch on a version gap, or when updated_at shows other fields changed
+ * - Ignore events whose version is not newer than the cached copy
+ */
+export const applyGameUpdate = (game: GameSession, event: GameUpdateEvent): GameSession | null => {
+  if (event.version === undefined || game.version === undefined) {
+    return null;
+  }
+  if (event.version <= game.version) {
+    return game;
+  }
+  if (
+    event.version !== game.version + 1 ||
+    event.participants === undefined ||
+    event.updated_at !== game.updated_at
+  ) {
+    return null;
+  }
+
+  const confirmedIds = new Set(event.confirmed_participant_ids ?? []);
+  return {
+    ...game,
+    version: event.version,
+    status: event.status ?? game.status,
+    max_players: event.max_players ?? game.max_players,
+    participant_count: event.participant_count ?? game.participant_count,
+    participants: event.participants,
+    confirmed_participants: event.participants.filter((p) => confirmedIds.has(p.id)),
+    waitlist_participants: event.participants.filter((p) => !confirmedIds.has(p.id)),
+  };
+};
@@ -40,6 +40,7 @@ from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
 
 from services.api import middleware
+from services.api.auth import principal_cache
 from services.api.config import get_api_config
 from services.api.routes import (
     auth,
@@ -54,6 +55,8 @@ from services.api.routes import (
 )
 from services.api.services.sse_bridge import get_sse_bridge
 from shared.cache import client as redis_client
+from shared.cache import l1
+from shared.services.image_processing import get_image_pool
 from shared.telemetry import init_telemetry
 from shared.version import get_api_version, get_git_version
 
@@ -101,16 +104,28 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     bridge_task = asyncio.create_task(bridge.start_consuming())
     logger.info("SSE bridge started consuming game events")
 
+    l1_task = asyncio.create_task(l1.listen_for_invalidations(redis_instance))
+    principal_task = asyncio.create_task(principal_cache.listen_for_invalidations(redis_instance))
+
     yield
 
     logger.info("Shutting down API service...")
 
+    listeners = (l1_task, principal_task)
+    for task in listeners:
+        task.cancel()
+    for task in listeners:
+        with suppress(asyncio.CancelledError):
+            await task
+
     bridge_task.cancel()
     with suppress(asyncio.CancelledError):
         await bridge_task
     await bridge.stop_consuming()
     logger.info("SSE bridge stopped")
 
+    get_image_pool().shutdown()
+
     await redis_instance.disconnect()
     logger.info("Redis connection closed")
 
@@ -137,6 +152,8 @@ def create_app() -> FastAPI:
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
     app.add_middleware(SlowAPIMiddleware)
+    app.add_middleware(middleware.round_trips.RoundTripMiddleware)
+    app.add_middleware(middleware.request_memo.RequestMemoMiddleware)
 
     middleware.cors.configure_cors(app, config)
     middleware.error_handler.configure_error_handlers(app)
@@ -0,0 +1,198 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+In-process cache of authenticated principals.
+
+Every authenticated request resolves its session cookie to the decoded
+Redis session and the matching users row, and dashboard polling resolves
+the same few sessions over and over.  PrincipalCache keeps that pair in
+memory, keyed by session token, for a short TTL.
+
+Sessions change on logout, token refresh and maintainer toggling.  The
+process making the change drops its own entry and publishes the session
+token on INVALIDATION_CHANNEL so every other API process drops it too.  As
+with the Discord metadata L1 cache, entries are only served while that
+subscription is confirmed.  The TTL bounds how long a change made outside
+those paths, such as a session expiring in Redis, can go unnoticed.
+
+The OAuth tokens in a cached session stay Fernet-encrypted.  Only callers
+that talk to Discord decrypt them.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from opentelemetry import metrics
+
+from services.api.config import get_api_config
+from shared.cache import l1
+from shared.cache.client import RedisClient
+from shared.models.user import User
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+INVALIDATION_CHANNEL = "api:principal:invalidate"
+
+principal_cache_lookup_counter = meter.create_counter(
+    name="api.principal_cache.lookups",
+    description="Authenticated principal cache lookups, by result",
+    unit="1",
+)
+
+_MAX_ENTRIES = 10_000
+
+
+@dataclass(frozen=True)
+class Principal:
+    """A decoded session (tokens still encrypted) and its users row."""
+
+    session: dict[str, Any]
+    user: User
+
+
+class PrincipalCache:
+    """
+    Least-recently-used principals keyed by session token, each with a TTL.
+
+    Entries are only served while active, i.e. while this process is
+    subscribed to INVALIDATION_CHANNEL.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = _MAX_ENTRIES) -> None:
+        """
+        Initialize an empty, inactive cache.
+
+        Args:
+            ttl_seconds: Age after which an entry is reloaded; 0 disables the cache
+            max_entries: Upper bound on the number of sessions held
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+        self._generation = 0
+        self.active = False
+
+    def activate(self) -> None:
+        """Start serving entries from a clean slate."""
+        self.clear()
+        self.active = True
+
+    def deactivate(self) -> None:
+        """Stop serving entries and drop everything held."""
+        self.active = False
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._generation += 1
+
+    def invalidate(self, session_tokens: Iterable[str]) -> None:
+        """Drop the entries for the given session tokens."""
+        for session_token in session_tokens:
+            self._entries.pop(session_token, None)
+        self._generation += 1
+
+    def apply_message(self, data: str) -> None:
+        """Apply one invalidation message published by an API process."""
+        if data == l1.INVALIDATE_ALL:
+            self.clear()
+            return
+        try:
+            session_tokens = json.loads(data)
+        except json.JSONDecodeError:
+            logger.warning("Ignoring malformed principal invalidation message: %r", data)
+            self.clear()
+            return
+        self.invalidate(session_tokens)
+
+    async def get_or_load(
+        self, session_token: str, load: Callable[[], Awaitable[Principal]]
+    ) -> Principal:
+        """
+        Return the cached principal for a session, calling load() on a miss.
+
+        Args:
+            session_token: Session token from the request cookie
+            load: Resolves the principal; exceptions propagate and nothing is cached
+
+        Returns:
+            The cached or freshly loaded principal
+        """
+        if not self.active or self.ttl_seconds <= 0:
+            return await load()
+
+        entry = self._entries.get(session_token)
+        if entry is not None and time.monotonic() - entry[0] <= self.ttl_seconds:
+            principal_cache_lookup_counter.add(1, {"result": "hit"})
+            self._entries.move_to_end(session_token)
+            return entry[1]
+
+        principal_cache_lookup_counter.add(1, {"result": "miss"})
+        generation = self._generation
+        principal = await load()
+        # A logout or refresh that landed while load() was awaiting means the
+        # principal may already be stale; return it but do not keep it.
+        if self.active and generation == self._generation:
+            self._entries[session_token] = (time.monotonic(), principal)
+            self._entries.move_to_end(session_token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return principal
+
+
+_principal_cache: PrincipalCache | None = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get or create the process-wide principal cache."""
+    global _principal_cache  # noqa: PLW0603
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache(get_api_config().principal_cache_ttl_seconds)
+    return _principal_cache
+
+
+async def publish_invalidation(redis: RedisClient, session_tokens: list[str]) -> None:
+    """
+    Drop sessions from this process's cache and tell every other process to.
+
+    Args:
+        redis: Redis async client wrapper
+        session_tokens: Sessions that were rewritten or deleted
+    """
+    if not session_tokens:
+        return
+    get_principal_cache().invalidate(session_tokens)
+    await redis.publish(INVALIDATION_CHANNEL, l1.invalidation_message(session_tokens))
+
+
+async def listen_for_invalidations(redis: RedisClient) -> None:
+    """Subscribe the process-wide cache to INVALIDATION_CHANNEL until cancelled."""
+    await l1.listen_for_invalidations(
+        redis, channel=INVALIDATION_CHANNEL, cache=get_principal_cache()
+    )
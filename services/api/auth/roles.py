@@ -26,6 +26,7 @@ Provides role checking using Discord API and Redis caching for web dashboard.
 """
 
 import logging
+from functools import partial
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -33,6 +34,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from services.api.dependencies.discord import get_discord_client
 from shared.cache import client as cache_client
 from shared.cache import keys as cache_keys
+from shared.cache import l1
 from shared.cache import projection as member_projection
 from shared.cache import ttl as cache_ttl
 from shared.cache.operations import CacheOperation, cache_get
@@ -42,6 +44,11 @@ from shared.utils.discord import DiscordPermissions
 logger = logging.getLogger(__name__)
 
 
+def _index_role_permissions(guild_roles: list[dict]) -> dict[str, int]:
+    """Map each role ID in a cached guild role list to its permission bits."""
+    return {r["id"]: int(r.get("permissions", 0)) for r in guild_roles}
+
+
 class RoleVerificationService:
     """Service for verifying user roles and permissions via Discord API."""
 
@@ -137,6 +144,7 @@ class RoleVerificationService:
         Check if user has any of the specified permissions in a guild.
 
         Reads role permission bitfields from the Redis projection (no OAuth calls).
+        The guild and its role index are served from the in-process L1 cache.
         ADMINISTRATOR permission always grants access.
 
         Args:
@@ -150,23 +158,24 @@ class RoleVerificationService:
         try:
             cache = await self._get_cache()
 
-            guild_data: dict | None = await cache.get_json(
-                cache_keys.CacheKeys.discord_guild(guild_id)
+            guild_key = cache_keys.CacheKeys.discord_guild(guild_id)
+            guild_data: dict | None = await l1.get_or_load(
+                guild_key, partial(cache.get_json, guild_key)
             )
             if guild_data and guild_data.get("owner_id") == user_id:
                 return True
 
-            guild_roles: list[dict] | None = await cache.get_json(
-                cache_keys.CacheKeys.discord_guild_roles(guild_id)
+            roles_key = cache_keys.CacheKeys.discord_guild_roles(guild_id)
+            role_perms_by_id: dict[str, int] | None = await l1.get_or_load(
+                roles_key, partial(cache.get_json, roles_key), _index_role_permissions
             )
-            if not guild_roles:
+            if not role_perms_by_id:
                 return False
 
             user_role_ids = await member_projection.get_user_roles(guild_id, user_id, redis=cache)
             if guild_id not in user_role_ids:
                 user_role_ids = [*user_role_ids, guild_id]
 
-            role_perms_by_id = {r["id"]: int(r.get("permissions", 0)) for r in guild_roles}
             user_permissions = 0
             for role_id in user_role_ids:
                 user_permissions |= role_perms_by_id.get(role_id, 0)
@@ -267,6 +276,32 @@ class RoleVerificationService:
         )
         guild_config = result.scalar_one_or_none()
 
+        return await self.check_bot_manager_for_config(
+            user_id, guild_id, guild_config, user_role_ids
+        )
+
+    async def check_bot_manager_for_config(
+        self,
+        user_id: str,
+        guild_id: str,
+        guild_config: guild_model.GuildConfiguration | None,
+        user_role_ids: list[str],
+    ) -> bool:
+        """
+        Check Bot Manager status against an already-loaded guild configuration.
+
+        Same rule as check_bot_manager_permission, for callers that already hold
+        the guild configuration and the user's role IDs.
+
+        Args:
+            user_id: Discord user ID
+            guild_id: Discord guild ID
+            guild_config: Guild configuration, or None if the guild is not configured
+            user_role_ids: User's role IDs in the guild (from get_user_role_ids)
+
+        Returns:
+            True if user has Bot Manager role or MANAGE_GUILD permission
+        """
         if not guild_config or not guild_config.bot_manager_role_ids:
             return await self.has_permissions(user_id, guild_id, DiscordPermissions.MANAGE_GUILD)
 
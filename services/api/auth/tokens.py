@@ -25,18 +25,23 @@ Uses Redis for session storage with encrypted token data.
 """
 
 import base64
+import hashlib
+import hmac
 import logging
 import uuid
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache, partial
 from typing import Any
 
 from cryptography.fernet import Fernet
 
 from services.api import config
+from services.api.auth import principal_cache
 from shared.cache import client as cache_client
 from shared.cache import ttl as cache_ttl
 from shared.cache.keys import CacheKeys
 from shared.cache.operations import CacheOperation, cache_get
+from shared.cache.request_memo import forget, memoize
 from shared.utils.security_constants import ENCRYPTION_KEY_LENGTH
 
 logger = logging.getLogger(__name__)
@@ -49,14 +54,35 @@ def get_encryption_key() -> bytes:
     Returns:
         Fernet-compatible encryption key
     """
-    api_config = config.get_api_config()
-    key = api_config.jwt_secret.encode()
+    return _derive_encryption_key(config.get_api_config().jwt_secret)
+
+
+@lru_cache(maxsize=4)
+def _derive_encryption_key(jwt_secret: str) -> bytes:
+    """Derive the Fernet key for a JWT secret once per process."""
+    key = jwt_secret.encode()
     if len(key) < ENCRYPTION_KEY_LENGTH:
         key = key.ljust(ENCRYPTION_KEY_LENGTH, b"0")
     key = key[:ENCRYPTION_KEY_LENGTH]
     return base64.urlsafe_b64encode(key)
 
 
+@lru_cache(maxsize=4)
+def _fernet_for_key(key: bytes) -> Fernet:
+    """Build the Fernet instance for a key once per process."""
+    return Fernet(key)
+
+
+def get_fernet() -> Fernet:
+    """
+    Get the Fernet instance for the current encryption key.
+
+    Returns:
+        Process-wide Fernet instance, rebuilt only if the key changes
+    """
+    return _fernet_for_key(get_encryption_key())
+
+
 def encrypt_token(token: str) -> str:
     """
     Encrypt token for secure storage.
@@ -67,7 +93,7 @@ def encrypt_token(token: str) -> str:
     Returns:
         Encrypted token string
     """
-    fernet = Fernet(get_encryption_key())
+    fernet = get_fernet()
     encrypted = fernet.encrypt(token.encode())
     return encrypted.decode()
 
@@ -82,7 +108,7 @@ def decrypt_token(encrypted_token: str) -> str:
     Returns:
         Decrypted plain text token
     """
-    fernet = Fernet(get_encryption_key())
+    fernet = get_fernet()
     decrypted = fernet.decrypt(encrypted_token.encode())
     return decrypted.decode()
 
@@ -136,9 +162,29 @@ async def store_user_tokens(
     return session_token
 
 
+async def get_session(session_token: str) -> dict[str, Any] | None:
+    """
+    Retrieve a user session from Redis without decrypting its OAuth tokens.
+
+    The session is read once per request_memo() scope; each caller gets its
+    own copy of the result.  Use get_user_tokens() when the OAuth tokens
+    themselves are needed.
+
+    Args:
+        session_token: Session token (UUID4)
+
+    Returns:
+        Dictionary with user_id, expires_at, maintainer flags, username, avatar
+        and the still-encrypted access_token and refresh_token, or None
+    """
+    session_key = f"api:session:{session_token}"
+    session = await memoize(session_key, partial(_load_session, session_token))
+    return dict(session) if session is not None else None
+
+
 async def get_user_tokens(session_token: str) -> dict[str, Any] | None:
     """
-    Retrieve user tokens from Redis session.
+    Retrieve a user session with its OAuth tokens decrypted.
 
     Args:
         session_token: Session token (UUID4)
@@ -146,6 +192,16 @@ async def get_user_tokens(session_token: str) -> dict[str, Any] | None:
     Returns:
         Dictionary with user_id, access_token, refresh_token, expires_at or None
     """
+    token_data = await get_session(session_token)
+    if token_data is None:
+        return None
+    token_data["access_token"] = decrypt_token(token_data["access_token"])
+    token_data["refresh_token"] = decrypt_token(token_data["refresh_token"])
+    return token_data
+
+
+async def _load_session(session_token: str) -> dict[str, Any] | None:
+    """Read and decode one session from Redis."""
     session_key = f"api:session:{session_token}"
     session_data_raw = await cache_get(session_key, CacheOperation.SESSION_LOOKUP)
 
@@ -159,13 +215,10 @@ async def get_user_tokens(session_token: str) -> dict[str, Any] | None:
 
     session_data: dict[str, Any] = session_data_raw
 
-    decrypted_access = decrypt_token(session_data.get("access_token", ""))
-    decrypted_refresh = decrypt_token(session_data.get("refresh_token", ""))
-
     return {
         "user_id": str(session_data.get("user_id", "")),
-        "access_token": decrypted_access,
-        "refresh_token": decrypted_refresh,
+        "access_token": str(session_data.get("access_token", "")),
+        "refresh_token": str(session_data.get("refresh_token", "")),
         "expires_at": datetime.fromisoformat(str(session_data.get("expires_at", ""))),
         "can_be_maintainer": bool(session_data.get("can_be_maintainer")),
         "is_maintainer": bool(session_data.get("is_maintainer")),
@@ -207,6 +260,8 @@ async def refresh_user_tokens(
     session_data["expires_at"] = expiry.isoformat()
 
     await redis.set_json(session_key, session_data, ttl=cache_ttl.CacheTTL.SESSION)
+    forget(session_key)
+    await principal_cache.publish_invalidation(redis, [session_token])
     logger.info("Refreshed tokens for session %s", session_token)
 
 
@@ -221,6 +276,8 @@ async def delete_user_tokens(session_token: str) -> None:
 
     session_key = f"api:session:{session_token}"
     await redis.delete(session_key)
+    forget(session_key)
+    await principal_cache.publish_invalidation(redis, [session_token])
 
     logger.info("Deleted session %s", session_token)
 
@@ -265,3 +322,46 @@ async def get_calendar_export_token(token: str) -> str | None:
         logger.warning("No calendar export token found for %s", token)
         return None
     return str(data["game_id"])
+
+
+_CALENDAR_FEED_ALL_GUILDS = "all"
+
+
+def _calendar_feed_signature(user_id: str, scope: str) -> str:
+    secret = config.get_api_config().jwt_secret.encode()
+    message = f"calendar-feed:{user_id}:{scope}".encode()
+    return hmac.new(secret, message, hashlib.sha256).hexdigest()[:32]
+
+
+def mint_calendar_feed_token(user_id: str, guild_id: str | None = None) -> str:
+    """
+    Mint a long-lived token for a user's subscribable calendar feed.
+
+    Calendar clients keep polling a subscribed URL indefinitely, so unlike
+    export tokens this one is stateless: it is signed with the JWT secret and
+    stays valid until that secret is rotated.
+
+    Args:
+        user_id: User UUID whose games the feed lists
+        guild_id: Guild configuration UUID to restrict the feed to (optional)
+
+    Returns:
+        URL-safe token of the form ``{user_id}_{guild_id|all}_{signature}``
+    """
+    scope = guild_id or _CALENDAR_FEED_ALL_GUILDS
+    return f"{user_id}_{scope}_{_calendar_feed_signature(user_id, scope)}"
+
+
+def verify_calendar_feed_token(token: str) -> tuple[str, str | None] | None:
+    """Resolve a calendar feed token to (user_id, guild_id), or None if invalid."""
+    try:
+        user_id, scope, signature = token.split("_")
+        uuid.UUID(user_id)
+        if scope != _CALENDAR_FEED_ALL_GUILDS:
+            uuid.UUID(scope)
+    except ValueError:
+        return None
+    if not hmac.compare_digest(signature, _calendar_feed_signature(user_id, scope)):
+        logger.warning("Rejected calendar feed token with bad signature for user %s", user_id)
+        return None
+    return user_id, None if scope == _CALENDAR_FEED_ALL_GUILDS else scope
@@ -150,6 +150,9 @@ class APIConfig:
 
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
 
+        self.image_cache_max_bytes = int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+        self.principal_cache_ttl_seconds = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+
         # Derive cookie domain for cross-subdomain sharing
         self.cookie_domain = _get_cookie_domain(self.frontend_url, self.backend_url)
 
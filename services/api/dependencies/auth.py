@@ -25,14 +25,17 @@ Provides dependency injection for current user retrieval.
 """
 
 import logging
+from functools import partial
 
 from fastapi import Cookie, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from starlette import status
 
-from services.api.auth import tokens
+from services.api.auth import principal_cache, tokens
 from shared import database
+from shared.cache.keys import CacheKeys
+from shared.cache.request_memo import remember
 from shared.models import user as user_model
 from shared.schemas import auth as auth_schemas
 
@@ -51,6 +54,11 @@ async def get_current_user(
     """
     Get current authenticated user from cookie.
 
+    The session and users row are served from the process-wide principal
+    cache when possible, and the session is handed to the request memo so
+    later get_session() calls in the same request skip Redis.  The cached
+    user is detached from any database session.
+
     Args:
         session_token: Session token from cookie
         db: Database session
@@ -64,15 +72,28 @@ async def get_current_user(
     if not session_token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
-    token_data = await tokens.get_user_tokens(session_token)
-    if not token_data:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session not found")
+    principal = await principal_cache.get_principal_cache().get_or_load(
+        session_token, partial(_load_principal, session_token, db)
+    )
+    remember(CacheKeys.session(session_token), principal.session)
 
-    if await tokens.is_token_expired(token_data["expires_at"]):
+    if await tokens.is_token_expired(principal.session["expires_at"]):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
 
+    return auth_schemas.CurrentUser(
+        user=principal.user,
+        session_token=session_token,
+    )
+
+
+async def _load_principal(session_token: str, db: AsyncSession) -> principal_cache.Principal:
+    """Read the session from Redis and its user from the database."""
+    session = await tokens.get_session(session_token)
+    if not session:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session not found")
+
     # Get user from database by Discord ID
-    discord_id = token_data["user_id"]
+    discord_id = session["user_id"]
     result = await db.execute(
         select(user_model.User).where(user_model.User.discord_id == discord_id)
     )
@@ -81,8 +102,7 @@ async def get_current_user(
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
-    return auth_schemas.CurrentUser(
-        user=user,
-        access_token=token_data["access_token"],
-        session_token=session_token,
-    )
+    # The principal outlives this request's session.  Detach the user so a
+    # rollback of this request cannot expire the copy later requests read.
+    db.expunge(user)
+    return principal_cache.Principal(session=session, user=user)
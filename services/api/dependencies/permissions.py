@@ -25,6 +25,7 @@ Permission check dependencies for protected routes.
 Provides FastAPI dependencies for role-based authorization.
 """
 
+import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from typing import Any
@@ -41,6 +42,7 @@ from shared import database
 from shared.cache import projection as member_projection
 from shared.cache.client import RedisClient, get_redis_client
 from shared.models.game import GameSession
+from shared.models.guild import GuildConfiguration
 from shared.models.template import GameTemplate
 from shared.schemas import auth as auth_schemas
 from shared.utils.discord import DiscordPermissions
@@ -274,6 +276,160 @@ async def verify_game_access(
     return game
 
 
+class BatchGameAuthorizer:
+    """
+    Authorize a page of games for one user with a bounded number of lookups.
+
+    Applies the rules of verify_game_access (guild membership, then template
+    player roles with the host exempt) and of can_manage_game (host,
+    maintainer or Bot Manager).  Bot freshness, the user's guild list and the
+    maintainer flag are read once per call; role IDs and Bot Manager status
+    once per distinct guild.  The page is then filtered in memory, so the cost
+    does not grow with the number of games.
+
+    Games must have their ``host`` and ``guild`` relationships loaded.
+
+    Args:
+        current_user: Current authenticated user
+        role_service: Role verification service
+        redis: Redis client for projection reads (optional, will get singleton if not provided)
+    """
+
+    def __init__(
+        self,
+        current_user: auth_schemas.CurrentUser,
+        role_service: roles_module.RoleVerificationService,
+        redis: RedisClient | None = None,
+    ) -> None:
+        self.current_user = current_user
+        self.role_service = role_service
+        self._redis = redis
+
+    def _is_host(self, game: GameSession) -> bool:
+        return game.host is not None and game.host.discord_id == self.current_user.user.discord_id
+
+    async def _load_user_guilds(self, redis: RedisClient) -> set[str]:
+        """Return the user's guild IDs, or an empty set when the projection is unusable."""
+        if not await member_projection.is_bot_fresh(redis=redis):
+            logger.debug(
+                "Bot projection not fresh for batch game authorization (user=%s)",
+                self.current_user.user.discord_id,
+            )
+            return set()
+        guild_ids = await member_projection.get_user_guilds(
+            self.current_user.user.discord_id, redis=redis
+        )
+        return set(guild_ids or [])
+
+    async def _is_maintainer(self) -> bool:
+        token_data = await tokens.get_session(self.current_user.session_token)
+        return bool(token_data and token_data.get("is_maintainer"))
+
+    async def filter_games(
+        self,
+        games: list[GameSession],
+        manage_required: Callable[[GameSession], bool] | None = None,
+    ) -> list[GameSession]:
+        """
+        Return the games the user may see, preserving order.
+
+        Args:
+            games: Games to authorize
+            manage_required: Predicate marking games that are only visible to
+                users who can manage them (e.g. pre-announcement games)
+
+        Returns:
+            Authorized subset of ``games``
+        """
+        if not games:
+            return []
+
+        redis = self._redis or await get_redis_client()
+        user_guilds = await self._load_user_guilds(redis)
+        member_games = [game for game in games if game.guild.guild_id in user_guilds]
+        if not member_games:
+            return []
+
+        role_guilds = {game.guild.guild_id for game in member_games if self._needs_role_check(game)}
+        manage_guilds = {
+            game.guild.guild_id: game.guild
+            for game in member_games
+            if self._needs_manage_check(game, manage_required)
+        }
+        is_maintainer = bool(manage_guilds) and await self._is_maintainer()
+        if is_maintainer:
+            manage_guilds = {}
+
+        role_ids_by_guild = await self._load_role_ids(sorted(role_guilds | manage_guilds.keys()))
+        manager_by_guild = await self._load_bot_manager_flags(manage_guilds, role_ids_by_guild)
+
+        return [
+            game
+            for game in member_games
+            if self._has_player_role(game, role_ids_by_guild)
+            and self._may_manage(game, manage_required, is_maintainer, manager_by_guild)
+        ]
+
+    async def _load_role_ids(self, guild_ids: list[str]) -> dict[str, list[str]]:
+        """Read the user's role IDs in each guild concurrently."""
+        user_discord_id = self.current_user.user.discord_id
+        role_ids = await asyncio.gather(
+            *(
+                self.role_service.get_user_role_ids(user_discord_id, guild_id)
+                for guild_id in guild_ids
+            )
+        )
+        return dict(zip(guild_ids, role_ids, strict=True))
+
+    async def _load_bot_manager_flags(
+        self,
+        guild_configs: dict[str, GuildConfiguration],
+        role_ids_by_guild: dict[str, list[str]],
+    ) -> dict[str, bool]:
+        """Check Bot Manager status in each guild concurrently, reusing the loaded role IDs."""
+        user_discord_id = self.current_user.user.discord_id
+        flags = await asyncio.gather(
+            *(
+                self.role_service.check_bot_manager_for_config(
+                    user_discord_id, guild_id, guild_config, role_ids_by_guild[guild_id]
+                )
+                for guild_id, guild_config in guild_configs.items()
+            )
+        )
+        return dict(zip(guild_configs, flags, strict=True))
+
+    def _needs_role_check(self, game: GameSession) -> bool:
+        """Whether the game's template player roles apply to the user (hosts are exempt)."""
+        return bool(game.allowed_player_role_ids) and not self._is_host(game)
+
+    def _needs_manage_check(
+        self, game: GameSession, manage_required: Callable[[GameSession], bool] | None
+    ) -> bool:
+        """Whether the game is only visible to managers and the user is not its host."""
+        return manage_required is not None and manage_required(game) and not self._is_host(game)
+
+    def _has_player_role(self, game: GameSession, role_ids_by_guild: dict[str, list[str]]) -> bool:
+        """Whether the user passes the game's player-role restriction."""
+        if not self._needs_role_check(game):
+            return True
+        return any(
+            role_id in game.allowed_player_role_ids
+            for role_id in role_ids_by_guild[game.guild.guild_id]
+        )
+
+    def _may_manage(
+        self,
+        game: GameSession,
+        manage_required: Callable[[GameSession], bool] | None,
+        is_maintainer: bool,
+        manager_by_guild: dict[str, bool],
+    ) -> bool:
+        """Whether the user passes the manage check, for games that require one."""
+        if not self._needs_manage_check(game, manage_required):
+            return True
+        return is_maintainer or manager_by_guild[game.guild.guild_id]
+
+
 async def get_role_service() -> roles_module.RoleVerificationService:
     """
     Get role verification service dependency.
@@ -340,7 +496,7 @@ async def _require_permission(
         HTTPException(401): If session token is invalid
         HTTPException(403): If user lacks required permission
     """
-    token_data = await tokens.get_user_tokens(current_user.session_token)
+    token_data = await tokens.get_session(current_user.session_token)
     if not token_data:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session expired")
 
@@ -602,7 +758,7 @@ async def require_game_host(
     Raises:
         HTTPException: If user lacks game host permission
     """
-    token_data = await tokens.get_user_tokens(current_user.session_token)
+    token_data = await tokens.get_session(current_user.session_token)
     if not token_data:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session expired")
 
@@ -665,7 +821,7 @@ async def can_manage_game(
     if current_user.user.discord_id == game_host_id:
         return True
 
-    token_data = await tokens.get_user_tokens(current_user.session_token)
+    token_data = await tokens.get_session(current_user.session_token)
     if token_data and token_data.get("is_maintainer"):
         return True
 
@@ -751,7 +907,7 @@ async def require_administrator(
     Raises:
         HTTPException: If user lacks ADMINISTRATOR permission
     """
-    token_data = await tokens.get_user_tokens(current_user.session_token)
+    token_data = await tokens.get_session(current_user.session_token)
     if not token_data:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session expired")
 
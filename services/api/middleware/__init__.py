@@ -25,6 +25,6 @@ Middleware components for the API service.
 Includes CORS configuration, error handling, logging, and authentication.
 """
 
-from services.api.middleware import authorization, cors, error_handler
+from services.api.middleware import authorization, cors, error_handler, request_memo, round_trips
 
-__all__ = ["authorization", "cors", "error_handler"]
+__all__ = ["authorization", "cors", "error_handler", "request_memo", "round_trips"]
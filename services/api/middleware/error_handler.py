@@ -35,6 +35,7 @@ from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
 from services.api.config import get_api_config
+from shared.services.image_processing import ImageProcessingUnavailableError
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +107,31 @@ async def database_exception_handler(_request: Request, exc: SQLAlchemyError) ->
     )
 
 
+async def image_processing_exception_handler(
+    _request: Request, exc: ImageProcessingUnavailableError
+) -> JSONResponse:
+    """
+    Handle an upload refused or abandoned by the image processing pool.
+
+    Args:
+        _request: HTTP request that caused the error (unused, required by FastAPI)
+        exc: Saturation or timeout error from the pool
+
+    Returns:
+        JSON response with 503 status and a Retry-After hint
+    """
+    logger.warning("Image processing unavailable: %s", exc)
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "error": "image_processing_unavailable",
+            "message": str(exc),
+        },
+        headers={"Retry-After": "5"},
+    )
+
+
 async def general_exception_handler(_request: Request, exc: Exception) -> JSONResponse:
     """
     Handle unexpected exceptions with generic error message.
@@ -145,4 +171,8 @@ def configure_error_handlers(app: FastAPI) -> None:
     app.add_exception_handler(RequestValidationError, validation_exception_handler)  # type: ignore[arg-type]
     app.add_exception_handler(ValidationError, validation_exception_handler)  # type: ignore[arg-type]
     app.add_exception_handler(SQLAlchemyError, database_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(
+        ImageProcessingUnavailableError,
+        image_processing_exception_handler,  # type: ignore[arg-type]
+    )
     app.add_exception_handler(Exception, general_exception_handler)
@@ -0,0 +1,76 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Round-trip accounting middleware for the API service.
+
+Counts the database statements and Redis commands each request issues and
+records them per route, so a change that turns a constant-cost endpoint into
+one that scales with page size shows up in metrics and tests.
+"""
+
+from opentelemetry import metrics
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from shared.data_access.round_trips import track_round_trips
+
+meter = metrics.get_meter(__name__)
+
+request_round_trips_histogram = meter.create_histogram(
+    name="api.request.round_trips",
+    description="Database statements and Redis commands per request, labeled by route and kind",
+    unit="{round_trip}",
+)
+
+
+class RoundTripMiddleware:
+    """ASGI middleware that records per-request database and Redis round-trips."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Wrap an ASGI application.
+
+        Args:
+            app: Next ASGI application in the stack
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Run the request inside a round-trip tracking scope.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_round_trips() as counts:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                route = getattr(scope.get("route"), "path", "unmatched")
+                request_round_trips_histogram.record(counts.db, {"http.route": route, "kind": "db"})
+                request_round_trips_histogram.record(
+                    counts.redis, {"http.route": route, "kind": "redis"}
+                )
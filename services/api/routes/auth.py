@@ -223,7 +223,7 @@ async def get_user_info(
     Returns:
         User info from session cache
     """
-    token_data = await tokens.get_user_tokens(current_user.session_token)
+    token_data = await tokens.get_session(current_user.session_token)
     if not token_data:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="No session found")
 
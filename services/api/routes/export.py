@@ -22,15 +22,17 @@
 """
 Calendar export REST API endpoints.
 
-Provides iCal export functionality for individual game sessions.
+Provides iCal export functionality for individual game sessions and mints
+tokens for the subscribable multi-game calendar feed.
 """
 
 import logging
 import re
+import uuid
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -45,7 +47,7 @@ from shared import database
 from shared.models.game import GameSession
 from shared.models.participant import GameParticipant
 from shared.schemas import auth as auth_schemas
-from shared.schemas.export import CalendarExportTokenResponse
+from shared.schemas.export import CalendarExportTokenResponse, CalendarFeedTokenResponse
 from shared.utils.limits import GAME_LIST_DESCRIPTION_SNIPPET_LENGTH
 
 logger = logging.getLogger(__name__)
@@ -223,3 +225,33 @@ async def mint_calendar_token(
 
     token = await tokens.mint_calendar_export_token(game_id)
     return CalendarExportTokenResponse(token=token)
+
+
+@router.post(
+    "/feed/token",
+    summary="Mint a calendar feed token",
+    description="Mint a token for the public, subscribable feed of the user's games",
+)
+async def mint_calendar_feed_token(
+    user: Annotated[auth_schemas.CurrentUser, Depends(auth_deps.get_current_user)],
+    guild_id: Annotated[
+        str | None, Query(description="Restrict the feed to one guild UUID")
+    ] = None,
+) -> CalendarFeedTokenResponse:
+    """
+    Mint a token for the caller's calendar feed.
+
+    The feed only ever lists games the user hosts or joined, so no further
+    permission check is needed; the guild filter just narrows it.
+    """
+    if guild_id is not None:
+        try:
+            uuid.UUID(guild_id)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="guild_id must be a guild UUID",
+            ) from e
+
+    token = tokens.mint_calendar_feed_token(user.user.id, guild_id)
+    return CalendarFeedTokenResponse(token=token)
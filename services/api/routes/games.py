@@ -30,12 +30,23 @@ import json
 import logging
 from collections import defaultdict
 from datetime import UTC, datetime
+from functools import partial
 from typing import TYPE_CHECKING, Annotated, NoReturn
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status as http_status
 
@@ -47,6 +58,7 @@ from services.api.schemas.clone_game import CloneGameRequest
 from services.api.services import channel_resolver as channel_resolver_module
 from services.api.services import display_names as display_names_module
 from services.api.services import emoji_resolver as emoji_resolver_module
+from services.api.services import game_response_cache
 from services.api.services import games as games_service
 from services.api.services import participant_resolver as resolver_module
 from shared import database
@@ -141,25 +153,6 @@ def _is_pending_announcement(game: game_model.GameSession) -> bool:
     return game.post_at is not None and game.post_at > now and game.message_id is None
 
 
-async def _is_pending_and_hidden(
-    game: game_model.GameSession,
-    current_user: auth_schemas.CurrentUser,
-    role_service: roles_module.RoleVerificationService,
-    db: AsyncSession,
-) -> bool:
-    """Return True when a pending-announcement game should be hidden from the requesting user."""
-    if not _is_pending_announcement(game):
-        return False
-    can_manage = await permissions_deps.can_manage_game(
-        game_host_id=game.host.discord_id,
-        guild_id=game.guild.guild_id,
-        current_user=current_user,
-        role_service=role_service,
-        db=db,
-    )
-    return not can_manage
-
-
 async def _resolve_join_position(
     game: game_model.GameSession,
     discord_id: str,
@@ -525,6 +518,12 @@ async def list_games(
     ] = None,
     limit: Annotated[int, Query(ge=1, le=25, description="Maximum results")] = 25,
     offset: Annotated[int, Query(ge=0, description="Results offset")] = 0,
+    cursor: Annotated[
+        str | None, Query(description="next_cursor from the previous page; overrides offset")
+    ] = None,
+    include_total: Annotated[
+        bool, Query(description="Count all matching games; set false to skip the count")
+    ] = True,
     *,  # Force remaining parameters to be keyword-only
     current_user: Annotated[auth_schemas.CurrentUser, Depends(auth_deps.get_current_user)],
     game_service: Annotated[games_service.GameService, Depends(_get_game_service)],
@@ -538,7 +537,14 @@ async def list_games(
 
     Supports filtering by guild, channel, status, and caller role with pagination.
     Games are filtered by guild membership and template player role restrictions.
+    Pages can be addressed by offset or, for constant-cost deep paging, by the
+    ``next_cursor`` returned with the previous page.
     """
+    try:
+        list_cursor = games_service.GameListCursor.decode(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e)) from None
+
     games, total = await game_service.list_games(
         guild_id=guild_id,
         channel_id=channel_id,
@@ -547,28 +553,20 @@ async def list_games(
         user_id=current_user.user.id,
         limit=limit,
         offset=offset,
+        cursor=list_cursor,
+        include_total=include_total,
+    )
+    # The cursor follows the unfiltered page so hidden games do not stall paging.
+    next_cursor = (
+        games_service.GameListCursor.after(games[-1]).encode() if len(games) == limit else None
     )
 
-    # Filter games by guild membership and player role restrictions
-    authorized_games = []
-    for game in games:
-        try:
-            # Use verify_game_access helper to check authorization
-            await permissions_deps.verify_game_access(
-                game=game,
-                user_discord_id=current_user.user.discord_id,
-                db=game_service.db,
-                role_service=role_service,
-            )
-        except HTTPException:
-            # User not authorized to see this game - skip it
-            continue
-
-        # Hide pre-announced games from non-managers until the bot posts the announcement
-        if await _is_pending_and_hidden(game, current_user, role_service, game_service.db):
-            continue
-
-        authorized_games.append(game)
+    # Filter games by guild membership and player role restrictions, hiding
+    # pre-announced games from non-managers until the bot posts the announcement
+    authorizer = permissions_deps.BatchGameAuthorizer(current_user, role_service)
+    authorized_games = await authorizer.filter_games(
+        games, manage_required=_is_pending_announcement
+    )
 
     # Batch-fetch host display names grouped by guild — one API call per guild, hosts deduplicated.
     hosts_by_guild = _collect_hosts_by_guild(authorized_games)
@@ -596,6 +594,7 @@ async def list_games(
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -607,8 +606,15 @@ async def get_game(
     role_service: Annotated[
         roles_module.RoleVerificationService, Depends(permissions_deps.get_role_service)
     ],
-) -> game_schemas.GameResponse:
-    """Get game session by ID with guild membership and role verification."""
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """
+    Get game session by ID with guild membership and role verification.
+
+    The permission-independent response is served from the shared game
+    response cache and the per-user can_manage flag is applied on top.  The
+    body carries a strong ETag; a matching If-None-Match returns 304.
+    """
     game = await game_service.get_game(game_id)
 
     if game is None:
@@ -635,10 +641,15 @@ async def get_game(
     except HTTPException:
         can_manage = False
 
-    return await _build_game_response(
-        game,
-        can_manage=can_manage,
+    shared_response = await game_response_cache.get_or_build(
+        game, partial(_build_game_response, game)
     )
+    body = shared_response.model_copy(update={"can_manage": can_manage}).model_dump_json()
+    etag = game_response_cache.strong_etag(body.encode())
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if game_response_cache.etag_matches(if_none_match, etag):
+        return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.put("/{game_id}", response_model=game_schemas.GameResponse)
@@ -1197,4 +1208,5 @@ async def _build_game_response(
             )
             else game.status
         ),
+        version=game.version or 0,
     )
@@ -28,7 +28,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from starlette import status
 
 from services.api import dependencies
-from services.api.auth import oauth2
+from services.api.auth import oauth2, principal_cache
 from shared.cache import client as cache_client
 from shared.cache import keys as cache_keys
 from shared.cache import ttl as cache_ttl
@@ -62,6 +62,7 @@ async def toggle_maintainer_mode(
     if currently_enabled:
         session_data["is_maintainer"] = False
         await redis.set_json(session_key, session_data, ttl=cache_ttl.CacheTTL.SESSION)
+        await principal_cache.publish_invalidation(redis, [current_user.session_token])
         logger.info("Maintainer mode disabled for user %s", discord_id)
         return {"is_maintainer": False}
 
@@ -71,6 +72,7 @@ async def toggle_maintainer_mode(
 
     session_data["is_maintainer"] = True
     await redis.set_json(session_key, session_data, ttl=cache_ttl.CacheTTL.SESSION)
+    await principal_cache.publish_invalidation(redis, [current_user.session_token])
 
     logger.info("Maintainer mode enabled for user %s", discord_id)
     return {"is_maintainer": True}
@@ -95,13 +97,16 @@ async def refresh_maintainers(
         err_msg = "Maintainer mode required"
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=err_msg)
 
+    revoked: list[str] = []
     async for key in redis._client.scan_iter("api:session:*"):
         if key == session_key:
             continue
         data = await redis.get_json(key)
         if data and data.get("is_maintainer"):
             await redis.delete(key)
+            revoked.append(key.removeprefix("api:session:"))
             logger.info("Revoked elevated session %s", key)
+    await principal_cache.publish_invalidation(redis, revoked)
 
     await redis.delete(cache_keys.CacheKeys.app_info())
     logger.info("Flushed app_info cache; refresh initiated by %s", current_user.session_token)
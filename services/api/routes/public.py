@@ -23,10 +23,12 @@
 
 import logging
 from collections.abc import Callable
-from typing import Annotated
+from dataclasses import dataclass
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy import select
@@ -35,10 +37,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from services.api.auth import tokens
 from services.api.config import get_rate_limits
 from services.api.routes.export import generate_calendar_filename
-from services.api.services.calendar_export import CalendarExportService
+from services.api.services.calendar_export import (
+    CalendarExportService,
+    feed_etag,
+    feed_not_modified,
+)
+from services.api.services.game_response_cache import etag_matches
+from services.api.services.image_cache import CachedImage, get_image_cache
 from shared.database import get_bypass_db_session, get_db
 from shared.models.game import GameSession
-from shared.models.game_image import GameImage
+from shared.models.game_image import GameImage, GameImageVariant
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/public/images", tags=["public"])
@@ -60,6 +68,79 @@ def _apply_rate_limits(func: Callable) -> Callable:
     return func
 
 
+_IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+ImageSize = Literal["thumbnail", "banner"]
+
+
+def _parse_image_id(image_id_with_ext: str) -> UUID:
+    """Parse ``{uuid}`` or ``{uuid}.{ext}``, raising 404 for anything else."""
+    try:
+        return UUID(image_id_with_ext.split(".", maxsplit=1)[0])
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Image not found") from None
+
+
+def _image_headers(etag: str) -> dict[str, str]:
+    """
+    Return delivery headers for an image.
+
+    Image IDs are never reused for different bytes, so responses are
+    cacheable forever and the content hash serves as a strong ETag.
+    """
+    return {
+        "ETag": etag,
+        "Cache-Control": _IMAGE_CACHE_CONTROL,
+        "Access-Control-Allow-Origin": "*",
+    }
+
+
+@dataclass(frozen=True)
+class _ImageMetadata:
+    """What a response needs before deciding whether to read any bytes."""
+
+    etag: str
+    mime_type: str
+    variant: str | None
+
+
+async def _load_image_metadata(
+    db: AsyncSession, image_id: UUID, size: ImageSize | None
+) -> _ImageMetadata | None:
+    """
+    Resolve an image (or its size variant) without reading its bytes.
+
+    A requested size the image has no variant for falls back to the
+    original. Variants are only stored for images larger than their box,
+    at upload or by the 20261016_backfill_image_variants migration for
+    older images, so the original is then already within that size.
+    """
+    result = await db.execute(select(GameImage).where(GameImage.id == image_id))
+    image = result.scalar_one_or_none()
+    if image is None:
+        return None
+    if size is not None:
+        variant_mime = await db.scalar(
+            select(GameImageVariant.mime_type).where(
+                GameImageVariant.image_id == image_id, GameImageVariant.variant == size
+            )
+        )
+        if variant_mime is not None:
+            return _ImageMetadata(f'"{image.content_hash}-{size}"', variant_mime, size)
+    return _ImageMetadata(f'"{image.content_hash}"', image.mime_type, None)
+
+
+async def _load_image_bytes(db: AsyncSession, image_id: UUID, variant: str | None) -> bytes | None:
+    """Read the deferred bytes of an image or one of its variants."""
+    if variant is None:
+        stmt = select(GameImage.image_data).where(GameImage.id == image_id)
+    else:
+        stmt = select(GameImageVariant.image_data).where(
+            GameImageVariant.image_id == image_id, GameImageVariant.variant == variant
+        )
+    return await db.scalar(stmt)
+
+
 @router.get("/{image_id_with_ext}")
 @_apply_rate_limits
 async def get_image(
@@ -68,6 +149,10 @@ async def get_image(
         str, Path(description="UUID of the image, optionally with a file extension")
     ],
     db: Annotated[AsyncSession, Depends(get_db)],
+    if_none_match: Annotated[str | None, Header()] = None,
+    size: Annotated[
+        ImageSize | None, Query(description="Serve the pre-rendered display size")
+    ] = None,
 ) -> Response:
     """
     Serve image by ID without authentication.
@@ -76,47 +161,58 @@ async def get_image(
     external image references. Images are served from the game_images table
     which has no RLS policies.
 
+    Hot images are answered from the in-process image cache without touching
+    the database.  Otherwise the row's metadata is read first and the bytes
+    only when the client's If-None-Match does not already match.
+
     Args:
         image_id_with_ext: UUID of the image, optionally suffixed with a file extension
             (e.g. ``{uuid}.gif``) so Discord animates GIFs correctly
         db: Database session
+        if_none_match: ETag(s) the client already holds
+        size: Pre-rendered variant to serve; the original if the image has none
 
     Returns:
-        Image binary data with appropriate content-type and cache headers
+        Image binary data with an immutable ETag, or 304 when the ETag matches
 
     Raises:
         HTTPException: 404 if image not found
     """
+    image_id = _parse_image_id(image_id_with_ext)
     try:
-        image_id = UUID(image_id_with_ext.split(".")[0])
         logger.info("GET image request for %s from %s", image_id, get_remote_address(request))
 
-        stmt = select(GameImage).where(GameImage.id == image_id)
-        result = await db.execute(stmt)
-        image = result.scalar_one_or_none()
+        image_cache = get_image_cache()
+        cached = image_cache.get((image_id, size))
+        if cached is None:
+            metadata = await _load_image_metadata(db, image_id, size)
+            if not metadata:
+                logger.warning("Image %s not found", image_id)
+                raise HTTPException(status_code=404, detail="Image not found")
 
-        if not image:
-            logger.warning("Image %s not found", image_id)
-            raise HTTPException(status_code=404, detail="Image not found")
+            if etag_matches(if_none_match, metadata.etag):
+                return Response(status_code=304, headers=_image_headers(metadata.etag))
+
+            image_data = await _load_image_bytes(db, image_id, metadata.variant)
+            if image_data is None:
+                raise HTTPException(status_code=404, detail="Image not found")
+            cached = CachedImage(metadata.etag, metadata.mime_type, image_data)
+            image_cache.put((image_id, size), cached)
+
+        headers = _image_headers(cached.etag)
+        if etag_matches(if_none_match, cached.etag):
+            return Response(status_code=304, headers=headers)
 
         logger.debug(
-            "Serving image %s, mime_type=%s, size=%d",
+            "Serving image %s, size=%s, mime_type=%s, bytes=%d",
             image_id,
-            image.mime_type,
-            len(image.image_data),
-        )
-        return Response(
-            content=image.image_data,
-            media_type=image.mime_type,
-            headers={
-                "Cache-Control": "public, max-age=3600",
-                "Access-Control-Allow-Origin": "*",
-            },
+            size,
+            cached.mime_type,
+            len(cached.data),
         )
+        return Response(content=cached.data, media_type=cached.mime_type, headers=headers)
     except HTTPException:
         raise
-    except ValueError:
-        raise HTTPException(status_code=404, detail="Image not found") from None
     except Exception as e:
         logger.exception("Error serving image %s: %s", image_id_with_ext, e)
         raise
@@ -130,16 +226,21 @@ async def head_image(
         str, Path(description="UUID of the image, optionally with a file extension")
     ],
     db: Annotated[AsyncSession, Depends(get_db)],
+    size: Annotated[
+        ImageSize | None, Query(description="Serve the pre-rendered display size")
+    ] = None,
 ) -> Response:
     """
     Get image metadata without downloading the full image.
 
     Returns the same headers as GET but without the body, useful for
-    checking if an image exists and getting its content-type.
+    checking if an image exists and getting its content-type.  The image
+    bytes are never read from the database.
 
     Args:
         image_id_with_ext: UUID of the image, optionally suffixed with a file extension
         db: Database session
+        size: Pre-rendered variant to describe; the original if the image has none
 
     Returns:
         Headers only, no body
@@ -147,30 +248,68 @@ async def head_image(
     Raises:
         HTTPException: 404 if image not found
     """
-    try:
-        image_id = UUID(image_id_with_ext.split(".")[0])
-    except ValueError:
-        raise HTTPException(status_code=404, detail="Image not found") from None
-    stmt = select(GameImage).where(GameImage.id == image_id)
-    result = await db.execute(stmt)
-    image = result.scalar_one_or_none()
+    image_id = _parse_image_id(image_id_with_ext)
+    cached = get_image_cache().get((image_id, size))
+    if cached is not None:
+        etag, mime_type = cached.etag, cached.mime_type
+    else:
+        metadata = await _load_image_metadata(db, image_id, size)
+        if not metadata:
+            raise HTTPException(status_code=404, detail="Image not found")
+        etag, mime_type = metadata.etag, metadata.mime_type
 
-    if not image:
-        raise HTTPException(status_code=404, detail="Image not found")
-
-    return Response(
-        content=b"",
-        media_type=image.mime_type,
-        headers={
-            "Cache-Control": "public, max-age=3600",
-            "Access-Control-Allow-Origin": "*",
-        },
-    )
+    return Response(content=b"", media_type=mime_type, headers=_image_headers(etag))
 
 
 calendar_router = APIRouter(prefix="/api/v1/public/calendar", tags=["public"])
 
 
+@calendar_router.get("/feed/{token_with_ext}")
+@_apply_rate_limits
+async def get_calendar_feed(
+    request: Request,  # Required by slowapi for rate limiting  # noqa: ARG001
+    token_with_ext: Annotated[str, Path(description="Calendar feed token, optionally with .ics")],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """
+    Serve a user's subscribable multi-game .ics feed by signed token.
+
+    Lists the games the token's user hosts or joined, optionally limited to
+    one guild.  Every poll costs one query; the ETag derived from it answers
+    unchanged polls with 304, and otherwise the body is streamed from
+    per-game cached VEVENTs.  Uses a BYPASSRLS session for the same reason as
+    the single-game export route.
+
+    Args:
+        token_with_ext: Calendar feed token, optionally suffixed with ``.ics``
+        if_none_match: ETag(s) from the client's previous fetch
+
+    Returns:
+        Streamed iCal content, or 304 when the feed is unchanged
+
+    Raises:
+        HTTPException: 404 if the token is invalid
+    """
+    scope = tokens.verify_calendar_feed_token(token_with_ext.split(".")[0])
+    if scope is None:
+        raise HTTPException(status_code=404, detail="Calendar feed not found")
+    user_id, guild_id = scope
+
+    async with get_bypass_db_session() as db:
+        service = CalendarExportService(db)
+        games = await service.load_feed_games(user_id, guild_id)
+
+    etag = feed_etag(f"{user_id}:{guild_id}", games)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if feed_not_modified(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    headers["Content-Disposition"] = 'inline; filename="game-scheduler.ics"'
+    return StreamingResponse(
+        service.stream_calendar(games), media_type="text/calendar", headers=headers
+    )
+
+
 @calendar_router.get("/{token_with_ext}")
 @_apply_rate_limits
 async def get_calendar_export(
@@ -64,7 +64,8 @@ async def game_updates(
     queue: asyncio.Queue[str] = asyncio.Queue(maxsize=100)
 
     bridge = get_sse_bridge()
-    bridge.connections[client_id] = (
+    await bridge.register(
+        client_id,
         queue,
         current_user.session_token,
         current_user.user.discord_id,
@@ -82,9 +83,12 @@ async def game_updates(
                     )
                     yield f"data: {message}\n\n"
                 except TimeoutError:
+                    if client_id not in bridge.connections:
+                        # Session expired and the bridge dropped this client.
+                        return
                     yield 'data: {"type":"keepalive"}\n\n'
         finally:
-            bridge.connections.pop(client_id, None)
+            bridge.unregister(client_id)
             logger.info("SSE connection closed: %s", client_id)
 
     return StreamingResponse(
@@ -19,19 +19,33 @@
 # SOFTWARE.
 
 
-"""Calendar export service for generating iCal files."""
+"""
+Calendar export service for generating iCal files.
 
+Besides single-game exports, builds the subscribable multi-game feed of
+everything a user hosts or joined.  Each game's serialized VEVENT is cached
+in Redis tagged with the game's ``updated_at``, so a feed poll only renders
+the events that changed since the last one and streams the rest as stored.
+"""
+
+import hashlib
+import json
 import logging
-from collections.abc import Sequence
+import time
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime, timedelta
 
 from icalendar import Alarm, Calendar, Event
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from services.api.services.game_response_cache import etag_matches
 from shared.cache import projection as member_projection
-from shared.cache.client import get_redis_client
+from shared.cache.client import RedisClient, get_redis_client
+from shared.cache.keys import CacheKeys
+from shared.cache.operations import CacheOperation, record_cache_lookups
+from shared.cache.ttl import CacheTTL
 from shared.discord.client import (
     fetch_channel_name_safe,
     fetch_guild_name_safe,
@@ -39,9 +53,61 @@ from shared.discord.client import (
 from shared.models.channel import ChannelConfiguration
 from shared.models.game import GameSession
 from shared.models.participant import GameParticipant
+from shared.utils.limits import (
+    CALENDAR_FEED_BATCH_SIZE,
+    CALENDAR_FEED_LOOKBACK_DAYS,
+    CALENDAR_FEED_MAX_GAMES,
+)
 
 logger = logging.getLogger(__name__)
 
+_CALENDAR_END = b"END:VCALENDAR\r\n"
+
+
+def _new_calendar() -> Calendar:
+    """Return an empty VCALENDAR carrying the feed-level properties."""
+    cal = Calendar()
+    cal.add("prodid", "-//Game Scheduler//Discord Game Scheduler//EN")
+    cal.add("version", "2.0")
+    cal.add("calscale", "GREGORIAN")
+    cal.add("method", "PUBLISH")
+    cal.add("x-wr-calname", "Game Scheduler")
+    cal.add("x-wr-timezone", "UTC")
+    cal.add("x-wr-caldesc", "Game sessions from Discord Game Scheduler")
+    return cal
+
+
+def _member_display(member: dict | None) -> str | None:
+    if not member:
+        return None
+    return member.get("nick") or member.get("global_name") or member.get("username")
+
+
+def feed_etag(scope: str, games: Sequence[GameSession]) -> str:
+    """
+    Return a weak ETag for a calendar feed.
+
+    The tag covers the feed scope and each game's ID and ``updated_at``, so it
+    changes whenever a game in the feed changes, appears or drops out.
+    """
+    digest = hashlib.sha256(scope.encode())
+    for game in games:
+        digest.update(f"|{game.id}:{game.updated_at.isoformat()}".encode())
+    return f'W/"{digest.hexdigest()[:32]}"'
+
+
+def feed_not_modified(if_none_match: str | None, etag: str) -> bool:
+    """
+    Evaluate a feed poll's If-None-Match header against the feed ETag.
+
+    The feed deliberately carries no Last-Modified: joining or leaving a game
+    does not touch its ``updated_at``, so only the ETag, which covers the set
+    of game IDs, notices a feed gaining or losing a game.
+    """
+    if not if_none_match:
+        return False
+    return etag_matches(if_none_match, etag.removeprefix("W/"))
+
 
 class CalendarExportService:
     """Service for exporting game sessions to iCal format."""
@@ -103,6 +169,111 @@ class CalendarExportService:
 
         return await self._generate_calendar([game])
 
+    async def load_feed_games(self, user_id: str, guild_id: str | None = None) -> list[GameSession]:
+        """
+        Load the games that belong in a user's calendar feed.
+
+        Args:
+            user_id: User UUID whose hosted and joined games are included
+            guild_id: Guild configuration UUID to restrict the feed to (optional)
+
+        Returns:
+            Games scheduled within the lookback window, oldest first
+        """
+        joined = select(GameParticipant.game_session_id).where(GameParticipant.user_id == user_id)
+        since = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=CALENDAR_FEED_LOOKBACK_DAYS)
+        query = select(GameSession).where(
+            or_(GameSession.host_id == user_id, GameSession.id.in_(joined)),
+            GameSession.scheduled_at >= since,
+        )
+        if guild_id is not None:
+            query = query.where(GameSession.guild_id == guild_id)
+        query = (
+            query
+            .order_by(GameSession.scheduled_at, GameSession.id)
+            .limit(CALENDAR_FEED_MAX_GAMES)
+            .options(
+                selectinload(GameSession.guild),
+                selectinload(GameSession.channel).selectinload(ChannelConfiguration.guild),
+                selectinload(GameSession.host),
+            )
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def stream_calendar(self, games: Sequence[GameSession]) -> AsyncIterator[bytes]:
+        """
+        Stream a multi-game iCal feed.
+
+        Events are emitted in batches.  Each batch is looked up with one MGET;
+        a cached VEVENT is reused when its ``updated_at`` tag still matches the
+        game, and the rest are rendered (with host names from one bulk
+        projection read) and written back in one pipelined round-trip.
+
+        Args:
+            games: Games to include, in output order
+
+        Yields:
+            Chunks of iCal content
+        """
+        envelope = _new_calendar().to_ical()
+        yield envelope.removesuffix(_CALENDAR_END)
+
+        redis = await get_redis_client()
+        for offset in range(0, len(games), CALENDAR_FEED_BATCH_SIZE):
+            batch = games[offset : offset + CALENDAR_FEED_BATCH_SIZE]
+            tags = [game.updated_at.isoformat() for game in batch]
+
+            t0 = time.monotonic()
+            raw = await redis.mget([CacheKeys.calendar_event(game.id) for game in batch])
+            events: list[bytes | None] = [
+                _cached_event(value, tag) for value, tag in zip(raw, tags, strict=True)
+            ]
+            record_cache_lookups(CacheOperation.CALENDAR_EVENT, events, time.monotonic() - t0)
+
+            yield b"".join(await self._fill_stale_events(redis, batch, events))
+
+        yield _CALENDAR_END
+
+    async def _fill_stale_events(
+        self,
+        redis: RedisClient,
+        batch: Sequence[GameSession],
+        events: list[bytes | None],
+    ) -> list[bytes]:
+        """
+        Render the VEVENTs a batch lookup missed and write them back.
+
+        Args:
+            redis: Redis client used for the pipelined write-back
+            batch: Games in the batch, in output order
+            events: Cached VEVENT per game, None where missing or stale
+
+        Returns:
+            Serialized VEVENT per game, in output order
+        """
+        stale = [game for game, event in zip(batch, events, strict=True) if event is None]
+        host_displays = await self._resolve_host_displays(stale) if stale else {}
+        rendered: dict[str, str] = {}
+        for game in stale:
+            event = await self._create_event(game, host_displays.get(game.id))
+            rendered[game.id] = event.to_ical().decode()
+        if rendered:
+            await redis.set_many(
+                {
+                    CacheKeys.calendar_event(game.id): json.dumps({
+                        "updated_at": game.updated_at.isoformat(),
+                        "ical": rendered[game.id],
+                    })
+                    for game in stale
+                },
+                ttl=CacheTTL.CALENDAR_EVENT,
+            )
+        return [
+            event if event is not None else rendered[game.id].encode()
+            for game, event in zip(batch, events, strict=True)
+        ]
+
     async def _generate_calendar(self, games: Sequence[GameSession]) -> bytes:
         """
         Generate iCal calendar from game sessions.
@@ -113,37 +284,34 @@ class CalendarExportService:
         Returns:
             iCal file content as bytes
         """
-        cal = Calendar()
-        cal.add("prodid", "-//Game Scheduler//Discord Game Scheduler//EN")
-        cal.add("version", "2.0")
-        cal.add("calscale", "GREGORIAN")
-        cal.add("method", "PUBLISH")
-        cal.add("x-wr-calname", "Game Scheduler")
-        cal.add("x-wr-timezone", "UTC")
-        cal.add("x-wr-caldesc", "Game sessions from Discord Game Scheduler")
-
+        cal = _new_calendar()
+        host_displays = await self._resolve_host_displays(games)
         for game in games:
-            event = await self._create_event(game)
+            event = await self._create_event(game, host_displays.get(game.id))
             cal.add_component(event)
 
         return cal.to_ical()
 
-    async def _resolve_host_display(self, game: GameSession) -> str | None:
-        guild_id = game.guild.guild_id if game.guild else None
-        if not guild_id or not game.host:
-            return None
+    async def _resolve_host_displays(self, games: Sequence[GameSession]) -> dict[str, str | None]:
+        """Resolve every game's host display name with one bulk projection read."""
+        pairs = {
+            game.id: (game.guild.guild_id, game.host.discord_id)
+            for game in games
+            if game.guild and game.guild.guild_id and game.host
+        }
+        if not pairs:
+            return {}
         redis = await get_redis_client()
-        member = await member_projection.get_member(guild_id, game.host.discord_id, redis=redis)
-        if not member:
-            return None
-        return member.get("nick") or member.get("global_name") or member.get("username")
+        members = await member_projection.get_members(list(pairs.values()), redis=redis)
+        return {game_id: _member_display(members.get(pair)) for game_id, pair in pairs.items()}
 
-    async def _create_event(self, game: GameSession) -> Event:
+    async def _create_event(self, game: GameSession, host_display: str | None = None) -> Event:
         """
         Create iCal event from game session.
 
         Args:
             game: Game session to convert
+            host_display: Host's resolved display name, if known
 
         Returns:
             iCal Event component
@@ -169,7 +337,6 @@ class CalendarExportService:
         # Description with game details
         description_parts = []
         if game.host:
-            host_display = await self._resolve_host_display(game)
             host_name = f"@{host_display or game.host.discord_id}"
             description_parts.append(f"Host: {host_name}")
 
@@ -232,3 +399,17 @@ class CalendarExportService:
         alarm.add("description", "Game starting soon!")
         alarm.add("trigger", timedelta(minutes=-minutes_before))
         return alarm
+
+
+def _cached_event(raw: str | None, updated_at: str) -> bytes | None:
+    """Return a cached VEVENT if it was rendered from the game's current state."""
+    if raw is None:
+        return None
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict) or data.get("updated_at") != updated_at:
+        return None
+    ical = data.get("ical")
+    return ical.encode() if isinstance(ical, str) else None
@@ -26,13 +26,15 @@ Resolves Discord user IDs to guild-specific display names and avatar URLs
 with Redis caching.
 """
 
+import json
 import logging
+import time
 
 from shared.cache import client as cache_client
 from shared.cache import keys as cache_keys
-from shared.cache import projection as member_projection
 from shared.cache import ttl as cache_ttl
-from shared.cache.operations import CacheOperation, cache_get
+from shared.cache.member_record import decode_member_record
+from shared.cache.operations import CacheOperation, read_projection_keys, record_cache_lookups
 
 logger = logging.getLogger(__name__)
 
@@ -94,56 +96,68 @@ class DisplayNameResolver:
             return f"https://cdn.discordapp.com/avatars/{user_id}/{user_avatar}.png?size={size}"
         return None
 
-    async def _fetch_and_cache_display_names(
-        self, guild_id: str, uncached_ids: list[str]
-    ) -> dict[str, str]:
+    async def _read_cached_names_and_members(
+        self, guild_id: str, user_ids: list[str]
+    ) -> tuple[dict[str, str], dict[str, str | None]]:
         """
-        Fetch display names from Redis projection and cache them.
+        Read cached display names and projection member records in one MGET.
 
         Args:
             guild_id: Discord guild ID
-            uncached_ids: List of user IDs not found in cache
+            user_ids: User IDs to look up
 
         Returns:
-            Dictionary mapping user IDs to display names
+            Tuple of (cached names by user ID, raw member record or None by user
+            ID for every user without a cached name)
         """
-        result = {}
-        for user_id in uncached_ids:
-            member = await member_projection.get_member(guild_id, user_id, redis=self.cache)
-            if member is None:
-                result[user_id] = "Unknown User"
-                continue
-            display_name = self._resolve_display_name(member)
-            result[user_id] = display_name
-            cache_key = cache_keys.CacheKeys.display_name(user_id, guild_id)
-            await self.cache.set_json(cache_key, display_name, ttl=cache_ttl.CacheTTL.DISPLAY_NAME)
-        return result
+        name_keys = [cache_keys.CacheKeys.display_name(user_id, guild_id) for user_id in user_ids]
+        t0 = time.monotonic()
+        member_records, cached_values = await read_projection_keys(
+            self.cache,
+            cache_keys.CacheKeys.proj_member,
+            [(guild_id, user_id) for user_id in user_ids],
+            extra_keys=name_keys,
+        )
+        cached_names = [json.loads(value) if value else None for value in cached_values]
+        record_cache_lookups(CacheOperation.DISPLAY_NAME, cached_names, time.monotonic() - t0)
+
+        cached: dict[str, str] = {}
+        uncached: dict[str, str | None] = {}
+        for user_id, name, record in zip(user_ids, cached_names, member_records, strict=True):
+            if name:
+                cached[user_id] = name
+            else:
+                uncached[user_id] = record
+        return cached, uncached
 
-    async def _check_cache_for_display_names(
-        self, guild_id: str, user_ids: list[str]
-    ) -> tuple[dict[str, str], list[str]]:
+    async def _resolve_and_cache_display_names(
+        self, guild_id: str, member_records: dict[str, str | None]
+    ) -> dict[str, str]:
         """
-        Check cache for display names.
+        Resolve display names from projection member records and cache them.
+
+        All new names are written back in one pipelined round-trip.
 
         Args:
             guild_id: Discord guild ID
-            user_ids: List of user IDs to check
+            member_records: Raw projection member record (or None) by user ID
 
         Returns:
-            Tuple of (cached_results, uncached_ids)
+            Dictionary mapping user IDs to display names
         """
         result = {}
-        uncached_ids = []
-
-        for user_id in user_ids:
-            cache_key = cache_keys.CacheKeys.display_name(user_id, guild_id)
-            cached = await cache_get(cache_key, CacheOperation.DISPLAY_NAME)
-            if cached:
-                result[user_id] = cached
-            else:
-                uncached_ids.append(user_id)
-
-        return result, uncached_ids
+        to_cache = {}
+        for user_id, record in member_records.items():
+            if record is None:
+                result[user_id] = "Unknown User"
+                continue
+            display_name = self._resolve_display_name(decode_member_record(record, user_id))
+            result[user_id] = display_name
+            to_cache[cache_keys.CacheKeys.display_name(user_id, guild_id)] = json.dumps(
+                display_name
+            )
+        await self.cache.set_many(to_cache, ttl=cache_ttl.CacheTTL.DISPLAY_NAME)
+        return result
 
     def _create_fallback_display_names(self, uncached_ids: list[str]) -> dict[str, str]:
         """
@@ -161,8 +175,9 @@ class DisplayNameResolver:
         """
         Resolve Discord user IDs to display names for a guild.
 
-        Checks cache first, then fetches uncached IDs from the Redis projection.
-        Names are resolved using priority: nick > global_name > username.
+        Cached names and projection member records are read together in one
+        MGET; names resolved from the projection are cached with one pipelined
+        write.  Names are resolved using priority: nick > global_name > username.
 
         Args:
             guild_id: Discord guild (server) ID
@@ -171,43 +186,56 @@ class DisplayNameResolver:
         Returns:
             Dictionary mapping user IDs to display names
         """
-        result, uncached_ids = await self._check_cache_for_display_names(guild_id, user_ids)
+        if not user_ids:
+            return {}
 
-        if uncached_ids:
+        try:
+            result, member_records = await self._read_cached_names_and_members(guild_id, user_ids)
+        except Exception as e:
+            logger.error("Failed to read display names: %s", e)
+            return self._create_fallback_display_names(user_ids)
+
+        if member_records:
             try:
-                fetched_data = await self._fetch_and_cache_display_names(guild_id, uncached_ids)
+                fetched_data = await self._resolve_and_cache_display_names(guild_id, member_records)
                 result.update(fetched_data)
             except Exception as e:
                 logger.error("Failed to fetch display names: %s", e)
-                fallback_data = self._create_fallback_display_names(uncached_ids)
+                fallback_data = self._create_fallback_display_names(list(member_records))
                 result.update(fallback_data)
 
         return result
 
-    async def _fetch_and_cache_display_names_avatars(
+    async def _fetch_display_names_avatars(
         self,
         guild_id: str,
-        uncached_ids: list[str],
+        user_ids: list[str],
     ) -> dict[str, dict[str, str | None]]:
         """
-        Fetch display names and avatars from Redis projection and cache them.
+        Fetch display names and avatars from the Redis projection in one MGET.
 
         Args:
             guild_id: Discord guild ID
-            uncached_ids: User IDs not found in cache
+            user_ids: User IDs to resolve
 
         Returns:
             Dictionary mapping user IDs to display_name and avatar_url
         """
-        result = {}
-        for user_id in uncached_ids:
-            member = await member_projection.get_member(guild_id, user_id, redis=self.cache)
-            if member is None:
+        member_records, _ = await read_projection_keys(
+            self.cache,
+            cache_keys.CacheKeys.proj_member,
+            [(guild_id, user_id) for user_id in user_ids],
+        )
+        result: dict[str, dict[str, str | None]] = {}
+        for user_id, record in zip(user_ids, member_records, strict=True):
+            if record is None:
                 result[user_id] = {"display_name": "Unknown User", "avatar_url": None}
                 continue
-            display_name = self._resolve_display_name(member)
-            avatar_url = member.get("avatar_url")
-            result[user_id] = {"display_name": display_name, "avatar_url": avatar_url}
+            member = decode_member_record(record, user_id)
+            result[user_id] = {
+                "display_name": self._resolve_display_name(member),
+                "avatar_url": member.get("avatar_url"),
+            }
         return result
 
     @staticmethod
@@ -236,8 +264,8 @@ class DisplayNameResolver:
         """
         Resolve Discord user IDs to display names and avatar URLs.
 
-        Checks projection for each user. Names are resolved using priority:
-        nick > global_name > username. Avatar URLs come from the projection's
+        Reads every user's projection record in one MGET. Names are resolved
+        using priority: nick > global_name > username. Avatar URLs come from the projection's
         pre-computed avatar_url field.
 
         Args:
@@ -247,8 +275,11 @@ class DisplayNameResolver:
         Returns:
             Dictionary mapping user IDs to dicts with display_name and avatar_url
         """
+        if not user_ids:
+            return {}
+
         try:
-            result = await self._fetch_and_cache_display_names_avatars(guild_id, user_ids)
+            result = await self._fetch_display_names_avatars(guild_id, user_ids)
         except Exception as e:
             logger.error("Failed to fetch display names and avatars: %s", e)
             result = self._create_fallback_user_data(user_ids)
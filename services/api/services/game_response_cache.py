@@ -0,0 +1,128 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Shared cache for GET /api/v1/games/{game_id} responses.
+
+Holds the permission-independent GameResponse of each game (built with
+can_manage=False) under one key per game, tagged with the game's version
+and updated_at.  A lookup whose tag no longer matches the loaded game is a
+miss, so any committed change invalidates the entry even before the
+game_updated_sse notification deletes it.
+"""
+
+import hashlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from opentelemetry import metrics
+from pydantic import ValidationError
+
+from shared.cache import client as cache_client
+from shared.cache.keys import CacheKeys
+from shared.cache.operations import CacheOperation, record_cache_lookups
+from shared.cache.ttl import CacheTTL
+from shared.models.game import GameSession
+from shared.schemas.game import GameResponse
+
+logger = logging.getLogger(__name__)
+
+meter = metrics.get_meter(__name__)
+
+game_response_build_histogram = meter.create_histogram(
+    name="api.game_response.build.duration",
+    description="Time to build a GameResponse on a cache miss",
+    unit="s",
+)
+
+
+def response_version(game: GameSession) -> str:
+    """Return the cache tag for a game's current state."""
+    return f"{game.version or 0}:{game.updated_at.isoformat()}"
+
+
+async def get_or_build(
+    game: GameSession,
+    build: Callable[[], Awaitable[GameResponse]],
+) -> GameResponse:
+    """
+    Return the cached GameResponse for a game, building and storing it on a miss.
+
+    Args:
+        game: Game session as loaded for this request
+        build: Builds the permission-independent response for ``game``
+
+    Returns:
+        Shared GameResponse; callers apply per-user fields on a copy
+    """
+    key = CacheKeys.game_details(game.id)
+    version = response_version(game)
+    redis = await cache_client.get_redis_client()
+
+    t0 = time.monotonic()
+    cached = await redis.get_json(key)
+    hit: GameResponse | None = None
+    if isinstance(cached, dict) and cached.get("version") == version:
+        try:
+            hit = GameResponse.model_validate(cached["response"])
+        except (KeyError, ValidationError):
+            logger.warning("Discarding unreadable cached response for game %s", game.id)
+    record_cache_lookups(CacheOperation.GAME_RESPONSE, [hit], time.monotonic() - t0)
+    if hit is not None:
+        return hit
+
+    t0 = time.monotonic()
+    response = await build()
+    game_response_build_histogram.record(time.monotonic() - t0)
+
+    await redis.set_json(
+        key,
+        {"version": version, "response": response.model_dump(mode="json")},
+        ttl=CacheTTL.GAME_DETAILS,
+    )
+    return response
+
+
+async def invalidate(game_id: str) -> None:
+    """Drop the cached response for a game."""
+    redis = await cache_client.get_redis_client()
+    await redis.delete(CacheKeys.game_details(game_id))
+
+
+def strong_etag(body: bytes) -> str:
+    """Return a strong ETag for a response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against the current ETag.
+
+    Uses the weak comparison RFC 9110 specifies for If-None-Match, so a
+    ``W/`` prefix on a client-supplied tag is ignored.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
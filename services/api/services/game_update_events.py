@@ -0,0 +1,125 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Build the game_updated SSE event for a changed game.
+
+The event is built once per NOTIFY and shared by every subscriber, so it
+carries enough state (participants, counts, status and version) for
+dashboards to patch their copy of the game instead of refetching it.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from services.api.services import display_names as display_names_module
+from shared.database import get_bypass_db_session
+from shared.models.game import GameSession
+from shared.models.participant import GameParticipant
+from shared.schemas.game import GameUpdateEvent
+from shared.schemas.participant import ParticipantResponse
+from shared.utils import datetime_utils, participant_sorting
+
+
+async def _load_game(game_id: str) -> GameSession | None:
+    """Load a game with participants and their users using a BYPASSRLS session."""
+    async with get_bypass_db_session() as db:
+        result = await db.execute(
+            select(GameSession)
+            .options(selectinload(GameSession.participants).selectinload(GameParticipant.user))
+            .where(GameSession.id == game_id)
+        )
+        return result.scalar_one_or_none()
+
+
+def _participant_response(
+    participant: GameParticipant,
+    display_data_map: dict[str, dict[str, str | None]],
+) -> ParticipantResponse:
+    """Build a ParticipantResponse using resolved display data when available."""
+    discord_id = participant.user.discord_id if participant.user else None
+    display_name = participant.display_name
+    avatar_url = None
+    if discord_id and discord_id in display_data_map:
+        display_name = display_data_map[discord_id]["display_name"]
+        avatar_url = display_data_map[discord_id]["avatar_url"]
+
+    return ParticipantResponse(
+        id=participant.id,
+        game_session_id=participant.game_session_id,
+        user_id=participant.user_id,
+        discord_id=discord_id,
+        display_name=display_name,
+        avatar_url=avatar_url,
+        joined_at=datetime_utils.format_datetime_as_utc(participant.joined_at),
+        position_type=participant.position_type,
+        position=participant.position,
+    )
+
+
+async def build_game_update_event(
+    game_id: str,
+    guild_uuid: str,
+    discord_guild_id: str,
+    version: int | None,
+) -> GameUpdateEvent:
+    """
+    Build the game_updated event for one game change.
+
+    Games with player role restrictions, and games that no longer exist, get
+    an event without participant data so clients refetch through the
+    access-checked GET endpoint instead.
+
+    Args:
+        game_id: Game session ID from the NOTIFY payload
+        guild_uuid: Guild configuration ID from the NOTIFY payload
+        discord_guild_id: Discord snowflake of the guild, for display names
+        version: Game version from the NOTIFY payload
+
+    Returns:
+        Event to send to every subscriber of the guild
+    """
+    game = await _load_game(game_id)
+    if game is None or game.allowed_player_role_ids:
+        return GameUpdateEvent(game_id=game_id, guild_id=guild_uuid, version=version)
+
+    partitioned = participant_sorting.partition_participants(
+        game.participants, game.max_players, signup_method=game.signup_method
+    )
+    discord_ids = [p.user.discord_id for p in partitioned.all_sorted if p.user is not None]
+    display_data_map: dict[str, dict[str, str | None]] = {}
+    if discord_ids:
+        resolver = await display_names_module.get_display_name_resolver()
+        display_data_map = await resolver.resolve_display_names_and_avatars(
+            discord_guild_id, discord_ids
+        )
+
+    return GameUpdateEvent(
+        game_id=game_id,
+        guild_id=guild_uuid,
+        version=game.version,
+        updated_at=datetime_utils.format_datetime_as_utc(game.updated_at),
+        status=game.status,
+        max_players=game.max_players,
+        participant_count=len(partitioned.confirmed),
+        participants=[_participant_response(p, display_data_map) for p in partitioned.all_sorted],
+        confirmed_participant_ids=[p.id for p in partitioned.confirmed],
+    )
@@ -24,6 +24,8 @@
 Handles game CRUD operations, participant management, and event publishing.
 """
 
+import base64
+import binascii
 import datetime
 import json
 import logging
@@ -32,7 +34,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
-from sqlalchemy import func, text
+from sqlalchemy import ColumnElement, case, cast, func, literal, literal_column, text, tuple_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -44,6 +46,7 @@ from services.api.services import channel_resolver as channel_resolver_module
 from services.api.services import emoji_resolver as emoji_resolver_module
 from services.api.services import notification_schedule as notification_schedule_service
 from services.api.services import participant_resolver as resolver_module
+from shared.data_access.game_updates import notify_game_updated
 from shared.discord import client as discord_client_module
 from shared.models import channel as channel_model
 from shared.models import game as game_model
@@ -95,7 +98,7 @@ _FREE_TEXT_FIELD_LABELS = {
 
 # Sort rank for each status: lower rank sorts first.
 # SCHEDULED and IN_PROGRESS sort ascending by scheduled_at (soonest first);
-# COMPLETED and CANCELLED sort descending (most recently ended first).
+# COMPLETED, CANCELLED and ARCHIVED sort descending (most recently ended first).
 _STATUS_ORDER: dict[str, int] = {
     game_model.GameStatus.SCHEDULED.value: 0,
     game_model.GameStatus.IN_PROGRESS.value: 1,
@@ -103,20 +106,91 @@ _STATUS_ORDER: dict[str, int] = {
     game_model.GameStatus.CANCELLED.value: 3,
     game_model.GameStatus.ARCHIVED.value: 4,
 }
+_UNKNOWN_STATUS_RANK = 99
+_DESCENDING_STATUSES = (
+    game_model.GameStatus.COMPLETED.value,
+    game_model.GameStatus.CANCELLED.value,
+    game_model.GameStatus.ARCHIVED.value,
+)
+
+
+def _sql_literal(value: str | int) -> ColumnElement[Any]:
+    return literal_column(f"'{value}'" if isinstance(value, str) else str(value))
+
+
+# list_games ordering as SQL expressions: (rank, signed epoch of scheduled_at, id).
+# Constants are rendered inline rather than bound so the expressions match
+# ix_game_sessions_list_order and Postgres can walk that index for both the
+# ORDER BY and the keyset predicate.
+_LIST_SORT_RANK: ColumnElement[int] = case(
+    *(
+        (game_model.GameSession.status == _sql_literal(status), _sql_literal(rank))
+        for status, rank in _STATUS_ORDER.items()
+    ),
+    else_=_sql_literal(_UNKNOWN_STATUS_RANK),
+)
+_LIST_SORT_AT: ColumnElement[Any] = case(
+    (
+        game_model.GameSession.status.in_([
+            _sql_literal(status) for status in _DESCENDING_STATUSES
+        ]),
+        -func.extract("epoch", game_model.GameSession.scheduled_at),
+    ),
+    else_=func.extract("epoch", game_model.GameSession.scheduled_at),
+)
+
 
+@dataclass(frozen=True)
+class GameListCursor:
+    """Position of the last game on a list_games page."""
 
-def _game_sort_key(game: game_model.GameSession) -> tuple[int, float]:
-    rank = _STATUS_ORDER.get(game.status, 99)
-    ts = game.scheduled_at.timestamp() if game.scheduled_at else 0.0
-    # Negate timestamp for COMPLETED/CANCELLED so most recently ended sorts first.
-    descending_statuses = (
-        game_model.GameStatus.COMPLETED.value,
-        game_model.GameStatus.CANCELLED.value,
-        game_model.GameStatus.ARCHIVED.value,
-    )
-    if game.status in descending_statuses:
-        ts = -ts
-    return (rank, ts)
+    status: str
+    scheduled_at: datetime.datetime
+    game_id: str
+
+    @classmethod
+    def after(cls, game: game_model.GameSession) -> "GameListCursor":
+        """Cursor that continues the listing after ``game``."""
+        return cls(status=game.status, scheduled_at=game.scheduled_at, game_id=game.id)
+
+    def encode(self) -> str:
+        """Serialize to an opaque, URL-safe token."""
+        payload = json.dumps(
+            {"s": self.status, "t": self.scheduled_at.isoformat(), "id": self.game_id},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "GameListCursor":
+        """
+        Parse a token produced by encode.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return cls(
+                status=str(payload["s"]),
+                scheduled_at=datetime.datetime.fromisoformat(payload["t"]),
+                game_id=str(payload["id"]),
+            )
+        except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, ValueError) as e:
+            msg = "Invalid game list cursor"
+            raise ValueError(msg) from e
+
+    def where_after(self) -> ColumnElement[bool]:
+        """Keyset predicate selecting games that sort after this cursor."""
+        epoch = func.extract(
+            "epoch", cast(self.scheduled_at, game_model.GameSession.scheduled_at.type)
+        )
+        return tuple_(_LIST_SORT_RANK, _LIST_SORT_AT, game_model.GameSession.id) > tuple_(
+            literal(_STATUS_ORDER.get(self.status, _UNKNOWN_STATUS_RANK)),
+            -epoch if self.status in _DESCENDING_STATUSES else epoch,
+            literal(self.game_id),
+        )
 
 
 @dataclass
@@ -1138,10 +1212,17 @@ class GameService:
         user_id: str | None = None,
         limit: int = 25,
         offset: int = 0,
-    ) -> tuple[list[game_model.GameSession], int]:
+        cursor: GameListCursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[game_model.GameSession], int | None]:
         """
         List games with optional filters.
 
+        Games are ordered in SQL by status rank, then scheduled_at (ascending for
+        upcoming games, descending for finished ones), then id, so pages are
+        stable across requests.  Pass ``cursor`` (built from the last game of the
+        previous page) instead of ``offset`` to page without scanning skipped rows.
+
         Args:
             guild_id: Filter by guild UUID
             channel_id: Filter by channel UUID
@@ -1150,58 +1231,55 @@ class GameService:
                   "participant" returns only games where the user is a non-host participant
             user_id: DB UUID of the calling user; required when role is set
             limit: Maximum results (default 25)
-            offset: Results offset
+            offset: Results offset, ignored when ``cursor`` is given
+            cursor: Keyset position to continue after
+            include_total: Run the count query; when False the total is None
 
         Returns:
-            Tuple of (games list, total count)
-        """
-        query = select(game_model.GameSession).options(
-            selectinload(game_model.GameSession.host),
-            selectinload(game_model.GameSession.guild),
-            selectinload(game_model.GameSession.channel),
-            selectinload(game_model.GameSession.participants).selectinload(
-                participant_model.GameParticipant.user
-            ),
-        )
-
-        if guild_id:
-            query = query.where(game_model.GameSession.guild_id == guild_id)
-        if channel_id:
-            query = query.where(game_model.GameSession.channel_id == channel_id)
-        if status:
-            query = query.where(game_model.GameSession.status.in_(status))
-
-        # Get total count
-        count_query = select(func.count(game_model.GameSession.id))
+            Tuple of (games list, total count or None)
+        """
+        filters: list[ColumnElement[bool]] = []
         if guild_id:
-            count_query = count_query.where(game_model.GameSession.guild_id == guild_id)
+            filters.append(game_model.GameSession.guild_id == guild_id)
         if channel_id:
-            count_query = count_query.where(game_model.GameSession.channel_id == channel_id)
+            filters.append(game_model.GameSession.channel_id == channel_id)
         if status:
-            count_query = count_query.where(game_model.GameSession.status.in_(status))
-
+            filters.append(game_model.GameSession.status.in_(status))
         if role == "host" and user_id:
-            query = query.where(game_model.GameSession.host_id == user_id)
-            count_query = count_query.where(game_model.GameSession.host_id == user_id)
+            filters.append(game_model.GameSession.host_id == user_id)
         elif role == "participant" and user_id:
             participant_subquery = select(participant_model.GameParticipant.game_session_id).where(
                 participant_model.GameParticipant.user_id == user_id
             )
-            query = query.where(game_model.GameSession.id.in_(participant_subquery))
-            count_query = count_query.where(game_model.GameSession.id.in_(participant_subquery))
+            filters.append(game_model.GameSession.id.in_(participant_subquery))
 
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+        total = None
+        if include_total:
+            count_query = select(func.count(game_model.GameSession.id)).where(*filters)
+            total_result = await self.db.execute(count_query)
+            total = total_result.scalar() or 0
 
-        # Get paginated results
-        query = query.limit(limit).offset(offset)
-        result = await self.db.execute(query)
-        games = result.scalars().all()
-
-        if status:
-            games = [g for g in games if g.status in status]
+        query = (
+            select(game_model.GameSession)
+            .options(
+                selectinload(game_model.GameSession.host),
+                selectinload(game_model.GameSession.guild),
+                selectinload(game_model.GameSession.channel),
+                selectinload(game_model.GameSession.participants).selectinload(
+                    participant_model.GameParticipant.user
+                ),
+            )
+            .where(*filters)
+            .order_by(_LIST_SORT_RANK, _LIST_SORT_AT, game_model.GameSession.id)
+            .limit(limit)
+        )
+        if cursor is not None:
+            query = query.where(cursor.where_after())
+        elif offset:
+            query = query.offset(offset)
 
-        return sorted(games, key=_game_sort_key), total
+        result = await self.db.execute(query)
+        return list(result.scalars().all()), total
 
     def _update_simple_text_fields(
         self,
@@ -2208,24 +2286,12 @@ class GameService:
             )
             return existing_participant
 
-        # Verify guild and channel configuration exist before allowing the join
-        guild_result = await self.db.execute(
-            select(guild_model.GuildConfiguration).where(
-                guild_model.GuildConfiguration.id == game.guild_id
-            )
-        )
-        guild_config = guild_result.scalar_one_or_none()
-        if guild_config is None:
+        # get_game() already loaded the guild and channel configuration
+        if game.guild is None:
             msg = f"Guild configuration not found for ID: {game.guild_id}"
             raise ValueError(msg)
 
-        channel_result = await self.db.execute(
-            select(channel_model.ChannelConfiguration).where(
-                channel_model.ChannelConfiguration.id == game.channel_id
-            )
-        )
-        channel_config = channel_result.scalar_one_or_none()
-        if channel_config is None:
+        if game.channel is None:
             msg = f"Channel configuration not found for ID: {game.channel_id}"
             raise ValueError(msg)
 
@@ -2260,13 +2326,8 @@ class GameService:
             delay_seconds=60,
         )
 
-        # Reload game with relationships for event publishing
-        game = await self.get_game(game_id)
-        if game is None:
-            msg = "Failed to reload game after join"
-            raise ValueError(msg)
-
-        # Publish game.updated event
+        # Publishing only needs the game ID and channel, so the game loaded
+        # above is reused rather than reloaded with the new participant.
         await self._publish_game_updated(game)
 
         return participant
@@ -2366,11 +2427,7 @@ class GameService:
             )
         )
         await self.db.execute(stmt)
-
-        payload = json.dumps({"game_id": game.id, "guild_id": game.guild_id})
-        await self.db.execute(
-            text("SELECT pg_notify('game_updated_sse', :payload)").bindparams(payload=payload)
-        )
+        await notify_game_updated(self.db, game.id)
         logger.info("Queued message refresh and notified SSE for game %s", game.id)
 
     async def _publish_player_removed(
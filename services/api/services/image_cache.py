@@ -0,0 +1,134 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+In-process LRU cache for public image bytes.
+
+Discord's embed proxy re-fetches banners and thumbnails often, and each
+miss on the public image route costs a bytea read from Postgres.  An image
+row's bytes never change for its ID (new content gets a new row), so hot
+images are kept in memory, bounded by total size, and only re-read once an
+entry is evicted or reaches its maximum age.  The age limit bounds how long
+a released image keeps being served from memory after its row is deleted.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from opentelemetry import metrics
+
+from services.api.config import get_api_config
+
+meter = metrics.get_meter(__name__)
+
+image_cache_lookup_counter = meter.create_counter(
+    name="api.image_cache.lookups",
+    description="Public image cache lookups, by result",
+    unit="1",
+)
+
+_MAX_AGE_SECONDS = 3600
+_MAX_ENTRY_FRACTION = 8
+
+ImageKey = tuple[UUID, str | None]
+
+
+@dataclass(frozen=True)
+class CachedImage:
+    """Bytes and delivery metadata of one stored image."""
+
+    etag: str
+    mime_type: str
+    data: bytes
+
+
+class ImageCache:
+    """
+    Least-recently-used image store bounded by the total bytes held.
+
+    Entries are keyed by image ID and requested size (None for the original).
+    """
+
+    def __init__(self, max_bytes: int, max_age_seconds: float = _MAX_AGE_SECONDS) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Upper bound on the summed size of cached images; 0 disables
+                the cache.  A single image larger than an eighth of this is
+                never cached so one upload cannot flush everything else.
+            max_age_seconds: Age after which an entry is re-read from the database
+        """
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._entries: OrderedDict[ImageKey, tuple[float, CachedImage]] = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Summed size in bytes of the images currently held."""
+        return self._size
+
+    def get(self, key: ImageKey) -> CachedImage | None:
+        """Return a cached image and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] > self.max_age_seconds:
+            self._remove(key)
+            entry = None
+        image_cache_lookup_counter.add(1, {"result": "miss" if entry is None else "hit"})
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: ImageKey, image: CachedImage) -> None:
+        """Store an image, evicting least recently used entries to fit."""
+        if len(image.data) > self.max_bytes // _MAX_ENTRY_FRACTION:
+            return
+        self._remove(key)
+        self._entries[key] = (time.monotonic(), image)
+        self._size += len(image.data)
+        while self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: ImageKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1].data)
+
+
+_image_cache: ImageCache | None = None
+
+
+def get_image_cache() -> ImageCache:
+    """Get or create the process-wide image cache."""
+    global _image_cache  # noqa: PLW0603
+    if _image_cache is None:
+        _image_cache = ImageCache(get_api_config().image_cache_max_bytes)
+    return _image_cache
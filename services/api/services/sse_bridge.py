@@ -24,26 +24,46 @@ SSE bridge service for real-time game updates.
 
 Listens for game_updated_sse notifications via asyncpg and broadcasts them to
 authorized SSE connections with server-side guild filtering.
+
+Connections are indexed by Discord guild ID when they register, so a
+broadcast only touches clients that belong to the event's guild.  Session
+validity and guild memberships are re-checked for all connections on a
+timer rather than per event.
 """
 
 import asyncio
+import contextlib
 import json
 import logging
+from dataclasses import dataclass, field
 
 import asyncpg
 from sqlalchemy import select
 
 from services.api.auth import tokens
 from services.api.config import get_api_config
+from services.api.services import game_response_cache
+from services.api.services.game_update_events import build_game_update_event
 from shared.cache import client as cache_client
 from shared.cache import projection as member_projection
 from shared.database import get_bypass_db_session
 from shared.models.guild import GuildConfiguration
 from shared.pg_listen import listen_with_reconnect
+from shared.schemas.game import GameUpdateEvent
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SSEConnection:
+    """One open SSE stream and the Discord guilds it receives events for."""
+
+    queue: asyncio.Queue
+    session_token: str
+    discord_id: str
+    guild_ids: frozenset[str] = field(default_factory=frozenset)
+
+
 class SSEGameUpdateBridge:
     """
     Bridges PostgreSQL NOTIFY game events to SSE connections.
@@ -54,11 +74,14 @@ class SSEGameUpdateBridge:
 
     def __init__(self, db_url: str) -> None:
         """Initialize SSE bridge with empty connection registry."""
-        self.connections: dict[str, tuple[asyncio.Queue, str, str]] = {}
+        self.connections: dict[str, SSEConnection] = {}
+        self._clients_by_guild: dict[str, set[str]] = {}
+        self._guild_snowflakes: dict[str, str] = {}
         self._db_url = db_url
         self._conn: asyncpg.Connection | None = None
         self._active_broadcasts: set[asyncio.Task] = set()
         self.keepalive_interval_seconds: int = 30
+        self.membership_refresh_interval_seconds: int = 60
 
     def set_keepalive_interval(self, seconds: int) -> None:
         """
@@ -72,15 +95,124 @@ class SSEGameUpdateBridge:
             raise ValueError(msg)
         self.keepalive_interval_seconds = seconds
 
+    async def register(
+        self,
+        client_id: str,
+        queue: asyncio.Queue,
+        session_token: str,
+        discord_id: str,
+    ) -> None:
+        """
+        Add an SSE connection and index it under the user's guilds.
+
+        Args:
+            client_id: Unique identifier for the connection
+            queue: Queue the SSE stream reads messages from
+            session_token: Session token the connection was opened with
+            discord_id: Discord user ID of the connected user
+        """
+        self.connections[client_id] = SSEConnection(queue, session_token, discord_id)
+        try:
+            guilds = await self._load_user_guilds([discord_id])
+        except Exception as e:
+            logger.warning("Failed to load guilds for SSE client %s: %s", client_id, e)
+            return
+        self._set_guilds(client_id, guilds[discord_id])
+
+    def unregister(self, client_id: str) -> None:
+        """Remove an SSE connection and drop it from the guild index."""
+        connection = self.connections.pop(client_id, None)
+        if connection is not None:
+            self._unindex(client_id, connection.guild_ids)
+
+    def clients_for_guild(self, discord_guild_id: str) -> frozenset[str]:
+        """Return the client IDs currently indexed under a Discord guild."""
+        return frozenset(self._clients_by_guild.get(discord_guild_id, ()))
+
+    def _set_guilds(self, client_id: str, guild_ids: frozenset[str]) -> None:
+        """Replace a connection's guild set, updating the index by difference."""
+        connection = self.connections.get(client_id)
+        if connection is None:
+            return
+        self._unindex(client_id, connection.guild_ids - guild_ids)
+        for guild_id in guild_ids - connection.guild_ids:
+            self._clients_by_guild.setdefault(guild_id, set()).add(client_id)
+        connection.guild_ids = guild_ids
+
+    def _unindex(self, client_id: str, guild_ids: frozenset[str]) -> None:
+        """Remove a client from the index entries of the given guilds."""
+        for guild_id in guild_ids:
+            clients = self._clients_by_guild.get(guild_id)
+            if clients is None:
+                continue
+            clients.discard(client_id)
+            if not clients:
+                del self._clients_by_guild[guild_id]
+
+    async def _load_user_guilds(self, discord_ids: list[str]) -> dict[str, frozenset[str]]:
+        """Read guild memberships for many users from the projection in one MGET."""
+        redis = await cache_client.get_redis_client()
+        guilds = await member_projection.get_users_guilds(discord_ids, redis=redis)
+        return {uid: frozenset(guild_ids or ()) for uid, guild_ids in guilds.items()}
+
+    async def _session_is_valid(self, session_token: str) -> bool:
+        """Return False only when the session is known to be gone."""
+        try:
+            return bool(await tokens.get_session(session_token))
+        except Exception as e:
+            logger.warning("Failed to validate SSE session: %s", e)
+            return True
+
+    async def refresh_connections(self) -> None:
+        """
+        Drop connections with expired sessions and re-read guild memberships.
+
+        Each distinct session is validated once, and the guild lists of all
+        remaining users are fetched with a single projection MGET.
+        """
+        snapshot = dict(self.connections)
+        if not snapshot:
+            return
+
+        session_tokens = list({c.session_token for c in snapshot.values()})
+        results = await asyncio.gather(*(self._session_is_valid(t) for t in session_tokens))
+        valid = dict(zip(session_tokens, results, strict=True))
+        for client_id, connection in snapshot.items():
+            if not valid[connection.session_token]:
+                logger.info("SSE session expired, removing client %s", client_id)
+                self.unregister(client_id)
+
+        live = {cid: c for cid, c in snapshot.items() if cid in self.connections}
+        if not live:
+            return
+        guilds = await self._load_user_guilds([c.discord_id for c in live.values()])
+        for client_id, connection in live.items():
+            self._set_guilds(client_id, guilds[connection.discord_id])
+
+    async def _refresh_periodically(self) -> None:
+        """Run refresh_connections() every membership_refresh_interval_seconds."""
+        while True:
+            await asyncio.sleep(self.membership_refresh_interval_seconds)
+            try:
+                await self.refresh_connections()
+            except Exception:
+                logger.exception("SSE connection refresh failed")
+
     async def start_consuming(self) -> None:
         """Maintain the LISTEN connection, reconnecting automatically on loss."""
-        await listen_with_reconnect(
-            self._db_url,
-            "game_updated_sse",
-            self._on_notify,
-            on_connected=self._set_conn,
-            on_disconnected=self._clear_conn,
-        )
+        refresh_task = asyncio.create_task(self._refresh_periodically())
+        try:
+            await listen_with_reconnect(
+                self._db_url,
+                "game_updated_sse",
+                self._on_notify,
+                on_connected=self._set_conn,
+                on_disconnected=self._clear_conn,
+            )
+        finally:
+            refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await refresh_task
 
     def _set_conn(self, conn: asyncpg.Connection) -> None:
         """Track the live connection so stop_consuming() can close it on demand."""
@@ -116,106 +248,89 @@ class SSEGameUpdateBridge:
         self._active_broadcasts.add(task)
         task.add_done_callback(self._active_broadcasts.discard)
 
-    async def _send_to_connection(
-        self,
-        client_id: str,
-        queue: asyncio.Queue,
-        session_token: str,
-        discord_id: str,
-        discord_guild_id: str,
-        message: str,
-    ) -> bool:
+    async def _discord_guild_id(self, guild_uuid: str) -> str | None:
         """
-        Evaluate guild membership and enqueue event for one SSE connection.
+        Map a guild configuration UUID to its Discord snowflake.
 
-        Returns True if the client's session is invalid and should be removed.
+        The mapping never changes for a row, so hits are served from memory and
+        only the first event for a guild queries the database.
         """
-        try:
-            token_data = await tokens.get_user_tokens(session_token)
-            if not token_data:
-                return True
-            redis = await cache_client.get_redis_client()
-            guild_ids = await member_projection.get_user_guilds(discord_id, redis=redis)
-            user_guild_ids = set(guild_ids) if guild_ids else set()
-
-            logger.info(
-                "Guild check: discord_guild_id=%s (type=%s), user has %d guilds, match=%s",
-                discord_guild_id,
-                type(discord_guild_id).__name__,
-                len(user_guild_ids),
-                discord_guild_id in user_guild_ids,
+        cached = self._guild_snowflakes.get(guild_uuid)
+        if cached is not None:
+            return cached
+
+        async with get_bypass_db_session() as db:
+            guild_result = await db.execute(
+                select(GuildConfiguration.guild_id).where(GuildConfiguration.id == guild_uuid)
             )
+            discord_guild_id = guild_result.scalar_one_or_none()
 
-            if discord_guild_id in user_guild_ids:
-                try:
-                    queue.put_nowait(message)
-                    logger.info("Sent game update to client %s", client_id)
-                except asyncio.QueueFull:
-                    logger.warning("Queue full for client %s, dropping event", client_id)
-            else:
-                logger.debug("Client %s not in guild %s, skipping", client_id, discord_guild_id)
+        if discord_guild_id:
+            self._guild_snowflakes[guild_uuid] = discord_guild_id
+        return discord_guild_id
 
+    async def _invalidate_cached_response(self, game_id: str) -> None:
+        """Delete the shared GameResponse cache entry for a changed game."""
+        try:
+            await game_response_cache.invalidate(game_id)
         except Exception as e:
-            logger.warning("Failed to check guild membership for client %s: %s", client_id, e)
-
-        return False
+            logger.warning("Failed to invalidate cached response for game %s: %s", game_id, e)
 
     async def _broadcast_to_clients(self, data: dict) -> None:
         """
         Broadcast game update to authorized SSE connections.
 
-        Checks each connection's guild membership via cached get_user_guilds()
-        and only sends events to users who are members of the event's guild.
+        Only the connections indexed under the event's guild are visited, so
+        the cost scales with interested clients rather than open connections.
+        The event payload is built once and shared by all of them.  The
+        game's cached GET response is dropped first, whether or not anyone is
+        subscribed.
 
         Args:
             data: Parsed pg_notify payload with game_id and guild_id (UUID).
         """
-        logger.info("SSE bridge received event: %s", data)
+        if data.get("game_id"):
+            await self._invalidate_cached_response(str(data["game_id"]))
 
         guild_uuid = data.get("guild_id")
         if not guild_uuid:
             logger.warning("Game update event missing guild_id: %s", data.get("game_id"))
             return
 
-        # Look up Discord snowflake ID from UUID using BYPASSRLS session
-        async with get_bypass_db_session() as db:
-            guild_result = await db.execute(
-                select(GuildConfiguration.guild_id).where(GuildConfiguration.id == guild_uuid)
-            )
-            discord_guild_id = guild_result.scalar_one_or_none()
-
+        discord_guild_id = await self._discord_guild_id(guild_uuid)
         if not discord_guild_id:
             logger.warning("Guild UUID not found in database: %s", guild_uuid)
             return
 
-        game_id = data.get("game_id")
-        message = json.dumps({
-            "type": "game_updated",
-            "game_id": str(game_id),
-            "guild_id": guild_uuid,
-        })
-
-        logger.info(
-            (
-                "Broadcasting game update to %d connections: "
-                "game=%s, guild_uuid=%s, discord_guild_id=%s"
-            ),
+        client_ids = self.clients_for_guild(discord_guild_id)
+        if not client_ids:
+            return
+
+        game_id = str(data.get("game_id"))
+        version = data.get("version")
+        try:
+            event = await build_game_update_event(game_id, guild_uuid, discord_guild_id, version)
+        except Exception as e:
+            logger.warning("Failed to build game update delta for game %s: %s", game_id, e)
+            event = GameUpdateEvent(game_id=game_id, guild_id=guild_uuid, version=version)
+        message = event.model_dump_json(exclude_none=True)
+
+        logger.debug(
+            "Broadcasting game update to %d of %d connections: game=%s, guild=%s",
+            len(client_ids),
             len(self.connections),
             game_id,
-            guild_uuid,
             discord_guild_id,
         )
 
-        disconnected_clients: list[str] = []
-
-        for client_id, (queue, session_token, discord_id) in list(self.connections.items()):
-            if await self._send_to_connection(
-                client_id, queue, session_token, discord_id, discord_guild_id, message
-            ):
-                disconnected_clients.append(client_id)
-
-        for client_id in disconnected_clients:
-            self.connections.pop(client_id, None)
+        for client_id in client_ids:
+            connection = self.connections.get(client_id)
+            if connection is None:
+                continue
+            try:
+                connection.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning("Queue full for client %s, dropping event", client_id)
 
 
 _sse_bridge: SSEGameUpdateBridge | None = None
@@ -37,7 +37,7 @@ from sqlalchemy.orm import selectinload
 from shared.database import get_db_session
 from shared.models import participant as participant_model
 from shared.models.game import GameSession
-from shared.pg_listen import listen_with_reconnect
+from shared.pg_listen import NotificationHub, listen_with_reconnect
 from shared.services.game_metrics import record_game_posted
 from shared.services.game_schedules import setup_game_schedules
 from shared.utils.status_transitions import GameStatus
@@ -55,16 +55,19 @@ logger = logging.getLogger(__name__)
 class AnnouncementLoop:
     """Polls for deferred game announcements and posts them when their post_at time arrives.
 
-    Maintains a dedicated asyncpg connection listening for
-    ``game_announcement_changed`` notifications from Postgres to wake up early
-    when a game's ``post_at`` changes.
+    Listens for ``game_announcement_changed`` notifications from Postgres to
+    wake up early when a game's ``post_at`` changes, either on the shared
+    ``hub`` connection or, without one, on a dedicated asyncpg connection.
     """
 
     MAX_TIMEOUT = 3600
 
-    def __init__(self, db_url: str, bot: GameSchedulerBot) -> None:
+    def __init__(
+        self, db_url: str, bot: GameSchedulerBot, hub: NotificationHub | None = None
+    ) -> None:
         self._db_url = db_url
         self._bot = bot
+        self._hub = hub
         self._wake_event = asyncio.Event()
 
     async def start(self) -> None:
@@ -75,6 +78,14 @@ class AnnouncementLoop:
         only depends on the _wake_event set by _on_notify, not on the
         connection object itself.
         """
+        if self._hub is not None:
+            await self._hub.subscribe(
+                "game_announcement_changed",
+                self._on_notify,
+                on_connected=lambda _conn: self._wake_event.set(),
+            )
+            await self._run_loop()
+            return
         async with asyncio.TaskGroup() as tg:
             tg.create_task(
                 listen_with_reconnect(self._db_url, "game_announcement_changed", self._on_notify)
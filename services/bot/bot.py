@@ -23,6 +23,7 @@
 
 import asyncio
 import contextlib
+import json
 import logging
 import os
 import time
@@ -30,6 +31,7 @@ from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 import aiohttp.web
 import discord
@@ -45,6 +47,8 @@ from services.bot.config import BotConfig
 from services.bot.guild_sync import sync_guilds_from_gateway, sync_single_guild_from_gateway
 from services.bot.message_refresh_listener import MessageRefreshListener
 from services.bot.scheduler_loop import SchedulerLoop
+from services.bot.write_batcher import GatewayWriteBatcher
+from shared.cache import l1
 from shared.cache.client import RedisClient, get_redis_client
 from shared.cache.keys import CacheKeys
 from shared.cache.ttl import CacheTTL
@@ -56,6 +60,7 @@ from shared.models.game_status_schedule import GameStatusSchedule
 from shared.models.message_refresh_queue import MessageRefreshQueue
 from shared.models.notification_schedule import NotificationSchedule
 from shared.models.participant_action_schedule import ParticipantActionSchedule
+from shared.pg_listen import NotificationHub
 from shared.services.event_builders import build_notification_event, build_status_transition_event
 from shared.services.game_cancellation import cancel_game
 from shared.services.game_metrics import record_game_cancelled
@@ -96,6 +101,42 @@ sweep_duration_histogram = meter.create_histogram(
     description="Duration of completed embed deletion sweeps in seconds",
     unit="s",
 )
+sweep_skipped_counter = meter.create_counter(
+    name="bot.sweep.skipped",
+    description="Number of sweeps skipped because the resumed outage was short",
+    unit="1",
+)
+sweep_api_calls_counter = meter.create_counter(
+    name="bot.sweep.api_calls",
+    description="Discord REST calls made by sweeps, labeled by mode ('history' or 'fetch')",
+    unit="1",
+)
+sweep_calls_saved_histogram = meter.create_histogram(
+    name="bot.sweep.calls_saved",
+    description=(
+        "Per sweep, fetch_message calls avoided by paging channel history "
+        "(games resolved by history minus history pages read)"
+    ),
+    unit="1",
+)
+orphan_sweep_channels_counter = meter.create_counter(
+    name="bot.orphan_sweep.channels",
+    description=(
+        "Channels handled by the post-restore orphaned-embed sweep, labeled by status "
+        "('completed', 'resumed' or 'already_done')"
+    ),
+    unit="1",
+)
+orphan_sweep_messages_counter = meter.create_counter(
+    name="bot.orphan_sweep.messages_checked",
+    description="Bot game embeds checked against the database by the orphaned-embed sweep",
+    unit="1",
+)
+orphan_sweep_deleted_counter = meter.create_counter(
+    name="bot.orphan_sweep.deleted",
+    description="Orphaned embeds deleted, labeled by mode ('bulk' or 'single')",
+    unit="1",
+)
 gateway_disconnect_counter = meter.create_counter(
     name="bot.gateway.disconnect",
     description="Number of times the bot's Gateway connection was interrupted",
@@ -111,6 +152,17 @@ gateway_reconnect_duration_histogram = meter.create_histogram(
 )
 
 
+# Discord returns at most this many messages per channel history request
+SWEEP_HISTORY_PAGE_SIZE = 100
+SWEEP_MAX_WORKERS = 60
+# Discord rejects bulk deletes of messages older than 14 days; keep a margin
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(hours=1)
+ORPHAN_SWEEP_DONE = "done"
+
+# Sweep queue entry: scheduled_at, game_id, channel_id and message_id of one game
+type SweepItem = tuple[datetime, str, str, str]
+
+
 # Forward declarations to avoid circular imports
 if False:  # TYPE_CHECKING equivalent
     pass
@@ -139,6 +191,9 @@ class GameSchedulerBot(commands.Bot):
         self.api_cache = None
         self._sweep_task: asyncio.Task[None] | None = None
         self._disconnected_at: float | None = None
+        self._projection_ready = False
+        self._projection_gen: str | None = None
+        self._writes = GatewayWriteBatcher()
 
         intents = discord.Intents(
             guilds=True, guild_messages=True, members=True, emojis_and_stickers=True
@@ -223,76 +278,15 @@ class GameSchedulerBot(commands.Bot):
             await self._sweep_orphaned_embeds()
             await self._restore_recurrence_confirmation_views()
 
-            if not hasattr(self, "_refresh_listener_started"):
-                self._refresh_listener_started = True
-                self._refresh_listener_task = asyncio.create_task(
-                    MessageRefreshListener(
-                        self.config.database_url,
-                        self._spawn_channel_worker,
-                    ).start()
-                )
-                logger.info("Started message refresh listener task")
-
-            if not hasattr(self, "_action_listener_started"):
-                self._action_listener_started = True
-                self._action_listener_task = asyncio.create_task(
-                    BotActionListener(
-                        self.config.database_url,
-                        self.event_handlers,
-                    ).start()
-                )
-                logger.info("Started bot action listener task")
-
-            if not hasattr(self, "_announcement_loop_started"):
-                self._announcement_loop_started = True
-                self._announcement_loop_task = asyncio.create_task(
-                    AnnouncementLoop(self.config.database_url, self).start()
-                )
-                logger.info("Started announcement loop task")
-
-            if not hasattr(self, "_scheduler_loops_started"):
-                self._scheduler_loops_started = True
-                self._notification_scheduler_task = asyncio.create_task(
-                    SchedulerLoop(
-                        db_url=self.config.database_url,
-                        notify_channel="notification_schedule_changed",
-                        model_class=NotificationSchedule,
-                        time_field="notification_time",
-                        status_field="sent",
-                        event_builder=build_notification_event,
-                    ).run()
-                )
-                self._game_status_scheduler_task = asyncio.create_task(
-                    SchedulerLoop(
-                        db_url=self.config.database_url,
-                        notify_channel="game_status_schedule_changed",
-                        model_class=GameStatusSchedule,
-                        time_field="transition_time",
-                        status_field="executed",
-                        event_builder=build_status_transition_event,
-                    ).run()
-                )
-                self._participant_action_scheduler_task = asyncio.create_task(
-                    SchedulerLoop(
-                        db_url=self.config.database_url,
-                        notify_channel="participant_action_schedule_changed",
-                        model_class=ParticipantActionSchedule,
-                        time_field="action_time",
-                        status_field="processed",
-                        event_builder=build_participant_action_event,
-                    ).run()
-                )
-                logger.info("Started scheduler loop tasks")
+            self._start_background_tasks()
 
             # Populate member projection from gateway
 
             redis = await get_redis_client()
             logger.info("Repopulation triggered: reason=on_ready")
             guild_projection.repopulation_started_counter.add(1, {"reason": "on_ready"})
-            await guild_projection.repopulate_all(
-                bot=self,
-                redis=redis,
-            )
+            await self._repopulate_projection(redis)
+            self._projection_ready = True
 
             Path("/tmp/bot-ready").touch()  # noqa: S108, ASYNC240, RUF100
             logger.info("Bot marked as healthy")
@@ -347,50 +341,56 @@ class GameSchedulerBot(commands.Bot):
         """Populate Redis from the in-memory gateway cache after a full reconnect.
 
         Writes guild, channel, and role data without any REST calls so the cache
-        is consistent immediately after on_ready fires.
+        is consistent immediately after on_ready fires, then tells other processes
+        to drop their in-process copies.  Each guild's keys go out in one
+        pipeline, and any handler writes still buffered are flushed first so
+        they cannot land on top of the rebuilt state.
         """
+        await self._writes.flush()
         redis = await get_redis_client()
         total_channels = 0
         total_roles = 0
         for guild in self.guilds:
             guild_id = str(guild.id)
-
-            await redis.set_json(
-                CacheKeys.discord_guild(guild_id),
-                {"id": guild_id, "name": guild.name, "owner_id": str(guild.owner_id)},
-                CacheTTL.DISCORD_GUILD,
-            )
-
             postable = self._postable_channels(guild)
             channels = self._channel_list(postable)
-            await redis.set_json(
-                CacheKeys.discord_guild_channels(guild_id),
-                channels,
-                CacheTTL.DISCORD_GUILD_CHANNELS,
-            )
-
-            for channel in postable:
-                await redis.set_json(
-                    CacheKeys.discord_channel(str(channel.id)),
-                    {"name": channel.name},
-                    CacheTTL.DISCORD_CHANNEL,
-                )
-
             roles = self._role_list(guild.roles)
-            await redis.set_json(
-                CacheKeys.discord_guild_roles(guild_id),
-                roles,
-                CacheTTL.DISCORD_GUILD_ROLES,
-            )
-
             emojis = [
                 {"id": str(e.id), "name": e.name, "animated": e.animated} for e in guild.emojis
             ]
-            await redis.set_json(
-                CacheKeys.discord_guild_emojis(guild_id),
-                emojis,
-                CacheTTL.DISCORD_GUILD_EMOJIS,
-            )
+
+            async with redis._client.pipeline(transaction=False) as pipe:
+                pipe.set(
+                    CacheKeys.discord_guild(guild_id),
+                    json.dumps({
+                        "id": guild_id,
+                        "name": guild.name,
+                        "owner_id": str(guild.owner_id),
+                    }),
+                    ex=CacheTTL.DISCORD_GUILD,
+                )
+                pipe.set(
+                    CacheKeys.discord_guild_channels(guild_id),
+                    json.dumps(channels),
+                    ex=CacheTTL.DISCORD_GUILD_CHANNELS,
+                )
+                for channel in postable:
+                    pipe.set(
+                        CacheKeys.discord_channel(str(channel.id)),
+                        json.dumps({"name": channel.name}),
+                        ex=CacheTTL.DISCORD_CHANNEL,
+                    )
+                pipe.set(
+                    CacheKeys.discord_guild_roles(guild_id),
+                    json.dumps(roles),
+                    ex=CacheTTL.DISCORD_GUILD_ROLES,
+                )
+                pipe.set(
+                    CacheKeys.discord_guild_emojis(guild_id),
+                    json.dumps(emojis),
+                    ex=CacheTTL.DISCORD_GUILD_EMOJIS,
+                )
+                await pipe.execute()
 
             logger.info(
                 "Redis cache rebuilt for guild %r (%s): %d channels, %d roles",
@@ -402,6 +402,7 @@ class GameSchedulerBot(commands.Bot):
             total_channels += len(channels)
             total_roles += len(roles)
 
+        await l1.publish_invalidation(redis)
         logger.info(
             "Redis cache rebuild complete: %d guilds, %d channels, %d roles",
             len(self.guilds),
@@ -411,21 +412,16 @@ class GameSchedulerBot(commands.Bot):
 
     async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
         """Write the new channel to Redis and rewrite the guild channel list."""
-        redis = await get_redis_client()
         if (
             isinstance(channel, discord.TextChannel)
             and channel.permissions_for(channel.guild.me).send_messages
         ):
-            await redis.set_json(
+            self._writes.set(
                 CacheKeys.discord_channel(str(channel.id)),
-                {"name": channel.name},
-                CacheTTL.DISCORD_CHANNEL,
+                json.dumps({"name": channel.name}),
+                ex=CacheTTL.DISCORD_CHANNEL,
             )
-        await redis.set_json(
-            CacheKeys.discord_guild_channels(str(channel.guild.id)),
-            self._channel_list(self._postable_channels(channel.guild)),
-            CacheTTL.DISCORD_GUILD_CHANNELS,
-        )
+        self._rewrite_guild_channels_cache(channel.guild, str(channel.id))
 
     async def on_guild_channel_update(
         self,
@@ -433,43 +429,42 @@ class GameSchedulerBot(commands.Bot):
         after: discord.abc.GuildChannel,
     ) -> None:
         """Update the channel entry in Redis and rewrite the guild channel list."""
-        redis = await get_redis_client()
         if (
             isinstance(after, discord.TextChannel)
             and after.permissions_for(after.guild.me).send_messages
         ):
-            await redis.set_json(
+            self._writes.set(
                 CacheKeys.discord_channel(str(after.id)),
-                {"name": after.name},
-                CacheTTL.DISCORD_CHANNEL,
+                json.dumps({"name": after.name}),
+                ex=CacheTTL.DISCORD_CHANNEL,
             )
         else:
-            await redis.delete(CacheKeys.discord_channel(str(after.id)))
-        await redis.set_json(
-            CacheKeys.discord_guild_channels(str(after.guild.id)),
-            self._channel_list(self._postable_channels(after.guild)),
-            CacheTTL.DISCORD_GUILD_CHANNELS,
+            self._writes.delete(CacheKeys.discord_channel(str(after.id)))
+        self._rewrite_guild_channels_cache(after.guild, str(after.id))
+
+    def _rewrite_guild_channels_cache(self, guild: discord.Guild, channel_id: str) -> None:
+        """Queue a guild channel list rewrite and L1 invalidation of it and one channel."""
+        guild_channels_key = CacheKeys.discord_guild_channels(str(guild.id))
+        self._writes.set(
+            guild_channels_key,
+            json.dumps(self._channel_list(self._postable_channels(guild))),
+            ex=CacheTTL.DISCORD_GUILD_CHANNELS,
         )
+        self._writes.invalidate([CacheKeys.discord_channel(channel_id), guild_channels_key])
 
-    async def _rewrite_guild_roles_cache(self, guild: discord.Guild) -> None:
-        redis = await get_redis_client()
-        await redis.set_json(
-            CacheKeys.discord_guild_roles(str(guild.id)),
-            self._role_list(guild.roles),
-            CacheTTL.DISCORD_GUILD_ROLES,
+    def _rewrite_guild_roles_cache(self, guild: discord.Guild) -> None:
+        roles_key = CacheKeys.discord_guild_roles(str(guild.id))
+        self._writes.set(
+            roles_key, json.dumps(self._role_list(guild.roles)), ex=CacheTTL.DISCORD_GUILD_ROLES
         )
+        self._writes.invalidate([roles_key])
 
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
         """Remove the deleted channel from Redis and rewrite the guild channel list."""
-        redis = await get_redis_client()
-        await redis.delete(CacheKeys.discord_channel(str(channel.id)))
-        await redis.set_json(
-            CacheKeys.discord_guild_channels(str(channel.guild.id)),
-            self._channel_list(self._postable_channels(channel.guild)),
-            CacheTTL.DISCORD_GUILD_CHANNELS,
-        )
+        self._writes.delete(CacheKeys.discord_channel(str(channel.id)))
+        self._rewrite_guild_channels_cache(channel.guild, str(channel.id))
 
-    async def _sync_thread_cache(self, thread: discord.Thread) -> None:
+    def _sync_thread_cache(self, thread: discord.Thread) -> None:
         """Write or clear one thread's cache entry and rewrite the guild channel list.
 
         Mirrors the channel create/update handlers' write-or-clear-then-rewrite shape:
@@ -477,24 +472,19 @@ class GameSchedulerBot(commands.Bot):
         the full guild list is always rewritten from current gateway state so it stays
         the single source of truth.
         """
-        redis = await get_redis_client()
         if not thread.archived and thread.permissions_for(thread.guild.me).send_messages_in_threads:
-            await redis.set_json(
+            self._writes.set(
                 CacheKeys.discord_channel(str(thread.id)),
-                {"name": thread.name},
-                CacheTTL.DISCORD_CHANNEL,
+                json.dumps({"name": thread.name}),
+                ex=CacheTTL.DISCORD_CHANNEL,
             )
         else:
-            await redis.delete(CacheKeys.discord_channel(str(thread.id)))
-        await redis.set_json(
-            CacheKeys.discord_guild_channels(str(thread.guild.id)),
-            self._channel_list(self._postable_channels(thread.guild)),
-            CacheTTL.DISCORD_GUILD_CHANNELS,
-        )
+            self._writes.delete(CacheKeys.discord_channel(str(thread.id)))
+        self._rewrite_guild_channels_cache(thread.guild, str(thread.id))
 
     async def on_thread_create(self, thread: discord.Thread) -> None:
         """Write a newly created thread to Redis and rewrite the guild channel list."""
-        await self._sync_thread_cache(thread)
+        self._sync_thread_cache(thread)
 
     async def on_thread_join(self, thread: discord.Thread) -> None:
         """Write a thread the bot has just become aware of and rewrite the channel list.
@@ -502,7 +492,7 @@ class GameSchedulerBot(commands.Bot):
         Fires when the bot is added to an existing thread, or when a thread from the
         guild's initial active-thread snapshot is not yet locally cached.
         """
-        await self._sync_thread_cache(thread)
+        self._sync_thread_cache(thread)
 
     async def on_thread_update(self, _before: discord.Thread, after: discord.Thread) -> None:
         """Update the cached thread entry and rewrite the guild channel list.
@@ -512,29 +502,24 @@ class GameSchedulerBot(commands.Bot):
         the same way `on_guild_channel_update` clears a channel's key when the bot
         loses send_messages.
         """
-        await self._sync_thread_cache(after)
+        self._sync_thread_cache(after)
 
     async def on_thread_delete(self, thread: discord.Thread) -> None:
         """Remove the deleted thread from Redis and rewrite the guild channel list."""
-        redis = await get_redis_client()
-        await redis.delete(CacheKeys.discord_channel(str(thread.id)))
-        await redis.set_json(
-            CacheKeys.discord_guild_channels(str(thread.guild.id)),
-            self._channel_list(self._postable_channels(thread.guild)),
-            CacheTTL.DISCORD_GUILD_CHANNELS,
-        )
+        self._writes.delete(CacheKeys.discord_channel(str(thread.id)))
+        self._rewrite_guild_channels_cache(thread.guild, str(thread.id))
 
     async def on_guild_role_create(self, role: discord.Role) -> None:
         """Rewrite the guild roles cache from current gateway state."""
-        await self._rewrite_guild_roles_cache(role.guild)
+        self._rewrite_guild_roles_cache(role.guild)
 
     async def on_guild_role_update(self, _before: discord.Role, after: discord.Role) -> None:
         """Rewrite the guild roles cache from current gateway state."""
-        await self._rewrite_guild_roles_cache(after.guild)
+        self._rewrite_guild_roles_cache(after.guild)
 
     async def on_guild_role_delete(self, role: discord.Role) -> None:
         """Rewrite the guild roles cache from current gateway state."""
-        await self._rewrite_guild_roles_cache(role.guild)
+        self._rewrite_guild_roles_cache(role.guild)
 
     async def on_guild_emojis_update(
         self,
@@ -543,13 +528,10 @@ class GameSchedulerBot(commands.Bot):
         after: list[discord.Emoji],
     ) -> None:
         """Rewrite the guild emojis cache from the updated emoji list."""
-        redis = await get_redis_client()
         emojis = [{"id": str(e.id), "name": e.name, "animated": e.animated} for e in after]
-        await redis.set_json(
-            CacheKeys.discord_guild_emojis(str(guild.id)),
-            emojis,
-            CacheTTL.DISCORD_GUILD_EMOJIS,
-        )
+        emojis_key = CacheKeys.discord_guild_emojis(str(guild.id))
+        self._writes.set(emojis_key, json.dumps(emojis), ex=CacheTTL.DISCORD_GUILD_EMOJIS)
+        self._writes.invalidate([emojis_key])
 
     async def on_disconnect(self) -> None:
         """Handle Gateway disconnection.
@@ -563,6 +545,7 @@ class GameSchedulerBot(commands.Bot):
         if self._disconnected_at is None:
             self._disconnected_at = time.monotonic()
             gateway_disconnect_counter.add(1)
+        self._projection_ready = False
         logger.info("Bot disconnected from Gateway")
 
     async def on_resumed(self) -> None:
@@ -579,48 +562,92 @@ class GameSchedulerBot(commands.Bot):
                 "Bot reconnected to Gateway (resumed session, outage %.2fs)", outage_seconds
             )
         redis = await get_redis_client()
-        await guild_projection.repopulate_all(bot=self, redis=redis)
+        await self._repopulate_projection(redis)
+        self._projection_ready = True
         await self._recover_pending_workers()
-        await self._trigger_sweep("on_resumed")
+        await self._trigger_sweep("on_resumed", outage_seconds)
         await self._sweep_orphaned_embeds()
 
     async def on_guild_available(self, guild: discord.Guild) -> None:
         """Handle guild becoming available after a Discord outage."""
         logger.info("Guild available: %s", guild.id)
+        await self._repopulate_guild_projection(guild, "guild_available")
+
+    async def _repopulate_guild_projection(self, guild: discord.Guild, reason: str) -> None:
+        """Rewrite one guild's projection, deferring to the full rebuild when appropriate.
+
+        Guild events dispatched while the gateway is (re)connecting arrive before
+        on_ready/on_resumed, whose repopulate_all flips the generation anyway, so
+        per-guild writes are skipped until that rebuild has run. A missing
+        generation pointer (cold Redis) falls back to a full rebuild.
+        """
+        if not self._projection_ready:
+            logger.info(
+                "Deferring guild projection to full repopulation: guild=%s reason=%s",
+                guild.id,
+                reason,
+            )
+            return
         redis = await get_redis_client()
-        await guild_projection.repopulate_all(bot=self, redis=redis)
+        guild_projection.repopulation_started_counter.add(1, {"reason": reason})
+        if not await guild_projection.repopulate_guild(guild, redis=redis):
+            await self._repopulate_projection(redis)
+
+    async def _repopulate_projection(self, redis: RedisClient) -> None:
+        """Run repopulate_all and remember the generation it flipped to.
+
+        Buffered member writes target the outgoing generation, so they are
+        flushed before the rebuild starts rather than after it has deleted
+        that generation.
+        """
+        self._projection_gen = None
+        await self._writes.flush()
+        self._projection_gen = await guild_projection.repopulate_all(bot=self, redis=redis)
+
+    async def _current_projection_gen(self, redis: RedisClient) -> str | None:
+        """Return the projection generation, reading Redis only until it is known.
+
+        The bot is the only writer of the proj:gen pointer, so once a full
+        repopulation has run the in-memory copy stays authoritative.
+        """
+        if self._projection_gen is not None:
+            return self._projection_gen
+        gen = await redis.get(CacheKeys.proj_gen())
+        if self._projection_ready:
+            self._projection_gen = gen
+        return gen
 
     async def on_member_add(self, member: discord.Member) -> None:
         """Handle member added to guild event."""
         redis = await get_redis_client()
-        gen = await redis.get(CacheKeys.proj_gen())
+        gen = await self._current_projection_gen(redis)
         if gen is None:
             return
-        await guild_projection.add_member(gen, member, redis=redis)
+        guild_projection.queue_member_add(self._writes, gen, member)
 
     async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
         """Handle member profile update event."""
         redis = await get_redis_client()
-        gen = await redis.get(CacheKeys.proj_gen())
+        gen = await self._current_projection_gen(redis)
         if gen is None:
             return
-        await guild_projection.update_member(gen, before, after, redis=redis)
+        guild_projection.queue_member_update(self._writes, gen, before, after)
 
     async def on_user_update(self, before: discord.User, after: discord.User) -> None:
         """Handle user profile update event (global username or global_name change)."""
         redis = await get_redis_client()
-        gen = await redis.get(CacheKeys.proj_gen())
+        gen = await self._current_projection_gen(redis)
         if gen is None:
             return
-        await guild_projection.update_user(gen, before, after, self.guilds, redis=redis)
+        guild_projection.queue_user_update(self._writes, gen, before, after, self.guilds)
 
     async def on_member_remove(self, member: discord.Member) -> None:
         """Handle member removed from guild event."""
         redis = await get_redis_client()
-        gen = await redis.get(CacheKeys.proj_gen())
+        gen = await self._current_projection_gen(redis)
         if gen is None:
             return
-        await guild_projection.remove_member(gen, member, redis=redis)
+        guild_projection.queue_member_remove(self._writes, gen, member)
 
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
         """Handle raw message delete event to detect embed deletions.
@@ -658,13 +685,28 @@ class GameSchedulerBot(commands.Bot):
         except Exception as e:
             logger.exception("Error handling message delete for message %s: %s", message_id, e)
 
-    async def _trigger_sweep(self, reason: str) -> None:
+    async def _trigger_sweep(self, reason: str, outage_seconds: float | None = None) -> None:
         """Cancel any in-progress sweep and start a fresh one.
 
         If a sweep is already running, cancels it and waits for it to finish
         before launching a new one. Back-to-back on_resumed events therefore
         never run two concurrent sweeps.
+
+        A resumed session replays the dispatch events missed during the outage,
+        including MESSAGE_DELETE, so when outage_seconds is shorter than
+        embed_sweep_min_outage_seconds the sweep is skipped altogether.
         """
+        if (
+            outage_seconds is not None
+            and outage_seconds < self.config.embed_sweep_min_outage_seconds
+        ):
+            logger.info(
+                "Embed deletion sweep skipped: outage %.2fs below %ds threshold",
+                outage_seconds,
+                self.config.embed_sweep_min_outage_seconds,
+            )
+            sweep_skipped_counter.add(1, {"reason": reason})
+            return
         if self._sweep_task and not self._sweep_task.done():
             logger.warning("Embed deletion sweep interrupted: new sweep triggered")
             sweep_interrupted_counter.add(1, {"reason": reason})
@@ -705,8 +747,8 @@ class GameSchedulerBot(commands.Bot):
 
         Queries the DB for channels with un-processed queue rows and spawns a
         worker for each channel that does not already have an active one.
-        Runs on startup (on_ready) and after reconnect (on_resumed) to recover
-        from crashes or disconnects.
+        Runs on startup (on_ready), after a gateway reconnect (on_resumed) and
+        after every LISTEN (re)connect to recover from crashes or disconnects.
         """
         if not self.event_handlers:
             return
@@ -737,8 +779,12 @@ class GameSchedulerBot(commands.Bot):
     async def _sweep_deleted_embeds(self, reason: str) -> None:
         """Check for embed posts deleted while the bot was offline.
 
-        Queries all game sessions with a message_id, then fetches each Discord
-        message to see if it still exists. For each 404, cancels the game directly.
+        Queries all game sessions with a message_id and groups them by channel.
+        Channels tracking several games are checked by paging channel.history()
+        across the span of tracked message IDs, 100 messages per REST call, and
+        diffing the returned IDs against the DB; any game a page leaves absent
+        is cancelled. Single-game channels, and games a history scan could not
+        resolve, fall back to one fetch_message per game.
 
         ~60 concurrent workers keep the global rate-limit bucket saturated while
         individual per-channel sleeps avoid per-channel bursts.
@@ -772,25 +818,155 @@ class GameSchedulerBot(commands.Bot):
 
         logger.info("Embed deletion sweep: checking %d games", len(games))
 
-        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        by_channel: dict[str, list[SweepItem]] = {}
         for game in games:
-            await queue.put((
+            channel_id = str(game.channel.channel_id)
+            by_channel.setdefault(channel_id, []).append((
                 game.scheduled_at,
                 str(game.id),
-                str(game.channel.channel_id),
+                channel_id,
                 game.message_id,
             ))
 
         redis = await get_redis_client()
-        num_workers = min(60, queue.qsize())
+        fetch_items = [items[0] for items in by_channel.values() if len(items) == 1]
+        history_channels = [items for items in by_channel.values() if len(items) > 1]
+
+        history_resolved = 0
+        history_calls = 0
+        if history_channels:
+            slots = asyncio.Semaphore(SWEEP_MAX_WORKERS)
+
+            async def scan(items: list[SweepItem]) -> tuple[list[SweepItem], int] | None:
+                async with slots:
+                    return await self._scan_channel_for_deleted_embeds(items, redis)
+
+            for items, outcome in zip(
+                history_channels,
+                await asyncio.gather(*(scan(items) for items in history_channels)),
+                strict=True,
+            ):
+                if outcome is None:
+                    continue
+                leftover, calls = outcome
+                history_resolved += len(items) - len(leftover)
+                history_calls += calls
+                fetch_items.extend(leftover)
+
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        for item in fetch_items:
+            await queue.put(item)
+        num_workers = min(SWEEP_MAX_WORKERS, queue.qsize())
         workers = [self._run_sweep_worker(queue, redis) for _ in range(num_workers)]
         await asyncio.gather(*workers)
+
+        sweep_calls_saved_histogram.record(history_resolved - history_calls, {"reason": reason})
         sweep_duration_histogram.record(time.time() - start_time, {"reason": reason})
-        logger.info("Embed deletion sweep complete")
+        logger.info(
+            "Embed deletion sweep complete: %d games, %d history pages, %d fetches",
+            len(games),
+            history_calls,
+            len(fetch_items),
+        )
+
+    async def _scan_channel_for_deleted_embeds(
+        self, items: list[SweepItem], redis: RedisClient
+    ) -> tuple[list[SweepItem], int] | None:
+        """Resolve one channel's games by paging its history oldest-first.
+
+        Pages start just before the oldest tracked message and stop once every
+        tracked message has been passed. A tracked ID inside a page's span that
+        the page does not contain was deleted. Paging also stops once it has
+        cost as many calls as there are unresolved games, since fetching those
+        individually is then no more expensive.
+
+        Args:
+            items: Sweep items for games whose embeds are in the same channel
+            redis: Redis client for rate-limit slot claims
+
+        Returns:
+            Items left for fetch_message, and the number of history calls made,
+            or None when the channel was skipped and nothing was resolved
+        """
+        channel_id = items[0][2]
+        channel = self.get_channel(int(channel_id))
+        if channel is None:
+            logger.warning("Sweep: channel %s not in gateway cache, skipping", channel_id)
+            return None
+        if not isinstance(channel, discord.TextChannel):
+            logger.warning("Sweep: channel %s is not a text channel, skipping", channel_id)
+            return None
+
+        pending = {int(item[3]): item for item in items}
+        tracked = sorted(pending)
+        cursor = tracked[0] - 1
+        calls = 0
+        while pending and calls < len(pending):
+            wait_ms = await redis.claim_global_and_channel_slot(channel_id)
+            if wait_ms > 0:
+                await asyncio.sleep(wait_ms / 1000)
+                continue
+
+            page = await self._read_history_page(channel, cursor)
+            if page is None:
+                break
+            calls += 1
+
+            end_of_channel = len(page) < SWEEP_HISTORY_PAGE_SIZE
+            covered_to = tracked[-1] if end_of_channel else page[-1]
+            await self._resolve_swept_messages(pending, covered_to, set(page))
+
+            if end_of_channel:
+                break
+            cursor = page[-1]
+
+        return list(pending.values()), calls
+
+    async def _resolve_swept_messages(
+        self, pending: dict[int, SweepItem], covered_to: int, present: set[int]
+    ) -> None:
+        """Resolve the pending messages a history page has covered.
+
+        Pops every pending message ID up to covered_to; those missing from the
+        page were deleted, and their games are cancelled.
+        """
+        for message_id in sorted(m for m in pending if m <= covered_to):
+            _scheduled_at, game_id, _channel_id, _message_id = pending.pop(message_id)
+            if message_id in present:
+                sweep_messages_checked_counter.add(1)
+            else:
+                sweep_deletions_detected_counter.add(1)
+                await self._cancel_missing_embed(game_id)
+
+    async def _read_history_page(
+        self, channel: discord.TextChannel, after: int
+    ) -> list[int] | None:
+        """Return the IDs of up to one page of messages after a message ID, oldest first.
+
+        Returns None when the history cannot be read, e.g. without the Read
+        Message History permission, so the caller falls back to fetch_message.
+        """
+        sweep_api_calls_counter.add(1, {"mode": "history"})
+        try:
+            page = [
+                message.id
+                async for message in channel.history(
+                    limit=SWEEP_HISTORY_PAGE_SIZE,
+                    after=discord.Object(after),
+                    oldest_first=True,
+                )
+            ]
+        except discord.Forbidden:
+            logger.info("Sweep: no history access in channel %s, fetching instead", channel.id)
+            return None
+        except Exception:
+            logger.exception("Sweep: error reading history of channel %s", channel.id)
+            return None
+        return page
 
     async def _run_sweep_worker(
         self,
-        queue: "asyncio.PriorityQueue[tuple]",
+        queue: "asyncio.PriorityQueue[SweepItem]",
         redis: RedisClient,
     ) -> None:
         """Process one worker loop for the embed deletion sweep.
@@ -818,6 +994,7 @@ class GameSchedulerBot(commands.Bot):
                 if not isinstance(channel, discord.TextChannel):
                     logger.warning("Sweep: channel %s is not a text channel, skipping", channel_id)
                     continue
+                sweep_api_calls_counter.add(1, {"mode": "fetch"})
                 await channel.fetch_message(int(message_id))
                 sweep_messages_checked_counter.add(1)
             except discord.NotFound:
@@ -866,6 +1043,11 @@ class GameSchedulerBot(commands.Bot):
         (fresh install with no backups), skips the sweep entirely. Uses
         backed_up_at minus a 5-minute buffer as the channel.history() cutoff to
         avoid false positives for games being created at backup time.
+
+        Channels are scanned concurrently, every Discord call claiming a slot
+        from the shared rate limiter. Each channel's position is saved in Redis
+        under the backup's timestamp, so a bot restarted mid-sweep resumes where
+        it stopped and skips channels it already finished.
         """
         try:
             async with get_bypass_db_session() as db:
@@ -891,6 +1073,52 @@ class GameSchedulerBot(commands.Bot):
             logger.exception("Orphaned embed sweep: failed to query channel_configurations: %s", e)
             return
 
+        channels = self._orphan_sweep_channels(channel_cfgs)
+        if not channels:
+            return
+
+        redis = await get_redis_client()
+        backup_stamp = str(int(backup_row.backed_up_at.timestamp()))
+        progress_keys = [
+            CacheKeys.orphan_sweep_progress(backup_stamp, str(channel.id)) for channel in channels
+        ]
+        saved_positions = await redis.mget(progress_keys)
+        slots = asyncio.Semaphore(SWEEP_MAX_WORKERS)
+
+        async def scan(channel: discord.TextChannel, key: str, saved: str | None) -> None:
+            if saved == ORPHAN_SWEEP_DONE:
+                orphan_sweep_channels_counter.add(1, {"status": "already_done"})
+                return
+            resume_after = int(saved) if saved else None
+            async with slots:
+                try:
+                    await self._scan_channel_for_orphaned_embeds(
+                        channel, cutoff, redis, progress_key=key, resume_after=resume_after
+                    )
+                except Exception as e:
+                    logger.exception(
+                        "Orphaned embed sweep: error scanning channel %s: %s", channel.id, e
+                    )
+                    return
+            status = "resumed" if resume_after else "completed"
+            orphan_sweep_channels_counter.add(1, {"status": status})
+
+        logger.info("Orphaned embed sweep: scanning %d channels", len(channels))
+        await asyncio.gather(
+            *(
+                scan(channel, key, saved)
+                for channel, key, saved in zip(
+                    channels, progress_keys, saved_positions, strict=True
+                )
+            )
+        )
+        logger.info("Orphaned embed sweep complete")
+
+    def _orphan_sweep_channels(
+        self, channel_cfgs: list[ChannelConfiguration]
+    ) -> list[discord.TextChannel]:
+        """Return the configured text channels the bot can post in, and so scan."""
+        channels = []
         for cfg in channel_cfgs:
             channel = self.get_channel(int(cfg.channel_id))
             if not isinstance(channel, discord.TextChannel):
@@ -901,32 +1129,202 @@ class GameSchedulerBot(commands.Bot):
                     cfg.channel_id,
                 )
                 continue
-            try:
-                await self._scan_channel_for_orphaned_embeds(channel, cutoff)
-            except Exception as e:
-                logger.exception(
-                    "Orphaned embed sweep: error scanning channel %s: %s", cfg.channel_id, e
-                )
+            channels.append(channel)
+        return channels
 
     async def _scan_channel_for_orphaned_embeds(
-        self, channel: discord.TextChannel, cutoff: datetime
+        self,
+        channel: discord.TextChannel,
+        cutoff: datetime,
+        redis: RedisClient,
+        *,
+        progress_key: str | None = None,
+        resume_after: int | None = None,
+    ) -> None:
+        """Scan one channel for bot messages whose game no longer exists in the DB.
+
+        Pages through history oldest-first, checks each page's game IDs with one
+        query and deletes the orphans before moving on.  A failed game lookup
+        propagates before the page is checkpointed, so a resumed sweep rescans it.
+
+        Args:
+            channel: Channel to scan
+            cutoff: Only messages posted after this time are considered
+            redis: Redis client for rate-limit slots and progress
+            progress_key: Where to record the last scanned message ID, if resumable
+            resume_after: Message ID a previous run had already scanned up to
+        """
+        after: discord.abc.Snowflake | datetime = (
+            discord.Object(resume_after) if resume_after else cutoff
+        )
+        while True:
+            await self._wait_for_sweep_slot(redis, str(channel.id))
+            page = [
+                message
+                async for message in channel.history(
+                    limit=SWEEP_HISTORY_PAGE_SIZE, after=after, oldest_first=True
+                )
+            ]
+            if page:
+                await self._delete_orphans_in_page(channel, page, redis)
+                after = page[-1]
+                if progress_key:
+                    await redis.set(progress_key, str(page[-1].id), CacheTTL.ORPHAN_SWEEP_PROGRESS)
+            if len(page) < SWEEP_HISTORY_PAGE_SIZE:
+                break
+
+        if progress_key:
+            await redis.set(progress_key, ORPHAN_SWEEP_DONE, CacheTTL.ORPHAN_SWEEP_PROGRESS)
+
+    async def _delete_orphans_in_page(
+        self, channel: discord.TextChannel, page: list[discord.Message], redis: RedisClient
     ) -> None:
-        """Scan a single channel for bot messages whose game no longer exists in the DB."""
-        async for message in channel.history(after=cutoff, limit=None):
+        """Delete the bot's game embeds in one history page whose games are gone."""
+        embeds: dict[UUID, discord.Message] = {}
+        for message in page:
             if message.author.id != self.user.id:
                 continue
-
             game_id = self._extract_game_id(message)
             if game_id is None:
                 continue
+            try:
+                embeds[UUID(game_id)] = message
+            except ValueError:
+                logger.debug("Orphaned embed sweep: ignoring malformed game id %s", game_id)
+        if not embeds:
+            return
+        orphan_sweep_messages_counter.add(len(embeds))
+
+        # A failed lookup propagates so the caller does not checkpoint past this page.
+        async with get_bypass_db_session() as db:
+            result = await db.execute(
+                select(GameSession.id).where(GameSession.id.in_(list(embeds)))
+            )
+            existing = {UUID(str(game_id)) for game_id in result.scalars().all()}
 
+        orphans = [message for game_id, message in embeds.items() if game_id not in existing]
+        if orphans:
+            await self._delete_orphan_messages(channel, orphans, redis)
+
+    async def _delete_orphan_messages(
+        self, channel: discord.TextChannel, orphans: list[discord.Message], redis: RedisClient
+    ) -> None:
+        """Bulk delete recent orphans, falling back to one delete each for the rest."""
+        bulk_after = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+        young = [m for m in orphans if m.created_at > bulk_after]
+        if len(young) > 1:
+            await self._wait_for_sweep_slot(redis, str(channel.id))
             try:
-                async with get_bypass_db_session() as db:
-                    r = await db.execute(select(GameSession).where(GameSession.id == game_id))
-                    if r.scalar_one_or_none() is None:
-                        await message.delete()
-            except Exception as e:
-                logger.exception("Orphaned embed sweep: error checking game %s: %s", game_id, e)
+                await channel.delete_messages(young)
+            except discord.HTTPException as e:
+                logger.warning(
+                    "Orphaned embed sweep: bulk delete failed in channel %s, "
+                    "deleting individually: %s",
+                    channel.id,
+                    e,
+                )
+            else:
+                orphan_sweep_deleted_counter.add(len(young), {"mode": "bulk"})
+                orphans = [m for m in orphans if m.created_at <= bulk_after]
+
+        for message in orphans:
+            await self._wait_for_sweep_slot(redis, str(channel.id))
+            try:
+                await message.delete()
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                logger.warning(
+                    "Orphaned embed sweep: failed to delete message %s in channel %s: %s",
+                    message.id,
+                    channel.id,
+                    e,
+                )
+                continue
+            orphan_sweep_deleted_counter.add(1, {"mode": "single"})
+
+    @staticmethod
+    async def _wait_for_sweep_slot(redis: RedisClient, channel_id: str) -> None:
+        """Block until the shared rate limiter grants a global and per-channel slot."""
+        while True:
+            wait_ms = await redis.claim_global_and_channel_slot(channel_id)
+            if wait_ms <= 0:
+                return
+            await asyncio.sleep(wait_ms / 1000)
+
+    def _start_background_tasks(self) -> None:
+        """Start the LISTEN hub and the loops that subscribe to it, once per process."""
+        if not hasattr(self, "_notification_hub"):
+            self._notification_hub = NotificationHub(self.config.database_url)
+            self._notification_hub_task = asyncio.create_task(self._notification_hub.run())
+            logger.info("Started shared LISTEN notification hub task")
+
+        if not hasattr(self, "_refresh_listener_started"):
+            self._refresh_listener_started = True
+            self._refresh_listener_task = asyncio.create_task(
+                MessageRefreshListener(
+                    self.config.database_url,
+                    self._spawn_channel_worker,
+                    catch_up_cb=self._recover_pending_workers,
+                    hub=self._notification_hub,
+                ).start()
+            )
+            logger.info("Started message refresh listener task")
+
+        if not hasattr(self, "_action_listener_started"):
+            self._action_listener_started = True
+            self._action_listener_task = asyncio.create_task(
+                BotActionListener(
+                    self.config.database_url,
+                    self.event_handlers,
+                    hub=self._notification_hub,
+                ).start()
+            )
+            logger.info("Started bot action listener task")
+
+        if not hasattr(self, "_announcement_loop_started"):
+            self._announcement_loop_started = True
+            self._announcement_loop_task = asyncio.create_task(
+                AnnouncementLoop(self.config.database_url, self, hub=self._notification_hub).start()
+            )
+            logger.info("Started announcement loop task")
+
+        if not hasattr(self, "_scheduler_loops_started"):
+            self._scheduler_loops_started = True
+            self._notification_scheduler_task = asyncio.create_task(
+                SchedulerLoop(
+                    db_url=self.config.database_url,
+                    notify_channel="notification_schedule_changed",
+                    model_class=NotificationSchedule,
+                    time_field="notification_time",
+                    status_field="sent",
+                    event_builder=build_notification_event,
+                    hub=self._notification_hub,
+                ).run()
+            )
+            self._game_status_scheduler_task = asyncio.create_task(
+                SchedulerLoop(
+                    db_url=self.config.database_url,
+                    notify_channel="game_status_schedule_changed",
+                    model_class=GameStatusSchedule,
+                    time_field="transition_time",
+                    status_field="executed",
+                    event_builder=build_status_transition_event,
+                    hub=self._notification_hub,
+                ).run()
+            )
+            self._participant_action_scheduler_task = asyncio.create_task(
+                SchedulerLoop(
+                    db_url=self.config.database_url,
+                    notify_channel="participant_action_schedule_changed",
+                    model_class=ParticipantActionSchedule,
+                    time_field="action_time",
+                    status_field="processed",
+                    event_builder=build_participant_action_event,
+                    hub=self._notification_hub,
+                ).run()
+            )
+            logger.info("Started scheduler loop tasks")
 
     async def _restore_recurrence_confirmation_views(self) -> None:
         """Re-register RecurrenceConfirmationView for games awaiting host confirmation.
@@ -1032,8 +1430,7 @@ class GameSchedulerBot(commands.Bot):
                 )
 
                 await self._rebuild_guild_channel_cache()
-                redis = await get_redis_client()
-                await guild_projection.repopulate_all(bot=self, redis=redis)
+                await self._repopulate_guild_projection(guild, "guild_join")
             except Exception as e:
                 logger.error("Failed to sync guild %s (ID: %s): %s", guild.name, guild.id, e)
 
@@ -1053,7 +1450,7 @@ class GameSchedulerBot(commands.Bot):
         ):
             logger.info("Bot removed from guild: %s (ID: %s)", guild.name, guild.id)
             redis = await get_redis_client()
-            await guild_projection.repopulate_all(bot=self, redis=redis)
+            await guild_projection.remove_guild(str(guild.id), redis=redis)
 
     async def _projection_heartbeat(self) -> None:
         """Periodic task to write bot heartbeat to projection."""
@@ -1077,6 +1474,7 @@ class GameSchedulerBot(commands.Bot):
         """Cleanup resources before bot shutdown."""
         logger.info("Shutting down bot")
 
+        await self._writes.flush()
         await super().close()
 
 
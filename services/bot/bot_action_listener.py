@@ -23,19 +23,45 @@
 
 import asyncio
 import logging
+import time
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 import asyncpg
-from sqlalchemy import select
+from opentelemetry import metrics
+from sqlalchemy import delete, func, or_, select, update
 
 from shared.database import get_db_session
 from shared.models.bot_action_queue import BotActionQueue
-from shared.pg_listen import listen_with_reconnect
+from shared.pg_listen import NotificationHub, listen_with_reconnect
 
 if TYPE_CHECKING:
     from services.bot.events.handlers import EventHandlers
 
 logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+_LEASE_BATCH_SIZE = 100
+_DISPATCH_CONCURRENCY = 16
+# Rows leased by a listener that died before deleting them become claimable
+# again after this long.  Must comfortably exceed the slowest batch dispatch.
+_LEASE_TIMEOUT = timedelta(minutes=10)
+
+action_queue_depth_gauge = meter.create_gauge(
+    name="bot.action_queue.depth",
+    description="Rows in bot_action_queue when a batch was leased, including the batch",
+    unit="{row}",
+)
+action_queue_lease_age_histogram = meter.create_histogram(
+    name="bot.action_queue.lease.age",
+    description="Seconds a leased batch was held before its rows were deleted",
+    unit="s",
+)
+action_dispatch_duration_histogram = meter.create_histogram(
+    name="bot.action_queue.dispatch.duration",
+    description="Duration of one bot_action_queue row dispatch, labeled by action_type",
+    unit="s",
+)
 
 
 def _build_handler_data(row: BotActionQueue) -> dict[str, Any]:
@@ -75,33 +101,49 @@ def _build_handler_data(row: BotActionQueue) -> dict[str, Any]:
 
 class BotActionListener:
     """
-    Holds a dedicated asyncpg connection that listens for
-    ``bot_action_queue_changed`` notifications from Postgres.
+    Listens for ``bot_action_queue_changed`` notifications from Postgres,
+    on the shared ``hub`` connection when one is given.
 
     When a NOTIFY arrives (or on startup to catch any rows written before
-    the listener connected), it drains the ``bot_action_queue`` table one row
-    at a time, dispatching each row to the appropriate ``EventHandlers`` method.
+    the listener connected), it drains the ``bot_action_queue`` table in
+    batches.  Each batch is leased by stamping ``leased_at`` on up to
+    ``batch_size`` rows selected with ``SKIP LOCKED`` and committing, so no
+    transaction stays open across Discord API calls.  The leased rows are then
+    dispatched concurrently, at most ``concurrency`` at a time; rows sharing a
+    ``game_id`` are dispatched one after another in ``enqueued_at`` order.
+    Once the whole batch has been attempted its rows are deleted in one
+    statement before the next batch is leased.
 
-    Each row is deleted within the same transaction as the dispatch attempt.
     If dispatch raises, the error is logged and the row is still deleted to
-    prevent infinite retry loops. Crash safety is provided by Postgres atomicity:
-    rows that were not yet committed as deleted survive a bot restart.
+    prevent infinite retry loops.  A listener that dies mid-batch leaves its
+    rows leased; they become claimable again once the lease is older than
+    ``_LEASE_TIMEOUT``, so delivery remains at-least-once across restarts.
 
     Args:
         bot_db_url: PostgreSQL connection URL (``postgresql+asyncpg://…`` or
             ``postgresql://…`` are both accepted).
         event_handlers: ``EventHandlers`` instance whose handler methods are
             called for each action type.
+        batch_size: Maximum rows leased per batch.
+        concurrency: Maximum rows dispatched at the same time.
+        hub: Optional shared NotificationHub to subscribe to instead of
+            holding a dedicated LISTEN connection.
     """
 
     def __init__(
         self,
         bot_db_url: str,
         event_handlers: "EventHandlers",
+        batch_size: int = _LEASE_BATCH_SIZE,
+        concurrency: int = _DISPATCH_CONCURRENCY,
+        hub: NotificationHub | None = None,
     ) -> None:
         self._bot_db_url = bot_db_url
         self._event_handlers = event_handlers
+        self._batch_size = batch_size
+        self._dispatch_slots = asyncio.Semaphore(concurrency)
         self._drain_task: asyncio.Task[None] | None = None
+        self._hub = hub
 
     async def start(self) -> None:
         """Maintain the LISTEN connection, reconnecting automatically on loss.
@@ -109,7 +151,16 @@ class BotActionListener:
         Drains any pending bot_action_queue rows on every (re)connect, not
         just the first one, so rows written while the connection was down
         (or before the listener started) are picked up once LISTEN resumes.
+        With a shared hub, the subscription returns immediately and the hub's
+        reconnect path drives the drains.
         """
+        if self._hub is not None:
+            await self._hub.subscribe(
+                "bot_action_queue_changed",
+                self._on_notify,
+                on_connected=lambda _conn: self._spawn_drain(),
+            )
+            return
         await listen_with_reconnect(
             self._bot_db_url,
             "bot_action_queue_changed",
@@ -133,42 +184,93 @@ class BotActionListener:
             self._drain_task = asyncio.create_task(self._drain_queue())
 
     async def _drain_queue(self) -> None:
-        """Process rows until the queue is empty."""
+        """Process batches until the queue is empty."""
         while True:
-            processed = await self._process_one()
+            processed = await self._process_batch()
             if not processed:
                 break
 
-    async def _process_one(self) -> bool:
-        """Fetch and process one pending row.
+    async def _process_batch(self) -> int:
+        """Lease, dispatch and delete one batch of pending rows.
 
-        Returns True if a row was processed, False if the queue was empty.
-        The row is always deleted (within the same db transaction) even if
-        dispatch raises, to prevent infinite retry loops.
+        Returns the number of rows processed, 0 if nothing was claimable.
+        Rows are always deleted after their dispatch attempt, even if it raised.
         """
+        rows = await self._lease_batch()
+        if not rows:
+            return 0
+        leased_at = time.monotonic()
+
+        by_game: dict[str, list[BotActionQueue]] = {}
+        for row in rows:
+            by_game.setdefault(row.game_id or row.id, []).append(row)
+        async with asyncio.TaskGroup() as tg:
+            for game_rows in by_game.values():
+                tg.create_task(self._dispatch_in_order(game_rows))
+
         async with get_db_session() as db:
-            result = await db.execute(
-                select(BotActionQueue)
-                .order_by(BotActionQueue.enqueued_at)
-                .with_for_update(skip_locked=True)
-                .limit(1)
+            await db.execute(
+                delete(BotActionQueue).where(BotActionQueue.id.in_([row.id for row in rows]))
             )
-            row = result.scalar_one_or_none()
-            if row is None:
-                return False
-
-            try:
-                await self._dispatch(row)
-            except Exception:
-                logger.exception(
-                    "Error dispatching action_type=%r row=%s; deleting to prevent retry loop",
-                    row.action_type,
-                    row.id,
-                )
+            await db.commit()
+        action_queue_lease_age_histogram.record(time.monotonic() - leased_at)
+        return len(rows)
+
+    async def _lease_batch(self) -> list[BotActionQueue]:
+        """Stamp leased_at on the oldest claimable rows and commit the lease.
 
-            await db.delete(row)
+        Returns the leased rows in enqueued_at order.
+        """
+        claimable = (
+            select(BotActionQueue.id)
+            .where(
+                or_(
+                    BotActionQueue.leased_at.is_(None),
+                    BotActionQueue.leased_at < func.now() - _LEASE_TIMEOUT,
+                )
+            )
+            .order_by(BotActionQueue.enqueued_at)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        async with get_db_session() as db:
+            result = await db.execute(
+                update(BotActionQueue)
+                .where(BotActionQueue.id.in_(claimable.scalar_subquery()))
+                .values(leased_at=func.now())
+                .returning(BotActionQueue)
+                .execution_options(synchronize_session=False)
+            )
+            rows = list(result.scalars().all())
+            if not rows:
+                return []
+            depth = await db.scalar(select(func.count()).select_from(BotActionQueue))
             await db.commit()
-            return True
+
+        action_queue_depth_gauge.set(depth or 0)
+        rows.sort(key=lambda row: row.enqueued_at)
+        return rows
+
+    async def _dispatch_in_order(self, rows: list[BotActionQueue]) -> None:
+        """Dispatch rows for one game sequentially, each holding a dispatch slot."""
+        for row in rows:
+            async with self._dispatch_slots:
+                await self._dispatch_logged(row)
+
+    async def _dispatch_logged(self, row: BotActionQueue) -> None:
+        """Dispatch one row, logging instead of raising and recording its latency."""
+        start = time.monotonic()
+        try:
+            await self._dispatch(row)
+        except Exception:
+            logger.exception(
+                "Error dispatching action_type=%r row=%s; deleting to prevent retry loop",
+                row.action_type,
+                row.id,
+            )
+        action_dispatch_duration_histogram.record(
+            time.monotonic() - start, {"action_type": row.action_type}
+        )
 
     async def _dispatch(self, row: BotActionQueue) -> None:
         """Route a queue row to the appropriate EventHandlers method."""
@@ -37,6 +37,8 @@ class BotConfig(BaseSettings):
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         environment: Environment name (development, staging, production)
         frontend_url: Frontend application URL for calendar download links
+        embed_sweep_min_outage_seconds: Shortest resumed outage that triggers an
+            embed deletion sweep
     """
 
     model_config = SettingsConfigDict(
@@ -83,6 +85,11 @@ class BotConfig(BaseSettings):
         description="Backend API URL for image URLs in Discord embeds and frontend calls",
     )
 
+    embed_sweep_min_outage_seconds: int = Field(
+        default=60,
+        description="Resumed Gateway outages shorter than this skip the embed deletion sweep",
+    )
+
 
 _config: BotConfig | None = None
 
@@ -23,15 +23,18 @@
 
 import asyncio
 import logging
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import discord
 from dateutil.rrule import rrulestr
-from sqlalchemy import delete, func, select
+from opentelemetry import metrics
+from sqlalchemy import Select, delete, func, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from services.bot.config import get_config
 from services.bot.formatters.game_message import format_game_announcement
@@ -40,7 +43,9 @@ from services.bot.utils.discord_format import get_member_display_info
 from services.bot.views.clone_confirmation_view import CloneConfirmationView
 from services.bot.views.recurrence_confirmation_view import RecurrenceConfirmationView
 from shared.cache.client import get_redis_client
+from shared.cache.ttl import DISCORD_GLOBAL_RATE_LIMIT_BACKGROUND
 from shared.database import get_db_session
+from shared.discord.rate_limit import get_global_lease
 from shared.message_formats import DMFormats
 from shared.models import game as game_model
 from shared.models import participant as participant_model
@@ -52,6 +57,7 @@ from shared.models.message_refresh_queue import MessageRefreshQueue
 from shared.models.notification_schedule import NotificationSchedule
 from shared.models.participant import GameParticipant
 from shared.models.participant_action_schedule import ParticipantActionSchedule
+from shared.models.reminder_delivery import ReminderDelivery
 from shared.models.signup_method import SignupMethod
 from shared.schemas.events import (
     GameStatusTransitionDueEvent,
@@ -67,8 +73,59 @@ from shared.utils.status_transitions import GameStatus, is_valid_transition
 _HTTP_TOO_MANY_REQUESTS = 429
 _MAX_EDIT_ATTEMPTS = 3
 _CHANNEL_WORKER_RETRY_DELAY_SECONDS = 1.0
+# Upper bound on distinct games drained per channel worker pass.
+_REFRESH_BATCH_SIZE = 100
+# Reminder DMs in flight at once; the global token lease paces the actual rate.
+_REMINDER_DM_CONCURRENCY = 10
 
 logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+message_refresh_requests_counter = meter.create_counter(
+    name="bot.message_refresh.requests",
+    description="Embed refresh requests enqueued, labeled by channel_id",
+    unit="{request}",
+)
+message_refresh_edits_counter = meter.create_counter(
+    name="bot.message_refresh.edits",
+    description=(
+        "Discord embed edits performed by the channel worker, labeled by channel_id. "
+        "requests / edits is the per-channel coalescing ratio."
+    ),
+    unit="{edit}",
+)
+message_refresh_batch_size_histogram = meter.create_histogram(
+    name="bot.message_refresh.batch_size",
+    description="Distinct games drained per channel worker pass, labeled by channel_id",
+    unit="{game}",
+)
+reminder_dm_counter = meter.create_counter(
+    name="bot.reminder.dms",
+    description="Reminder DMs attempted, labeled by outcome (sent/failed/skipped)",
+    unit="{dm}",
+)
+reminder_dm_rate_histogram = meter.create_histogram(
+    name="bot.reminder.dm_rate",
+    description="Reminder DMs sent per second across one reminder's fan-out",
+    unit="{dm}/s",
+)
+reminder_time_to_last_dm_histogram = meter.create_histogram(
+    name="bot.reminder.time_to_last_dm",
+    description="Seconds from the start of a reminder's fan-out to its last DM completing",
+    unit="s",
+)
+
+
+def _select_game_with_participants() -> Select[tuple[GameSession]]:
+    """Build the GameSession select with everything needed to render an embed."""
+    return (
+        select(GameSession)
+        .options(selectinload(GameSession.participants).selectinload(GameParticipant.user))
+        .options(selectinload(GameSession.host))
+        .options(selectinload(GameSession.channel))
+        .options(selectinload(GameSession.archive_channel))
+        .options(selectinload(GameSession.guild))
+    )
 
 
 class EventHandlers:
@@ -84,6 +141,7 @@ class EventHandlers:
         self.bot = bot
         # Per-channel workers driven by the DB queue; keyed by discord_channel_id
         self._channel_workers: dict[str, asyncio.Task[Any]] = {}
+        self._dm_semaphore = asyncio.Semaphore(_REMINDER_DM_CONCURRENCY)
 
     async def _validate_game_created_event(
         self, game_id: str | None, channel_id: str | None
@@ -202,6 +260,7 @@ class EventHandlers:
                 )
                 await db.execute(stmt)
                 await db.commit()
+                message_refresh_requests_counter.add(1, {"channel_id": channel_id})
                 logger.info("Queued message refresh: game=%s, channel=%s", game_id, channel_id)
 
         except Exception as e:
@@ -391,13 +450,15 @@ class EventHandlers:
         game_time_unix: int,
         is_waitlist: bool,
         jump_url: str | None,
-    ) -> None:
-        """Send reminder DMs to a list of participants."""
+        notification_id: str | None = None,
+    ) -> int:
+        """Send reminder DMs to a list of participants concurrently; return the number sent."""
         participant_type = "waitlist" if is_waitlist else "confirmed"
 
-        for participant in participants:
+        async def _send_one(participant: participant_model.GameParticipant) -> bool:
             try:
-                await self._send_reminder_dm(
+                return await self._deliver_reminder_dm(
+                    notification_id,
                     user_discord_id=participant.user.discord_id,
                     game_title=game_title,
                     game_time_unix=game_time_unix,
@@ -412,6 +473,10 @@ class EventHandlers:
                     participant.user_id,
                     e,
                 )
+                return False
+
+        results = await asyncio.gather(*(_send_one(p) for p in participants))
+        return sum(results)
 
     async def _send_host_reminder(
         self,
@@ -419,13 +484,15 @@ class EventHandlers:
         game_title: str,
         game_time_unix: int,
         jump_url: str | None,
-    ) -> None:
-        """Send reminder DM to game host if present."""
+        notification_id: str | None = None,
+    ) -> int:
+        """Send reminder DM to game host if present; return the number sent."""
         if not host or not host.discord_id:
-            return
+            return 0
 
         try:
-            await self._send_reminder_dm(
+            sent = await self._deliver_reminder_dm(
+                notification_id,
                 user_discord_id=host.discord_id,
                 game_title=game_title,
                 game_time_unix=game_time_unix,
@@ -435,12 +502,169 @@ class EventHandlers:
                 is_host=True,
             )
             logger.info("Sent reminder to host %s", host.discord_id)
+            return int(sent)
         except Exception as e:
             logger.exception(
                 "Failed to send reminder to host %s: %s",
                 host.discord_id,
                 e,
             )
+            return 0
+
+    async def _deliver_reminder_dm(
+        self,
+        notification_id: str | None,
+        user_discord_id: str,
+        game_title: str,
+        game_time_unix: int,
+        _reminder_minutes: int,
+        is_waitlist: bool,
+        jump_url: str | None,
+        is_host: bool = False,
+    ) -> bool:
+        """
+        Send one reminder DM under the global rate limit and checkpoint it.
+
+        At most ``_REMINDER_DM_CONCURRENCY`` DMs are in flight at once and each
+        one spends a token from the fleet-wide Discord global budget.  A
+        successful DM is recorded in ``reminder_deliveries`` straight away so a
+        retried reminder skips this recipient.
+
+        Args:
+            notification_id: notification_schedule row being delivered, or None
+                for events that predate checkpointing
+            user_discord_id: Discord user ID (snowflake string)
+            game_title: Title of the game
+            game_time_unix: Unix timestamp of game start time
+            reminder_minutes: Minutes before game
+            is_waitlist: Whether participant is on waitlist
+            jump_url: Discord jump URL to game posting, or None if unavailable
+            is_host: Whether recipient is the game host
+
+        Returns:
+            True if the DM was sent
+        """
+        async with self._dm_semaphore:
+            # Reminder fan-out spends the same background budget, through the
+            # same lease, as the bot's other Discord REST traffic.
+            await get_global_lease(DISCORD_GLOBAL_RATE_LIMIT_BACKGROUND).acquire(
+                await get_redis_client()
+            )
+            sent = await self._send_reminder_dm(
+                user_discord_id=user_discord_id,
+                game_title=game_title,
+                game_time_unix=game_time_unix,
+                _reminder_minutes=_reminder_minutes,
+                is_waitlist=is_waitlist,
+                jump_url=jump_url,
+                is_host=is_host,
+            )
+
+        reminder_dm_counter.add(1, {"outcome": "sent" if sent else "failed"})
+        if sent and notification_id:
+            await self._record_reminder_delivery(notification_id, user_discord_id)
+        return sent
+
+    async def _record_reminder_delivery(self, notification_id: str, user_discord_id: str) -> None:
+        """Checkpoint a delivered reminder DM; failures only risk a duplicate DM on retry."""
+        try:
+            async with get_db_session() as db:
+                await db.execute(
+                    pg_insert(ReminderDelivery)
+                    .values(notification_id=notification_id, discord_id=user_discord_id)
+                    .on_conflict_do_nothing()
+                )
+                await db.commit()
+        except Exception as e:
+            logger.exception(
+                "Failed to record reminder delivery %s for %s: %s",
+                notification_id,
+                user_discord_id,
+                e,
+            )
+
+    async def _get_delivered_reminder_recipients(
+        self, db: AsyncSession, notification_id: str
+    ) -> set[str]:
+        """Return Discord IDs that already received this reminder."""
+        result = await db.execute(
+            select(ReminderDelivery.discord_id).where(
+                ReminderDelivery.notification_id == notification_id
+            )
+        )
+        return set(result.scalars().all())
+
+    async def _skip_delivered_reminder_recipients(
+        self,
+        db: AsyncSession,
+        notification_id: str,
+        confirmed: list[participant_model.GameParticipant],
+        overflow: list[participant_model.GameParticipant],
+        host: user_model.User | None,
+    ) -> tuple[
+        list[participant_model.GameParticipant],
+        list[participant_model.GameParticipant],
+        user_model.User | None,
+    ]:
+        """Drop recipients a previous attempt of this reminder already reached."""
+        delivered = await self._get_delivered_reminder_recipients(db, notification_id)
+        if not delivered:
+            return confirmed, overflow, host
+        logger.info(
+            "Reminder %s resuming: %s recipients already delivered",
+            notification_id,
+            len(delivered),
+        )
+        reminder_dm_counter.add(len(delivered), {"outcome": "skipped"})
+        confirmed = [p for p in confirmed if p.user.discord_id not in delivered]
+        overflow = [p for p in overflow if p.user.discord_id not in delivered]
+        if host and host.discord_id in delivered:
+            host = None
+        return confirmed, overflow, host
+
+    async def _send_reminder_dms(
+        self,
+        confirmed: list[participant_model.GameParticipant],
+        overflow: list[participant_model.GameParticipant],
+        host: user_model.User | None,
+        game_title: str,
+        game_time_unix: int,
+        jump_url: str | None,
+        notification_id: str | None,
+    ) -> tuple[int, float]:
+        """Send a game's reminder DMs concurrently; return the count sent and seconds taken."""
+        started = time.monotonic()
+        sent_counts = await asyncio.gather(
+            self._send_participant_reminders(
+                confirmed,
+                game_title,
+                game_time_unix,
+                is_waitlist=False,
+                jump_url=jump_url,
+                notification_id=notification_id,
+            ),
+            self._send_participant_reminders(
+                overflow,
+                game_title,
+                game_time_unix,
+                is_waitlist=True,
+                jump_url=jump_url,
+                notification_id=notification_id,
+            ),
+            self._send_host_reminder(
+                host,
+                game_title,
+                game_time_unix,
+                jump_url=jump_url,
+                notification_id=notification_id,
+            ),
+        )
+        elapsed = time.monotonic() - started
+        sent = sum(sent_counts)
+        if sent:
+            reminder_time_to_last_dm_histogram.record(elapsed)
+            reminder_dm_rate_histogram.record(sent / elapsed if elapsed > 0 else sent)
+        return sent, elapsed
 
     async def _handle_game_reminder(self, reminder_event: NotificationDueEvent) -> None:
         """
@@ -450,13 +674,15 @@ class EventHandlers:
         - Filters to only real participants (user_id IS NOT NULL)
         - Sorts by position_type, position, then joined_at
         - Determines active vs waitlist based on max_players
-        - Sends DM to each eligible participant
+        - Skips recipients already checkpointed for this notification
+        - Sends DMs concurrently after the DB session is released
 
         Args:
             reminder_event: Notification event with game_id
         """
 
         try:
+            notification_id = reminder_event.notification_id
             async with get_db_session() as db:
                 game = await self._get_game_with_participants(db, str(reminder_event.game_id))
 
@@ -468,6 +694,12 @@ class EventHandlers:
                     return
 
                 confirmed, overflow = self._partition_and_filter_participants(game)
+                host = game.host
+
+                if notification_id:
+                    confirmed, overflow, host = await self._skip_delivered_reminder_recipients(
+                        db, notification_id, confirmed, overflow, host
+                    )
 
                 game_time_unix = int(game.scheduled_at.timestamp())
 
@@ -483,34 +715,25 @@ class EventHandlers:
                         reminder_event.game_id,
                     )
 
-                await self._send_participant_reminders(
-                    confirmed,
-                    game.title,
-                    game_time_unix,
-                    is_waitlist=False,
-                    jump_url=jump_url,
-                )
-                await self._send_participant_reminders(
-                    overflow,
-                    game.title,
-                    game_time_unix,
-                    is_waitlist=True,
-                    jump_url=jump_url,
-                )
-                await self._send_host_reminder(
-                    game.host,
-                    game.title,
-                    game_time_unix,
-                    jump_url=jump_url,
-                )
+            sent, elapsed = await self._send_reminder_dms(
+                confirmed,
+                overflow,
+                host,
+                game.title,
+                game_time_unix,
+                jump_url=jump_url,
+                notification_id=notification_id,
+            )
 
-                logger.info(
-                    "✓ Completed reminder notifications for game %s: "
-                    "%s confirmed, %s waitlist, host notified",
-                    reminder_event.game_id,
-                    len(confirmed),
-                    len(overflow),
-                )
+            logger.info(
+                "✓ Completed reminder notifications for game %s: "
+                "%s confirmed, %s waitlist, host notified (%s DMs in %.2fs)",
+                reminder_event.game_id,
+                len(confirmed),
+                len(overflow),
+                sent,
+                elapsed,
+            )
 
         except Exception as e:
             logger.exception(
@@ -874,7 +1097,7 @@ class EventHandlers:
         is_waitlist: bool,
         jump_url: str | None,
         is_host: bool = False,
-    ) -> None:
+    ) -> bool:
         """
         Send reminder DM to a single participant or host.
 
@@ -886,6 +1109,9 @@ class EventHandlers:
             is_waitlist: Whether participant is on waitlist
             jump_url: Discord jump URL to game posting, or None if unavailable
             is_host: Whether recipient is the game host
+
+        Returns:
+            True if the DM was sent
         """
         if is_host:
             message = DMFormats.reminder_host(game_title, game_time_unix, jump_url)
@@ -893,7 +1119,7 @@ class EventHandlers:
             message = DMFormats.reminder_participant(
                 game_title, game_time_unix, is_waitlist, jump_url
             )
-        await self._send_dm(user_discord_id, message)
+        return await self._send_dm(user_discord_id, message)
 
     async def _handle_send_notification(self, data: dict[str, Any]) -> None:
         """
@@ -1451,16 +1677,8 @@ class EventHandlers:
         """
         from uuid import UUID  # noqa: PLC0415 - avoid top-level UUID conflict
 
-        from sqlalchemy.orm import selectinload  # noqa: PLC0415
-
         result = await db.execute(
-            select(GameSession)
-            .options(selectinload(GameSession.participants).selectinload(GameParticipant.user))
-            .options(selectinload(GameSession.host))
-            .options(selectinload(GameSession.channel))
-            .options(selectinload(GameSession.archive_channel))
-            .options(selectinload(GameSession.guild))
-            .where(GameSession.id == str(UUID(game_id)))
+            _select_game_with_participants().where(GameSession.id == str(UUID(game_id)))
         )
         return result.scalar_one_or_none()
 
@@ -1468,6 +1686,9 @@ class EventHandlers:
         """
         Per-channel worker that drains the message_refresh_queue for one channel.
 
+        Each pass snapshots every pending game for the channel, loads them in
+        one query and edits each embed once with the loaded state, so a burst
+        of updates to the same game collapses into a single Discord edit.
         Loops until no pending rows remain, then deregisters itself from
         ``_channel_workers``.  Rate limiting is enforced via
         ``claim_channel_rate_limit_slot`` before each Discord edit.
@@ -1479,7 +1700,7 @@ class EventHandlers:
         try:
             while True:
                 try:
-                    if not await self._drain_one_queued_game(discord_channel_id, attempt_counts):
+                    if not await self._drain_queued_games(discord_channel_id, attempt_counts):
                         break
                 except Exception:
                     logger.exception(
@@ -1491,55 +1712,85 @@ class EventHandlers:
         finally:
             self._channel_workers.pop(discord_channel_id, None)
 
-    async def _drain_one_queued_game(
+    async def _drain_queued_games(
         self, discord_channel_id: str, attempt_counts: dict[str, int]
     ) -> bool:
-        """Process one queued game for this channel; return False when the queue is empty."""
-        game_id = await self._fetch_next_queued_game(discord_channel_id)
-        if game_id is None:
+        """Edit every queued game for this channel once; return False when the queue is empty.
+
+        Queue rows enqueued after the snapshot ``t_cut`` survive the final
+        delete, so updates that land mid-pass trigger another edit next pass.
+        """
+        game_ids = await self._fetch_queued_games(discord_channel_id)
+        if not game_ids:
             return False
 
-        redis = await get_redis_client()
-        wait_ms = await redis.claim_channel_rate_limit_slot(discord_channel_id)
-        t_cut = await self._edit_with_backoff(discord_channel_id, game_id, wait_ms)
-        if t_cut is None:
-            attempt_counts[game_id] = attempt_counts.get(game_id, 0) + 1
-            if attempt_counts[game_id] < _MAX_EDIT_ATTEMPTS:
-                return True
-            logger.error(
-                "Dropping game %s from refresh queue after %d failed attempts",
-                game_id,
-                _MAX_EDIT_ATTEMPTS,
-            )
-            t_cut = datetime.now(tz=UTC)
+        attributes = {"channel_id": discord_channel_id}
+        message_refresh_batch_size_histogram.record(len(game_ids), attributes)
 
-        attempt_counts.pop(game_id, None)
+        t_cut = datetime.now(tz=UTC)
         async with get_db_session() as db:
-            await db.execute(
-                delete(MessageRefreshQueue).where(
-                    MessageRefreshQueue.channel_id == discord_channel_id,
-                    MessageRefreshQueue.game_id == game_id,
-                    MessageRefreshQueue.enqueued_at <= t_cut,
+            games = await self._get_games_with_participants(db, game_ids)
+
+        redis = await get_redis_client()
+        processed: list[str] = []
+        for game_id in game_ids:
+            wait_ms = await redis.claim_channel_rate_limit_slot(discord_channel_id)
+            if await self._edit_with_backoff(
+                discord_channel_id, game_id, games.get(game_id), wait_ms
+            ):
+                message_refresh_edits_counter.add(1, attributes)
+            else:
+                attempt_counts[game_id] = attempt_counts.get(game_id, 0) + 1
+                if attempt_counts[game_id] < _MAX_EDIT_ATTEMPTS:
+                    continue
+                logger.error(
+                    "Dropping game %s from refresh queue after %d failed attempts",
+                    game_id,
+                    _MAX_EDIT_ATTEMPTS,
                 )
-            )
-            await db.commit()
+            attempt_counts.pop(game_id, None)
+            processed.append(game_id)
+
+        if processed:
+            async with get_db_session() as db:
+                await db.execute(
+                    delete(MessageRefreshQueue).where(
+                        MessageRefreshQueue.channel_id == discord_channel_id,
+                        MessageRefreshQueue.game_id.in_(processed),
+                        MessageRefreshQueue.enqueued_at <= t_cut,
+                    )
+                )
+                await db.commit()
         return True
 
-    async def _fetch_next_queued_game(self, discord_channel_id: str) -> str | None:
-        """Return one pending game_id from the queue for this channel, or None if empty."""
+    async def _fetch_queued_games(self, discord_channel_id: str) -> list[str]:
+        """Return the pending game_ids for this channel, oldest request first.
+
+        The (channel_id, game_id) primary key already collapses repeated
+        requests for a game into one row, so each id appears at most once.
+        """
         async with get_db_session() as db:
             result = await db.execute(
                 select(MessageRefreshQueue.game_id)
                 .where(MessageRefreshQueue.channel_id == discord_channel_id)
-                .limit(1)
+                .order_by(MessageRefreshQueue.enqueued_at)
+                .limit(_REFRESH_BATCH_SIZE)
             )
-            return result.scalar_one_or_none()
+            return list(result.scalars().all())
 
-    async def _try_edit_game_message(self, discord_channel_id: str, game_id: str) -> bool:
-        """Fetch game state and edit its Discord embed. Returns False if the game is gone."""
-        async with get_db_session() as db:
-            game = await self._get_game_with_participants(db, game_id)
+    async def _get_games_with_participants(
+        self, db: AsyncSession, game_ids: list[str]
+    ) -> dict[str, GameSession]:
+        """Load several games with participants in one query, keyed by game id."""
+        result = await db.execute(
+            _select_game_with_participants().where(GameSession.id.in_(game_ids))
+        )
+        return {game.id: game for game in result.scalars().all()}
 
+    async def _try_edit_game_message(
+        self, discord_channel_id: str, game_id: str, game: GameSession | None
+    ) -> bool:
+        """Edit a game's Discord embed from loaded state. Returns False if the game is gone."""
         if not game or not game.message_id:
             logger.warning("Game or message not found for channel worker: %s", game_id)
             return False
@@ -1555,20 +1806,23 @@ class EventHandlers:
         return True
 
     async def _edit_with_backoff(
-        self, discord_channel_id: str, game_id: str, wait_ms: int
-    ) -> datetime | None:
+        self,
+        discord_channel_id: str,
+        game_id: str,
+        game: GameSession | None,
+        wait_ms: int,
+    ) -> bool:
         """Attempt to edit a game's Discord embed, retrying on 429.
 
-        Returns the timestamp snapshot taken just before a successful edit,
-        or None if the edit was permanently skipped or failed.
+        Returns True after a successful edit, or False if the edit was
+        permanently skipped or failed.
         """
         while True:
             if wait_ms > 0:
                 await asyncio.sleep(wait_ms / 1000)
-            t_cut = datetime.now(tz=UTC)
             try:
-                if not await self._try_edit_game_message(discord_channel_id, game_id):
-                    return None
+                if not await self._try_edit_game_message(discord_channel_id, game_id, game):
+                    return False
             except discord.HTTPException as exc:
                 if exc.status == _HTTP_TOO_MANY_REQUESTS:
                     retry_after: float = getattr(exc, "retry_after", 1.0) or 1.0
@@ -1580,8 +1834,8 @@ class EventHandlers:
                     )
                     continue
                 logger.exception("Discord error editing message for game %s: %s", game_id, exc)
-                return None
+                return False
             except Exception as exc:
                 logger.exception("Unexpected error in channel worker for game %s: %s", game_id, exc)
-                return None
-            return t_cut
+                return False
+            return True
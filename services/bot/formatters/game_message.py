@@ -723,11 +723,13 @@ def format_game_announcement(
 
     if thumbnail_id:
         ext = _MIME_TO_EXT.get(thumbnail_mime_type or "", "")
-        thumbnail_url = f"{config.backend_url}/api/v1/public/images/{thumbnail_id}{ext}"
+        thumbnail_url = (
+            f"{config.backend_url}/api/v1/public/images/{thumbnail_id}{ext}?size=thumbnail"
+        )
 
     if banner_image_id:
         ext = _MIME_TO_EXT.get(banner_image_mime_type or "", "")
-        image_url = f"{config.backend_url}/api/v1/public/images/{banner_image_id}{ext}"
+        image_url = f"{config.backend_url}/api/v1/public/images/{banner_image_id}{ext}?size=banner"
 
     embed = formatter.create_game_embed(
         game_title=game_title,
@@ -21,10 +21,14 @@
 
 """Bot-side projection writer and reader for Discord member data from gateway events."""
 
+import asyncio
 import json
 import logging
-from collections.abc import Iterable
+import os
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime
+from pathlib import Path
+from typing import Protocol
 
 import discord
 from opentelemetry import metrics
@@ -32,6 +36,7 @@ from redis.asyncio.client import Pipeline
 
 from shared.cache.client import RedisClient
 from shared.cache.keys import CacheKeys
+from shared.cache.member_record import avatar_url, decode_member_record, encode_member_record
 from shared.cache.operations import read_projection_key
 
 
@@ -50,12 +55,13 @@ async def get_user_roles(guild_id: str, uid: str, *, redis: RedisClient) -> list
     raw = await read_projection_key(redis, CacheKeys.proj_member, guild_id, uid)
     if raw is None:
         return []
-    return json.loads(raw).get("roles", [])
+    return decode_member_record(raw, uid).get("roles", [])
 
 
 logger = logging.getLogger(__name__)
 meter = metrics.get_meter(__name__)
 
+
 repopulation_started_counter = meter.create_counter(
     name="bot.projection.repopulation.started",
     description="Number of projection repopulation cycles started",
@@ -71,6 +77,81 @@ repopulation_members_written_gauge = meter.create_gauge(
     description="Number of members written in projection repopulation",
     unit="{member}",
 )
+repopulation_peak_memory_gauge = meter.create_gauge(
+    name="bot.projection.repopulation.peak_memory_growth",
+    description=(
+        "Peak growth of bot resident memory during projection repopulation, "
+        "sampled at each pipeline flush"
+    ),
+    unit="By",
+)
+repopulation_pipeline_flushes_gauge = meter.create_gauge(
+    name="bot.projection.repopulation.pipeline_flushes",
+    description="Number of Redis pipeline flushes in projection repopulation",
+    unit="1",
+)
+
+_PIPELINE_FLUSH_COMMANDS = 5000
+
+# Add or remove one guild ID in many proj:user_guilds JSON lists atomically.
+# KEYS[i]    = proj:user_guilds key
+# ARGV[1]    = guild ID
+# ARGV[i+1]  = "1" to add the guild to KEYS[i], "0" to remove it
+#
+# An add leaves a list that already holds the guild untouched; a remove always
+# writes the list back, as "[]" when it ends up empty (cjson would write "{}").
+_PATCH_USER_GUILDS_LUA = """
+local guild_id = ARGV[1]
+for i, key in ipairs(KEYS) do
+    local raw = redis.call('GET', key)
+    local kept = {}
+    local present = false
+    if raw then
+        for _, g in ipairs(cjson.decode(raw)) do
+            if g == guild_id then
+                present = true
+            else
+                kept[#kept + 1] = g
+            end
+        end
+    end
+    if ARGV[i + 1] == '1' then
+        if not present then
+            kept[#kept + 1] = guild_id
+            redis.call('SET', key, cjson.encode(kept))
+        end
+    elseif #kept == 0 then
+        redis.call('SET', key, '[]')
+    else
+        redis.call('SET', key, cjson.encode(kept))
+    end
+end
+return 0
+"""
+
+
+class ProjectionWriter(Protocol):
+    """The subset of Redis pipeline commands incremental projection updates queue.
+
+    Satisfied by a redis-py Pipeline and by the bot's GatewayWriteBatcher.
+    """
+
+    def set(self, name: str, value: str) -> object: ...
+
+    def delete(self, name: str) -> object: ...
+
+    def zadd(self, name: str, mapping: Mapping[str, float]) -> object: ...
+
+    def zrem(self, name: str, value: str) -> object: ...
+
+    def eval(self, script: str, numkeys: int, *keys_and_args: str) -> object: ...
+
+
+def _queue_user_guilds_patch(
+    writer: ProjectionWriter, key: str, guild_id: str, *, add: bool
+) -> None:
+    """Queue _PATCH_USER_GUILDS_LUA for one user's list, adding or removing one guild."""
+    writer.eval(_PATCH_USER_GUILDS_LUA, 1, key, guild_id, "1" if add else "0")
 
 
 async def _delete_old_generation(redis: RedisClient, prev_gen: str) -> None:
@@ -105,6 +186,26 @@ def _build_member_data(member: discord.Member) -> dict[str, object]:
     }
 
 
+def _encode_member(member: discord.Member) -> str:
+    """Encode a member record compactly, falling back to JSON when it can't round-trip.
+
+    The compact form rebuilds the avatar URL from the hash, so it is only used when
+    that reconstruction matches the URL discord.py reports for the member.
+    """
+    data = _build_member_data(member)
+    avatar_hash = member.avatar.key if member.avatar else None
+    if avatar_url(str(member.id), avatar_hash) != data["avatar_url"]:
+        return json.dumps(data)
+    encoded = encode_member_record(
+        role_ids=(role.id for role in member.roles),
+        nick=member.nick,
+        global_name=member.global_name,
+        username=member.name,
+        avatar_hash=avatar_hash,
+    )
+    return encoded if encoded is not None else json.dumps(data)
+
+
 def _member_username_variants(member: discord.Member) -> list[str]:
     seen: set[str] = set()
     result: list[str] = []
@@ -124,14 +225,15 @@ def _queue_member_to_pipe(
     guild_id: str,
     uid: str,
     member: discord.Member,
-) -> None:
-    """Queue a single member write into a Redis pipeline buffer (synchronous)."""
-    key = CacheKeys.proj_member(gen, guild_id, uid)
-    pipe.set(key, json.dumps(_build_member_data(member)))
+) -> list[str]:
+    """Queue a single member write into a Redis pipeline buffer (synchronous).
 
-    usernames_key = CacheKeys.proj_usernames(gen, guild_id)
-    for name_lower in _member_username_variants(member):
-        pipe.zadd(usernames_key, {f"{name_lower}\x00{uid}": 0})
+    Returns the member's proj:usernames entries so the caller can batch them into
+    one multi-member ZADD instead of one ZADD per variant.
+    """
+    key = CacheKeys.proj_member(gen, guild_id, uid)
+    pipe.set(key, _encode_member(member))
+    return [f"{name_lower}\x00{uid}" for name_lower in _member_username_variants(member)]
 
 
 def _queue_user_guilds_to_pipe(
@@ -156,42 +258,125 @@ def _queue_guild_name_to_pipe(
     pipe.set(key, guild_name)
 
 
+class _ChunkedProjectionWriter:
+    """Stream projection writes through one pipeline, flushing every few thousand commands.
+
+    Username entries are buffered per guild and emitted as a single multi-member ZADD
+    at each flush. Each flush awaits the pipeline and then yields to the event loop, so
+    neither the client nor Redis buffers more than one chunk and gateway heartbeats
+    keep running during large rebuilds.
+    """
+
+    def __init__(self, pipe: Pipeline, gen: str) -> None:
+        self._pipe = pipe
+        self._gen = gen
+        self._queued = 0
+        self._usernames_key: str | None = None
+        self._username_entries: dict[str, int] = {}
+        self.flushes = 0
+        self.peak_rss: int | None = None
+
+    async def begin_guild(self, guild_id: str, guild_name: str) -> None:
+        """Start writing a guild: emit the previous guild's entries and queue the name."""
+        self._queue_username_entries()
+        self._usernames_key = CacheKeys.proj_usernames(self._gen, guild_id)
+        _queue_guild_name_to_pipe(self._pipe, self._gen, guild_id, guild_name)
+        await self._count(1)
+
+    async def add_member(self, guild_id: str, uid: str, member: discord.Member) -> list[str]:
+        """Queue a member record; returns the member's proj:usernames entries."""
+        entries = _queue_member_to_pipe(self._pipe, self._gen, guild_id, uid, member)
+        self._username_entries.update(dict.fromkeys(entries, 0))
+        await self._count(1)
+        return entries
+
+    async def add_user_guilds(self, uid: str, guild_ids: list[str]) -> None:
+        """Queue a proj:user_guilds write."""
+        _queue_user_guilds_to_pipe(self._pipe, self._gen, uid, guild_ids)
+        await self._count(1)
+
+    async def flush(self) -> None:
+        """Send everything queued so far and yield to the event loop."""
+        self._queue_username_entries()
+        if self._queued == 0:
+            return
+        # The client-side buffer is fullest right before it is sent.
+        rss = _current_rss_bytes()
+        if rss is not None and (self.peak_rss is None or rss > self.peak_rss):
+            self.peak_rss = rss
+        await self._pipe.execute()
+        self._queued = 0
+        self.flushes += 1
+        await asyncio.sleep(0)
+
+    def _queue_username_entries(self) -> None:
+        if self._usernames_key is None or not self._username_entries:
+            return
+        self._pipe.zadd(self._usernames_key, self._username_entries)
+        self._username_entries = {}
+        self._queued += 1
+
+    async def _count(self, commands: int) -> None:
+        self._queued += commands
+        if self._queued + len(self._username_entries) >= _PIPELINE_FLUSH_COMMANDS:
+            await self.flush()
+
+
 async def _write_all_members(
     bot: discord.Client,
     redis: RedisClient,
     new_gen: str,
-) -> tuple[int, dict[str, list[str]]]:
-    """Write all member records and accumulate user->guild mapping via a single pipeline.
+) -> int:
+    """Stream all member records and user->guild lists into the new generation.
+
+    The user->guild map is kept as integer ids (guild ids by position in bot.guilds)
+    and drained as it is written, which keeps it far smaller than the string form.
 
     Returns:
-        Tuple of (total_members_written, user_guild_map)
+        Total members written
     """
-    user_guild_map: dict[str, list[str]] = {}
+    guilds = list(bot.guilds)
+    guild_ids = [str(guild.id) for guild in guilds]
+    user_guild_map: dict[int, list[int]] = {}
     total_members_written = 0
+    rss_before = _current_rss_bytes()
 
     async with redis._client.pipeline(transaction=False) as pipe:
-        for guild in bot.guilds:
-            guild_id = str(guild.id)
-            _queue_guild_name_to_pipe(pipe, new_gen, guild_id, guild.name)
+        writer = _ChunkedProjectionWriter(pipe, new_gen)
+        for index, guild in enumerate(guilds):
+            guild_id = guild_ids[index]
+            await writer.begin_guild(guild_id, guild.name)
             for member in guild.members:
-                uid = str(member.id)
-                _queue_member_to_pipe(pipe, new_gen, guild_id, uid, member)
+                await writer.add_member(guild_id, str(member.id), member)
                 total_members_written += 1
-                user_guild_map.setdefault(uid, []).append(guild_id)
+                user_guild_map.setdefault(member.id, []).append(index)
 
-        for uid, guild_ids in user_guild_map.items():
-            _queue_user_guilds_to_pipe(pipe, new_gen, uid, guild_ids)
+        while user_guild_map:
+            uid, indexes = user_guild_map.popitem()
+            await writer.add_user_guilds(str(uid), [guild_ids[i] for i in indexes])
 
-        await pipe.execute()
+        await writer.flush()
+
+    repopulation_pipeline_flushes_gauge.set(writer.flushes)
+    if rss_before is not None and writer.peak_rss is not None:
+        repopulation_peak_memory_gauge.set(max(writer.peak_rss - rss_before, 0))
+    return total_members_written
 
-    return total_members_written, user_guild_map
+
+def _current_rss_bytes() -> int | None:
+    """Return the current resident set size in bytes, or None without /proc."""
+    try:
+        resident_pages = int(Path("/proc/self/statm").read_text(encoding="ascii").split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
 
 
 async def repopulate_all(
     *,
     bot: discord.Client,
     redis: RedisClient,
-) -> None:
+) -> str:
     """
     Repopulate entire member projection from bot gateway cache.
 
@@ -201,13 +386,16 @@ async def repopulate_all(
     Args:
         bot: Discord bot instance with guild cache
         redis: Redis async client
+
+    Returns:
+        The new generation, now the value of the proj:gen pointer
     """
     start_time = datetime.now(UTC)
 
     new_gen = str(int(datetime.now(UTC).timestamp() * 1000))
     prev_gen = await redis.get(CacheKeys.proj_gen())
 
-    total_members_written, _ = await _write_all_members(bot, redis, new_gen)
+    total_members_written = await _write_all_members(bot, redis, new_gen)
 
     # CRITICAL: Flip generation pointer AFTER all writes are complete.
     # Readers observing the new gen value are guaranteed to find all data present.
@@ -234,6 +422,146 @@ async def repopulate_all(
         delete_duration = (datetime.now(UTC) - delete_start).total_seconds()
         logger.info("Projection old-gen cleanup: %.2fs, gen=%s", delete_duration, prev_gen)
 
+    return new_gen
+
+
+async def _existing_guild_entries(redis: RedisClient, gen: str, guild_id: str) -> set[str]:
+    """Return the current proj:usernames entries for a guild in the given generation.
+
+    Every projected member has at least one username variant, so the sorted set
+    doubles as an index of the guild's projected uids without a keyspace SCAN.
+    """
+    entries = await redis._client.zrange(CacheKeys.proj_usernames(gen, guild_id), 0, -1)
+    return set(entries)
+
+
+def _entry_uids(entries: Iterable[str]) -> set[str]:
+    return {entry.rsplit("\x00", 1)[1] for entry in entries}
+
+
+async def _patch_user_guilds(
+    redis: RedisClient,
+    gen: str,
+    guild_id: str,
+    *,
+    added_uids: set[str],
+    removed_uids: set[str],
+) -> None:
+    """Add or remove one guild from many proj:user_guilds lists in one round-trip.
+
+    Each list is edited inside _PATCH_USER_GUILDS_LUA, so a concurrent patch
+    of the same user for another guild cannot be overwritten by a value read
+    before it landed.  Keys are sent in chunks of _PIPELINE_FLUSH_COMMANDS per
+    script call so no single call blocks Redis for long.
+    """
+    uids = sorted(added_uids | removed_uids)
+    if not uids:
+        return
+
+    async with redis._client.pipeline(transaction=False) as pipe:
+        for i in range(0, len(uids), _PIPELINE_FLUSH_COMMANDS):
+            chunk = uids[i : i + _PIPELINE_FLUSH_COMMANDS]
+            keys = [CacheKeys.proj_user_guilds(gen, uid) for uid in chunk]
+            ops = ["1" if uid in added_uids else "0" for uid in chunk]
+            pipe.eval(_PATCH_USER_GUILDS_LUA, len(keys), *keys, guild_id, *ops)
+        await pipe.execute()
+
+
+async def repopulate_guild(guild: discord.Guild, *, redis: RedisClient) -> bool:
+    """
+    Rewrite a single guild's projection in place within the current generation.
+
+    Member and username entries are written before stale entries are removed, so
+    readers using read_projection_key never observe a member disappearing and
+    reappearing. Only proj:user_guilds lists for members who joined or left the
+    guild since the last write are patched. The generation pointer is untouched.
+
+    Args:
+        guild: Discord guild whose members should be rewritten
+        redis: Redis async client
+
+    Returns:
+        True if the guild was rewritten, False if no generation exists yet and the
+        caller must fall back to repopulate_all
+    """
+    gen = await redis.get(CacheKeys.proj_gen())
+    if gen is None:
+        return False
+
+    start_time = datetime.now(UTC)
+    guild_id = str(guild.id)
+
+    old_entries = await _existing_guild_entries(redis, gen, guild_id)
+    old_uids = _entry_uids(old_entries)
+
+    new_entries: set[str] = set()
+    new_uids: set[str] = set()
+
+    async with redis._client.pipeline(transaction=False) as pipe:
+        writer = _ChunkedProjectionWriter(pipe, gen)
+        await writer.begin_guild(guild_id, guild.name)
+        for member in guild.members:
+            uid = str(member.id)
+            new_uids.add(uid)
+            new_entries.update(await writer.add_member(guild_id, uid, member))
+        await writer.flush()
+
+        usernames_key = CacheKeys.proj_usernames(gen, guild_id)
+        stale_entries = sorted(old_entries - new_entries)
+        stale_keys = [CacheKeys.proj_member(gen, guild_id, uid) for uid in old_uids - new_uids]
+        for i in range(0, len(stale_entries), _PIPELINE_FLUSH_COMMANDS):
+            pipe.zrem(usernames_key, *stale_entries[i : i + _PIPELINE_FLUSH_COMMANDS])
+        for i in range(0, len(stale_keys), _PIPELINE_FLUSH_COMMANDS):
+            pipe.delete(*stale_keys[i : i + _PIPELINE_FLUSH_COMMANDS])
+        if stale_entries or stale_keys:
+            await pipe.execute()
+
+    await _patch_user_guilds(
+        redis,
+        gen,
+        guild_id,
+        added_uids=new_uids - old_uids,
+        removed_uids=old_uids - new_uids,
+    )
+
+    logger.info(
+        "Projection guild repopulation complete: guild=%s, %d members, %.2fs",
+        guild_id,
+        len(new_uids),
+        (datetime.now(UTC) - start_time).total_seconds(),
+    )
+    return True
+
+
+async def remove_guild(guild_id: str, *, redis: RedisClient) -> None:
+    """
+    Remove a single guild from the current projection generation.
+
+    Deletes the guild's member keys, username sorted set and guild name, and drops
+    the guild from each former member's proj:user_guilds list. The generation
+    pointer is untouched.
+
+    Args:
+        guild_id: Discord guild ID the bot has left
+        redis: Redis async client
+    """
+    gen = await redis.get(CacheKeys.proj_gen())
+    if gen is None:
+        return
+
+    old_uids = _entry_uids(await _existing_guild_entries(redis, gen, guild_id))
+
+    await _patch_user_guilds(redis, gen, guild_id, added_uids=set(), removed_uids=old_uids)
+
+    async with redis._client.pipeline(transaction=False) as pipe:
+        for uid in old_uids:
+            pipe.delete(CacheKeys.proj_member(gen, guild_id, uid))
+        pipe.delete(CacheKeys.proj_usernames(gen, guild_id))
+        pipe.delete(CacheKeys.proj_guild_name(gen, guild_id))
+        await pipe.execute()
+
+    logger.info("Projection guild removed: guild=%s, %d members", guild_id, len(old_uids))
+
 
 async def write_member(
     *,
@@ -257,7 +585,7 @@ async def write_member(
         NotImplementedError: Function not yet implemented
     """
     key = CacheKeys.proj_member(gen, guild_id, uid)
-    await redis.set_json(key, _build_member_data(member), ttl=None)
+    await redis.set(key, _encode_member(member), ttl=None)
 
     usernames_key = CacheKeys.proj_usernames(gen, guild_id)
     for name_lower in _member_username_variants(member):
@@ -326,6 +654,19 @@ async def update_member(
         member_after: Member state after the update
         redis: Redis async client
     """
+    async with redis._client.pipeline(transaction=True) as pipe:
+        pipe.multi()
+        queue_member_update(pipe, gen, member_before, member_after)
+        await pipe.execute()
+
+
+def queue_member_update(
+    writer: ProjectionWriter,
+    gen: str,
+    member_before: discord.Member,
+    member_after: discord.Member,
+) -> None:
+    """Queue the writes of update_member() into a pipeline or write batcher."""
     guild_id = str(member_after.guild.id)
     uid = str(member_after.id)
 
@@ -337,21 +678,17 @@ async def update_member(
 
     logger.info("Projection update_member: guild=%s uid=%s", guild_id, uid)
 
-    async with redis._client.pipeline(transaction=True) as pipe:
-        pipe.multi()
-        pipe.set(member_key, json.dumps(_build_member_data(member_after)))
-        if old_variants != new_variants:
-            for name_lower in new_variants - old_variants:
-                pipe.zadd(usernames_key, {f"{name_lower}\x00{uid}": 0})
-            for name_lower in old_variants - new_variants:
-                pipe.zrem(usernames_key, f"{name_lower}\x00{uid}")
-        await pipe.execute()
+    writer.set(member_key, _encode_member(member_after))
+    for name_lower in new_variants - old_variants:
+        writer.zadd(usernames_key, {f"{name_lower}\x00{uid}": 0})
+    for name_lower in old_variants - new_variants:
+        writer.zrem(usernames_key, f"{name_lower}\x00{uid}")
 
 
 async def add_member(gen: str, member: discord.Member, *, redis: RedisClient) -> None:
     """Add a new member to the projection incrementally using an atomic pipeline.
 
-    Writes the member key, appends the guild to the user's guild list, and ZADDs
+    Writes the member key, adds the guild to the user's guild list, and ZADDs
     all username variants. Does not change the generation pointer.
 
     Args:
@@ -359,25 +696,29 @@ async def add_member(gen: str, member: discord.Member, *, redis: RedisClient) ->
         member: The new Discord member
         redis: Redis async client
     """
+    async with redis._client.pipeline(transaction=True) as pipe:
+        pipe.multi()
+        queue_member_add(pipe, gen, member)
+        await pipe.execute()
+
+
+def queue_member_add(writer: ProjectionWriter, gen: str, member: discord.Member) -> None:
+    """Queue the writes of add_member() into a pipeline or write batcher.
+
+    The guild list is patched by _PATCH_USER_GUILDS_LUA when the writes land,
+    so it never overwrites a concurrent patch for another guild.
+    """
     guild_id = str(member.guild.id)
     uid = str(member.id)
 
     logger.info("Projection add_member: guild=%s uid=%s", guild_id, uid)
 
-    raw = await redis.get(CacheKeys.proj_user_guilds(gen, uid))
-    current_guilds: list[str] = json.loads(raw) if raw else []
-    if guild_id not in current_guilds:
-        current_guilds.append(guild_id)
-
     member_key, guilds_key, usernames_key = _member_projection_keys(gen, guild_id, uid)
 
-    async with redis._client.pipeline(transaction=True) as pipe:
-        pipe.multi()
-        pipe.set(member_key, json.dumps(_build_member_data(member)))
-        pipe.set(guilds_key, json.dumps(current_guilds))
-        for name_lower in _member_username_variants(member):
-            pipe.zadd(usernames_key, {f"{name_lower}\x00{uid}": 0})
-        await pipe.execute()
+    writer.set(member_key, _encode_member(member))
+    _queue_user_guilds_patch(writer, guilds_key, guild_id, add=True)
+    for name_lower in _member_username_variants(member):
+        writer.zadd(usernames_key, {f"{name_lower}\x00{uid}": 0})
 
 
 async def remove_member(gen: str, member: discord.Member, *, redis: RedisClient) -> None:
@@ -391,24 +732,29 @@ async def remove_member(gen: str, member: discord.Member, *, redis: RedisClient)
         member: The Discord member being removed
         redis: Redis async client
     """
+    async with redis._client.pipeline(transaction=True) as pipe:
+        pipe.multi()
+        queue_member_remove(pipe, gen, member)
+        await pipe.execute()
+
+
+def queue_member_remove(writer: ProjectionWriter, gen: str, member: discord.Member) -> None:
+    """Queue the writes of remove_member() into a pipeline or write batcher.
+
+    As in queue_member_add(), the guild list is patched in place by
+    _PATCH_USER_GUILDS_LUA rather than overwritten.
+    """
     guild_id = str(member.guild.id)
     uid = str(member.id)
 
     logger.info("Projection remove_member: guild=%s uid=%s", guild_id, uid)
 
-    raw = await redis.get(CacheKeys.proj_user_guilds(gen, uid))
-    current_guilds: list[str] = json.loads(raw) if raw else []
-    updated_guilds = [g for g in current_guilds if g != guild_id]
-
     member_key, guilds_key, usernames_key = _member_projection_keys(gen, guild_id, uid)
 
-    async with redis._client.pipeline(transaction=True) as pipe:
-        pipe.multi()
-        pipe.delete(member_key)
-        pipe.set(guilds_key, json.dumps(updated_guilds))
-        for name_lower in _member_username_variants(member):
-            pipe.zrem(usernames_key, f"{name_lower}\x00{uid}")
-        await pipe.execute()
+    writer.delete(member_key)
+    _queue_user_guilds_patch(writer, guilds_key, guild_id, add=False)
+    for name_lower in _member_username_variants(member):
+        writer.zrem(usernames_key, f"{name_lower}\x00{uid}")
 
 
 def _member_projection_keys(gen: str, guild_id: str, uid: str) -> tuple[str, str, str]:
@@ -461,6 +807,23 @@ async def update_user(
         bot_guilds: All guilds known to the bot
         redis: Redis async client
     """
+    if set(_user_global_variants(user_before)) == set(_user_global_variants(user_after)):
+        return
+
+    async with redis._client.pipeline(transaction=True) as pipe:
+        pipe.multi()
+        queue_user_update(pipe, gen, user_before, user_after, bot_guilds)
+        await pipe.execute()
+
+
+def queue_user_update(
+    writer: ProjectionWriter,
+    gen: str,
+    user_before: discord.User,
+    user_after: discord.User,
+    bot_guilds: Iterable[discord.Guild],
+) -> None:
+    """Queue the writes of update_user(); queues nothing if no indexed name changed."""
     old_variants = set(_user_global_variants(user_before))
     new_variants = set(_user_global_variants(user_after))
 
@@ -473,23 +836,20 @@ async def update_user(
     added_variants = new_variants - old_variants
     removed_variants = old_variants - new_variants
 
-    async with redis._client.pipeline(transaction=True) as pipe:
-        pipe.multi()
-        for guild in bot_guilds:
-            member = guild.get_member(user_after.id)
-            if member is None:
-                continue
-            guild_id = str(guild.id)
-            pipe.set(
-                CacheKeys.proj_member(gen, guild_id, uid),
-                json.dumps(_build_member_data(member)),
-            )
-            usernames_key = CacheKeys.proj_usernames(gen, guild_id)
-            for name_lower in added_variants:
-                pipe.zadd(usernames_key, {f"{name_lower}\x00{uid}": 0})
-            for name_lower in removed_variants:
-                pipe.zrem(usernames_key, f"{name_lower}\x00{uid}")
-        await pipe.execute()
+    for guild in bot_guilds:
+        member = guild.get_member(user_after.id)
+        if member is None:
+            continue
+        guild_id = str(guild.id)
+        writer.set(
+            CacheKeys.proj_member(gen, guild_id, uid),
+            _encode_member(member),
+        )
+        usernames_key = CacheKeys.proj_usernames(gen, guild_id)
+        for name_lower in added_variants:
+            writer.zadd(usernames_key, {f"{name_lower}\x00{uid}": 0})
+        for name_lower in removed_variants:
+            writer.zrem(usernames_key, f"{name_lower}\x00{uid}")
 
 
 async def write_bot_last_seen(
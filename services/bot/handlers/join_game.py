@@ -25,27 +25,13 @@ import logging
 import uuid
 
 import discord
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from services.bot.auth.role_checker import RoleChecker
-from services.bot.handlers.utils import (
-    get_participant_count,
-    send_deferred_response,
-    send_error_message,
-    upsert_message_refresh_and_notify,
-)
+from services.bot.handlers.utils import send_deferred_response, send_error_message
+from shared.data_access import game_joins
 from shared.database import get_db_session
-from shared.models.game import GameSession
-from shared.models.participant import UNPOSITIONED_SENTINEL, GameParticipant, ParticipantType
-from shared.models.signup_method import SignupMethod
-from shared.models.user import User
 from shared.services.game_metrics import record_game_joined
-from shared.services.game_schedules import schedule_join_notification
 from shared.utils.games import resolve_max_players
-from shared.utils.participant_sorting import resolve_role_position
 
 logger = logging.getLogger(__name__)
 
@@ -57,8 +43,9 @@ async def handle_join_game(interaction: discord.Interaction, game_id: str) -> No
         interaction: Discord interaction from button click
         game_id: Game session ID from custom_id
 
-    Validates user can join game, upserts a message_refresh_queue row,
-    and sends a pg_notify for SSE clients.
+    Validates and records the join, schedules the join notification, upserts
+    a message_refresh_queue row and sends a pg_notify for SSE clients, all in
+    one statement (see shared.data_access.game_joins).
     """
     await send_deferred_response(interaction)
 
@@ -69,143 +56,51 @@ async def handle_join_game(interaction: discord.Interaction, game_id: str) -> No
         return
 
     user_discord_id = str(interaction.user.id)
+    user_role_ids = _interaction_role_ids(interaction)
 
     async with get_db_session() as db:
-        result = await _validate_join_game(db, game_uuid, user_discord_id)
+        result = await game_joins.join_game(db, str(game_uuid), user_discord_id, user_role_ids)
 
-        if not result["can_join"]:
-            await send_error_message(interaction, result["error"])
+        if result.error:
+            await send_error_message(interaction, result.error)
             return
 
-        game = result["game"]
-        user_result = result["user"]
-        participant_count = result["participant_count"]
-
-        role_checker = RoleChecker(bot=interaction.client, db_session=db)
-        position_type, position = await _resolve_bot_role_position(interaction, game, role_checker)
-
-        # Create participant in database
-        participant = GameParticipant(
-            game_session_id=str(game_id),
-            user_id=user_result.id,
-            position_type=position_type,
-            position=position,
-        )
-        db.add(participant)
-        try:
-            await db.commit()
-            await db.refresh(participant)
-        except IntegrityError:
+        if not result.joined:
             logger.info("User %s attempted duplicate join for game %s", user_discord_id, game_id)
             return
 
-        # Create delayed join notification schedule
-        await schedule_join_notification(
-            db=db,
-            game_id=str(game_id),
-            participant_id=participant.id,
-            game_scheduled_at=game.scheduled_at,
-            delay_seconds=60,
-        )
-
-        await upsert_message_refresh_and_notify(
-            db, str(game_id), game.channel.channel_id, game.guild_id
-        )
         await db.commit()
 
+        if result.has_priority_roles and isinstance(interaction.user, discord.Member):
+            role_checker = RoleChecker(bot=interaction.client, db_session=db)
+            await role_checker.seed_user_roles(
+                user_discord_id, str(interaction.guild_id), user_role_ids
+            )
+
     record_game_joined("bot")
     logger.info(
         "User %s joined game %s (%s/%s)",
         user_discord_id,
         game_id,
-        participant_count + 1,
-        resolve_max_players(game.max_players),
-    )
-
-
-async def _validate_join_game(db: AsyncSession, game_id: uuid.UUID, user_discord_id: str) -> dict:
-    """Validate user can join game.
-
-    Args:
-        db: Database session
-        game_id: Game session UUID
-        user_discord_id: Discord user ID
-
-    Returns:
-        Dictionary with validation results:
-        - can_join: bool
-        - error: str (if can_join is False)
-        - user: User
-        - game: GameSession (with template eagerly loaded)
-        - participant_count: int
-    """
-    result_game = await db.execute(
-        select(GameSession)
-        .options(selectinload(GameSession.template))
-        .options(selectinload(GameSession.guild))
-        .options(selectinload(GameSession.channel))
-        .where(GameSession.id == str(game_id))
+        result.participant_count,
+        resolve_max_players(result.max_players),
     )
-    game = result_game.scalar_one_or_none()
-
-    if not game:
-        return {"can_join": False, "error": "Game not found"}
 
-    if game.status != "SCHEDULED":
-        return {"can_join": False, "error": "Game has already started or is completed"}
 
-    # HOST_SELECTED games never accept self-joins - only the host adds
-    # participants. The Discord join button is disabled for this method, but
-    # that is client-side only; enforce it here too in case it's bypassed.
-    if game.signup_method == SignupMethod.HOST_SELECTED.value:
-        return {
-            "can_join": False,
-            "error": "This game does not accept self-signups; only the host can add participants",
-        }
+def _interaction_role_ids(interaction: discord.Interaction) -> list[str]:
+    """Return the joiner's guild role IDs from the interaction payload.
 
-    result_user = await db.execute(select(User).where(User.discord_id == user_discord_id))
-    user_result = result_user.scalar_one_or_none()
-
-    if not user_result:
-        user_result = User(discord_id=user_discord_id)
-        db.add(user_result)
-        await db.flush()
-
-    participant_count = await get_participant_count(db, game_id)
-
-    return {
-        "can_join": True,
-        "user": user_result,
-        "game": game,
-        "participant_count": participant_count,
-    }
-
-
-async def _resolve_bot_role_position(
-    interaction: discord.Interaction,
-    game: GameSession,
-    role_checker: RoleChecker,
-) -> tuple[int, int]:
-    """Resolve position_type and position from the interaction payload.
-
-    Extracts role IDs from the Discord member object (zero extra API calls)
-    and seeds the role cache as a side effect.
+    The payload already carries the member's roles, so priority-role
+    placement costs no Discord API call.  The @everyone role, which shares
+    the guild's ID, is excluded.
 
     Args:
         interaction: Discord interaction containing member role data
-        game: GameSession with template loaded
-        role_checker: RoleChecker for cache seeding
 
     Returns:
-        (position_type, position) tuple
+        Role IDs, or an empty list outside a guild
     """
-    priority_role_ids = (game.template.signup_priority_role_ids or []) if game.template else []
-    if not priority_role_ids or not isinstance(interaction.user, discord.Member):
-        return (ParticipantType.SELF_ADDED, UNPOSITIONED_SENTINEL)
-
+    if not isinstance(interaction.user, discord.Member):
+        return []
     guild_discord_id = str(interaction.guild_id)
-    user_discord_id = str(interaction.user.id)
-    user_role_ids = [str(r.id) for r in interaction.user.roles if str(r.id) != guild_discord_id]
-
-    await role_checker.seed_user_roles(user_discord_id, guild_discord_id, user_role_ids)
-    return resolve_role_position(user_role_ids, priority_role_ids)
+    return [str(r.id) for r in interaction.user.roles if str(r.id) != guild_discord_id]
@@ -89,7 +89,7 @@ async def handle_leave_game(interaction: discord.Interaction, game_id: str) -> N
 
         # Delete participant, detect waitlist transitions, and notify affected users
         game = await leave_game_and_notify(db, game, participant)
-        await upsert_message_refresh_and_notify(db, game_id, game.channel.channel_id, game.guild_id)
+        await upsert_message_refresh_and_notify(db, game_id, game.channel.channel_id)
         await db.commit()
 
     record_game_left("bot")
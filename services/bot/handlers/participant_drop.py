@@ -73,7 +73,6 @@ async def handle_participant_drop_due(
             return
 
         game_title = participant.game.title
-        guild_id = participant.game.guild_id
         channel_id = participant.game.channel.channel_id
         discord_id = participant.user.discord_id if participant.user else None
 
@@ -88,7 +87,7 @@ async def handle_participant_drop_due(
         await db.delete(participant)
 
         # Upsert message refresh and notify SSE atomically with the delete
-        await upsert_message_refresh_and_notify(db, game_id, channel_id, guild_id)
+        await upsert_message_refresh_and_notify(db, game_id, channel_id)
         await db.commit()
 
     logger.info("Dropped participant %s from game %s", participant_id, game_id)
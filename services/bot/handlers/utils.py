@@ -21,15 +21,15 @@
 
 """Utilities for interaction handling."""
 
-import json
 import logging
 import uuid
 
 import discord
-from sqlalchemy import func, select, text
+from sqlalchemy import func, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from shared.data_access.game_updates import notify_game_updated
 from shared.models.message_refresh_queue import MessageRefreshQueue
 from shared.models.participant import GameParticipant
 
@@ -64,11 +64,12 @@ async def get_participant_count(db: AsyncSession, game_id: uuid.UUID | str) -> i
         Number of participants with actual user IDs (excludes placeholders)
     """
     result = await db.execute(
-        select(GameParticipant)
+        select(func.count())
+        .select_from(GameParticipant)
         .where(GameParticipant.game_session_id == str(game_id))
         .where(GameParticipant.user_id.isnot(None))
     )
-    return len(result.scalars().all())
+    return result.scalar_one()
 
 
 async def send_error_message(interaction: discord.Interaction, message: str) -> None:
@@ -98,7 +99,7 @@ async def send_success_message(interaction: discord.Interaction, message: str) -
 
 
 async def upsert_message_refresh_and_notify(
-    db: AsyncSession, game_id: str, channel_id: str, guild_id: str
+    db: AsyncSession, game_id: str, channel_id: str
 ) -> None:
     """Upsert a message_refresh_queue row and emit a pg_notify for SSE clients.
 
@@ -106,7 +107,6 @@ async def upsert_message_refresh_and_notify(
         db: Database session (must be inside an active transaction)
         game_id: Game session ID string
         channel_id: Discord channel ID string
-        guild_id: Guild DB UUID string
     """
     stmt = (
         pg_insert(MessageRefreshQueue)
@@ -117,7 +117,4 @@ async def upsert_message_refresh_and_notify(
         )
     )
     await db.execute(stmt)
-    payload = json.dumps({"game_id": game_id, "guild_id": guild_id})
-    await db.execute(
-        text("SELECT pg_notify('game_updated_sse', :payload)").bindparams(payload=payload)
-    )
+    await notify_game_updated(db, game_id)
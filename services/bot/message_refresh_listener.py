@@ -23,49 +23,77 @@
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from typing import Any
 
 import asyncpg
 
-from shared.pg_listen import listen_with_reconnect
+from shared.pg_listen import NotificationHub, listen_with_reconnect
 
 logger = logging.getLogger(__name__)
 
 
 class MessageRefreshListener:
     """
-    Holds a dedicated asyncpg connection that listens for
-    ``message_refresh_queue_changed`` notifications from Postgres.
+    Listens for ``message_refresh_queue_changed`` notifications from Postgres,
+    on the shared ``hub`` connection when one is given.
 
     When a NOTIFY arrives, it invokes ``spawn_worker_cb(discord_channel_id)``
     at most once per channel; subsequent NOTIFYs for the same channel are
     ignored while the worker is still running.
 
+    After every (re)connect it runs ``catch_up_cb``, the same pending-row
+    scan the bot does at startup, so rows queued while LISTEN was down still
+    get a worker.
+
     Args:
         bot_db_url: PostgreSQL connection URL (``postgresql+asyncpg://…`` or
             ``postgresql://…`` are both accepted).
         spawn_worker_cb: Callable that accepts a ``discord_channel_id`` string
             and returns an :class:`asyncio.Task`.
+        catch_up_cb: Optional coroutine function that spawns workers for
+            every channel with pending ``message_refresh_queue`` rows.
+        hub: Optional shared NotificationHub to subscribe to instead of
+            holding a dedicated LISTEN connection.
     """
 
     def __init__(
         self,
         bot_db_url: str,
         spawn_worker_cb: Callable[[str], asyncio.Task[Any]],
+        catch_up_cb: Callable[[], Coroutine[Any, Any, None]] | None = None,
+        hub: NotificationHub | None = None,
     ) -> None:
         self._bot_db_url = bot_db_url
         self._spawn_worker_cb = spawn_worker_cb
+        self._catch_up_cb = catch_up_cb
+        self._catch_up_task: asyncio.Task[None] | None = None
         self._channel_workers: dict[str, asyncio.Task[Any]] = {}
+        self._hub = hub
 
     async def start(self) -> None:
         """Maintain the LISTEN connection, reconnecting automatically on loss."""
+        if self._hub is not None:
+            await self._hub.subscribe(
+                "message_refresh_queue_changed",
+                self._on_notify,
+                on_connected=self._on_connected,
+            )
+            return
         await listen_with_reconnect(
             self._bot_db_url,
             "message_refresh_queue_changed",
             self._on_notify,
+            on_connected=self._on_connected,
         )
 
+    def _on_connected(self, _conn: asyncpg.Connection) -> None:
+        """Spawn the catch-up scan unless one is already running."""
+        if self._catch_up_cb is None:
+            return
+        if self._catch_up_task is None or self._catch_up_task.done():
+            self._catch_up_task = asyncio.create_task(self._catch_up_cb())
+
     def _on_notify(
         self,
         _conn: asyncpg.Connection,
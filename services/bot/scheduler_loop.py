@@ -26,13 +26,15 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from opentelemetry import metrics
+from sqlalchemy import inspect, select, update
 
 from shared.database import get_db_session
 from shared.models.base import utc_now
-from shared.pg_listen import listen_with_reconnect
+from shared.pg_listen import NotificationHub, listen_with_reconnect
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -40,12 +42,38 @@ if TYPE_CHECKING:
     import asyncpg
 
 _RETRY_DELAY_SECONDS = 1.0
+_DEFAULT_BATCH_SIZE = 500
 
 logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+scheduler_items_processed_counter = meter.create_counter(
+    name="bot.scheduler.items_processed",
+    description="Number of due schedule rows claimed and enqueued, labeled by channel",
+    unit="1",
+)
+scheduler_batch_size_histogram = meter.create_histogram(
+    name="bot.scheduler.batch.size",
+    description="Number of due schedule rows claimed per batch, labeled by channel",
+    unit="1",
+)
+scheduler_batch_duration_histogram = meter.create_histogram(
+    name="bot.scheduler.batch.duration",
+    description="Duration of one claim-and-enqueue batch transaction in seconds",
+    unit="s",
+)
 
 
 class SchedulerLoop:
-    """Async replacement for SchedulerDaemon — one per schedule table."""
+    """Async replacement for SchedulerDaemon — one per schedule table.
+
+    Due rows are claimed in batches of up to ``batch_size`` with
+    ``FOR UPDATE SKIP LOCKED`` so several loops (in one process or across bot
+    replicas) can drain the same table without enqueuing a row twice.
+
+    When ``hub`` is given the loop subscribes to the shared NotificationHub
+    connection instead of opening its own LISTEN connection.
+    """
 
     def __init__(
         self,
@@ -56,6 +84,8 @@ class SchedulerLoop:
         status_field: str,
         event_builder: Callable[..., Any],
         max_timeout: int = 900,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        hub: NotificationHub | None = None,
     ) -> None:
         self._db_url = db_url
         self.notify_channel = notify_channel
@@ -64,6 +94,8 @@ class SchedulerLoop:
         self.status_field = status_field
         self.event_builder = event_builder
         self.max_timeout = max_timeout
+        self.batch_size = batch_size
+        self._hub = hub
         self._notified = asyncio.Event()
 
     async def run(self) -> None:
@@ -73,7 +105,18 @@ class SchedulerLoop:
         listen_with_reconnect; the due-item loop runs independently since it
         only depends on the _notified event set by _on_notify, not on the
         connection object itself.
+
+        With a shared hub, every hub (re)connect wakes the loop so rows whose
+        NOTIFY was missed while disconnected are claimed straight away.
         """
+        if self._hub is not None:
+            await self._hub.subscribe(
+                self.notify_channel,
+                self._on_notify,
+                on_connected=lambda _conn: self._notified.set(),
+            )
+            await self._run_loop()
+            return
         async with asyncio.TaskGroup() as tg:
             tg.create_task(
                 listen_with_reconnect(self._db_url, self.notify_channel, self._on_notify)
@@ -81,18 +124,17 @@ class SchedulerLoop:
             tg.create_task(self._run_loop())
 
     async def _run_loop(self) -> None:
-        """Run the due-item check/process/wait cycle, surviving per-iteration errors."""
+        """Run the claim/process/wait cycle, surviving per-iteration errors."""
         while True:
             try:
-                item = await self._get_next_due_item()
-                if item is not None and self._is_due(item):
-                    await self._process_item(item)
+                if await self._process_due_batch():
                     await asyncio.sleep(0)
-                else:
-                    wait = self._time_until_due(item) or self.max_timeout
-                    with contextlib.suppress(asyncio.TimeoutError):
-                        await asyncio.wait_for(self._notified.wait(), timeout=wait)
-                    self._notified.clear()
+                    continue
+                item = await self._get_next_due_item()
+                wait = self._wait_timeout(item)
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._notified.wait(), timeout=wait)
+                self._notified.clear()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -101,16 +143,49 @@ class SchedulerLoop:
                 )
                 await asyncio.sleep(_RETRY_DELAY_SECONDS)
 
-    async def _process_item(self, item: object) -> None:
-        """Build a BotActionQueue row, add it to the DB session, and mark item processed."""
-        queue_row = self.event_builder(item)
+    async def _process_due_batch(self) -> int:
+        """Claim up to batch_size due rows, enqueue their actions, and mark them processed.
+
+        The claim, the BotActionQueue inserts and the status update share one
+        transaction.  Rows locked by a concurrent loop are skipped rather than
+        waited on, and stay unprocessed if that loop rolls back.
+
+        Returns:
+            Number of rows claimed; 0 when nothing unlocked is due.
+        """
+        model = self.model_class
+        time_column = getattr(model, self.time_field)
+        status_column = getattr(model, self.status_field)
+        primary_key: Any = inspect(model).primary_key[0]
+        start = time.monotonic()
         async with get_db_session() as db:
-            db.add(queue_row)
-            # Re-attach the detached item so the status change is tracked by this session.
-            db.add(item)
-            setattr(item, self.status_field, True)
+            result: Any = await db.execute(
+                select(model)
+                .where(status_column.is_(False))
+                .where(time_column.isnot(None))
+                .where(time_column <= utc_now())
+                .order_by(time_column.asc())
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            items = result.scalars().all()
+            if not items:
+                return 0
+            db.add_all([self.event_builder(item) for item in items])
+            await db.execute(
+                update(model)
+                .where(primary_key.in_([getattr(item, primary_key.key) for item in items]))
+                .values({self.status_field: True})
+                .execution_options(synchronize_session=False)
+            )
             await db.commit()
 
+        attributes = {"channel": self.notify_channel}
+        scheduler_items_processed_counter.add(len(items), attributes)
+        scheduler_batch_size_histogram.record(len(items), attributes)
+        scheduler_batch_duration_histogram.record(time.monotonic() - start, attributes)
+        return len(items)
+
     def _on_notify(
         self,
         _conn: asyncpg.Connection,
@@ -133,9 +208,19 @@ class SchedulerLoop:
             )
             return result.scalar_one_or_none()
 
-    def _is_due(self, item: object) -> bool:
-        """Return True if item's scheduled time is now or in the past."""
-        return getattr(item, self.time_field) <= utc_now()
+    def _wait_timeout(self, item: object | None) -> float:
+        """Return how long to sleep before the next claim attempt.
+
+        An item that is already due here was skipped by the claim because a
+        concurrent loop holds its lock; retry shortly in case that loop's
+        transaction rolls back instead of sleeping for max_timeout.
+        """
+        wait = self._time_until_due(item)
+        if wait is None:
+            return self.max_timeout
+        if wait == 0:
+            return _RETRY_DELAY_SECONDS
+        return wait
 
     def _time_until_due(self, item: object | None) -> float | None:
         """Return seconds until item is due, or None if no item."""
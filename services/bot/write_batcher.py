@@ -0,0 +1,229 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Write-behind batching of the Redis writes made by gateway event handlers.
+
+Gateway events arrive in bursts (role reshuffles, mass joins, channel
+reorders) and each handler used to make its own one to three Redis round
+trips plus an L1 invalidation publish.  GatewayWriteBatcher buffers those
+writes for a few milliseconds, coalesces repeated writes to the same key, and
+flushes everything, invalidation message included, as one MULTI/EXEC
+pipeline.
+
+Handlers queue derived state, so the last SET or DEL to a key always wins.
+Edits that depend on a key's current value, such as adding one guild to a
+user's guild list, are queued as Lua scripts instead; those are never
+coalesced and run in queue order after the batch's plain writes.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Mapping
+from typing import NamedTuple
+
+from opentelemetry import metrics
+
+from shared.cache import l1
+from shared.cache.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+WRITE_BATCH_DELAY_SECONDS = 0.005
+
+write_batch_size_histogram = meter.create_histogram(
+    name="bot.write_batch.size",
+    description="Writes and invalidated keys per gateway write-behind flush, after coalescing",
+    unit="1",
+)
+
+write_batch_flush_latency_histogram = meter.create_histogram(
+    name="bot.write_batch.flush_latency",
+    description=(
+        "Duration of gateway write-behind pipeline flushes in seconds, labeled by "
+        "outcome ('ok' or 'error')"
+    ),
+    unit="s",
+)
+
+write_batch_coalesced_counter = meter.create_counter(
+    name="bot.write_batch.coalesced",
+    description="Gateway cache writes superseded by a later write to the same key before flush",
+    unit="1",
+)
+
+
+class PendingWrite(NamedTuple):
+    """An unflushed string write; value None means the key is queued for deletion."""
+
+    value: str | None
+    ttl: int | None
+
+
+class PendingScript(NamedTuple):
+    """An unflushed EVAL; keys_and_args holds numkeys keys followed by the arguments."""
+
+    script: str
+    numkeys: int
+    keys_and_args: tuple[str, ...]
+
+
+class _Buffer:
+    """One generation of queued writes, swapped out whole on flush."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, PendingWrite] = {}
+        self.members: dict[tuple[str, str], float | None] = {}
+        self.scripts: list[PendingScript] = []
+        self.invalidations: dict[str, None] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.values or self.members or self.scripts or self.invalidations)
+
+
+class GatewayWriteBatcher:
+    """
+    Buffers gateway cache and projection writes and flushes them in one pipeline.
+
+    The queueing methods mirror the redis-py Pipeline commands the handlers
+    use, so projection helpers can take either.  The first write after a
+    flush schedules the next one WRITE_BATCH_DELAY_SECONDS later; flush()
+    can also be awaited directly when writes must land before continuing.
+
+    Args:
+        delay_seconds: How long to collect writes before flushing them.
+    """
+
+    def __init__(self, delay_seconds: float = WRITE_BATCH_DELAY_SECONDS) -> None:
+        self._delay_seconds = delay_seconds
+        self._buffer = _Buffer()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def set(self, name: str, value: str, ex: int | None = None) -> None:
+        """Queue SET name value, replacing any earlier queued write to name."""
+        self._queue_value(name, PendingWrite(value, ex))
+
+    def delete(self, *names: str) -> None:
+        """Queue DEL for each name, replacing any earlier queued write to it."""
+        for name in names:
+            self._queue_value(name, PendingWrite(None, None))
+
+    def zadd(self, name: str, mapping: Mapping[str, float]) -> None:
+        """Queue ZADD of each member, replacing any earlier queued op on that member."""
+        for member, score in mapping.items():
+            self._queue_member(name, member, score)
+
+    def zrem(self, name: str, *values: str) -> None:
+        """Queue ZREM of each member, replacing any earlier queued op on that member."""
+        for member in values:
+            self._queue_member(name, member, None)
+
+    def eval(self, script: str, numkeys: int, *keys_and_args: str) -> None:
+        """Queue EVAL of a Lua script; scripts run in queue order after the plain writes."""
+        self._buffer.scripts.append(PendingScript(script, numkeys, keys_and_args))
+        self._schedule_flush()
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Queue an L1 invalidation of keys, published in the same pipeline."""
+        for key in keys:
+            self._buffer.invalidations[key] = None
+        self._schedule_flush()
+
+    def _queue_value(self, name: str, write: PendingWrite) -> None:
+        if self._buffer.values.pop(name, None) is not None:
+            write_batch_coalesced_counter.add(1)
+        self._buffer.values[name] = write
+        self._schedule_flush()
+
+    def _queue_member(self, name: str, member: str, score: float | None) -> None:
+        if self._buffer.members.pop((name, member), ...) is not ...:
+            write_batch_coalesced_counter.add(1)
+        self._buffer.members[name, member] = score
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_delay())
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self._delay_seconds)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Send every queued write and invalidation in one MULTI/EXEC pipeline."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, _Buffer()
+            commands = (
+                len(batch.values)
+                + len(batch.members)
+                + len(batch.scripts)
+                + len(batch.invalidations)
+            )
+            start = time.monotonic()
+            outcome = "ok"
+            try:
+                await self._execute(batch)
+            except Exception:
+                outcome = "error"
+                logger.exception("Gateway write batch of %d commands failed", commands)
+            finally:
+                write_batch_size_histogram.record(commands)
+                write_batch_flush_latency_histogram.record(
+                    time.monotonic() - start, {"outcome": outcome}
+                )
+
+    @staticmethod
+    async def _execute(batch: _Buffer) -> None:
+        redis = await get_redis_client()
+        async with redis._client.pipeline(transaction=True) as pipe:
+            pipe.multi()
+            for name, write in batch.values.items():
+                if write.value is None:
+                    pipe.delete(name)
+                else:
+                    pipe.set(name, write.value, ex=write.ttl)
+            added: dict[str, dict[str, float]] = {}
+            removed: dict[str, list[str]] = {}
+            for (name, member), score in batch.members.items():
+                if score is None:
+                    removed.setdefault(name, []).append(member)
+                else:
+                    added.setdefault(name, {})[member] = score
+            for name, mapping in added.items():
+                pipe.zadd(name, mapping)
+            for name, members in removed.items():
+                pipe.zrem(name, *members)
+            for queued in batch.scripts:
+                pipe.eval(queued.script, queued.numkeys, *queued.keys_and_args)
+            if batch.invalidations:
+                pipe.publish(
+                    l1.INVALIDATION_CHANNEL, l1.invalidation_message(list(batch.invalidations))
+                )
+            await pipe.execute()
@@ -33,8 +33,11 @@ if TYPE_CHECKING:
 
 import redis
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline, PubSub
 from redis.asyncio.connection import ConnectionPool
 
+from shared.data_access.round_trips import record_redis_round_trip
+
 logger = logging.getLogger(__name__)
 
 _REDIS_ERROR_BACKOFF_BASE_MS = 1000
@@ -116,7 +119,7 @@ redis.call('zremrangebyscore', global_key, 0, now_ms - global_window)
 local global_n      = redis.call('zcard', global_key)
 local global_wait   = 0
 if global_n >= global_max then
-    local oldest_ts = tonumber(redis.call('zrange', global_key, 0, 0)[1])
+    local oldest_ts = tonumber(redis.call('zrange', global_key, 0, 0, 'WITHSCORES')[2])
     global_wait = oldest_ts + global_window - now_ms
     if global_wait < 1 then global_wait = 1 end
 end
@@ -185,7 +188,7 @@ redis.call('zremrangebyscore', global_key, 0, now_ms - global_window)
 local global_n = redis.call('zcard', global_key)
 
 if global_n >= global_max then
-    local oldest_ts = tonumber(redis.call('zrange', global_key, 0, 0)[1])
+    local oldest_ts = tonumber(redis.call('zrange', global_key, 0, 0, 'WITHSCORES')[2])
     local wait = oldest_ts + global_window - now_ms
     if wait < 1 then wait = 1 end
     return wait
@@ -196,6 +199,67 @@ redis.call('pexpire', global_key, 1001)
 return 0
 """
 
+# Atomic Lua script that leases up to ARGV[2] global tokens in one round-trip.
+#
+# Each leased token is recorded as its own member ("<now_ms>-<seq>") so a
+# block counts fully against the fleet-wide window; the global scripts above
+# read the oldest entry's score (not its member) so both formats coexist.
+#
+# KEYS[1] = global sorted-set key ("discord:global_rate_limit")
+# ARGV[1]  = current time in ms
+# ARGV[2]  = number of tokens requested
+# ARGV[3]  = global max requests per 1000ms window (default 25)
+#
+# Returns {granted, 0} when at least one token was available (granted may be
+# fewer than requested), or {0, wait_ms} when the budget is exhausted.
+_GLOBAL_LEASE_LUA = """
+local global_key    = KEYS[1]
+local now_ms        = tonumber(ARGV[1])
+local requested     = tonumber(ARGV[2])
+local global_max    = tonumber(ARGV[3] or '25')
+local global_window = 1000
+
+redis.call('zremrangebyscore', global_key, 0, now_ms - global_window)
+local global_n = redis.call('zcard', global_key)
+
+local granted = global_max - global_n
+if granted > requested then granted = requested end
+
+if granted <= 0 then
+    local oldest_ts = tonumber(redis.call('zrange', global_key, 0, 0, 'WITHSCORES')[2])
+    local wait = oldest_ts + global_window - now_ms
+    if wait < 1 then wait = 1 end
+    return {0, wait}
+end
+
+for i = 1, granted do
+    redis.call('zadd', global_key, now_ms, ARGV[1] .. '-' .. (global_n + i))
+end
+redis.call('pexpire', global_key, 1001)
+return {granted, 0}
+"""
+
+
+class _RoundTripCountingPipeline(Pipeline):
+    """Pipeline that counts each execute as one round-trip."""
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        record_redis_round_trip()
+        return await super().execute(raise_on_error)
+
+
+class _RoundTripCountingRedis(Redis):
+    """Redis client that counts each command toward the active round-trip scope."""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:  # noqa: ANN401
+        record_redis_round_trip()
+        return await super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> Pipeline:
+        return _RoundTripCountingPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
 
 class RedisClient:
     """Async Redis client wrapper with connection pooling."""
@@ -225,7 +289,7 @@ class RedisClient:
                 max_connections=_REDIS_CONNECTION_POOL_SIZE,
                 decode_responses=True,
             )
-            self._client = Redis(connection_pool=self._pool)
+            self._client = _RoundTripCountingRedis(connection_pool=self._pool)
             await self._client.ping()
             logger.info("Redis connection established")
         except Exception as e:
@@ -291,6 +355,55 @@ class RedisClient:
             logger.error("Redis SET error for key %s: %s", key, e)
             return False
 
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """
+        Get several values from cache in one round-trip.
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Values in key order, None for missing keys (all None on error).
+        """
+        if not keys:
+            return []
+        if not self._client:
+            await self.connect()
+
+        try:
+            return await self._client.mget(keys)
+        except Exception as e:
+            logger.error("Redis MGET error for %d keys: %s", len(keys), e)
+            return [None] * len(keys)
+
+    async def set_many(self, mapping: dict[str, str], ttl: int | None = None) -> bool:
+        """
+        Set several values in one pipelined round-trip (MSET plus EXPIRE per key).
+
+        Args:
+            mapping: Cache keys to values.
+            ttl: Time-to-live in seconds applied to every key (optional).
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        if not mapping:
+            return True
+        if not self._client:
+            await self.connect()
+
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.mset(mapping)
+            if ttl:
+                for key in mapping:
+                    pipe.expire(key, ttl)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error("Redis MSET error for %d keys: %s", len(mapping), e)
+            return False
+
     async def get_json(self, key: str) -> Any | None:  # noqa: ANN401
         """
         Get JSON value from cache.
@@ -414,6 +527,38 @@ class RedisClient:
             logger.error("Redis TTL error for key %s: %s", key, e)
             return -2
 
+    async def publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message on a pub/sub channel.
+
+        Args:
+            channel: Pub/sub channel name.
+            message: Message payload.
+
+        Returns:
+            Number of subscribers that received the message, 0 on error.
+        """
+        if not self._client:
+            await self.connect()
+
+        try:
+            return await self._client.publish(channel, message)
+        except Exception as e:
+            logger.error("Redis PUBLISH error for channel %s: %s", channel, e)
+            return 0
+
+    async def pubsub(self) -> PubSub:
+        """
+        Create a pub/sub object that holds its own dedicated connection.
+
+        Returns:
+            Unsubscribed PubSub; the caller must close it with aclose().
+        """
+        if not self._client:
+            await self.connect()
+
+        return self._client.pubsub()
+
     async def claim_channel_rate_limit_slot(self, channel_id: str) -> int:
         """
         Claim a rate-limit slot for the given Discord channel.
@@ -534,6 +679,46 @@ class RedisClient:
                 _REDIS_ERROR_BACKOFF_JITTER_MS + 1
             )
 
+    async def lease_global_slots(self, count: int, global_max: int = 25) -> tuple[int, int]:
+        """
+        Lease a block of global Discord rate-limit tokens in one round-trip.
+
+        The tokens are recorded in the shared sliding window immediately, so
+        the caller must spend them within the 1000ms window or let them lapse.
+
+        Args:
+            count: Number of tokens to lease.
+            global_max: Maximum global requests per 1000ms window (default 25).
+
+        Returns:
+            ``(granted, wait_ms)``: the number of tokens leased (possibly fewer
+            than ``count``), or ``(0, wait_ms)`` when the budget is exhausted.
+        """
+        if not self._client:
+            await self.connect()
+
+        global_key = "discord:global_rate_limit"
+        now_ms = int(time.time() * 1000)
+
+        try:
+            raw = self._client.eval(
+                _GLOBAL_LEASE_LUA,
+                1,
+                global_key,
+                str(now_ms),
+                str(count),
+                str(global_max),
+            )
+            granted, wait_ms = await cast("Awaitable[Any]", raw)
+            return int(granted), int(wait_ms)
+        except redis.exceptions.NoPermissionError:
+            raise
+        except Exception as e:
+            logger.error("Redis EVAL error for global lease: %s", e)
+            return 0, _REDIS_ERROR_BACKOFF_BASE_MS + secrets.randbelow(
+                _REDIS_ERROR_BACKOFF_JITTER_MS + 1
+            )
+
 
 _redis_client: RedisClient | None = None
 
@@ -47,7 +47,7 @@ class CacheKeys:
 
     @staticmethod
     def game_details(game_id: str) -> str:
-        """Return cache key for game session details."""
+        """Return cache key for the shared GameResponse of a game session."""
         return f"game:{game_id}"
 
     @staticmethod
@@ -90,6 +90,11 @@ class CacheKeys:
         """Return cache key for a calendar export token."""
         return f"api:calendar_export:{token}"
 
+    @staticmethod
+    def calendar_event(game_id: str) -> str:
+        """Return cache key for a game's serialized calendar VEVENT."""
+        return f"api:calendar_event:{game_id}"
+
     @staticmethod
     def discord_member(guild_id: str, user_id: str) -> str:
         """Return cache key for Discord guild member information."""
@@ -125,6 +130,11 @@ class CacheKeys:
         """Return cache key for bot last seen timestamp."""
         return "bot:last_seen"
 
+    @staticmethod
+    def orphan_sweep_progress(backup_stamp: str, channel_id: str) -> str:
+        """Return cache key for a channel's orphaned-embed sweep position after a restore."""
+        return f"bot:orphan_sweep:{backup_stamp}:{channel_id}"
+
     @staticmethod
     def proj_guild_name(gen: str, guild_id: str) -> str:
         """Return cache key for projection guild name."""
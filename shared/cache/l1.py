@@ -0,0 +1,231 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Per-process L1 cache for gateway-maintained Discord metadata.
+
+The bot keeps the ``discord:*`` channel, guild, role and emoji keys current
+from gateway events and they carry no TTL, so a process can hold decoded
+copies in memory for as long as it hears about every rewrite.  The bot
+publishes the keys it rewrote on INVALIDATION_CHANNEL and
+listen_for_invalidations() drops the matching entries.
+
+Entries are only served while that subscription is confirmed.  The cache is
+cleared whenever the subscription is established or lost, so a message
+missed during a Redis outage can never leave a stale value behind.
+
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Protocol
+
+from opentelemetry import metrics
+
+from shared.cache.client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "discord_cache:invalidate"
+INVALIDATE_ALL = "*"
+
+_meter = metrics.get_meter(__name__)
+_lookup_counter = _meter.create_counter(
+    name="cache.l1.lookups",
+    description="In-process L1 cache lookups, by result",
+    unit="1",
+)
+
+_RETRY_DELAY_SECONDS = 1.0
+
+
+class InvalidatedCache(Protocol):
+    """A cache kept coherent by listen_for_invalidations()."""
+
+    def activate(self) -> None: ...
+
+    def deactivate(self) -> None: ...
+
+    def apply_message(self, data: str) -> None: ...
+
+
+class L1Cache:
+    """
+    Decoded values keyed by Redis key, each with optional derived views.
+
+    A derived view (for example a role list indexed by ID) is stored next to
+    the plain value under the function that built it, and is dropped with it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, inactive cache."""
+        self._entries: dict[str, dict[Callable[[Any], Any] | None, Any]] = {}
+        self._generation = 0
+        self.active = False
+
+    def activate(self) -> None:
+        """Start serving entries from a clean slate."""
+        self.clear()
+        self.active = True
+
+    def deactivate(self) -> None:
+        """Stop serving entries and drop everything held."""
+        self.active = False
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._generation += 1
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Drop the entries (and derived views) for the given Redis keys."""
+        for key in keys:
+            self._entries.pop(key, None)
+        self._generation += 1
+
+    def apply_message(self, data: str) -> None:
+        """Apply one invalidation message published by the bot."""
+        if data == INVALIDATE_ALL:
+            self.clear()
+            return
+        try:
+            keys = json.loads(data)
+        except json.JSONDecodeError:
+            logger.warning("Ignoring malformed L1 invalidation message: %r", data)
+            self.clear()
+            return
+        self.invalidate(keys)
+
+    async def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any]],
+        derive: Callable[[Any], Any] | None = None,
+    ) -> Any | None:  # noqa: ANN401
+        """
+        Return the cached value for key, calling load() on a miss.
+
+        Args:
+            key: Redis key the value was read from; used for invalidation.
+            load: Reads and decodes the value from Redis; returns None if absent.
+            derive: Optional transform applied to the loaded value; its result
+                is cached separately from the plain value.
+
+        Returns:
+            The (derived) value, or None if load() found nothing.
+        """
+        if not self.active:
+            value = await load()
+            return derive(value) if derive is not None and value is not None else value
+
+        views = self._entries.get(key)
+        if views is not None and derive in views:
+            _lookup_counter.add(1, {"result": "hit"})
+            return views[derive]
+
+        _lookup_counter.add(1, {"result": "miss"})
+        generation = self._generation
+        value = await load()
+        if value is None:
+            return None
+        if derive is not None:
+            value = derive(value)
+        # An invalidation that landed while load() was awaiting means value
+        # may already be stale; return it but do not keep it.
+        if self.active and generation == self._generation:
+            self._entries.setdefault(key, {})[derive] = value
+        return value
+
+
+_cache = L1Cache()
+
+
+def get_l1_cache() -> L1Cache:
+    """Return the process-wide L1 cache."""
+    return _cache
+
+
+async def get_or_load(
+    key: str,
+    load: Callable[[], Awaitable[Any]],
+    derive: Callable[[Any], Any] | None = None,
+) -> Any | None:  # noqa: ANN401
+    """Read key through the process-wide L1 cache; see L1Cache.get_or_load."""
+    return await _cache.get_or_load(key, load, derive)
+
+
+def invalidation_message(keys: list[str] | None = None) -> str:
+    """Encode the INVALIDATION_CHANNEL message that drops keys, or everything for None."""
+    return INVALIDATE_ALL if keys is None else json.dumps(keys)
+
+
+async def publish_invalidation(redis: RedisClient, keys: list[str] | None = None) -> None:
+    """
+    Tell every subscribed process to drop its L1 entries for keys.
+
+    Args:
+        redis: Redis async client wrapper
+        keys: Redis keys that were rewritten or deleted; None drops everything
+    """
+    await redis.publish(INVALIDATION_CHANNEL, invalidation_message(keys))
+
+
+async def listen_for_invalidations(
+    redis: RedisClient,
+    retry_delay_seconds: float = _RETRY_DELAY_SECONDS,
+    *,
+    channel: str = INVALIDATION_CHANNEL,
+    cache: InvalidatedCache | None = None,
+) -> None:
+    """
+    Subscribe to an invalidation channel and apply messages until cancelled.
+
+    The cache is activated once Redis confirms the subscription and
+    deactivated whenever the subscription is lost, then the subscription is
+    retried after retry_delay_seconds.
+
+    Args:
+        redis: Redis async client wrapper
+        retry_delay_seconds: Delay before each resubscribe attempt
+        channel: Channel to subscribe to; defaults to the L1 channel
+        cache: Cache to keep coherent; defaults to the process-wide L1 cache
+    """
+    target: InvalidatedCache = _cache if cache is None else cache
+    while True:
+        pubsub = await redis.pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            async for message in pubsub.listen():
+                if message["type"] == "subscribe":
+                    target.activate()
+                    logger.info("Cache subscribed to %s", channel)
+                elif message["type"] == "message":
+                    target.apply_message(message["data"])
+        except Exception as e:
+            logger.warning("Invalidation subscription to %s lost: %s", channel, e)
+        finally:
+            target.deactivate()
+            await pubsub.aclose()
+        await asyncio.sleep(retry_delay_seconds)
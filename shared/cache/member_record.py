@@ -0,0 +1,173 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Compact, versioned encoding for projection member records.
+
+Member records were originally stored as JSON with string role IDs and a full CDN
+avatar URL. The compact format packs role IDs as 64-bit integers and stores the
+avatar as its 16-byte hash, then base64-encodes the result because the shared Redis
+pool uses decode_responses=True. Readers accept both formats: a JSON record always
+starts with "{", which is never the first character of the base64 form.
+
+Layout (big-endian) before base64:
+    B   version (MEMBER_RECORD_VERSION)
+    B   flags (bit 0: has avatar, bit 1: animated avatar)
+    16s avatar hash, only when bit 0 is set
+    H   role count, followed by that many Q role IDs
+    3x  (H length, bytes) for nick, global_name and username; length 0xFFFF is None
+"""
+
+import base64
+import json
+import re
+import struct
+from collections.abc import Iterable
+
+MEMBER_RECORD_VERSION = 1
+
+_AVATAR_CDN_BASE = "https://cdn.discordapp.com"
+_AVATAR_HASH_PATTERN = re.compile(r"^(a_)?([0-9a-f]{32})$")
+_FLAG_HAS_AVATAR = 0x01
+_FLAG_ANIMATED = 0x02
+_NONE_LENGTH = 0xFFFF
+
+_HEADER = struct.Struct(">BB")
+_COUNT = struct.Struct(">H")
+_ROLE = struct.Struct(">Q")
+_AVATAR_HASH_BYTES = 16
+
+
+def avatar_url(uid: str, avatar_hash: str | None) -> str | None:
+    """Build the CDN URL discord.py reports for a user avatar hash."""
+    if not avatar_hash:
+        return None
+    extension = "gif" if avatar_hash.startswith("a_") else "png"
+    return f"{_AVATAR_CDN_BASE}/avatars/{uid}/{avatar_hash}.{extension}?size=1024"
+
+
+def _pack_text(value: str | None) -> bytes:
+    if value is None:
+        return _COUNT.pack(_NONE_LENGTH)
+    data = value.encode()
+    return _COUNT.pack(len(data)) + data
+
+
+def _unpack_text(buffer: bytes, offset: int) -> tuple[str | None, int]:
+    (length,) = _COUNT.unpack_from(buffer, offset)
+    offset += _COUNT.size
+    if length == _NONE_LENGTH:
+        return None, offset
+    return buffer[offset : offset + length].decode(), offset + length
+
+
+def encode_member_record(
+    *,
+    role_ids: Iterable[int],
+    nick: str | None,
+    global_name: str | None,
+    username: str,
+    avatar_hash: str | None,
+) -> str | None:
+    """
+    Encode a member record in the compact format.
+
+    Args:
+        role_ids: Discord role IDs held by the member
+        nick: Guild nickname
+        global_name: Global display name
+        username: Discord username
+        avatar_hash: Discord avatar hash (e.g. "a_0123...") or None
+
+    Returns:
+        Base64 record string, or None if a field cannot be represented compactly
+        (non-hex avatar hash) and the caller should store JSON instead
+    """
+    flags = 0
+    avatar_bytes = b""
+    if avatar_hash is not None:
+        match = _AVATAR_HASH_PATTERN.match(avatar_hash)
+        if match is None:
+            return None
+        flags |= _FLAG_HAS_AVATAR
+        if match.group(1):
+            flags |= _FLAG_ANIMATED
+        avatar_bytes = bytes.fromhex(match.group(2))
+
+    roles = list(role_ids)
+    parts = [
+        _HEADER.pack(MEMBER_RECORD_VERSION, flags),
+        avatar_bytes,
+        _COUNT.pack(len(roles)),
+        b"".join(_ROLE.pack(role_id) for role_id in roles),
+        _pack_text(nick),
+        _pack_text(global_name),
+        _pack_text(username),
+    ]
+    return base64.b64encode(b"".join(parts)).decode("ascii")
+
+
+def _decode_compact(raw: str, uid: str) -> dict:
+    buffer = base64.b64decode(raw)
+    version, flags = _HEADER.unpack_from(buffer, 0)
+    if version != MEMBER_RECORD_VERSION:
+        msg = f"Unsupported member record version {version}"
+        raise ValueError(msg)
+    offset = _HEADER.size
+
+    avatar_hash = None
+    if flags & _FLAG_HAS_AVATAR:
+        avatar_hash = buffer[offset : offset + _AVATAR_HASH_BYTES].hex()
+        if flags & _FLAG_ANIMATED:
+            avatar_hash = f"a_{avatar_hash}"
+        offset += _AVATAR_HASH_BYTES
+
+    (role_count,) = _COUNT.unpack_from(buffer, offset)
+    offset += _COUNT.size
+    roles = [str(role_id) for role_id in struct.unpack_from(f">{role_count}Q", buffer, offset)]
+    offset += role_count * _ROLE.size
+
+    nick, offset = _unpack_text(buffer, offset)
+    global_name, offset = _unpack_text(buffer, offset)
+    username, offset = _unpack_text(buffer, offset)
+
+    return {
+        "roles": roles,
+        "nick": nick,
+        "global_name": global_name,
+        "username": username,
+        "avatar_url": avatar_url(uid, avatar_hash),
+    }
+
+
+def decode_member_record(raw: str, uid: str) -> dict:
+    """
+    Decode a member record stored in either the JSON or the compact format.
+
+    Args:
+        raw: Stored record value
+        uid: Discord user ID the record belongs to (needed to rebuild the avatar URL)
+
+    Returns:
+        Member dict with keys: roles, nick, global_name, username, avatar_url
+    """
+    if raw.startswith("{"):
+        return json.loads(raw)
+    return _decode_compact(raw, uid)
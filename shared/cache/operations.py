@@ -22,14 +22,16 @@
 """Cache operation names, generic hit/miss counters, latency histogram, and projection reads."""
 
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from enum import StrEnum
+from functools import partial
 from typing import Any
 
 from opentelemetry import metrics
 
 from shared.cache.client import RedisClient, get_redis_client
 from shared.cache.keys import CacheKeys
+from shared.cache.request_memo import memoize, remember
 
 _meter = metrics.get_meter(__name__)
 _hit_counter = _meter.create_counter("cache.hits", description="Cache hits", unit="1")
@@ -67,6 +69,8 @@ class CacheOperation(StrEnum):
     USER_ROLES_BOT = "user_roles_bot"
     GUILD_ROLES_BOT = "guild_roles_bot"
     CALENDAR_EXPORT_TOKEN_LOOKUP = "calendar_export_token_lookup"  # noqa: S105 - symbolic operation label, not a credential
+    CALENDAR_EVENT = "calendar_event"
+    GAME_RESPONSE = "game_response"
 
 
 async def cache_get(key: str, operation: CacheOperation) -> Any | None:  # noqa: ANN401
@@ -92,6 +96,28 @@ async def cache_get(key: str, operation: CacheOperation) -> Any | None:  # noqa:
     return result
 
 
+def record_cache_lookups(
+    operation: CacheOperation, values: Sequence[object | None], elapsed: float
+) -> None:
+    """
+    Record hit/miss counters for a bulk read, one count per key.
+
+    Args:
+        operation: Symbolic operation name used as the metric label.
+        values: Values read, None for each miss.
+        elapsed: Seconds the bulk read took.
+    """
+    hits = sum(1 for value in values if value is not None)
+    misses = len(values) - hits
+    if hits:
+        _hit_counter.add(hits, {"operation": operation})
+    if misses:
+        _miss_counter.add(misses, {"operation": operation})
+    _duration_histogram.record(
+        elapsed, {"operation": operation, "result": "miss" if misses else "hit"}
+    )
+
+
 async def read_projection_key(
     redis: RedisClient, key_fn: Callable[..., str], *key_args: str
 ) -> str | None:
@@ -100,7 +126,8 @@ async def read_projection_key(
 
     Handles the window where the gen pointer has flipped to a new value but
     the caller's key was constructed with the old value. Retries up to
-    _MAX_GEN_RETRIES times before giving up.
+    _MAX_GEN_RETRIES times before giving up.  Within a request_memo() scope
+    the gen pointer and each value are read at most once per request.
 
     Args:
         redis: Redis async client wrapper
@@ -110,15 +137,72 @@ async def read_projection_key(
     Returns:
         Cached value string, or None if absent
     """
-    gen = await redis.get(CacheKeys.proj_gen())
+    gen = await _read_projection_gen(redis)
     for _ in range(_MAX_GEN_RETRIES):
-        value = await redis.get(key_fn(gen, *key_args))
+        key = key_fn(gen, *key_args)
+        value = await memoize(key, partial(redis.get, key))
         if value is not None:
             return value
         gen2 = await redis.get(CacheKeys.proj_gen())
+        remember(CacheKeys.proj_gen(), gen2)
         if gen == gen2:
             _proj_read_not_found_counter.add(1)
             return None
         _proj_read_retry_counter.add(1)
         gen = gen2
     return None
+
+
+async def _read_projection_gen(redis: RedisClient) -> str | None:
+    """Read the projection gen pointer, once per request_memo() scope."""
+    return await memoize(CacheKeys.proj_gen(), partial(redis.get, CacheKeys.proj_gen()))
+
+
+async def read_projection_keys(
+    redis: RedisClient,
+    key_fn: Callable[..., str],
+    key_args: Sequence[tuple[str, ...]],
+    *,
+    extra_keys: Sequence[str] = (),
+) -> tuple[list[str | None], list[str | None]]:
+    """
+    Read many projection keys with one gen lookup and one MGET.
+
+    Bulk form of read_projection_key: the gen pointer is read once and every
+    key is fetched in a single MGET.  Misses are re-checked against the gen
+    pointer and, if it rotated, re-read under the new gen.  ``extra_keys``
+    (non-projection keys such as cached values) ride along in the first MGET
+    so callers can combine both reads into one round-trip.
+
+    Args:
+        redis: Redis async client wrapper
+        key_fn: Key factory function (e.g., CacheKeys.proj_member)
+        key_args: Arguments for key_fn after the gen argument, one tuple per key
+        extra_keys: Plain keys to fetch in the same MGET
+
+    Returns:
+        Tuple of (projection values in key_args order, extra_keys values)
+    """
+    values: list[str | None] = [None] * len(key_args)
+    pending = list(range(len(key_args)))
+    gen = await _read_projection_gen(redis)
+    fetched = await redis.mget([key_fn(gen, *key_args[i]) for i in pending] + list(extra_keys))
+    extra_values = fetched[len(pending) :]
+
+    for attempt in range(_MAX_GEN_RETRIES):
+        for index, value in zip(pending, fetched, strict=False):
+            values[index] = value
+        pending = [index for index in pending if values[index] is None]
+        if not pending:
+            break
+        gen2 = await redis.get(CacheKeys.proj_gen())
+        remember(CacheKeys.proj_gen(), gen2)
+        if gen == gen2:
+            _proj_read_not_found_counter.add(len(pending))
+            break
+        _proj_read_retry_counter.add(1)
+        if attempt == _MAX_GEN_RETRIES - 1:
+            break
+        gen = gen2
+        fetched = await redis.mget([key_fn(gen, *key_args[i]) for i in pending])
+    return values, extra_values
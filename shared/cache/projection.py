@@ -23,11 +23,15 @@
 
 import json
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
+from functools import partial
 
 from shared.cache.client import RedisClient
 from shared.cache.keys import CacheKeys
-from shared.cache.operations import read_projection_key
+from shared.cache.member_record import decode_member_record
+from shared.cache.operations import read_projection_key, read_projection_keys
+from shared.cache.request_memo import memoize
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +55,31 @@ async def get_user_guilds(uid: str, *, redis: RedisClient) -> list[str] | None:
     return json.loads(raw)
 
 
+async def get_users_guilds(
+    uids: Sequence[str], *, redis: RedisClient
+) -> dict[str, list[str] | None]:
+    """
+    Get the guild ID lists for many users with a single MGET.
+
+    Args:
+        uids: Discord user IDs
+        redis: Redis async client wrapper
+
+    Returns:
+        Dict mapping each user ID to its guild ID list, or None if absent
+    """
+    unique_uids = list(dict.fromkeys(uids))
+    if not unique_uids:
+        return {}
+    raw_values, _ = await read_projection_keys(
+        redis, CacheKeys.proj_user_guilds, [(uid,) for uid in unique_uids]
+    )
+    return {
+        uid: json.loads(raw) if raw is not None else None
+        for uid, raw in zip(unique_uids, raw_values, strict=True)
+    }
+
+
 async def get_member(guild_id: str, uid: str, *, redis: RedisClient) -> dict | None:
     """
     Get member data for a user in a guild from the projection.
@@ -67,7 +96,30 @@ async def get_member(guild_id: str, uid: str, *, redis: RedisClient) -> dict | N
     raw = await read_projection_key(redis, CacheKeys.proj_member, guild_id, uid)
     if raw is None:
         return None
-    return json.loads(raw)
+    return decode_member_record(raw, uid)
+
+
+async def get_members(
+    keys: Sequence[tuple[str, str]], *, redis: RedisClient
+) -> dict[tuple[str, str], dict | None]:
+    """
+    Get member data for many (guild, user) pairs with a single MGET.
+
+    Args:
+        keys: (guild_id, uid) pairs; the guilds may differ
+        redis: Redis async client wrapper
+
+    Returns:
+        Dict mapping each pair to its member dict, or None if absent
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    if not unique_keys:
+        return {}
+    raw_values, _ = await read_projection_keys(redis, CacheKeys.proj_member, unique_keys)
+    return {
+        (guild_id, uid): decode_member_record(raw, uid) if raw is not None else None
+        for (guild_id, uid), raw in zip(unique_keys, raw_values, strict=True)
+    }
 
 
 async def get_user_roles(guild_id: str, uid: str, *, redis: RedisClient) -> list[str]:
@@ -112,7 +164,8 @@ async def is_bot_fresh(*, redis: RedisClient) -> bool:
     Returns:
         True if bot:last_seen key exists and timestamp is within acceptable age
     """
-    raw = await redis.get(CacheKeys.bot_last_seen())
+    key = CacheKeys.bot_last_seen()
+    raw = await memoize(key, partial(redis.get, key))
     if raw is None:
         return False
     try:
@@ -0,0 +1,106 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Request-scoped memoization of Redis reads.
+
+One API request can resolve the same session, projection generation and
+projection entries from several dependencies.  Inside a request_memo()
+scope, memoize() returns the first result for a key instead of reading
+Redis again.  Outside a scope it always calls through, so the bot and
+background tasks are unaffected.
+
+Keys are the Redis keys the values were read from, so a writer in the same
+request can forget() the entry it just changed.
+"""
+
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class RequestMemo:
+    """Values memoized within one request and how often they were reused."""
+
+    values: dict[Hashable, Any] = field(default_factory=dict)
+    hits: int = 0
+
+
+_current_memo: ContextVar[RequestMemo | None] = ContextVar("request_memo", default=None)
+
+
+@contextmanager
+def request_memo() -> Iterator[RequestMemo]:
+    """
+    Memoize reads made inside the ``with`` block.
+
+    Tasks created inside the block share the same memo.
+
+    Yields:
+        Memo updated in place as values are loaded and reused
+    """
+    memo = RequestMemo()
+    token = _current_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _current_memo.reset(token)
+
+
+async def memoize[T](key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+    """
+    Return the memoized value for key, calling load() the first time.
+
+    None results are memoized too, so a miss is not re-read in the same request.
+
+    Args:
+        key: Redis key (or other hashable) identifying the value
+        load: Reads the value when it is not memoized yet
+
+    Returns:
+        The memoized or freshly loaded value
+    """
+    memo = _current_memo.get()
+    if memo is None:
+        return await load()
+    if key in memo.values:
+        memo.hits += 1
+        return memo.values[key]
+    value = await load()
+    memo.values[key] = value
+    return value
+
+
+def remember(key: Hashable, value: Any) -> None:  # noqa: ANN401
+    """Replace the memoized value for key in the active scope, if any."""
+    memo = _current_memo.get()
+    if memo is not None:
+        memo.values[key] = value
+
+
+def forget(key: Hashable) -> None:
+    """Drop the memoized value for key in the active scope, if any."""
+    memo = _current_memo.get()
+    if memo is not None:
+        memo.values.pop(key, None)
@@ -44,3 +44,5 @@ class CacheTTL:
     DISCORD_USER: int = 300  # 5 minutes - Discord user objects
     APP_INFO: int = 3600  # 1 hour - Discord application info
     CALENDAR_EXPORT_TOKEN: int = 300  # 5 minutes - TTL-only expiry, no delete-on-read
+    CALENDAR_EVENT: int = 3600  # 1 hour - also tagged with the game's updated_at
+    ORPHAN_SWEEP_PROGRESS: int = 86400  # 24 hours - lets a restarted bot resume its sweep
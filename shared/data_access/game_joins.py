@@ -0,0 +1,225 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Single-statement join for the Discord join button.
+
+A join used to read the game, the user and every participant row, then
+insert, commit, refresh and commit again.  join_game() does the whole job in
+one statement: it locks the game row, creates the user if needed, inserts
+the participant with its role-priority position, schedules the delayed join
+notification, queues the message refresh and publishes game_updated_sse.
+The confirmed and waitlist counters on game_sessions are maintained by
+triggers in the same transaction.
+
+Locking the game row first means concurrent joins to one game queue behind
+each other instead of deadlocking on the counter update.
+
+A brand-new user joining twice at once (e.g. two games) races on the users
+insert: the loser's ON CONFLICT DO NOTHING returns no row, and the winner's
+row is not visible in the loser's statement snapshot.  The statement reports
+this as lost_user_race and join_game() runs it once more, by which time the
+winner has committed.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import SmallInteger, String, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.models.participant import UNPOSITIONED_SENTINEL, ParticipantType
+from shared.models.signup_method import SignupMethod
+from shared.utils.status_transitions import GameStatus
+
+# The position expression mirrors resolve_role_position(): the index of the
+# first template priority role the user holds, otherwise SELF_ADDED.
+# signup_priority_role_ids is a plain JSON column, so a template saved
+# without priority roles holds JSON 'null'; the game CTE maps anything that
+# is not an array to SQL NULL before the json_array_* calls see it.
+_JOIN_GAME_SQL = text(
+    """
+    WITH game AS (
+        SELECT g.id, g.guild_id, g.status, g.signup_method, g.scheduled_at,
+               g.max_players, g.confirmed_count, g.waitlist_count,
+               c.channel_id AS discord_channel_id,
+               CASE WHEN json_typeof(t.signup_priority_role_ids) = 'array'
+                    THEN t.signup_priority_role_ids END AS signup_priority_role_ids
+        FROM game_sessions g
+        JOIN channel_configurations c ON c.id = g.channel_id
+        LEFT JOIN game_templates t ON t.id = g.template_id
+        WHERE g.id = :game_id
+        FOR UPDATE OF g
+    ),
+    open_game AS (
+        SELECT * FROM game
+        WHERE status = :scheduled_status
+          AND signup_method <> :host_selected
+    ),
+    new_user AS (
+        INSERT INTO users (id, discord_id)
+        SELECT gen_random_uuid()::text, CAST(:discord_id AS text) FROM open_game
+        ON CONFLICT (discord_id) DO NOTHING
+        RETURNING id
+    ),
+    joiner AS (
+        SELECT id FROM new_user
+        UNION ALL
+        SELECT id FROM users WHERE discord_id = CAST(:discord_id AS text)
+    ),
+    participant AS (
+        INSERT INTO game_participants
+            (id, game_session_id, user_id, joined_at, position_type, position)
+        SELECT gen_random_uuid()::text, open_game.id, joiner.id, timezone('utc', now()),
+               CASE WHEN matched.role_index IS NULL
+                    THEN :self_added
+                    ELSE :role_matched END,
+               COALESCE(matched.role_index, :unpositioned)
+        FROM open_game
+        CROSS JOIN joiner
+        LEFT JOIN LATERAL (
+            SELECT (r.ordinality - 1)::smallint AS role_index
+            FROM json_array_elements_text(open_game.signup_priority_role_ids)
+                WITH ORDINALITY AS r(role_id, ordinality)
+            WHERE r.role_id = ANY(:user_role_ids)
+            ORDER BY r.ordinality
+            LIMIT 1
+        ) AS matched ON true
+        ON CONFLICT (game_session_id, user_id) DO NOTHING
+        RETURNING id, game_session_id
+    ),
+    join_notification AS (
+        INSERT INTO notification_schedule
+            (id, game_id, participant_id, notification_type, notification_time,
+             game_scheduled_at, sent)
+        SELECT gen_random_uuid()::text, participant.game_session_id, participant.id,
+               'join_notification',
+               timezone('utc', now()) + CAST(:delay_seconds AS integer) * interval '1 second',
+               open_game.scheduled_at, false
+        FROM participant CROSS JOIN open_game
+    ),
+    refresh AS (
+        INSERT INTO message_refresh_queue (game_id, channel_id)
+        SELECT open_game.id, open_game.discord_channel_id
+        FROM participant CROSS JOIN open_game
+        ON CONFLICT (channel_id, game_id) DO UPDATE SET enqueued_at = now()
+    ),
+    bumped AS (
+        UPDATE game_sessions SET version = game_sessions.version + 1
+        FROM participant
+        WHERE game_sessions.id = participant.game_session_id
+        RETURNING game_sessions.id, game_sessions.guild_id, game_sessions.version
+    ),
+    notified AS (
+        SELECT pg_notify(
+            'game_updated_sse',
+            json_build_object('game_id', id, 'guild_id', guild_id, 'version', version)::text
+        )
+        FROM bumped
+    )
+    SELECT game.status, game.signup_method, game.max_players,
+           game.confirmed_count, game.waitlist_count,
+           COALESCE(json_array_length(game.signup_priority_role_ids), 0) > 0
+               AS has_priority_roles,
+           participant.id AS participant_id,
+           EXISTS (SELECT 1 FROM open_game) AND NOT EXISTS (SELECT 1 FROM joiner)
+               AS lost_user_race,
+           (SELECT count(*) FROM notified) AS notified
+    FROM game
+    LEFT JOIN participant ON true
+    """
+).bindparams(
+    bindparam("user_role_ids", type_=ARRAY(String)),
+    bindparam("self_added", type_=SmallInteger),
+    bindparam("role_matched", type_=SmallInteger),
+    bindparam("unpositioned", type_=SmallInteger),
+)
+
+
+@dataclass(frozen=True)
+class JoinResult:
+    """Outcome of one join attempt."""
+
+    error: str | None = None
+    participant_id: str | None = None
+    participant_count: int = 0
+    max_players: int | None = None
+    has_priority_roles: bool = False
+
+    @property
+    def joined(self) -> bool:
+        """Whether a new participant row was inserted."""
+        return self.participant_id is not None
+
+
+async def join_game(
+    db: AsyncSession,
+    game_id: str,
+    discord_id: str,
+    user_role_ids: list[str],
+    join_notification_delay_seconds: int = 60,
+) -> JoinResult:
+    """
+    Add a Discord user to a game in one round trip.
+
+    Does not commit.  When the user is already a participant nothing is
+    written and the result has neither an error nor a participant_id.
+
+    Args:
+        db: Database session (must be inside an active transaction)
+        game_id: Game session ID string
+        discord_id: Discord user ID of the joiner
+        user_role_ids: Guild role IDs the joiner holds, for priority-role placement
+        join_notification_delay_seconds: Delay before the join notification is sent
+
+    Returns:
+        The join outcome; participant_count includes the new participant
+    """
+    params = {
+        "game_id": game_id,
+        "discord_id": discord_id,
+        "user_role_ids": user_role_ids,
+        "delay_seconds": join_notification_delay_seconds,
+        "scheduled_status": GameStatus.SCHEDULED.value,
+        "host_selected": SignupMethod.HOST_SELECTED.value,
+        "self_added": ParticipantType.SELF_ADDED.value,
+        "role_matched": ParticipantType.ROLE_MATCHED.value,
+        "unpositioned": UNPOSITIONED_SENTINEL,
+    }
+    row = (await db.execute(_JOIN_GAME_SQL, params)).one_or_none()
+    if row is not None and row.lost_user_race:
+        # Nothing was written; a fresh statement sees the committed user row.
+        row = (await db.execute(_JOIN_GAME_SQL, params)).one_or_none()
+    if row is None:
+        return JoinResult(error="Game not found")
+    if row.status != GameStatus.SCHEDULED.value:
+        return JoinResult(error="Game has already started or is completed")
+    if row.signup_method == SignupMethod.HOST_SELECTED.value:
+        # The Discord join button is disabled for this method, but that is
+        # client-side only.
+        return JoinResult(
+            error="This game does not accept self-signups; only the host can add participants"
+        )
+    return JoinResult(
+        participant_id=row.participant_id,
+        participant_count=row.confirmed_count + row.waitlist_count + 1,
+        max_players=row.max_players,
+        has_priority_roles=row.has_priority_roles,
+    )
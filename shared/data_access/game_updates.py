@@ -0,0 +1,56 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Publish game_updated_sse notifications with a per-game version.
+
+Every publish bumps ``game_sessions.version`` and carries the new value in
+the NOTIFY payload, so SSE clients can tell an in-order change from a gap.
+Both the bump and the notify run as one statement inside the caller's
+transaction, so the event is only delivered if the change commits.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_NOTIFY_GAME_UPDATED_SQL = text(
+    """
+    WITH bumped AS (
+        UPDATE game_sessions SET version = version + 1
+        WHERE id = :game_id
+        RETURNING id, guild_id, version
+    )
+    SELECT pg_notify(
+        'game_updated_sse',
+        json_build_object('game_id', id, 'guild_id', guild_id, 'version', version)::text
+    )
+    FROM bumped
+    """
+)
+
+
+async def notify_game_updated(db: AsyncSession, game_id: str) -> None:
+    """
+    Bump the game's version and emit pg_notify('game_updated_sse', ...).
+
+    Args:
+        db: Database session (must be inside an active transaction)
+        game_id: Game session ID string
+    """
+    await db.execute(_NOTIFY_GAME_UPDATED_SQL.bindparams(game_id=game_id))
@@ -0,0 +1,98 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Per-request counting of database and Redis round-trips.
+
+A ContextVar holds the active counter; a SQLAlchemy cursor-execute listener and
+RedisClient's command hook increment it.  Outside a tracking scope each hook
+costs a single ContextVar lookup.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+
+@dataclass
+class RoundTripCounts:
+    """Database statements and Redis commands issued within one tracking scope."""
+
+    db: int = 0
+    redis: int = 0
+
+    @property
+    def total(self) -> int:
+        """Database and Redis round-trips combined."""
+        return self.db + self.redis
+
+
+_current_counts: ContextVar[RoundTripCounts | None] = ContextVar("round_trip_counts", default=None)
+
+
+@contextmanager
+def track_round_trips() -> Iterator[RoundTripCounts]:
+    """
+    Count database and Redis round-trips made inside the ``with`` block.
+
+    Tasks created inside the block inherit the same counter, so concurrent
+    work started with ``asyncio.gather`` is included.
+
+    Yields:
+        Counter updated in place as round-trips happen
+    """
+    counts = RoundTripCounts()
+    token = _current_counts.set(counts)
+    try:
+        yield counts
+    finally:
+        _current_counts.reset(token)
+
+
+def record_db_round_trip() -> None:
+    """Count one database statement against the active scope, if any."""
+    counts = _current_counts.get()
+    if counts is not None:
+        counts.db += 1
+
+
+def record_redis_round_trip() -> None:
+    """Count one Redis command against the active scope, if any."""
+    counts = _current_counts.get()
+    if counts is not None:
+        counts.redis += 1
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_cursor_execute(
+    _conn: Connection,
+    _cursor: Any,  # noqa: ANN401 - DBAPI cursor type varies by driver
+    _statement: str,
+    _parameters: Any,  # noqa: ANN401 - DBAPI parameters type varies by driver
+    _context: Any,  # noqa: ANN401 - ExecutionContext is optional per SQLAlchemy event signature
+    _executemany: bool,
+) -> None:
+    """Count every statement sent to the database by any engine."""
+    record_db_round_trip()
@@ -143,7 +143,7 @@ def get_db_with_user_guilds() -> Any:  # noqa: ANN401
         from shared.cache import client as cache_client  # noqa: PLC0415
         from shared.cache import projection as member_projection  # noqa: PLC0415
 
-        token_data = await tokens.get_user_tokens(current_user.session_token)
+        token_data = await tokens.get_session(current_user.session_token)
         if not token_data:
             raise HTTPException(status_code=401, detail="No session found")
 
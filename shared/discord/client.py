@@ -38,8 +38,9 @@ from starlette import status
 
 from shared.cache import client as cache_client
 from shared.cache import keys as cache_keys
-from shared.cache import ttl
+from shared.cache import l1, ttl
 from shared.cache.operations import CacheOperation
+from shared.discord.rate_limit import GlobalTokenLease, get_global_lease
 from shared.utils.discord_tokens import DISCORD_BOT_TOKEN_DOT_COUNT
 
 _T = TypeVar("_T")
@@ -101,6 +102,10 @@ class DiscordAPIClient:
         self._user_url = f"{api_base_url}/users/@me"
         self._session: aiohttp.ClientSession | None = None
 
+    def _global_lease(self, global_max: int) -> GlobalTokenLease:
+        """Return the process-wide token bucket for the given global budget."""
+        return get_global_lease(global_max)
+
     def _get_auth_header(self, token: str | None = None) -> str:
         """
         Detect token type and return appropriate Authorization header.
@@ -202,7 +207,7 @@ class DiscordAPIClient:
         cache_ttl: int | None = None,
         session: aiohttp.ClientSession | None = None,
         channel_id: str | None = None,
-        global_max: int = 25,
+        global_max: int = ttl.DISCORD_GLOBAL_RATE_LIMIT_BACKGROUND,
         **request_kwargs: Any,  # noqa: ANN401
     ) -> dict[str, Any]:
         """
@@ -217,7 +222,7 @@ class DiscordAPIClient:
             cache_ttl: Optional cache TTL in seconds
             session: Optional existing session
             channel_id: Discord channel ID for per-channel rate limiting (global-only if None)
-            global_max: Global rate-limit budget (requests per 1000ms window, default 25)
+            global_max: Global rate-limit budget (requests per 1000ms window)
             **request_kwargs: Additional arguments for aiohttp request
 
         Returns:
@@ -229,16 +234,18 @@ class DiscordAPIClient:
         redis = await cache_client.get_redis_client()
         self._log_request(method, url, operation_name)
 
-        while True:
-            if channel_id is not None:
+        if channel_id is not None:
+            # The per-channel window is fleet-wide too, so channel-scoped calls
+            # keep the atomic global+channel claim.
+            while True:
                 wait_ms = await redis.claim_global_and_channel_slot(
                     channel_id, global_max=global_max
                 )
-            else:
-                wait_ms = await redis.claim_global_slot(global_max=global_max)
-            if wait_ms == 0:
-                break
-            await asyncio.sleep(wait_ms / 1000)
+                if wait_ms == 0:
+                    break
+                await asyncio.sleep(wait_ms / 1000)
+        else:
+            await self._global_lease(global_max).acquire(redis)
 
         try:
             session_to_use = session or await self._get_session()
@@ -381,7 +388,7 @@ class DiscordAPIClient:
         calls fetch_fn(), writes the result back to Redis, and returns it.
         """
         try:
-            return await self._read_cache_only(cache_key, operation)
+            return await self._read_cache_only(cache_key, operation, in_process=False)
         except DiscordAPIError as exc:
             if exc.status != status.HTTP_503_SERVICE_UNAVAILABLE:
                 raise
@@ -390,23 +397,36 @@ class DiscordAPIClient:
         await redis.set(cache_key, json.dumps(result), ttl=cache_ttl)
         return result
 
-    async def _read_cache_only(self, cache_key: str, operation: CacheOperation) -> Any:  # noqa: ANN401
+    async def _read_cache_only(
+        self,
+        cache_key: str,
+        operation: CacheOperation,
+        *,
+        in_process: bool = True,
+    ) -> Any:  # noqa: ANN401
         """
         Cache-only read with OTel recording; raises DiscordAPIError(503) on miss.
 
         Gateway events keep these keys current. A miss means the bot is not yet
         connected or the resource is genuinely absent — not a reason to call REST.
+        Because the bot publishes an invalidation for every rewrite, the decoded
+        value is also held in the per-process L1 cache unless in_process is False.
         """
         redis = await cache_client.get_redis_client()
+
+        async def load() -> Any:  # noqa: ANN401
+            raw = await redis.get(cache_key)
+            return json.loads(raw) if raw else None
+
         t0 = time.monotonic()
-        cached = await redis.get(cache_key)
-        if cached:
+        cached = await (l1.get_or_load(cache_key, load) if in_process else load())
+        if cached is not None:
             _cache_hit_counter.add(1, {"operation": operation})
             _cache_duration_histogram.record(
                 time.monotonic() - t0,
                 attributes={"operation": operation, "result": "hit"},
             )
-            return json.loads(cached)
+            return cached
         _cache_miss_counter.add(1, {"operation": operation})
         _cache_duration_histogram.record(
             time.monotonic() - t0,
@@ -0,0 +1,100 @@
+# Copyright 2025-2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Process-local token bucket that leases Discord global rate-limit tokens in blocks.
+
+Claiming one token per request costs a Redis Lua round-trip per Discord call,
+and an exhausted budget makes every caller poll Redis again after its wait.
+GlobalTokenLease instead leases a small block of tokens from the shared
+sliding window, hands them out locally, and queues concurrent callers on an
+in-process lock so only one of them talks to Redis at a time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from shared.cache.client import RedisClient
+
+DEFAULT_LEASE_BLOCK_SIZE = 5
+
+# Leased tokens are recorded in Redis when leased, so they only count against
+# the current 1000ms window; spending one later would exceed the fleet budget.
+_LEASE_WINDOW_SECONDS = 1.0
+
+
+class GlobalTokenLease:
+    """Local bucket of global Discord rate-limit tokens leased from Redis.
+
+    The fleet-wide budget is still enforced by Redis: every leased token is
+    recorded in the shared window, and tokens not spent before the window
+    moves on are discarded rather than used late.  Waiters acquire the lock in
+    FIFO order; the holder either takes a local token or leases a new block,
+    sleeping for the Redis-provided wait when the budget is exhausted.
+
+    Args:
+        global_max: Fleet-wide requests per 1000ms window.
+        block_size: Tokens to request from Redis per lease.
+    """
+
+    def __init__(self, global_max: int, block_size: int = DEFAULT_LEASE_BLOCK_SIZE) -> None:
+        self.global_max = global_max
+        self.block_size = block_size
+        self._tokens = 0
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, redis: RedisClient) -> None:
+        """Wait until one global token is available and consume it."""
+        async with self._lock:
+            while True:
+                if self._tokens > 0 and time.monotonic() < self._expires_at:
+                    self._tokens -= 1
+                    return
+                leased_at = time.monotonic()
+                granted, wait_ms = await redis.lease_global_slots(
+                    self.block_size, global_max=self.global_max
+                )
+                if granted > 0:
+                    self._tokens = granted
+                    self._expires_at = leased_at + _LEASE_WINDOW_SECONDS
+                    continue
+                await asyncio.sleep(wait_ms / 1000)
+
+
+_leases: dict[int, GlobalTokenLease] = {}
+
+
+def get_global_lease(global_max: int) -> GlobalTokenLease:
+    """
+    Return the process-wide lease for a global budget.
+
+    Every sender in a process spends the same budget through one lease, so
+    their local token buckets cannot add up to more than global_max.
+    """
+    lease = _leases.get(global_max)
+    if lease is None:
+        lease = _leases[global_max] = GlobalTokenLease(global_max)
+    return lease
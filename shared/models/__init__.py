@@ -26,13 +26,14 @@ from .base import Base
 from .bot_action_queue import BotActionQueue
 from .channel import ChannelConfiguration
 from .game import GameSession, GameStatus
-from .game_image import GameImage
+from .game_image import GameImage, GameImageVariant
 from .game_status_schedule import GameStatusSchedule
 from .guild import GuildConfiguration
 from .message_refresh_queue import MessageRefreshQueue
 from .notification_schedule import NotificationSchedule
 from .participant import GameParticipant
 from .participant_action_schedule import ParticipantActionSchedule
+from .reminder_delivery import ReminderDelivery
 from .signup_method import SignupMethod
 from .template import GameTemplate
 from .user import User
@@ -43,6 +44,7 @@ __all__ = [
     "BotActionQueue",
     "ChannelConfiguration",
     "GameImage",
+    "GameImageVariant",
     "GameParticipant",
     "GameSession",
     "GameStatus",
@@ -52,6 +54,7 @@ __all__ = [
     "MessageRefreshQueue",
     "NotificationSchedule",
     "ParticipantActionSchedule",
+    "ReminderDelivery",
     "SignupMethod",
     "User",
 ]
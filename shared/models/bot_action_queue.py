@@ -37,8 +37,9 @@ class BotActionQueue(Base):
 
     Each row represents one pending action for the bot to execute.
     The action_type field determines which handler processes it.
-    Rows are deleted by the handler after successful processing,
-    within the same transaction — crash safety via Postgres atomicity.
+    The listener leases rows in batches by setting leased_at, dispatches
+    them, then deletes them; a lease older than the listener's timeout is
+    treated as abandoned and the row is claimed again.
 
     A DB trigger fires pg_notify('bot_action_queue_changed', '') on INSERT
     so the bot listener wakes up immediately.
@@ -64,3 +65,7 @@ class BotActionQueue(Base):
         nullable=False,
         server_default=func.now(),
     )
+    leased_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
@@ -25,7 +25,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import JSON, Boolean, ForeignKey, Integer, String, Text, func, text
+from sqlalchemy import JSON, Boolean, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from shared.utils.status_transitions import GameStatus
@@ -97,6 +97,19 @@ class GameSession(Base):
     updated_at: Mapped[datetime] = mapped_column(
         default=utc_now, onupdate=utc_now, server_default=func.now()
     )
+    # Bumped each time a game_updated_sse event is published for this game.
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    # Maintained by database triggers on game_participants and on max_players /
+    # signup_method changes; never written by the application.  Values loaded
+    # before a participant change in the same session are stale.
+    confirmed_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    waitlist_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
 
     # Image references (FK to game_images table)
     thumbnail_id: Mapped[UUID | None] = mapped_column(
@@ -128,5 +141,11 @@ class GameSession(Base):
         "GameImage", foreign_keys=[banner_image_id], lazy="selectin"
     )
 
+    # ix_game_sessions_list_order (the list_games sort-key expression index) is
+    # defined only in migration 20261016_game_list_indexes.
+    __table_args__ = (
+        Index("ix_game_sessions_guild_status_scheduled", "guild_id", "status", "scheduled_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<GameSession(id={self.id}, title={self.title}, status={self.status})>"
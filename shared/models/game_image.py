@@ -24,8 +24,8 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import LargeBinary, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from .base import Base, utc_now
@@ -39,13 +39,16 @@ class GameImage(Base):
     the same image, with automatic cleanup when reference count reaches zero.
 
     No RLS policies - designed for public access via image ID only.
+
+    ``image_data`` is deferred: loading a GameImage reads only its metadata,
+    and the bytes are fetched by an explicit query where they are served.
     """
 
     __tablename__ = "game_images"
 
     id: Mapped[UUID] = mapped_column(primary_key=True, server_default=func.gen_random_uuid())
     content_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
-    image_data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    image_data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False, deferred=True)
     mime_type: Mapped[str] = mapped_column(String(50), nullable=False)
     reference_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(default=utc_now, server_default=func.now())
@@ -53,9 +56,34 @@ class GameImage(Base):
         default=utc_now, onupdate=utc_now, server_default=func.now()
     )
 
+    variants: Mapped[list["GameImageVariant"]] = relationship(
+        back_populates="image", cascade="all, delete-orphan", passive_deletes=True
+    )
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return (
             f"<GameImage(id={self.id}, hash={self.content_hash[:16]}..., "
             f"mime={self.mime_type}, refs={self.reference_count})>"
         )
+
+
+class GameImageVariant(Base):
+    """
+    Pre-rendered smaller copy of a GameImage, served via ``?size=``.
+
+    Variants are rendered once when the image is first stored and only exist
+    for sizes the original exceeds.  ON DELETE CASCADE removes them with
+    their image.
+    """
+
+    __tablename__ = "game_image_variants"
+
+    image_id: Mapped[UUID] = mapped_column(
+        ForeignKey("game_images.id", ondelete="CASCADE"), primary_key=True
+    )
+    variant: Mapped[str] = mapped_column(String(20), primary_key=True)
+    image_data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False, deferred=True)
+    mime_type: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    image: Mapped[GameImage] = relationship(back_populates="variants")
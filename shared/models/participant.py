@@ -28,6 +28,7 @@ from typing import TYPE_CHECKING, Final
 from sqlalchemy import (
     CheckConstraint,
     ForeignKey,
+    Index,
     SmallInteger,
     String,
     UniqueConstraint,
@@ -104,6 +105,7 @@ class GameParticipant(Base):
             "user_id",
             name="unique_game_participant",
         ),
+        Index("ix_game_participants_user_game", "user_id", "game_session_id"),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,57 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""ORM model for per-recipient reminder delivery checkpoints."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ReminderDelivery(Base):
+    """
+    Record of one reminder DM delivered to one recipient.
+
+    The bot inserts a row as soon as each reminder DM succeeds. If the bot dies
+    mid fan-out, the notification_due action is leased again and the retry
+    skips every recipient that already has a row, so only missing recipients
+    are messaged.
+
+    ON DELETE CASCADE removes the checkpoints with their notification_schedule
+    row, e.g. when a game is rescheduled and its reminders are recalculated.
+    """
+
+    __tablename__ = "reminder_deliveries"
+
+    notification_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("notification_schedule.id", ondelete="CASCADE"),
+        nullable=False,
+        primary_key=True,
+    )
+    discord_id: Mapped[str] = mapped_column(String(20), nullable=False, primary_key=True)
+    delivered_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -19,11 +19,12 @@
 # SOFTWARE.
 
 
-"""Resilient asyncpg LISTEN helper that reconnects after connection loss."""
+"""Resilient asyncpg LISTEN helpers that reconnect after connection loss."""
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 import asyncpg
@@ -32,36 +33,18 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_RETRY_DELAY_SECONDS = 5.0
 
+NotifyCallback = Callable[[asyncpg.Connection, int, str, str], Any]
+ConnectedCallback = Callable[[asyncpg.Connection], None]
 
-async def listen_with_reconnect(
+
+async def _maintain_connection(
     db_url: str,
-    channel: str,
-    on_notify: Callable[[asyncpg.Connection, int, str, str], Any],
-    *,
-    on_connected: Callable[[asyncpg.Connection], None] | None = None,
-    on_disconnected: Callable[[], None] | None = None,
-    retry_delay_seconds: float = DEFAULT_RETRY_DELAY_SECONDS,
+    description: str,
+    setup: Callable[[asyncpg.Connection], Awaitable[None]],
+    on_disconnected: Callable[[], None] | None,
+    retry_delay_seconds: float,
 ) -> None:
-    """Maintain a Postgres LISTEN connection on ``channel``, reconnecting on loss.
-
-    Runs until cancelled. Unlike a bare ``asyncpg.connect()`` + ``add_listener()``
-    call, this detects a silently dropped connection (transient network loss, an
-    idle-timeout kill from a proxy/pooler, a Postgres restart) via
-    ``add_termination_listener`` and reconnects with a fixed delay, instead of
-    hanging forever on a connection that will never deliver another NOTIFY.
-
-    Args:
-        db_url: PostgreSQL connection URL. Accepts either ``postgresql://`` or
-            the SQLAlchemy ``postgresql+asyncpg://`` form; the driver prefix is
-            stripped before being passed to asyncpg.
-        channel: Channel name to LISTEN on.
-        on_notify: Callback registered via ``add_listener`` for NOTIFY payloads.
-        on_connected: Optional callback invoked with the new connection after
-            each successful (re)connect, once LISTEN is registered.
-        on_disconnected: Optional callback invoked after each connection is
-            closed, whether due to cancellation, an error, or a lost connection.
-        retry_delay_seconds: Delay before each reconnect attempt.
-    """
+    """Connect, run ``setup``, and wait for loss; repeat after a fixed delay until cancelled."""
     pg_url = db_url.replace("postgresql+asyncpg://", "postgresql://")
     while True:
         conn: asyncpg.Connection | None = None
@@ -71,21 +54,19 @@ async def listen_with_reconnect(
             conn.add_termination_listener(
                 lambda _conn, _disconnected=disconnected: _disconnected.set()
             )
-            await conn.add_listener(channel, on_notify)
-            if on_connected is not None:
-                on_connected(conn)
+            await setup(conn)
             await disconnected.wait()
             logger.warning(
-                "LISTEN connection on channel %s lost, reconnecting in %.1fs",
-                channel,
+                "LISTEN connection on %s lost, reconnecting in %.1fs",
+                description,
                 retry_delay_seconds,
             )
         except asyncio.CancelledError:
             raise
         except Exception:
             logger.exception(
-                "LISTEN connection on channel %s failed, retrying in %.1fs",
-                channel,
+                "LISTEN connection on %s failed, retrying in %.1fs",
+                description,
                 retry_delay_seconds,
             )
         finally:
@@ -94,3 +75,149 @@ async def listen_with_reconnect(
             if on_disconnected is not None:
                 on_disconnected()
         await asyncio.sleep(retry_delay_seconds)
+
+
+async def listen_with_reconnect(
+    db_url: str,
+    channel: str,
+    on_notify: NotifyCallback,
+    *,
+    on_connected: ConnectedCallback | None = None,
+    on_disconnected: Callable[[], None] | None = None,
+    retry_delay_seconds: float = DEFAULT_RETRY_DELAY_SECONDS,
+) -> None:
+    """Maintain a Postgres LISTEN connection on ``channel``, reconnecting on loss.
+
+    Runs until cancelled. Unlike a bare ``asyncpg.connect()`` + ``add_listener()``
+    call, this detects a silently dropped connection (transient network loss, an
+    idle-timeout kill from a proxy/pooler, a Postgres restart) via
+    ``add_termination_listener`` and reconnects with a fixed delay, instead of
+    hanging forever on a connection that will never deliver another NOTIFY.
+
+    Args:
+        db_url: PostgreSQL connection URL. Accepts either ``postgresql://`` or
+            the SQLAlchemy ``postgresql+asyncpg://`` form; the driver prefix is
+            stripped before being passed to asyncpg.
+        channel: Channel name to LISTEN on.
+        on_notify: Callback registered via ``add_listener`` for NOTIFY payloads.
+        on_connected: Optional callback invoked with the new connection after
+            each successful (re)connect, once LISTEN is registered.
+        on_disconnected: Optional callback invoked after each connection is
+            closed, whether due to cancellation, an error, or a lost connection.
+        retry_delay_seconds: Delay before each reconnect attempt.
+    """
+
+    async def _setup(conn: asyncpg.Connection) -> None:
+        await conn.add_listener(channel, on_notify)
+        if on_connected is not None:
+            on_connected(conn)
+
+    await _maintain_connection(
+        db_url, f"channel {channel}", _setup, on_disconnected, retry_delay_seconds
+    )
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    channel: str
+    on_notify: NotifyCallback
+    on_connected: ConnectedCallback | None
+
+
+class NotificationHub:
+    """One LISTEN connection shared by every subscriber in the process.
+
+    Each ``listen_with_reconnect`` call holds its own Postgres backend and its
+    own reconnect loop.  The hub instead LISTENs on every subscribed channel
+    over a single connection and fans each NOTIFY out to the callbacks
+    registered for that channel, so a Postgres failover produces one reconnect
+    instead of one per background loop.  After every (re)connect each
+    subscriber's ``on_connected`` hook runs, which is where subscribers
+    trigger their catch-up drain for NOTIFYs missed while disconnected.
+
+    Subscriptions may be added before or after :meth:`run` starts; a
+    subscription added while connected is LISTENed on immediately.
+
+    Args:
+        db_url: PostgreSQL connection URL (``postgresql+asyncpg://…`` or
+            ``postgresql://…`` are both accepted).
+        retry_delay_seconds: Delay before each reconnect attempt.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        *,
+        retry_delay_seconds: float = DEFAULT_RETRY_DELAY_SECONDS,
+    ) -> None:
+        self._db_url = db_url
+        self._retry_delay_seconds = retry_delay_seconds
+        self._subscriptions: list[_Subscription] = []
+        self._conn: asyncpg.Connection | None = None
+        self._listening: set[str] = set()
+
+    async def subscribe(
+        self,
+        channel: str,
+        on_notify: NotifyCallback,
+        *,
+        on_connected: ConnectedCallback | None = None,
+    ) -> None:
+        """Register ``on_notify`` for ``channel`` NOTIFYs.
+
+        ``on_connected`` is called with the shared connection after every
+        (re)connect, and right away if the hub is already connected.
+        """
+        subscription = _Subscription(channel, on_notify, on_connected)
+        self._subscriptions.append(subscription)
+        conn = self._conn
+        if conn is None:
+            return
+        if channel not in self._listening:
+            self._listening.add(channel)
+            try:
+                await conn.add_listener(channel, self._dispatch)
+            except Exception:
+                # The connection is going away; the reconnect path LISTENs again.
+                logger.exception("Failed to LISTEN on channel %s via notification hub", channel)
+                return
+        if on_connected is not None and self._conn is conn:
+            on_connected(conn)
+
+    async def run(self) -> None:
+        """Maintain the shared LISTEN connection until cancelled."""
+        await _maintain_connection(
+            self._db_url,
+            "notification hub",
+            self._setup,
+            self._on_disconnected,
+            self._retry_delay_seconds,
+        )
+
+    async def _setup(self, conn: asyncpg.Connection) -> None:
+        """LISTEN on every subscribed channel, then run each subscriber's connect hook."""
+        while pending := {s.channel for s in self._subscriptions} - self._listening:
+            for channel in pending:
+                self._listening.add(channel)
+                await conn.add_listener(channel, self._dispatch)
+        self._conn = conn
+        for subscription in list(self._subscriptions):
+            if subscription.on_connected is not None:
+                subscription.on_connected(conn)
+
+    def _on_disconnected(self) -> None:
+        self._conn = None
+        self._listening.clear()
+
+    def _dispatch(self, conn: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        """Fan a NOTIFY out to every callback subscribed to its channel.
+
+        A failing callback is logged and does not prevent delivery to the rest.
+        """
+        for subscription in list(self._subscriptions):
+            if subscription.channel != channel:
+                continue
+            try:
+                subscription.on_notify(conn, pid, channel, payload)
+            except Exception:
+                logger.exception("NOTIFY callback for channel %s failed", channel)
@@ -74,7 +74,6 @@ class CurrentUser(BaseModel):
     """Current authenticated user information."""
 
     user: Any = Field(..., description="Authenticated user model")
-    access_token: str = Field(..., description="Discord access token")
     session_token: str = Field(..., description="Session token for Redis lookup")
 
     model_config = {"from_attributes": True, "arbitrary_types_allowed": True}
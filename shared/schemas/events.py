@@ -62,6 +62,7 @@ class NotificationDueEvent(BaseModel):
     game_id: UUID
     notification_type: str
     participant_id: str | None = None
+    notification_id: str | None = None
 
 
 class NotificationSendDMEvent(BaseModel):
@@ -30,3 +30,9 @@ class CalendarExportTokenResponse(BaseModel):
     token: str = Field(
         ..., description="Opaque short-lived token for the public .ics download route"
     )
+
+
+class CalendarFeedTokenResponse(BaseModel):
+    """Response for the calendar-feed token mint endpoint."""
+
+    token: str = Field(..., description="Long-lived token for the public subscribable feed route")
@@ -253,22 +253,60 @@ class GameResponse(BaseModel):
         ...,
         description="Effective display status; PENDING_CONFIRMATION for unconfirmed clones",
     )
+    version: int = Field(
+        default=0, description="Change version, matching the version on game_updated events"
+    )
 
     model_config = {"from_attributes": True}
 
 
+class GameUpdateEvent(BaseModel):
+    """
+    game_updated event pushed on the SSE stream.
+
+    When the participant fields are present the event is a delta that can be
+    applied to a cached GameResponse whose version is exactly one less and
+    whose updated_at matches; otherwise clients refetch the game.
+    """
+
+    type: str = Field(default="game_updated", description="Event type")
+    game_id: str = Field(..., description="Game session ID (UUID)")
+    guild_id: str = Field(..., description="Guild ID (UUID)")
+    version: int | None = Field(default=None, description="Game version after this change")
+    updated_at: str | None = Field(default=None, description="Game last update timestamp (UTC ISO)")
+    status: str | None = Field(default=None, description="Game status")
+    max_players: int | None = Field(default=None, description="Max players (resolved)")
+    participant_count: int | None = Field(
+        default=None, description="Current number of participants"
+    )
+    participants: list["ParticipantResponse"] | None = Field(
+        default=None, description="All participants sorted; omitted when clients must refetch"
+    )
+    confirmed_participant_ids: list[str] | None = Field(
+        default=None, description="IDs of the confirmed entries in participants"
+    )
+
+
 class GameListResponse(BaseModel):
     """List of games response."""
 
     games: list[GameResponse] = Field(..., description="List of games")
-    total: int = Field(
-        ..., description="Total number of matching games (pre-authorization approximation)"
+    total: int | None = Field(
+        ...,
+        description=(
+            "Total number of matching games (pre-authorization approximation); "
+            "null when the count was not requested"
+        ),
     )
     limit: int = Field(..., description="Page size used for this request")
     offset: int = Field(..., description="Offset used for this request")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
 
 
 # Import at end to avoid circular import
 from shared.schemas.participant import ParticipantResponse  # noqa: E402, TC001
 
 GameResponse.model_rebuild()
+GameUpdateEvent.model_rebuild()
@@ -50,6 +50,7 @@ def build_notification_event(notification: NotificationSchedule) -> BotActionQue
         payload={
             "notification_type": notification.notification_type,
             "participant_id": notification.participant_id,
+            "notification_id": notification.id,
         },
     )
 
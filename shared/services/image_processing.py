@@ -0,0 +1,271 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+CPU-bound image normalization, run in a process pool off the event loop.
+
+Decoding and LANCZOS-resizing a large animated GIF takes long enough to
+stall every other request on an async worker, so uploads are handed to a
+small pool of worker processes.  The pool bounds how many jobs may be
+queued or running at once and how long the caller waits for each; beyond
+either limit the caller gets ImageProcessingUnavailableError instead of
+piling work onto the host.
+
+process_image() also renders the smaller copies Discord actually displays,
+so those are encoded once at upload time rather than on every fetch.
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+
+from opentelemetry import metrics
+from PIL import Image, ImageSequence
+
+logger = logging.getLogger(__name__)
+
+meter = metrics.get_meter(__name__)
+
+image_job_histogram = meter.create_histogram(
+    name="image.processing.duration",
+    description="Wall time of an image processing job, including queueing",
+    unit="s",
+)
+image_job_rejected_counter = meter.create_counter(
+    name="image.processing.rejected",
+    description="Image processing jobs refused or abandoned, by reason",
+    unit="1",
+)
+
+# Discord's embed image proxy silently fails to scale images whose longest side
+# exceeds roughly this many pixels, falling back to rendering the raw image at
+# native resolution clipped to the viewport instead of a scaled preview.
+MAX_IMAGE_DIMENSION = 4096
+
+# Bounding boxes of the variants served via ?size=.  Discord renders embed
+# thumbnails at up to 80x80 and embed images at up to 400x300; both are
+# doubled for high-DPI screens.
+IMAGE_VARIANT_BOXES: dict[str, tuple[int, int]] = {
+    "thumbnail": (160, 160),
+    "banner": (800, 600),
+}
+
+IMAGE_POOL_WORKERS = 2
+IMAGE_POOL_MAX_PENDING = 8
+IMAGE_JOB_TIMEOUT_SECONDS = 30.0
+
+
+class ImageProcessingUnavailableError(Exception):
+    """Raised when an image job is refused (pool saturated) or times out."""
+
+
+@dataclass(frozen=True)
+class ProcessedImage:
+    """Normalized upload bytes plus the variants that differ from them."""
+
+    data: bytes
+    variants: dict[str, bytes] = field(default_factory=dict)
+
+
+def _resize_frame(frame: Image.Image, size: tuple[int, int], *, is_gif: bool) -> Image.Image:
+    """Resize a single frame, converting to a mode Pillow can re-encode as GIF."""
+    if is_gif:
+        frame = frame.convert("RGBA")
+    return frame.resize(size, Image.Resampling.LANCZOS)
+
+
+def _fitted_size(img: Image.Image, box: tuple[int, int]) -> tuple[int, int] | None:
+    """Return the size that fits img inside box, or None if it already fits."""
+    if img.width <= box[0] and img.height <= box[1]:
+        return None
+    ratio = min(box[0] / img.width, box[1] / img.height)
+    return max(1, round(img.width * ratio)), max(1, round(img.height * ratio))
+
+
+def _encode_resized(img: Image.Image, size: tuple[int, int]) -> bytes:
+    """Re-encode img at size in its own format, keeping every animation frame."""
+    save_format = img.format or "PNG"
+    is_gif = save_format == "GIF"
+    frames = [
+        _resize_frame(frame.copy(), size, is_gif=is_gif) for frame in ImageSequence.Iterator(img)
+    ]
+
+    buf = io.BytesIO()
+    if len(frames) > 1:
+        frames[0].save(
+            buf,
+            format=save_format,
+            save_all=True,
+            append_images=frames[1:],
+            duration=img.info.get("duration", 100),
+            loop=img.info.get("loop", 0),
+        )
+    else:
+        single = frames[0]
+        if save_format == "JPEG" and single.mode != "RGB":
+            single = single.convert("RGB")
+        single.save(buf, format=save_format)
+    return buf.getvalue()
+
+
+def process_image(image_data: bytes, mime_type: str) -> ProcessedImage:
+    """
+    Downscale an upload to fit MAX_IMAGE_DIMENSION and render its display variants.
+
+    Animated images (e.g. GIF) are resized frame-by-frame so the animation is
+    preserved. Images already within the limit are kept byte-for-byte, and a
+    variant is only rendered when the image exceeds that variant's box. Data
+    that Pillow cannot decode is returned unchanged rather than raising, since
+    it has already passed content-type validation upstream.
+
+    Args:
+        image_data: Raw image bytes
+        mime_type: MIME type of the image (e.g. "image/png")
+
+    Returns:
+        Normalized bytes and any rendered variants, keyed by size name
+    """
+    try:
+        with Image.open(io.BytesIO(image_data)) as img:
+            data = image_data
+            new_size = _fitted_size(img, (MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION))
+            if new_size is not None:
+                data = _encode_resized(img, new_size)
+                logger.info(
+                    "Downscaled oversized image from %sx%s to %sx%s (format=%s)",
+                    img.width,
+                    img.height,
+                    new_size[0],
+                    new_size[1],
+                    img.format,
+                )
+
+            variants = {}
+            for name, box in IMAGE_VARIANT_BOXES.items():
+                variant_size = _fitted_size(img, box)
+                if variant_size is not None:
+                    variants[name] = _encode_resized(img, variant_size)
+            return ProcessedImage(data, variants)
+    except (OSError, SyntaxError):
+        logger.warning(
+            "Could not decode image data (mime=%s) for resizing; storing as-is", mime_type
+        )
+        return ProcessedImage(image_data)
+
+
+class ImageProcessingPool:
+    """Process pool with a bounded number of pending jobs and a per-job timeout."""
+
+    def __init__(
+        self,
+        workers: int = IMAGE_POOL_WORKERS,
+        max_pending: int = IMAGE_POOL_MAX_PENDING,
+        timeout_seconds: float = IMAGE_JOB_TIMEOUT_SECONDS,
+    ) -> None:
+        """
+        Initialize the pool; worker processes start on first use.
+
+        Args:
+            workers: Number of worker processes
+            max_pending: Jobs that may be queued or running at once
+            timeout_seconds: How long a caller waits for its job
+        """
+        self.workers = workers
+        self.timeout_seconds = timeout_seconds
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def run[T](self, fn: Callable[..., T], *args: object) -> T:
+        """
+        Run fn(*args) in a worker process.
+
+        A job keeps its slot until the worker finishes it, even after its
+        caller timed out, so abandoned work still counts against the bound.
+
+        Args:
+            fn: Module-level (picklable) function to run
+            *args: Picklable arguments
+
+        Returns:
+            fn's return value
+
+        Raises:
+            ImageProcessingUnavailableError: The pool is saturated, the job
+                timed out, or a worker process died
+        """
+        if not self._slots.acquire(blocking=False):
+            image_job_rejected_counter.add(1, {"reason": "saturated"})
+            msg = "Image processing is busy, please retry shortly"
+            raise ImageProcessingUnavailableError(msg)
+
+        t0 = time.monotonic()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _future: self._slots.release())
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout_seconds)
+        except TimeoutError as e:
+            image_job_rejected_counter.add(1, {"reason": "timeout"})
+            msg = "Image processing timed out"
+            raise ImageProcessingUnavailableError(msg) from e
+        except BrokenProcessPool as e:
+            logger.exception("Image processing worker died; restarting the pool")
+            image_job_rejected_counter.add(1, {"reason": "broken"})
+            self._executor = None
+            msg = "Image processing failed"
+            raise ImageProcessingUnavailableError(msg) from e
+        finally:
+            image_job_histogram.record(time.monotonic() - t0)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, cancelling jobs that have not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_image_pool: ImageProcessingPool | None = None
+
+
+def get_image_pool() -> ImageProcessingPool:
+    """Get or create the process-wide image processing pool."""
+    global _image_pool  # noqa: PLW0603
+    if _image_pool is None:
+        _image_pool = ImageProcessingPool()
+    return _image_pool
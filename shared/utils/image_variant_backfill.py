@@ -0,0 +1,86 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Backfill of game_image_variants for images stored before variants existed.
+
+Shared between the Alembic migration that runs it once in upgrade() and the
+unit test that exercises it, so the two can't drift.
+"""
+
+import logging
+
+from sqlalchemy import Connection, text
+
+from shared.services.image_processing import process_image
+
+logger = logging.getLogger(__name__)
+
+SELECT_IMAGES_WITHOUT_VARIANTS_SQL = text("""
+    SELECT id FROM game_images
+    WHERE NOT EXISTS (
+        SELECT 1 FROM game_image_variants WHERE game_image_variants.image_id = game_images.id
+    )
+""")
+
+SELECT_IMAGE_SQL = text("SELECT image_data, mime_type FROM game_images WHERE id = :image_id")
+
+INSERT_VARIANT_SQL = text("""
+    INSERT INTO game_image_variants (image_id, variant, image_data, mime_type)
+    VALUES (:image_id, :variant, :image_data, :mime_type)
+""")
+
+
+def backfill_image_variants(connection: Connection) -> int:
+    """
+    Render and store the size variants of every image that has none.
+
+    Images are read one at a time so only one image's bytes are held in
+    memory. Images that already fit every variant box get no rows, exactly
+    as when they are uploaded.
+
+    Args:
+        connection: Connection to run the backfill on, inside its transaction
+
+    Returns:
+        Number of variant rows inserted
+    """
+    image_ids = connection.execute(SELECT_IMAGES_WITHOUT_VARIANTS_SQL).scalars().all()
+    inserted = 0
+    for image_id in image_ids:
+        image_data, mime_type = connection.execute(SELECT_IMAGE_SQL, {"image_id": image_id}).one()
+        variants = process_image(image_data, mime_type).variants
+        for variant, data in variants.items():
+            connection.execute(
+                INSERT_VARIANT_SQL,
+                {
+                    "image_id": image_id,
+                    "variant": variant,
+                    "image_data": data,
+                    "mime_type": mime_type,
+                },
+            )
+        inserted += len(variants)
+    logger.info(
+        "Backfilled %d image variants across %d images without variants",
+        inserted,
+        len(image_ids),
+    )
+    return inserted
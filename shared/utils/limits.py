@@ -38,3 +38,7 @@ EMBED_FIELD_REWARDS = "🏆 Rewards"
 MAX_DESCRIPTION_LENGTH = 2000
 
 GAME_LIST_DESCRIPTION_SNIPPET_LENGTH = 100
+
+CALENDAR_FEED_LOOKBACK_DAYS = 30
+CALENDAR_FEED_MAX_GAMES = 500
+CALENDAR_FEED_BATCH_SIZE = 50
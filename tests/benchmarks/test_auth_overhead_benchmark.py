@@ -0,0 +1,113 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark: per-request authentication overhead with and without the principal cache.
+
+The cold path is what every request paid before the cache: decode the Redis
+session, select the users row and decrypt both OAuth tokens.  Redis and the
+database are replaced by in-process fakes, so the numbers isolate the API
+process's own CPU work.
+
+Run with: pytest tests/benchmarks -m "benchmark and not integration" -s
+"""
+
+import json
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.api.auth import tokens
+from services.api.auth.principal_cache import PrincipalCache
+from services.api.dependencies.auth import get_current_user
+
+pytestmark = pytest.mark.benchmark
+
+_REQUEST_COUNT = 20_000
+_SESSION_TOKEN = "bench-session"
+
+
+def _session_blob() -> str:
+    expires_at = datetime.now(UTC).replace(tzinfo=None) + timedelta(days=1)
+    return json.dumps({
+        "user_id": "123456789012345678",
+        "access_token": tokens.encrypt_token("discord-access-token"),
+        "refresh_token": tokens.encrypt_token("discord-refresh-token"),
+        "expires_at": expires_at.isoformat(),
+        "can_be_maintainer": False,
+        "is_maintainer": False,
+        "username": "bench",
+        "avatar": None,
+    })
+
+
+def _fake_db() -> AsyncMock:
+    user = MagicMock()
+    user.discord_id = "123456789012345678"
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = user
+    db = AsyncMock()
+    db.execute.return_value = result
+    db.expunge = MagicMock()
+    return db
+
+
+async def _time_requests(cache: PrincipalCache, *, eager_decrypt: bool) -> float:
+    db = _fake_db()
+    with patch(
+        "services.api.dependencies.auth.principal_cache.get_principal_cache", return_value=cache
+    ):
+        start = time.perf_counter()
+        for _ in range(_REQUEST_COUNT):
+            current_user = await get_current_user(session_token=_SESSION_TOKEN, db=db)
+            if eager_decrypt:
+                session = await tokens.get_session(_SESSION_TOKEN)
+                assert session is not None
+                tokens.decrypt_token(session["access_token"])
+                tokens.decrypt_token(session["refresh_token"])
+            assert current_user.session_token == _SESSION_TOKEN
+        return time.perf_counter() - start
+
+
+async def test_principal_cache_hit_cuts_auth_overhead() -> None:
+    """A cache hit skips the session decode, users select and token decrypts."""
+    blob = _session_blob()
+
+    async def fake_cache_get(_key, _operation):
+        return json.loads(blob)
+
+    cold_cache = PrincipalCache(ttl_seconds=30)
+    warm_cache = PrincipalCache(ttl_seconds=30)
+    warm_cache.activate()
+
+    with patch("services.api.auth.tokens.cache_get", side_effect=fake_cache_get):
+        cold_seconds = await _time_requests(cold_cache, eager_decrypt=True)
+        warm_seconds = await _time_requests(warm_cache, eager_decrypt=False)
+
+    print(
+        f"\nrequests={_REQUEST_COUNT} "
+        f"cold={cold_seconds * 1e6 / _REQUEST_COUNT:.2f}us/request "
+        f"cached={warm_seconds * 1e6 / _REQUEST_COUNT:.2f}us/request "
+        f"speedup={cold_seconds / warm_seconds:.1f}x"
+    )
+
+    assert warm_seconds < cold_seconds * 0.5
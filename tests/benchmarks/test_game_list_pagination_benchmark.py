@@ -0,0 +1,130 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark: fetching page 100 of list_games from a 1M-game guild.
+
+Compares OFFSET paging with keyset (cursor) paging.  Needs the integration
+PostgreSQL, so run it inside the integration test container:
+
+    pytest tests/benchmarks/test_game_list_pagination_benchmark.py -m benchmark -s
+"""
+
+import statistics
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text
+
+from services.api.services.games import GameListCursor, GameService
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.integration]
+
+_GAME_COUNT = 1_000_000
+_PAGE_SIZE = 25
+_PAGE = 100
+_REPEATS = 5
+
+
+def _insert_games(admin_db_sync, env: dict) -> None:
+    admin_db_sync.execute(
+        text(
+            "INSERT INTO game_sessions "
+            "(id, title, scheduled_at, guild_id, channel_id, host_id, status) "
+            "SELECT gen_random_uuid()::text, 'Benchmark game ' || i, "
+            "TIMESTAMP '2026-01-01' + (i * INTERVAL '1 minute'), "
+            ":guild_id, :channel_id, :host_id, "
+            "(ARRAY['SCHEDULED', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED'])[1 + i % 4] "
+            "FROM generate_series(1, :count) AS i"
+        ),
+        {
+            "guild_id": env["guild"]["id"],
+            "channel_id": env["channel"]["id"],
+            "host_id": env["user"]["id"],
+            "count": _GAME_COUNT,
+        },
+    )
+    admin_db_sync.commit()
+    admin_db_sync.execute(text("ANALYZE game_sessions"))
+    admin_db_sync.commit()
+
+
+async def _median_seconds(call) -> float:
+    timings = []
+    for _ in range(_REPEATS):
+        start = time.perf_counter()
+        await call()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@pytest.mark.asyncio
+async def test_page_100_latency_offset_vs_cursor(admin_db_sync, admin_db, test_game_environment):
+    """Cursor paging fetches page 100 of 1M games faster than OFFSET and returns the same rows."""
+    env = test_game_environment(with_game=False)
+    guild_id = env["guild"]["id"]
+    service = GameService(
+        db=admin_db,
+        discord_client=MagicMock(),
+        participant_resolver=MagicMock(),
+        channel_resolver=MagicMock(),
+    )
+
+    try:
+        _insert_games(admin_db_sync, env)
+
+        previous_page, _ = await service.list_games(
+            guild_id=guild_id,
+            limit=_PAGE_SIZE,
+            offset=(_PAGE - 2) * _PAGE_SIZE,
+            include_total=False,
+        )
+        cursor = GameListCursor.after(previous_page[-1])
+
+        async def by_offset():
+            return await service.list_games(
+                guild_id=guild_id,
+                limit=_PAGE_SIZE,
+                offset=(_PAGE - 1) * _PAGE_SIZE,
+                include_total=False,
+            )
+
+        async def by_cursor():
+            return await service.list_games(
+                guild_id=guild_id, limit=_PAGE_SIZE, cursor=cursor, include_total=False
+            )
+
+        offset_page, _ = await by_offset()
+        cursor_page, _ = await by_cursor()
+        offset_elapsed = await _median_seconds(by_offset)
+        cursor_elapsed = await _median_seconds(by_cursor)
+    finally:
+        admin_db_sync.execute(
+            text("DELETE FROM game_sessions WHERE guild_id = :guild_id"), {"guild_id": guild_id}
+        )
+        admin_db_sync.commit()
+
+    print(
+        f"\npage {_PAGE} of {_GAME_COUNT} games: "
+        f"OFFSET {offset_elapsed * 1000:.1f}ms, cursor {cursor_elapsed * 1000:.1f}ms"
+    )
+    assert [game.id for game in cursor_page] == [game.id for game in offset_page]
+    assert cursor_elapsed < offset_elapsed
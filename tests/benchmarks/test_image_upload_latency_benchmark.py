@@ -0,0 +1,95 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark: event-loop latency while an upload is processed inline versus in the pool.
+
+Run with: pytest tests/benchmarks -m "benchmark and not integration" -s
+"""
+
+import asyncio
+import io
+import time
+from collections.abc import Awaitable, Callable
+
+import pytest
+from PIL import Image
+
+from shared.services.image_processing import ImageProcessingPool, process_image
+
+pytestmark = pytest.mark.benchmark
+
+_TICK_SECONDS = 0.005
+
+
+def _large_animated_gif() -> bytes:
+    frames = [Image.effect_noise((2400, 1800), 64 + 32 * i).convert("RGB") for i in range(4)]
+    buf = io.BytesIO()
+    frames[0].save(buf, format="GIF", save_all=True, append_images=frames[1:], duration=100)
+    return buf.getvalue()
+
+
+async def _worst_tick_delay(upload: Callable[[], Awaitable[object]]) -> float:
+    """Run upload() alongside a 5 ms ticker standing in for other requests."""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal worst
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(_TICK_SECONDS)
+            worst = max(worst, time.perf_counter() - start - _TICK_SECONDS)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    try:
+        await upload()
+    finally:
+        done.set()
+        await ticker_task
+    return worst
+
+
+async def test_pool_keeps_event_loop_responsive_during_upload() -> None:
+    """Processing in the pool leaves other coroutines running on schedule."""
+    data = _large_animated_gif()
+    pool = ImageProcessingPool(workers=1, max_pending=2, timeout_seconds=120.0)
+    try:
+        await pool.run(time.sleep, 0)  # start the worker outside the measurement
+
+        async def inline() -> object:
+            return process_image(data, "image/gif")
+
+        async def pooled() -> object:
+            return await pool.run(process_image, data, "image/gif")
+
+        inline_worst = await _worst_tick_delay(inline)
+        pooled_worst = await _worst_tick_delay(pooled)
+    finally:
+        pool.shutdown()
+
+    print(
+        f"\ngif_bytes={len(data)} "
+        f"inline_worst_tick_delay={inline_worst * 1000:.1f}ms "
+        f"pooled_worst_tick_delay={pooled_worst * 1000:.1f}ms"
+    )
+
+    assert pooled_worst < inline_worst / 5
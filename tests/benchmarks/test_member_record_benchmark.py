@@ -0,0 +1,102 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark: compact projection member records versus the JSON layout.
+
+Run with: pytest tests/benchmarks -m "benchmark and not integration" -s
+"""
+
+import json
+import time
+
+import pytest
+
+from shared.cache.member_record import avatar_url, decode_member_record, encode_member_record
+
+pytestmark = pytest.mark.benchmark
+
+_RECORD_COUNT = 100_000
+
+
+def _fields(i: int) -> dict:
+    uid = str(100_000_000_000_000_000 + i)
+    avatar_hash = f"{i:032x}" if i % 4 else None
+    return {
+        "uid": uid,
+        "role_ids": [900_000_000_000_000_000 + r for r in range(i % 6)],
+        "nick": f"nick{i}" if i % 3 == 0 else None,
+        "global_name": f"Global Name {i}",
+        "username": f"username_{i}",
+        "avatar_hash": avatar_hash,
+    }
+
+
+def _json_record(fields: dict) -> str:
+    return json.dumps({
+        "roles": [str(r) for r in fields["role_ids"]],
+        "nick": fields["nick"],
+        "global_name": fields["global_name"],
+        "username": fields["username"],
+        "avatar_url": avatar_url(fields["uid"], fields["avatar_hash"]),
+    })
+
+
+def _compact_record(fields: dict) -> str:
+    encoded = encode_member_record(
+        role_ids=fields["role_ids"],
+        nick=fields["nick"],
+        global_name=fields["global_name"],
+        username=fields["username"],
+        avatar_hash=fields["avatar_hash"],
+    )
+    assert encoded is not None
+    return encoded
+
+
+def test_compact_record_size_and_decode_latency() -> None:
+    """Compact records are substantially smaller and decode to identical dicts."""
+    members = [_fields(i) for i in range(_RECORD_COUNT)]
+    json_records = [_json_record(m) for m in members]
+    compact_records = [_compact_record(m) for m in members]
+    uids = [m["uid"] for m in members]
+
+    json_bytes = sum(len(r) for r in json_records)
+    compact_bytes = sum(len(r) for r in compact_records)
+
+    start = time.perf_counter()
+    json_decoded = [decode_member_record(r, uid) for r, uid in zip(json_records, uids, strict=True)]
+    json_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compact_decoded = [
+        decode_member_record(r, uid) for r, uid in zip(compact_records, uids, strict=True)
+    ]
+    compact_seconds = time.perf_counter() - start
+
+    print(
+        f"\nrecords={_RECORD_COUNT} json_bytes={json_bytes} compact_bytes={compact_bytes} "
+        f"ratio={compact_bytes / json_bytes:.2f} "
+        f"json_decode={json_seconds * 1e6 / _RECORD_COUNT:.2f}us/record "
+        f"compact_decode={compact_seconds * 1e6 / _RECORD_COUNT:.2f}us/record"
+    )
+
+    assert compact_decoded == json_decoded
+    assert compact_bytes < json_bytes * 0.6
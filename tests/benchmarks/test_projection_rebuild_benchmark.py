@@ -0,0 +1,136 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark: streaming projection rebuild against a synthetic 500k-member guild.
+
+Run with: pytest tests/benchmarks -m "benchmark and not integration" -s
+"""
+
+import asyncio
+import gc
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.bot import guild_projection
+
+pytestmark = pytest.mark.benchmark
+
+_MEMBER_COUNT = 500_000
+_HEARTBEAT_INTERVAL = 0.01
+
+
+class _CountingPipeline:
+    """Pipeline stand-in that tracks buffered commands and simulates a Redis round-trip."""
+
+    def __init__(self) -> None:
+        self.buffered = 0
+        self.max_buffered = 0
+        self.executes = 0
+        self.commands = 0
+
+    def _queue(self, *_args: object) -> None:
+        self.buffered += 1
+        self.commands += 1
+        self.max_buffered = max(self.max_buffered, self.buffered)
+
+    set = _queue
+    zadd = _queue
+    zrem = _queue
+    delete = _queue
+
+    async def execute(self) -> list:
+        self.executes += 1
+        self.buffered = 0
+        await asyncio.sleep(0.001)
+        return []
+
+
+def _make_guild(member_count: int) -> SimpleNamespace:
+    members = [
+        SimpleNamespace(
+            id=10_000_000 + i,
+            roles=[SimpleNamespace(id=1), SimpleNamespace(id=2)],
+            nick=f"nick{i}" if i % 3 == 0 else None,
+            global_name=f"Global {i}",
+            name=f"user{i}",
+            avatar=None,
+        )
+        for i in range(member_count)
+    ]
+    return SimpleNamespace(id=123456789, name="Huge Guild", members=members)
+
+
+async def _heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(_HEARTBEAT_INTERVAL)
+        lags.append(time.perf_counter() - start - _HEARTBEAT_INTERVAL)
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(600)
+async def test_streaming_rebuild_500k_members() -> None:
+    """Rebuild stays within one chunk of buffered commands and keeps the loop responsive."""
+    pipe = _CountingPipeline()
+    redis = AsyncMock()
+    redis.get = AsyncMock(return_value=None)
+    redis._client = MagicMock()
+
+    @asynccontextmanager
+    async def _pipeline(transaction: bool = False):
+        yield pipe
+
+    redis._client.pipeline = _pipeline
+    bot = SimpleNamespace(guilds=[_make_guild(_MEMBER_COUNT)])
+    # The synthetic guild stands in for discord.py's long-lived gateway cache; move it
+    # out of the collector's young generations so a full GC pass over fixture objects
+    # is not mistaken for a stall in the rebuild itself.
+    gc.collect()
+    gc.freeze()
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(lags, stop))
+
+    start = time.perf_counter()
+    with patch.object(guild_projection, "repopulation_peak_memory_gauge") as memory_gauge:
+        await guild_projection.repopulate_all(bot=bot, redis=redis)
+    duration = time.perf_counter() - start
+    rss_growth = memory_gauge.set.call_args[0][0] if memory_gauge.set.called else 0
+
+    stop.set()
+    await heartbeat
+    gc.unfreeze()
+
+    max_lag = max(lags) if lags else duration
+    print(
+        f"\nmembers={_MEMBER_COUNT} duration={duration:.2f}s commands={pipe.commands} "
+        f"flushes={pipe.executes} max_buffered={pipe.max_buffered} "
+        f"peak_rss_growth={rss_growth / 1_048_576:.1f}MiB max_loop_lag={max_lag * 1000:.1f}ms"
+    )
+
+    assert pipe.max_buffered <= guild_projection._PIPELINE_FLUSH_COMMANDS + 1
+    assert pipe.executes >= pipe.commands // guild_projection._PIPELINE_FLUSH_COMMANDS
+    assert max_lag < 0.1
@@ -0,0 +1,129 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark: draining 10k due notification_schedule rows through SchedulerLoop.
+
+Unlike the other benchmarks this one needs the integration PostgreSQL, so run it
+inside the integration test container:
+
+    pytest tests/benchmarks/test_scheduler_loop_benchmark.py -m benchmark -s
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from services.bot.scheduler_loop import SchedulerLoop
+from shared.models import NotificationSchedule
+from shared.services.event_builders import build_notification_event
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.integration]
+
+_ROW_COUNT = 10_000
+_REPLICAS = 2
+
+
+def _insert_due_rows(admin_db_sync, game_id: str) -> None:
+    due = datetime.now(UTC).replace(tzinfo=None) - timedelta(minutes=1)
+    scheduled_at = due + timedelta(hours=1)
+    admin_db_sync.execute(
+        text(
+            "INSERT INTO notification_schedule "
+            "(id, game_id, reminder_minutes, notification_time, game_scheduled_at, sent) "
+            "VALUES (:id, :game_id, :reminder_minutes, :notification_time, "
+            ":game_scheduled_at, false)"
+        ),
+        [
+            {
+                "id": str(uuid4()),
+                "game_id": game_id,
+                "reminder_minutes": minutes,
+                "notification_time": due,
+                "game_scheduled_at": scheduled_at,
+            }
+            for minutes in range(1, _ROW_COUNT + 1)
+        ],
+    )
+    admin_db_sync.commit()
+
+
+def _reset(admin_db_sync, game_id: str) -> None:
+    admin_db_sync.execute(
+        text("DELETE FROM bot_action_queue WHERE game_id = :game_id"), {"game_id": game_id}
+    )
+    admin_db_sync.execute(
+        text("DELETE FROM notification_schedule WHERE game_id = :game_id"), {"game_id": game_id}
+    )
+    admin_db_sync.commit()
+
+
+async def _drain(bot_db_url: str, batch_size: int, replicas: int) -> float:
+    loops = [
+        SchedulerLoop(
+            db_url=bot_db_url,
+            notify_channel="notification_schedule_changed",
+            model_class=NotificationSchedule,
+            time_field="notification_time",
+            status_field="sent",
+            event_builder=build_notification_event,
+            batch_size=batch_size,
+        )
+        for _ in range(replicas)
+    ]
+
+    async def _run(loop: SchedulerLoop) -> None:
+        while await loop._process_due_batch():
+            pass
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_run(loop) for loop in loops))
+    return time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_batched_drain_of_10k_due_rows(admin_db_sync, bot_db_url, test_game_environment):
+    """Batched replicas drain 10k rows exactly once and beat row-at-a-time claiming."""
+    game_id = test_game_environment()["game"]["id"]
+    queued_sql = text("SELECT COUNT(*) FROM bot_action_queue WHERE game_id = :game_id")
+
+    try:
+        _insert_due_rows(admin_db_sync, game_id)
+        single_elapsed = await _drain(bot_db_url, batch_size=1, replicas=1)
+        _reset(admin_db_sync, game_id)
+
+        _insert_due_rows(admin_db_sync, game_id)
+        batched_elapsed = await _drain(bot_db_url, batch_size=500, replicas=_REPLICAS)
+        queued = admin_db_sync.execute(queued_sql, {"game_id": game_id}).scalar_one()
+    finally:
+        _reset(admin_db_sync, game_id)
+
+    print(
+        f"\n{_ROW_COUNT} due rows: row-at-a-time {single_elapsed:.2f}s "
+        f"({_ROW_COUNT / single_elapsed:.0f} rows/s), "
+        f"batched x{_REPLICAS} replicas {batched_elapsed:.2f}s "
+        f"({_ROW_COUNT / batched_elapsed:.0f} rows/s)"
+    )
+    assert queued == _ROW_COUNT
+    assert batched_elapsed < single_elapsed
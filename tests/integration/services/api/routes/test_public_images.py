@@ -21,6 +21,8 @@
 
 """Integration tests for public image endpoints."""
 
+import hashlib
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -82,7 +84,8 @@ async def test_get_image_includes_cache_headers(
     assert "cache-control" in response.headers
     cache_control = response.headers["cache-control"]
     assert "public" in cache_control
-    assert "max-age=3600" in cache_control
+    assert "immutable" in cache_control
+    assert response.headers["etag"] == f'"{hashlib.sha256(PNG_DATA).hexdigest()}"'
 
 
 @pytest.mark.asyncio
@@ -121,6 +124,22 @@ async def test_head_request_returns_headers_only(
     assert len(response.content) == 0
 
 
+@pytest.mark.asyncio
+async def test_get_image_with_matching_etag_returns_304(
+    async_client: AsyncClient,
+    stored_png_image: str,
+) -> None:
+    """A conditional GET carrying the image's ETag returns 304 without a body."""
+    first = await async_client.get(f"/api/v1/public/images/{stored_png_image}")
+    response = await async_client.get(
+        f"/api/v1/public/images/{stored_png_image}",
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+
+    assert response.status_code == 304
+    assert len(response.content) == 0
+
+
 @pytest.mark.asyncio
 async def test_get_jpeg_image_correct_mime_type(
     async_client: AsyncClient,
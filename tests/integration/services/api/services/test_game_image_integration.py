@@ -35,6 +35,7 @@ import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import undefer
 
 from services.api.schemas.clone_game import CarryoverOption, CloneGameRequest
 from services.api.services.games import GameService
@@ -164,7 +165,11 @@ async def test_create_game_with_thumbnail_stores_image(
     assert game.banner_image_id is None
 
     # Image should exist in game_images table
-    result = await admin_db.execute(select(GameImage).where(GameImage.id == game.thumbnail_id))
+    result = await admin_db.execute(
+        select(GameImage)
+        .where(GameImage.id == game.thumbnail_id)
+        .options(undefer(GameImage.image_data))
+    )
     image = result.scalar_one()
 
     assert image.image_data == valid_png_data
@@ -27,6 +27,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from shared.models.game_image import GameImage
 from shared.services.image_storage import release_image, store_image
@@ -76,7 +77,7 @@ async def test_store_image_creates_new_image(
     image_id = await store_image(admin_db, png_data, "image/png")
     await admin_db.commit()
 
-    result = await admin_db.get(GameImage, image_id)
+    result = await admin_db.get(GameImage, image_id, options=[undefer(GameImage.image_data)])
     assert result is not None
     assert result.image_data == png_data
     assert result.mime_type == "image/png"
@@ -0,0 +1,97 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Integration tests for BotActionListener batch leasing against real PostgreSQL.
+
+Rows are inserted directly into bot_action_queue with a unique marker game_id,
+then leased through the listener so the SKIP LOCKED / leased_at SQL runs
+against the real schema.
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from services.bot.bot_action_listener import BotActionListener
+
+pytestmark = pytest.mark.integration
+
+
+def _insert_rows(admin_db_sync, game_id: str, count: int) -> None:
+    admin_db_sync.execute(
+        text(
+            "INSERT INTO bot_action_queue (action_type, game_id, enqueued_at) "
+            "VALUES ('notification_due', :game_id, now() - make_interval(secs => :offset))"
+        ),
+        [{"game_id": game_id, "offset": count - i} for i in range(count)],
+    )
+    admin_db_sync.commit()
+
+
+def _delete_rows(admin_db_sync, game_id: str) -> None:
+    admin_db_sync.execute(
+        text("DELETE FROM bot_action_queue WHERE game_id = :game_id"), {"game_id": game_id}
+    )
+    admin_db_sync.commit()
+
+
+@pytest.mark.asyncio
+async def test_leased_rows_are_not_leased_again(admin_db_sync, bot_db_url):
+    """A second lease skips rows the first lease already stamped."""
+    game_id = str(uuid4())
+    _insert_rows(admin_db_sync, game_id, 3)
+    listener = BotActionListener(bot_db_url, MagicMock(), batch_size=2)
+
+    try:
+        first = await listener._lease_batch()
+        second = await listener._lease_batch()
+        third = await listener._lease_batch()
+
+        leased = [row for row in first + second + third if row.game_id == game_id]
+        assert len(leased) == 3
+        assert len({row.id for row in leased}) == 3
+        assert all(row.leased_at is not None for row in leased)
+    finally:
+        _delete_rows(admin_db_sync, game_id)
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_claimed_again(admin_db_sync, bot_db_url):
+    """A row whose lease is older than the timeout is treated as abandoned."""
+    game_id = str(uuid4())
+    _insert_rows(admin_db_sync, game_id, 1)
+    admin_db_sync.execute(
+        text(
+            "UPDATE bot_action_queue SET leased_at = now() - interval '1 hour' "
+            "WHERE game_id = :game_id"
+        ),
+        {"game_id": game_id},
+    )
+    admin_db_sync.commit()
+    listener = BotActionListener(bot_db_url, MagicMock())
+
+    try:
+        rows = [row for row in await listener._lease_batch() if row.game_id == game_id]
+        assert len(rows) == 1
+    finally:
+        _delete_rows(admin_db_sync, game_id)
@@ -21,6 +21,7 @@
 
 """Integration tests for guild projection write functions against a real Redis instance."""
 
+import asyncio
 import json
 import os
 from unittest.mock import MagicMock
@@ -31,6 +32,7 @@ import pytest
 from services.bot import guild_projection
 from shared.cache import client as cache_module
 from shared.cache.keys import CacheKeys
+from shared.cache.member_record import decode_member_record
 from shared.cache.projection import search_members_by_prefix
 
 pytestmark = pytest.mark.integration
@@ -132,7 +134,7 @@ async def test_repopulate_all_writes_member_keys(
     ]:
         raw = await redis._client.get(CacheKeys.proj_member(gen, guild_id, uid))
         assert raw is not None, f"Missing proj:member for guild={guild_id} uid={uid}"
-        data = json.loads(raw)
+        data = decode_member_record(raw, uid)
         for field in ("roles", "nick", "global_name", "username", "avatar_url"):
             assert field in data, f"Missing field '{field}' for guild={guild_id} uid={uid}"
 
@@ -220,7 +222,7 @@ async def test_member_update_role_change_updates_member_key(
 
     raw = await redis._client.get(CacheKeys.proj_member(gen, guild_id, uid))
     assert raw is not None
-    data = json.loads(raw)
+    data = decode_member_record(raw, uid)
     assert "9001" in data["roles"]
     assert "9003" in data["roles"]
     assert "9002" not in data["roles"]
@@ -316,7 +318,7 @@ async def test_member_update_atomic_visibility(
 
     raw = await redis._client.get(CacheKeys.proj_member(gen, "111", uid))
     assert raw is not None
-    data = json.loads(raw)
+    data = decode_member_record(raw, uid)
     assert data["nick"] == "renamed"
 
     usernames_key = CacheKeys.proj_usernames(gen, "111")
@@ -365,7 +367,7 @@ async def test_user_update_updates_all_guilds(
     for guild_id in ("111", "222"):
         raw = await redis._client.get(CacheKeys.proj_member(gen, guild_id, uid_str))
         assert raw is not None, f"Missing proj:member for guild={guild_id}"
-        data = json.loads(raw)
+        data = decode_member_record(raw, uid_str)
         assert data["global_name"] == "Shared Renamed"
 
         usernames_key = CacheKeys.proj_usernames(gen, guild_id)
@@ -398,7 +400,7 @@ async def test_member_add_creates_member_key_and_updates_guilds(
 
     raw = await redis._client.get(CacheKeys.proj_member(gen, "111", "9999"))
     assert raw is not None
-    data = json.loads(raw)
+    data = decode_member_record(raw, "9999")
     assert data["username"] == "newuser"
     assert data["global_name"] == "New User"
 
@@ -471,3 +473,76 @@ async def test_member_remove_last_guild_leaves_empty_guilds_list(
     guilds_raw = await redis._client.get(CacheKeys.proj_user_guilds(gen, "1002"))
     assert guilds_raw is not None
     assert json.loads(guilds_raw) == []
+
+
+@pytest.mark.asyncio
+async def test_repopulate_guild_rewrites_one_guild_in_current_gen(
+    redis: cache_module.RedisClient, two_guild_bot: MagicMock
+) -> None:
+    """repopulate_guild replaces one guild's members without flipping the generation."""
+    await guild_projection.repopulate_all(bot=two_guild_bot, redis=redis)
+    gen = await redis.get(CacheKeys.proj_gen())
+    assert gen is not None
+
+    guild_a = two_guild_bot.guilds[0]
+    guild_a.members = [
+        _make_mock_member(1001, "alice", global_name="Alice Smith", nick="ali", role_ids=[9001]),
+        _make_mock_member(1004, "erin", global_name="Erin Green"),
+    ]
+
+    assert await guild_projection.repopulate_guild(guild_a, redis=redis) is True
+
+    assert await redis.get(CacheKeys.proj_gen()) == gen
+    assert await redis._client.get(CacheKeys.proj_member(gen, "111", "1002")) is None
+    assert await redis._client.get(CacheKeys.proj_member(gen, "111", "1004")) is not None
+
+    shared_guilds = json.loads(await redis._client.get(CacheKeys.proj_user_guilds(gen, "1003")))
+    assert shared_guilds == ["222"]
+    assert json.loads(await redis._client.get(CacheKeys.proj_user_guilds(gen, "1004"))) == ["111"]
+
+    results = await search_members_by_prefix("111", "bob", redis=redis)
+    assert results == []
+    results = await search_members_by_prefix("111", "erin", redis=redis)
+    assert [r["uid"] for r in results] == ["1004"]
+
+
+@pytest.mark.asyncio
+async def test_remove_guild_drops_guild_from_current_gen(
+    redis: cache_module.RedisClient, two_guild_bot: MagicMock
+) -> None:
+    """remove_guild deletes one guild's keys and patches shared members' guild lists."""
+    await guild_projection.repopulate_all(bot=two_guild_bot, redis=redis)
+    gen = await redis.get(CacheKeys.proj_gen())
+    assert gen is not None
+
+    await guild_projection.remove_guild("222", redis=redis)
+
+    assert await redis.get(CacheKeys.proj_gen()) == gen
+    assert await redis._client.get(CacheKeys.proj_member(gen, "222", "2001")) is None
+    assert await redis._client.exists(CacheKeys.proj_usernames(gen, "222")) == 0
+    assert await redis._client.get(CacheKeys.proj_guild_name(gen, "222")) is None
+    assert json.loads(await redis._client.get(CacheKeys.proj_user_guilds(gen, "1003"))) == ["111"]
+    assert await redis._client.get(CacheKeys.proj_member(gen, "111", "1001")) is not None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_guild_patches_keep_both_updates(
+    redis: cache_module.RedisClient, two_guild_bot: MagicMock
+) -> None:
+    """Two guilds patching the same user's guild list at once both land."""
+    await guild_projection.repopulate_all(bot=two_guild_bot, redis=redis)
+    gen = await redis.get(CacheKeys.proj_gen())
+    assert gen is not None
+
+    newcomer = _make_mock_member(3001, "frank", global_name="Frank Gray")
+    guild_a, guild_b = two_guild_bot.guilds
+    guild_a.members = [*guild_a.members, newcomer]
+    guild_b.members = [*guild_b.members, newcomer]
+
+    await asyncio.gather(
+        guild_projection.repopulate_guild(guild_a, redis=redis),
+        guild_projection.repopulate_guild(guild_b, redis=redis),
+    )
+
+    guilds = json.loads(await redis._client.get(CacheKeys.proj_user_guilds(gen, "3001")))
+    assert sorted(guilds) == ["111", "222"]
@@ -34,11 +34,13 @@ import uuid
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import discord
 import pytest
 from sqlalchemy import text
 
 from services.bot.handlers.join_game import handle_join_game
 from shared.database import BotAsyncSessionLocal, bot_engine
+from shared.models.participant import UNPOSITIONED_SENTINEL, ParticipantType
 from shared.utils.status_transitions import GameStatus
 
 pytestmark = pytest.mark.integration
@@ -230,7 +232,7 @@ async def test_successful_join_creates_new_user_when_not_in_db(test_game, admin_
 async def test_duplicate_join_does_not_create_second_participant(
     test_game, create_user, admin_db_sync
 ) -> None:
-    """IntegrityError on duplicate join is swallowed; only one participant row exists."""
+    """A duplicate join is ignored; only one participant row exists."""
     player = create_user(discord_user_id=JOINER_DISCORD_ID)
     game = test_game["game"]
     interaction = _make_interaction(JOINER_DISCORD_ID)
@@ -252,3 +254,98 @@ async def test_duplicate_join_does_not_create_second_participant(
         {"game_id": game["id"], "user_id": player["id"]},
     ).fetchall()
     assert len(rows) == 1, "Duplicate join must not create a second participant row"
+
+
+def _set_priority_role_ids(admin_db_sync, template_id: str, raw_json: str) -> None:
+    """Store a raw JSON value in a template's signup_priority_role_ids column."""
+    admin_db_sync.execute(
+        text(
+            "UPDATE game_templates SET signup_priority_role_ids = CAST(:value AS json) "
+            "WHERE id = :id"
+        ),
+        {"value": raw_json, "id": template_id},
+    )
+    admin_db_sync.commit()
+
+
+@pytest.fixture
+def templated_game(test_game, create_template, create_game):
+    """Create a SCHEDULED game that references a template."""
+    guild = test_game["guild"]
+    channel = test_game["channel"]
+    template = create_template(guild_id=guild["id"], channel_id=channel["id"])
+    game = create_game(
+        guild_id=guild["id"],
+        channel_id=channel["id"],
+        host_id=test_game["host"]["id"],
+        template_id=template["id"],
+        title="Templated Join Test Game",
+        status=GameStatus.SCHEDULED,
+    )
+    return {"template": template, "game": game}
+
+
+@pytest.mark.asyncio
+async def test_join_templated_game_with_json_null_priority_roles(
+    templated_game, create_user, admin_db_sync
+) -> None:
+    """A template saved without priority roles stores JSON null; joining still works."""
+    _set_priority_role_ids(admin_db_sync, templated_game["template"]["id"], "null")
+    player = create_user(discord_user_id=JOINER_DISCORD_ID)
+    interaction = _make_interaction(JOINER_DISCORD_ID)
+
+    with _patch_db():
+        await handle_join_game(interaction, templated_game["game"]["id"])
+
+    interaction.user.send.assert_not_called()
+    row = admin_db_sync.execute(
+        text(
+            "SELECT position_type, position FROM game_participants "
+            "WHERE game_session_id = :game_id AND user_id = :user_id"
+        ),
+        {"game_id": templated_game["game"]["id"], "user_id": player["id"]},
+    ).fetchone()
+    assert row is not None, "Participant row must be created after join"
+    assert row.position_type == ParticipantType.SELF_ADDED
+    assert row.position == UNPOSITIONED_SENTINEL
+
+
+@pytest.mark.asyncio
+async def test_join_templated_game_places_by_priority_role(
+    templated_game, create_user, admin_db_sync
+) -> None:
+    """A joiner holding a template priority role is placed at that role's index."""
+    _set_priority_role_ids(
+        admin_db_sync,
+        templated_game["template"]["id"],
+        '["600000000000000001", "600000000000000002"]',
+    )
+    player = create_user(discord_user_id=JOINER_DISCORD_ID)
+    interaction = _make_interaction(JOINER_DISCORD_ID)
+    interaction.user = MagicMock(spec=discord.Member)
+    interaction.user.id = int(JOINER_DISCORD_ID)
+    interaction.user.roles = [MagicMock(id=600000000000000002)]
+    interaction.user.send = AsyncMock()
+    interaction.guild_id = 500111111111111111
+
+    with (
+        _patch_db(),
+        patch("services.bot.handlers.join_game.RoleChecker") as role_checker_cls,
+    ):
+        role_checker_cls.return_value.seed_user_roles = AsyncMock()
+        await handle_join_game(interaction, templated_game["game"]["id"])
+
+    interaction.user.send.assert_not_called()
+    row = admin_db_sync.execute(
+        text(
+            "SELECT position_type, position FROM game_participants "
+            "WHERE game_session_id = :game_id AND user_id = :user_id"
+        ),
+        {"game_id": templated_game["game"]["id"], "user_id": player["id"]},
+    ).fetchone()
+    assert row is not None, "Participant row must be created after join"
+    assert row.position_type == ParticipantType.ROLE_MATCHED
+    assert row.position == 1
+    role_checker_cls.return_value.seed_user_roles.assert_awaited_once_with(
+        JOINER_DISCORD_ID, "500111111111111111", ["600000000000000002"]
+    )
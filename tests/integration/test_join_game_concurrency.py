@@ -0,0 +1,193 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Integration tests for concurrent joins and the participant counter triggers.
+
+Fires many Join button presses at one game at once and checks that the
+single-statement join path and the game_participants triggers leave the game
+row consistent: every join lands exactly once, confirmed_count and
+waitlist_count match the participant rows, and each join bumps version once.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+
+from services.bot.handlers.join_game import handle_join_game
+from shared.database import BotAsyncSessionLocal, bot_engine
+from shared.utils.status_transitions import GameStatus
+
+pytestmark = pytest.mark.integration
+
+CONCURRENT_JOINS = 500
+MAX_PLAYERS = 8
+
+
+def _make_interaction(discord_user_id: str) -> MagicMock:
+    """Build minimal Discord interaction mock for the join handler."""
+    interaction = MagicMock()
+    interaction.user = MagicMock()
+    interaction.user.id = int(discord_user_id)
+    interaction.user.send = AsyncMock()
+    interaction.response = MagicMock()
+    interaction.response.is_done = MagicMock(return_value=False)
+    interaction.response.defer = AsyncMock()
+    return interaction
+
+
+def _patch_db():
+    """Patch get_db_session in join_game module to use BYPASSRLS session."""
+
+    def _bypass():
+        return BotAsyncSessionLocal()
+
+    return patch("services.bot.handlers.join_game.get_db_session", side_effect=_bypass)
+
+
+@pytest.fixture(autouse=True)
+async def _cleanup_engines():
+    """Dispose bot engine pool after each test for clean event loop state."""
+    yield
+    await bot_engine.dispose()
+
+
+@pytest.fixture
+def test_game(create_guild, create_channel, create_user, create_game):
+    """Create a SCHEDULED self-signup game with a small player limit."""
+    guild = create_guild(discord_guild_id="510111111111111111")
+    channel = create_channel(guild_id=guild["id"], discord_channel_id="510222222222222222")
+    host = create_user(discord_user_id="510333333333333333")
+    return create_game(
+        guild_id=guild["id"],
+        channel_id=channel["id"],
+        host_id=host["id"],
+        title="Concurrent Join Test Game",
+        max_players=MAX_PLAYERS,
+        status=GameStatus.SCHEDULED,
+    )
+
+
+def _game_counters(admin_db_sync, game_id: str) -> tuple[int, int, int]:
+    """Return (confirmed_count, waitlist_count, version) for a game."""
+    row = admin_db_sync.execute(
+        text("SELECT confirmed_count, waitlist_count, version FROM game_sessions WHERE id = :id"),
+        {"id": game_id},
+    ).one()
+    return row.confirmed_count, row.waitlist_count, row.version
+
+
+@pytest.mark.asyncio
+async def test_simultaneous_joins_keep_counters_consistent(test_game, admin_db_sync) -> None:
+    """500 simultaneous joins each land once and leave exact counters behind."""
+    interactions = [_make_interaction(str(520000000000000000 + i)) for i in range(CONCURRENT_JOINS)]
+
+    with _patch_db():
+        await asyncio.gather(*(handle_join_game(i, test_game["id"]) for i in interactions))
+
+    for interaction in interactions:
+        interaction.user.send.assert_not_called()
+
+    participants = admin_db_sync.execute(
+        text("SELECT COUNT(*) FROM game_participants WHERE game_session_id = :id"),
+        {"id": test_game["id"]},
+    ).scalar()
+    assert participants == CONCURRENT_JOINS
+
+    confirmed, waitlist, version = _game_counters(admin_db_sync, test_game["id"])
+    assert confirmed == MAX_PLAYERS
+    assert waitlist == CONCURRENT_JOINS - MAX_PLAYERS
+    assert version == CONCURRENT_JOINS
+
+    refresh_rows = admin_db_sync.execute(
+        text("SELECT COUNT(*) FROM message_refresh_queue WHERE game_id = :id"),
+        {"id": test_game["id"]},
+    ).scalar()
+    assert refresh_rows == 1
+
+    join_notifications = admin_db_sync.execute(
+        text(
+            "SELECT COUNT(*) FROM notification_schedule "
+            "WHERE game_id = :id AND notification_type = 'join_notification'"
+        ),
+        {"id": test_game["id"]},
+    ).scalar()
+    assert join_notifications == CONCURRENT_JOINS
+
+
+@pytest.mark.asyncio
+async def test_new_user_joining_two_games_at_once_lands_in_both(
+    test_game, create_game, admin_db_sync
+) -> None:
+    """A brand-new user's simultaneous joins both land despite racing on the users insert."""
+    other_game = create_game(
+        guild_id=test_game["guild_id"],
+        channel_id=test_game["channel_id"],
+        host_id=test_game["host_id"],
+        title="Concurrent Join Second Game",
+        max_players=MAX_PLAYERS,
+        status=GameStatus.SCHEDULED,
+    )
+    discord_id = "540000000000000000"
+
+    with _patch_db():
+        await asyncio.gather(
+            handle_join_game(_make_interaction(discord_id), test_game["id"]),
+            handle_join_game(_make_interaction(discord_id), other_game["id"]),
+        )
+
+    joined_games = admin_db_sync.execute(
+        text(
+            "SELECT p.game_session_id FROM game_participants p "
+            "JOIN users u ON u.id = p.user_id WHERE u.discord_id = :discord_id"
+        ),
+        {"discord_id": discord_id},
+    ).scalars()
+    assert set(joined_games) == {test_game["id"], other_game["id"]}
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_leave_and_capacity_change(test_game, admin_db_sync) -> None:
+    """Deleting a participant and changing max_players both recount the game."""
+    with _patch_db():
+        for i in range(MAX_PLAYERS + 2):
+            await handle_join_game(_make_interaction(str(530000000000000000 + i)), test_game["id"])
+
+    assert _game_counters(admin_db_sync, test_game["id"])[:2] == (MAX_PLAYERS, 2)
+
+    admin_db_sync.execute(
+        text(
+            "DELETE FROM game_participants WHERE id = ("
+            "SELECT id FROM game_participants WHERE game_session_id = :id "
+            "ORDER BY joined_at LIMIT 1)"
+        ),
+        {"id": test_game["id"]},
+    )
+    admin_db_sync.commit()
+    assert _game_counters(admin_db_sync, test_game["id"])[:2] == (MAX_PLAYERS, 1)
+
+    admin_db_sync.execute(
+        text("UPDATE game_sessions SET max_players = 3 WHERE id = :id"),
+        {"id": test_game["id"]},
+    )
+    admin_db_sync.commit()
+    assert _game_counters(admin_db_sync, test_game["id"])[:2] == (3, MAX_PLAYERS - 2)
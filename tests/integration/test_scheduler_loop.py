@@ -264,3 +264,83 @@ async def test_participant_action_due_item_enqueued(
             {"game_id": game_id},
         )
         admin_db_sync.commit()
+
+
+def _insert_due_notifications(admin_db_sync, game_id: str, count: int) -> None:
+    due = _now_minus_one_minute()
+    scheduled_at = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+    admin_db_sync.execute(
+        text(
+            "INSERT INTO notification_schedule "
+            "(id, game_id, reminder_minutes, notification_time, game_scheduled_at, sent) "
+            "VALUES (:id, :game_id, :reminder_minutes, :notification_time, "
+            ":game_scheduled_at, false)"
+        ),
+        [
+            {
+                "id": str(uuid4()),
+                "game_id": game_id,
+                "reminder_minutes": minutes,
+                "notification_time": due,
+                "game_scheduled_at": scheduled_at,
+            }
+            for minutes in range(1, count + 1)
+        ],
+    )
+    admin_db_sync.commit()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loops_enqueue_each_due_row_exactly_once(
+    admin_db_sync,
+    bot_db_url,
+    test_game_environment,
+):
+    """Two loops draining the same table in small batches never claim a row twice."""
+    env = test_game_environment()
+    game_id = env["game"]["id"]
+    row_count = 40
+    _insert_due_notifications(admin_db_sync, game_id, row_count)
+
+    loops = [
+        SchedulerLoop(
+            db_url=bot_db_url,
+            notify_channel="notification_schedule_changed",
+            model_class=NotificationSchedule,
+            time_field="notification_time",
+            status_field="sent",
+            event_builder=build_notification_event,
+            batch_size=7,
+        )
+        for _ in range(2)
+    ]
+
+    async def _drain(loop: SchedulerLoop) -> int:
+        total = 0
+        while claimed := await loop._process_due_batch():
+            total += claimed
+        return total
+
+    try:
+        claimed_per_loop = await asyncio.gather(*(_drain(loop) for loop in loops))
+        assert sum(claimed_per_loop) == row_count
+
+        queued = admin_db_sync.execute(
+            text("SELECT COUNT(*) FROM bot_action_queue WHERE game_id = :game_id"),
+            {"game_id": game_id},
+        ).scalar_one()
+        assert queued == row_count
+
+        unsent = admin_db_sync.execute(
+            text(
+                "SELECT COUNT(*) FROM notification_schedule WHERE game_id = :game_id AND NOT sent"
+            ),
+            {"game_id": game_id},
+        ).scalar_one()
+        assert unsent == 0
+    finally:
+        admin_db_sync.execute(
+            text("DELETE FROM bot_action_queue WHERE game_id = :game_id"),
+            {"game_id": game_id},
+        )
+        admin_db_sync.commit()
@@ -23,7 +23,7 @@
 
 Tests verify:
 - join_game / leave_game defensive guard paths (game/user/config not found, reload fails)
-- list_games optional filter branches
+- list_games filter, ordering and cursor paging
 - update_game / delete_game error and permission-denied paths
 - _resolve_game_host host-user-not-found path
 - _apply_deadline_carryover early-return path
@@ -35,11 +35,12 @@ import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from services.api.schemas.clone_game import CarryoverOption, CloneGameRequest
 from services.api.services import emoji_resolver as emoji_resolver_module
 from services.api.services import participant_resolver as resolver_module
-from services.api.services.games import GameService
+from services.api.services.games import GameListCursor, GameService
 from shared.models import game as game_model
 from shared.models import participant as participant_model
 from shared.models.bot_action_queue import BotActionQueue
@@ -110,6 +111,13 @@ def _make_db_scalar_value(value):
     return result
 
 
+def _compile(statement) -> str:
+    """Render a statement as PostgreSQL with bound values inlined."""
+    return str(
+        statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
 def _make_db_scalars_result(values):
     """Return a mock db.execute() result with scalars().all() set."""
     result = MagicMock()
@@ -148,16 +156,15 @@ class TestJoinGame:
     async def test_guild_config_not_found_raises_error(self, game_service, mock_db):
         """Raises ValueError when guild configuration is missing."""
         game = _make_game()
+        game.guild = None
         game_service.get_game = AsyncMock(return_value=game)
 
         mock_user = MagicMock()
         mock_user.id = "user-uuid"
         game_service.participant_resolver.ensure_user_exists = AsyncMock(return_value=mock_user)
 
-        # No existing participant, then guild_config = None
         mock_db.execute.side_effect = [
             _make_db_scalar_result(None),  # existing_participant query
-            _make_db_scalar_result(None),  # guild_config query → triggers error
         ]
 
         with pytest.raises(ValueError, match="Guild configuration not found"):
@@ -167,17 +174,15 @@ class TestJoinGame:
     async def test_channel_config_not_found_raises_error(self, game_service, mock_db):
         """Raises ValueError when channel configuration is missing."""
         game = _make_game()
+        game.channel = None
         game_service.get_game = AsyncMock(return_value=game)
 
         mock_user = MagicMock()
         mock_user.id = "user-uuid"
         game_service.participant_resolver.ensure_user_exists = AsyncMock(return_value=mock_user)
 
-        mock_guild_config = MagicMock()
         mock_db.execute.side_effect = [
             _make_db_scalar_result(None),  # existing_participant
-            _make_db_scalar_result(mock_guild_config),  # guild_config
-            _make_db_scalar_result(None),  # channel_config → triggers error
         ]
 
         with pytest.raises(ValueError, match="Channel configuration not found"):
@@ -197,49 +202,40 @@ class TestJoinGame:
         mock_user.id = "user-uuid"
         game_service.participant_resolver.ensure_user_exists = AsyncMock(return_value=mock_user)
 
-        mock_guild_config = MagicMock()
-        mock_channel_config = MagicMock()
         mock_db.execute.side_effect = [
             _make_db_scalar_result(None),  # existing_participant
-            _make_db_scalar_result(mock_guild_config),  # guild_config
-            _make_db_scalar_result(mock_channel_config),  # channel_config
         ]
 
         with pytest.raises(ValueError, match="does not accept self-signups"):
             await game_service.join_game(game.id, "user123")
 
     @pytest.mark.asyncio
-    async def test_reload_failure_after_join_raises_error(self, game_service, mock_db):
-        """Raises ValueError when game cannot be reloaded after joining."""
+    async def test_join_loads_game_once(self, game_service, mock_db):
+        """The game loaded for validation is reused to publish the update."""
         game = _make_game(max_players=None)
-        # First get_game returns valid game; second call returns None
-        game_service.get_game = AsyncMock(side_effect=[game, None])
+        game_service.get_game = AsyncMock(return_value=game)
+        game_service._publish_game_updated = AsyncMock()
 
         mock_user = MagicMock()
         mock_user.id = "user-uuid"
         game_service.participant_resolver.ensure_user_exists = AsyncMock(return_value=mock_user)
 
-        mock_participant = MagicMock()
-        mock_participant.id = "participant-uuid"
-        mock_guild_config = MagicMock()
-        mock_channel_config = MagicMock()
         mock_db.execute.side_effect = [
             _make_db_scalar_result(None),  # existing_participant
-            _make_db_scalar_result(mock_guild_config),  # guild_config
-            _make_db_scalar_result(mock_channel_config),  # channel_config
         ]
+        mock_db.add = MagicMock()
         mock_db.flush = AsyncMock()
         mock_db.refresh = AsyncMock()
 
-        with (
-            patch(
-                "services.api.services.games.schedule_join_notification",
-                new_callable=AsyncMock,
-            ),
-            pytest.raises(ValueError, match="Failed to reload game after join"),
+        with patch(
+            "services.api.services.games.schedule_join_notification",
+            new_callable=AsyncMock,
         ):
             await game_service.join_game(game.id, "user123")
 
+        game_service.get_game.assert_awaited_once_with(game.id)
+        game_service._publish_game_updated.assert_awaited_once_with(game)
+
 
 # ---------------------------------------------------------------------------
 # TestLeaveGame
@@ -397,88 +393,114 @@ class TestListGames:
 
     @pytest.mark.asyncio
     async def test_list_games_multi_status_filter(self, game_service, mock_db):
-        """list_games accepts a list of statuses and returns only matching games."""
-        scheduled = _make_game(status=game_model.GameStatus.SCHEDULED.value)
-        completed = _make_game(status=game_model.GameStatus.COMPLETED.value)
-        in_progress = _make_game(status=game_model.GameStatus.IN_PROGRESS.value)
-
+        """list_games filters a list of statuses in SQL."""
         mock_db.execute.side_effect = [
             _make_db_scalar_value(2),
-            _make_db_scalars_result([scheduled, completed, in_progress]),
+            _make_db_scalars_result([]),
         ]
 
-        games, total = await game_service.list_games(status=["SCHEDULED", "COMPLETED"])
+        await game_service.list_games(status=["SCHEDULED", "COMPLETED"])
 
-        statuses = {g.status for g in games}
-        assert statuses == {
-            game_model.GameStatus.SCHEDULED.value,
-            game_model.GameStatus.COMPLETED.value,
-        }
-        assert total == 2
+        for call in mock_db.execute.call_args_list:
+            sql = _compile(call.args[0])
+            assert "game_sessions.status IN ('SCHEDULED', 'COMPLETED')" in sql
 
     @pytest.mark.asyncio
     async def test_list_games_single_status_as_list(self, game_service, mock_db):
-        """list_games accepts a single-element list and returns only matching games."""
-        scheduled = _make_game(status=game_model.GameStatus.SCHEDULED.value)
-        completed = _make_game(status=game_model.GameStatus.COMPLETED.value)
-
+        """list_games accepts a single-element status list."""
         mock_db.execute.side_effect = [
             _make_db_scalar_value(1),
-            _make_db_scalars_result([scheduled, completed]),
+            _make_db_scalars_result([]),
         ]
 
-        games, total = await game_service.list_games(status=["SCHEDULED"])
+        await game_service.list_games(status=["SCHEDULED"])
 
-        statuses = {g.status for g in games}
-        assert statuses == {game_model.GameStatus.SCHEDULED.value}
-        assert total == 1
+        assert "game_sessions.status IN ('SCHEDULED')" in _compile(
+            mock_db.execute.call_args_list[1].args[0]
+        )
 
     @pytest.mark.asyncio
     async def test_list_games_sort_order(self, game_service, mock_db):
-        """Games are sorted: SCHEDULED asc → IN_PROGRESS → COMPLETED desc → CANCELLED desc."""
-        scheduled_soon = _make_game(status=game_model.GameStatus.SCHEDULED.value)
-        scheduled_soon.scheduled_at = datetime.datetime(2026, 6, 1, tzinfo=datetime.UTC)
+        """Games are ordered in SQL by status rank, signed scheduled_at, then id."""
+        rows = [_make_game(), _make_game(status=game_model.GameStatus.COMPLETED.value)]
+        mock_db.execute.side_effect = [
+            _make_db_scalar_value(2),
+            _make_db_scalars_result(rows),
+        ]
 
-        scheduled_later = _make_game(status=game_model.GameStatus.SCHEDULED.value)
-        scheduled_later.scheduled_at = datetime.datetime(2026, 7, 1, tzinfo=datetime.UTC)
+        games, _ = await game_service.list_games()
 
-        in_progress = _make_game(status=game_model.GameStatus.IN_PROGRESS.value)
-        in_progress.scheduled_at = datetime.datetime(2026, 5, 1, tzinfo=datetime.UTC)
+        sql = _compile(mock_db.execute.call_args_list[1].args[0])
+        order_by = sql[sql.index("ORDER BY") :]
+        assert order_by.startswith(
+            "ORDER BY CASE WHEN (game_sessions.status = 'SCHEDULED') THEN 0 "
+            "WHEN (game_sessions.status = 'IN_PROGRESS') THEN 1"
+        )
+        assert (
+            "CASE WHEN (game_sessions.status IN ('COMPLETED', 'CANCELLED', 'ARCHIVED')) "
+            "THEN -EXTRACT(epoch FROM game_sessions.scheduled_at)"
+        ) in order_by
+        assert order_by.endswith("game_sessions.id \n LIMIT 25")
+        assert "OFFSET" not in order_by
+        assert games == rows
 
-        completed_recent = _make_game(status=game_model.GameStatus.COMPLETED.value)
-        completed_recent.scheduled_at = datetime.datetime(2026, 4, 15, tzinfo=datetime.UTC)
+    @pytest.mark.asyncio
+    async def test_list_games_without_total_skips_count(self, game_service, mock_db):
+        """include_total=False issues only the page query and returns a None total."""
+        mock_db.execute.side_effect = [_make_db_scalars_result([])]
 
-        completed_older = _make_game(status=game_model.GameStatus.COMPLETED.value)
-        completed_older.scheduled_at = datetime.datetime(2026, 3, 1, tzinfo=datetime.UTC)
+        games, total = await game_service.list_games(include_total=False)
 
-        cancelled = _make_game(status=game_model.GameStatus.CANCELLED.value)
-        cancelled.scheduled_at = datetime.datetime(2026, 2, 1, tzinfo=datetime.UTC)
+        assert games == []
+        assert total is None
+        assert mock_db.execute.await_count == 1
 
-        # DB returns games in unsorted order to exercise Python-side sorting.
-        mock_db.execute.side_effect = [
-            _make_db_scalar_value(6),
-            _make_db_scalars_result([
-                completed_recent,
-                scheduled_soon,
-                cancelled,
-                in_progress,
-                scheduled_later,
-                completed_older,
-            ]),
-        ]
+    @pytest.mark.asyncio
+    async def test_list_games_cursor_replaces_offset(self, game_service, mock_db):
+        """A cursor adds a keyset predicate on the sort key and ignores offset."""
+        cursor = GameListCursor(
+            status=game_model.GameStatus.COMPLETED.value,
+            scheduled_at=datetime.datetime(2026, 3, 1, 12, 0),
+            game_id="game-uuid-9",
+        )
+        mock_db.execute.side_effect = [_make_db_scalars_result([])]
 
-        games, total = await game_service.list_games()
+        await game_service.list_games(offset=50, cursor=cursor, include_total=False)
 
-        expected = [
-            scheduled_soon,
-            scheduled_later,
-            in_progress,
-            completed_recent,
-            completed_older,
-            cancelled,
-        ]
-        assert games == expected
-        assert total == 6
+        sql = _compile(mock_db.execute.call_args_list[0].args[0])
+        assert (
+            "game_sessions.id) > (2, -EXTRACT(epoch FROM CAST('2026-03-01 12:00:00' "
+            "AS TIMESTAMP WITHOUT TIME ZONE)), 'game-uuid-9')"
+        ) in sql
+        assert "OFFSET" not in sql
+
+
+class TestGameListCursor:
+    """Tests for the opaque list_games cursor."""
+
+    def test_round_trip(self):
+        """Encoded cursors decode to the same position."""
+        cursor = GameListCursor(
+            status="SCHEDULED",
+            scheduled_at=datetime.datetime(2026, 6, 1, 20, 0, 0, 123456),
+            game_id="game-uuid-1",
+        )
+
+        assert GameListCursor.decode(cursor.encode()) == cursor
+
+    def test_after_uses_game_sort_fields(self):
+        """after() captures the status, scheduled_at and id of the given game."""
+        game = _make_game()
+
+        cursor = GameListCursor.after(game)
+
+        assert cursor == GameListCursor(game.status, game.scheduled_at, game.id)
+
+    @pytest.mark.parametrize("token", ["not-base64!", "e30", "eyJzIjoxfQ"])
+    def test_decode_rejects_malformed_tokens(self, token):
+        """Malformed tokens raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid game list cursor"):
+            GameListCursor.decode(token)
 
 
 # ---------------------------------------------------------------------------
@@ -21,7 +21,8 @@
 """Unit tests for handle_join_game — Phase 7 TDD.
 
 Verifies that the join handler inserts into message_refresh_queue and calls
-pg_notify('game_updated_sse', ...) directly instead of using BotEventPublisher.
+pg_notify('game_updated_sse', ...) directly instead of using BotEventPublisher,
+and that the whole join is a single statement.
 """
 
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -32,7 +33,6 @@ import pytest
 
 from services.bot.handlers.join_game import handle_join_game
 from shared.models.game import GameSession
-from shared.models.user import User
 
 USER_DISCORD_ID = "200111222333444555"
 
@@ -82,36 +82,30 @@ def mock_interaction():
     return interaction
 
 
-def _make_mock_db(mock_game: MagicMock) -> MagicMock:
+def _make_mock_db(
+    mock_game: MagicMock, participant_id: str | None = "new-participant"
+) -> MagicMock:
     """Build a mock DB session for join_game handler tests.
 
-    _validate_join_game runs 3 queries (game, user, participant count).
-    The new Phase 7 implementation then runs 2 more (upsert + pg_notify).
+    The whole join is one statement (shared.data_access.game_joins), so a
+    single db.execute() result stands in for it.
     """
     mock_db = AsyncMock()
-    mock_db.add = MagicMock()
     mock_db.commit = AsyncMock()
-    mock_db.refresh = AsyncMock()
-    mock_db.delete = AsyncMock()
 
-    game_result = MagicMock()
-    game_result.scalar_one_or_none = MagicMock(return_value=mock_game)
-
-    user = MagicMock(spec=User)
-    user.id = str(uuid4())
-    user_result = MagicMock()
-    user_result.scalar_one_or_none = MagicMock(return_value=user)
-
-    count_result = MagicMock()
-    count_result.scalars = MagicMock()
-    count_result.scalars.return_value.all = MagicMock(return_value=[])
-
-    upsert_result = MagicMock()
-    notify_result = MagicMock()
-
-    mock_db.execute = AsyncMock(
-        side_effect=[game_result, user_result, count_result, upsert_result, notify_result]
-    )
+    row = MagicMock()
+    row.status = mock_game.status
+    row.signup_method = "SELF_SIGNUP"
+    row.max_players = mock_game.max_players
+    row.confirmed_count = 0
+    row.waitlist_count = 0
+    row.has_priority_roles = False
+    row.participant_id = participant_id
+    row.lost_user_race = False
+    join_result = MagicMock()
+    join_result.one_or_none = MagicMock(return_value=row)
+
+    mock_db.execute = AsyncMock(return_value=join_result)
     return mock_db
 
 
@@ -173,3 +167,47 @@ async def test_join_game_records_shared_join_metric(mock_game, mock_interaction,
         await handle_join_game(mock_interaction, game_id)
 
     mock_record.assert_called_once_with("bot")
+
+
+@pytest.mark.asyncio
+async def test_join_game_is_one_statement_and_one_commit(mock_game, mock_interaction, game_id):
+    """A successful join issues exactly one statement and commits once."""
+    mock_db = _make_mock_db(mock_game)
+
+    with _patch_db(mock_db):
+        await handle_join_game(mock_interaction, game_id)
+
+    mock_db.execute.assert_awaited_once()
+    mock_db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_join_does_not_commit_or_record_metric(
+    mock_game, mock_interaction, game_id
+):
+    """When the user is already a participant nothing is committed or counted."""
+    mock_db = _make_mock_db(mock_game, participant_id=None)
+
+    with (
+        _patch_db(mock_db),
+        patch("services.bot.handlers.join_game.record_game_joined") as mock_record,
+    ):
+        await handle_join_game(mock_interaction, game_id)
+
+    mock_db.commit.assert_not_awaited()
+    mock_record.assert_not_called()
+    mock_interaction.user.send.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rejected_join_sends_error(mock_game, mock_interaction, game_id):
+    """A join the database rejects is reported to the user by DM."""
+    mock_game.status = "COMPLETED"
+    mock_db = _make_mock_db(mock_game, participant_id=None)
+
+    with _patch_db(mock_db):
+        await handle_join_game(mock_interaction, game_id)
+
+    mock_db.commit.assert_not_awaited()
+    mock_interaction.user.send.assert_awaited_once()
+    assert "already started" in mock_interaction.user.send.call_args.kwargs["content"]
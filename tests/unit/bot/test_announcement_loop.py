@@ -240,6 +240,27 @@ async def test_start_delegates_to_listen_with_reconnect() -> None:
     assert args[2] == loop._on_notify
 
 
+async def test_start_subscribes_to_hub_instead_of_connecting() -> None:
+    """With a hub, start() subscribes and each hub (re)connect wakes the loop."""
+    hub = MagicMock()
+    hub.subscribe = AsyncMock()
+    loop = AnnouncementLoop("postgresql://test", MagicMock(), hub=hub)
+
+    with (
+        patch(
+            "services.bot.announcement_loop.listen_with_reconnect", new_callable=AsyncMock
+        ) as mock_listen,
+        patch.object(loop, "_run_loop", new_callable=AsyncMock),
+    ):
+        await loop.start()
+
+    mock_listen.assert_not_called()
+    args, kwargs = hub.subscribe.await_args
+    assert args == ("game_announcement_changed", loop._on_notify)
+    kwargs["on_connected"](MagicMock())
+    assert loop._wake_event.is_set()
+
+
 async def test_announcement_loop_start_closes_connection_on_cancel() -> None:
     """Cancelling start()'s task raises CancelledError after the loop body has run."""
     bot = MagicMock()
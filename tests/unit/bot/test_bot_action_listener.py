@@ -21,10 +21,13 @@
 
 """Unit tests for BotActionListener."""
 
+import asyncio
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from services.bot.bot_action_listener import BotActionListener
 from shared.models.bot_action_queue import BotActionQueue
@@ -70,74 +73,210 @@ def listener(event_handlers: MagicMock) -> BotActionListener:
     )
 
 
-class TestProcessOneRow:
-    """_process_one returns False on empty queue; True after processing a row."""
+def _make_session(result: object = None) -> tuple[AsyncMock, MagicMock]:
+    mock_db = AsyncMock()
+    mock_db.execute = AsyncMock(return_value=result)
+    mock_db.commit = AsyncMock()
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=mock_db)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    return mock_db, ctx
 
-    @pytest.mark.asyncio
-    async def test_returns_false_when_queue_empty(self, listener: BotActionListener) -> None:
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute = AsyncMock(return_value=mock_result)
 
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=mock_db)
-        ctx.__aexit__ = AsyncMock(return_value=None)
+def _compiled_sql(statement: object) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
 
-        with patch("services.bot.bot_action_listener.get_db_session", return_value=ctx):
-            result = await listener._process_one()
 
-        assert result is False
+class TestLeaseBatch:
+    """_lease_batch stamps leased_at with SKIP LOCKED and commits before dispatch."""
 
     @pytest.mark.asyncio
-    async def test_returns_true_and_deletes_row(
-        self, listener: BotActionListener, event_handlers: MagicMock
+    async def test_returns_empty_list_without_commit_when_queue_empty(
+        self, listener: BotActionListener
     ) -> None:
-        row = _make_row("game_created", game_id="g1", channel_id="ch1")
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        mock_db, ctx = _make_session(result)
+
+        with patch("services.bot.bot_action_listener.get_db_session", return_value=ctx):
+            rows = await listener._lease_batch()
+
+        assert rows == []
+        mock_db.commit.assert_not_awaited()
 
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = row
-        mock_db.execute = AsyncMock(return_value=mock_result)
-        mock_db.delete = AsyncMock()
-        mock_db.commit = AsyncMock()
+    @pytest.mark.asyncio
+    async def test_leases_with_skip_locked_and_commits(self, listener: BotActionListener) -> None:
+        row = _make_row("game_created")
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [row]
+        mock_db, ctx = _make_session(result)
+        mock_db.scalar = AsyncMock(return_value=7)
+
+        with (
+            patch("services.bot.bot_action_listener.get_db_session", return_value=ctx),
+            patch("services.bot.bot_action_listener.action_queue_depth_gauge") as mock_depth,
+        ):
+            rows = await listener._lease_batch()
 
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=mock_db)
-        ctx.__aexit__ = AsyncMock(return_value=None)
+        assert rows == [row]
+        sql = _compiled_sql(mock_db.execute.await_args.args[0])
+        assert sql.startswith("UPDATE bot_action_queue SET leased_at=now()")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "leased_at IS NULL OR bot_action_queue.leased_at < now() -" in sql
+        mock_db.commit.assert_awaited_once()
+        mock_depth.set.assert_called_once_with(7)
+
+    @pytest.mark.asyncio
+    async def test_returns_rows_in_enqueue_order(self, listener: BotActionListener) -> None:
+        older = _make_row("game_created")
+        older.enqueued_at = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+        newer = _make_row("game_created")
+        newer.enqueued_at = datetime(2026, 1, 1, 12, 5, tzinfo=UTC)
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [newer, older]
+        mock_db, ctx = _make_session(result)
+        mock_db.scalar = AsyncMock(return_value=2)
 
         with patch("services.bot.bot_action_listener.get_db_session", return_value=ctx):
-            result = await listener._process_one()
+            rows = await listener._lease_batch()
+
+        assert rows == [older, newer]
+
 
-        assert result is True
-        mock_db.delete.assert_awaited_once_with(row)
+class TestProcessBatch:
+    """_process_batch dispatches a leased batch and deletes it in one statement."""
+
+    @pytest.mark.asyncio
+    async def test_returns_zero_when_nothing_leased(self, listener: BotActionListener) -> None:
+        listener._lease_batch = AsyncMock(return_value=[])  # type: ignore[method-assign]
+
+        with patch("services.bot.bot_action_listener.get_db_session") as mock_session:
+            result = await listener._process_batch()
+
+        assert result == 0
+        mock_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dispatches_and_bulk_deletes_rows(
+        self, listener: BotActionListener, event_handlers: MagicMock
+    ) -> None:
+        rows = [_make_row("game_created", channel_id="ch1") for _ in range(3)]
+        listener._lease_batch = AsyncMock(return_value=rows)  # type: ignore[method-assign]
+        mock_db, ctx = _make_session()
+
+        with patch("services.bot.bot_action_listener.get_db_session", return_value=ctx):
+            result = await listener._process_batch()
+
+        assert result == 3
+        assert event_handlers._handle_game_created.await_count == 3
+        mock_db.execute.assert_awaited_once()
+        delete_stmt = mock_db.execute.await_args.args[0]
+        assert _compiled_sql(delete_stmt).startswith("DELETE FROM bot_action_queue")
+        assert delete_stmt.compile().params["id_1"] == [row.id for row in rows]
         mock_db.commit.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_deletes_row_even_when_dispatch_raises(
+    async def test_deletes_rows_even_when_dispatch_raises(
         self, listener: BotActionListener, event_handlers: MagicMock
     ) -> None:
-        """Row is deleted even if the handler raises, to avoid infinite retry loops."""
-        row = _make_row("game_created", game_id="g1", channel_id="ch1")
+        """Rows are deleted even if the handler raises, to avoid infinite retry loops."""
+        rows = [_make_row("game_created"), _make_row("game_cancelled")]
         event_handlers._handle_game_created.side_effect = RuntimeError("discord error")
+        listener._lease_batch = AsyncMock(return_value=rows)  # type: ignore[method-assign]
+        mock_db, ctx = _make_session()
+
+        with patch("services.bot.bot_action_listener.get_db_session", return_value=ctx):
+            result = await listener._process_batch()
+
+        assert result == 2
+        event_handlers._handle_game_cancelled.assert_awaited_once()
+        assert mock_db.execute.await_args.args[0].compile().params["id_1"] == [
+            row.id for row in rows
+        ]
 
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = row
-        mock_db.execute = AsyncMock(return_value=mock_result)
-        mock_db.delete = AsyncMock()
-        mock_db.commit = AsyncMock()
+    @pytest.mark.asyncio
+    async def test_keeps_per_game_order_while_games_run_concurrently(
+        self, event_handlers: MagicMock
+    ) -> None:
+        """Rows for one game run in order; a slow game does not block another game."""
+        listener = BotActionListener("postgresql://x", event_handlers, concurrency=4)
+        slow_first = _make_row("game_created", game_id="slow")
+        slow_second = _make_row("game_cancelled", game_id="slow")
+        fast = _make_row("player_removed", game_id="fast")
+        release_slow = asyncio.Event()
+        events: list[str] = []
+
+        async def created(_data: dict) -> None:
+            events.append("slow-1-start")
+            await release_slow.wait()
+            events.append("slow-1-end")
+
+        async def cancelled(_data: dict) -> None:
+            events.append("slow-2")
+
+        async def removed(_data: dict) -> None:
+            events.append("fast")
+            release_slow.set()
+
+        event_handlers._handle_game_created.side_effect = created
+        event_handlers._handle_game_cancelled.side_effect = cancelled
+        event_handlers._handle_player_removed.side_effect = removed
+        listener._lease_batch = AsyncMock(  # type: ignore[method-assign]
+            return_value=[slow_first, slow_second, fast]
+        )
+        _mock_db, ctx = _make_session()
 
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=mock_db)
-        ctx.__aexit__ = AsyncMock(return_value=None)
+        with patch("services.bot.bot_action_listener.get_db_session", return_value=ctx):
+            await asyncio.wait_for(listener._process_batch(), timeout=1)
+
+        assert events == ["slow-1-start", "fast", "slow-1-end", "slow-2"]
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_dispatches(self, event_handlers: MagicMock) -> None:
+        listener = BotActionListener("postgresql://x", event_handlers, concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def handler(_data: dict) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        event_handlers._handle_game_created.side_effect = handler
+        listener._lease_batch = AsyncMock(  # type: ignore[method-assign]
+            return_value=[_make_row("game_created") for _ in range(6)]
+        )
+        _mock_db, ctx = _make_session()
 
         with patch("services.bot.bot_action_listener.get_db_session", return_value=ctx):
-            result = await listener._process_one()
+            result = await listener._process_batch()
 
-        assert result is True
-        mock_db.delete.assert_awaited_once_with(row)
-        mock_db.commit.assert_awaited_once()
+        assert result == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_records_dispatch_and_lease_metrics(self, listener: BotActionListener) -> None:
+        listener._lease_batch = AsyncMock(  # type: ignore[method-assign]
+            return_value=[_make_row("send_dm")]
+        )
+        _mock_db, ctx = _make_session()
+
+        with (
+            patch("services.bot.bot_action_listener.get_db_session", return_value=ctx),
+            patch(
+                "services.bot.bot_action_listener.action_dispatch_duration_histogram"
+            ) as mock_dispatch,
+            patch(
+                "services.bot.bot_action_listener.action_queue_lease_age_histogram"
+            ) as mock_lease_age,
+        ):
+            await listener._process_batch()
+
+        mock_dispatch.record.assert_called_once()
+        assert mock_dispatch.record.call_args.args[1] == {"action_type": "send_dm"}
+        mock_lease_age.record.assert_called_once()
 
 
 class TestDispatchGameCreated:
@@ -322,17 +461,17 @@ class TestOnNotify:
 
 
 class TestDrainQueue:
-    """_drain_queue loops until _process_one returns False."""
+    """_drain_queue loops until _process_batch returns 0."""
 
     @pytest.mark.asyncio
     async def test_drains_all_rows(self, listener: BotActionListener) -> None:
-        calls = [True, True, False]
+        calls = [100, 3, 0]
         call_iter = iter(calls)
 
-        async def fake_process_one() -> bool:
+        async def fake_process_batch() -> int:
             return next(call_iter)
 
-        listener._process_one = fake_process_one  # type: ignore[method-assign]
+        listener._process_batch = fake_process_batch  # type: ignore[method-assign]
 
         await listener._drain_queue()
 
@@ -443,3 +582,26 @@ class TestStart:
         on_connected(MagicMock())  # type: ignore[operator]
 
         assert spawn_called == [True]
+
+    @pytest.mark.asyncio
+    async def test_start_subscribes_to_hub_with_drain_on_connect(
+        self, event_handlers: MagicMock
+    ) -> None:
+        """With a hub, start() subscribes and every hub (re)connect drains the queue."""
+        hub = MagicMock()
+        hub.subscribe = AsyncMock()
+        listener = BotActionListener("postgresql://x", event_handlers, hub=hub)
+        spawn_called: list[bool] = []
+        listener._spawn_drain = lambda: spawn_called.append(True)  # type: ignore[method-assign]
+
+        with patch(
+            "services.bot.bot_action_listener.listen_with_reconnect",
+            new_callable=AsyncMock,
+        ) as mock_listen:
+            await listener.start()
+
+        mock_listen.assert_not_called()
+        args, kwargs = hub.subscribe.await_args
+        assert args == ("bot_action_queue_changed", listener._on_notify)
+        kwargs["on_connected"](MagicMock())
+        assert spawn_called == [True]
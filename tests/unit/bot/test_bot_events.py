@@ -21,12 +21,14 @@
 
 """Unit tests for GameSchedulerBot gateway event handlers (channel and role)."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from unittest.mock import MagicMock
 
 import discord
 import pytest
 
 from services.bot.bot import GameSchedulerBot
+from services.bot.write_batcher import GatewayWriteBatcher
 from shared.cache.keys import CacheKeys
 from shared.cache.ttl import CacheTTL
 
@@ -42,6 +44,7 @@ def _make_bot() -> GameSchedulerBot:
     instance.api_cache = None
     instance._sweep_task = None
     instance._disconnected_at = None
+    instance._writes = MagicMock(spec=GatewayWriteBatcher)
     return instance
 
 
@@ -92,70 +95,52 @@ def bot() -> GameSchedulerBot:
     return _make_bot()
 
 
-@pytest.fixture
-def mock_redis() -> AsyncMock:
-    redis = AsyncMock()
-    redis.set_json = AsyncMock(return_value=True)
-    redis.delete = AsyncMock(return_value=True)
-    return redis
-
-
 # ---------------------------------------------------------------------------
 # Channel event handlers
 # ---------------------------------------------------------------------------
 
 
-async def test_on_guild_channel_create_writes_channel_and_list(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_guild_channel_create_writes_channel_and_list(bot: GameSchedulerBot) -> None:
     """on_guild_channel_create writes discord:channel:{id} and rewrites the full channel list."""
     channel = _make_channel(1001, 111)
     expected_channels = [{"id": str(channel.id), "name": channel.name, "type": channel.type.value}]
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_guild_channel_create(channel)
+    await bot.on_guild_channel_create(channel)
 
-    mock_redis.set_json.assert_any_call(
+    bot._writes.set.assert_any_call(
         CacheKeys.discord_channel(str(channel.id)),
-        {"name": channel.name},
-        CacheTTL.DISCORD_CHANNEL,
+        json.dumps({"name": channel.name}),
+        ex=CacheTTL.DISCORD_CHANNEL,
     )
-    mock_redis.set_json.assert_any_call(
+    bot._writes.set.assert_any_call(
         CacheKeys.discord_guild_channels(str(channel.guild.id)),
-        expected_channels,
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps(expected_channels),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
-    mock_redis.delete.assert_not_called()
+    bot._writes.delete.assert_not_called()
 
 
-async def test_on_guild_channel_update_writes_channel_and_list(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_guild_channel_update_writes_channel_and_list(bot: GameSchedulerBot) -> None:
     """on_guild_channel_update writes discord:channel:{id} and rewrites the full channel list."""
     before = _make_channel(1001, 111, "old-name")
     after = _make_channel(1001, 111, "new-name")
     expected_channels = [{"id": str(after.id), "name": after.name, "type": after.type.value}]
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_guild_channel_update(before, after)
+    await bot.on_guild_channel_update(before, after)
 
-    mock_redis.set_json.assert_any_call(
+    bot._writes.set.assert_any_call(
         CacheKeys.discord_channel(str(after.id)),
-        {"name": after.name},
-        CacheTTL.DISCORD_CHANNEL,
+        json.dumps({"name": after.name}),
+        ex=CacheTTL.DISCORD_CHANNEL,
     )
-    mock_redis.set_json.assert_any_call(
+    bot._writes.set.assert_any_call(
         CacheKeys.discord_guild_channels(str(after.guild.id)),
-        expected_channels,
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps(expected_channels),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
-    mock_redis.delete.assert_not_called()
+    bot._writes.delete.assert_not_called()
 
 
 async def test_on_guild_channel_delete_removes_channel_and_rewrites_list(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
+    bot: GameSchedulerBot,
 ) -> None:
     """on_guild_channel_delete deletes discord:channel:{id} and rewrites the channel list."""
     remaining = _make_channel(1002, 111, "other")
@@ -163,54 +148,49 @@ async def test_on_guild_channel_delete_removes_channel_and_rewrites_list(
     expected_channels = [
         {"id": str(remaining.id), "name": remaining.name, "type": remaining.type.value}
     ]
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_guild_channel_delete(channel)
+    await bot.on_guild_channel_delete(channel)
 
-    mock_redis.delete.assert_called_once_with(CacheKeys.discord_channel(str(channel.id)))
-    mock_redis.set_json.assert_called_once_with(
+    bot._writes.delete.assert_called_once_with(CacheKeys.discord_channel(str(channel.id)))
+    bot._writes.set.assert_called_once_with(
         CacheKeys.discord_guild_channels(str(channel.guild.id)),
-        expected_channels,
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps(expected_channels),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
+    bot._writes.invalidate.assert_called_once_with([
+        CacheKeys.discord_channel(str(channel.id)),
+        CacheKeys.discord_guild_channels(str(channel.guild.id)),
+    ])
 
 
 async def test_on_guild_channel_create_skips_channel_key_when_no_send_messages(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
+    bot: GameSchedulerBot,
 ) -> None:
     """on_guild_channel_create skips writing discord:channel:{id} when bot lacks send_messages."""
     channel = _make_channel(1001, 111, send_messages=False)
     channel.guild.channels = []
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_guild_channel_create(channel)
+    await bot.on_guild_channel_create(channel)
 
-    mock_redis.set_json.assert_called_once_with(
+    bot._writes.set.assert_called_once_with(
         CacheKeys.discord_guild_channels(str(channel.guild.id)),
-        [],
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps([]),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
 
 
 async def test_on_guild_channel_update_deletes_channel_key_when_no_send_messages(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
+    bot: GameSchedulerBot,
 ) -> None:
     """on_guild_channel_update removes discord:channel:{id} when bot loses send_messages."""
     before = _make_channel(1001, 111, "general")
     after = _make_channel(1001, 111, "restricted", send_messages=False)
     after.guild.channels = []
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_guild_channel_update(before, after)
+    await bot.on_guild_channel_update(before, after)
 
-    mock_redis.delete.assert_called_once_with(CacheKeys.discord_channel(str(after.id)))
-    mock_redis.set_json.assert_called_once_with(
+    bot._writes.delete.assert_called_once_with(CacheKeys.discord_channel(str(after.id)))
+    bot._writes.set.assert_called_once_with(
         CacheKeys.discord_guild_channels(str(after.guild.id)),
-        [],
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps([]),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
 
 
@@ -246,116 +226,91 @@ def _make_thread(
     return th
 
 
-async def test_on_thread_create_writes_thread_and_list(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_thread_create_writes_thread_and_list(bot: GameSchedulerBot) -> None:
     """on_thread_create writes discord:channel:{id} and rewrites the full channel list."""
     thread = _make_thread(3001, 111)
     expected_channels = [{"id": str(thread.id), "name": thread.name, "type": thread.type.value}]
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_thread_create(thread)
+    await bot.on_thread_create(thread)
 
-    mock_redis.set_json.assert_any_call(
+    bot._writes.set.assert_any_call(
         CacheKeys.discord_channel(str(thread.id)),
-        {"name": thread.name},
-        CacheTTL.DISCORD_CHANNEL,
+        json.dumps({"name": thread.name}),
+        ex=CacheTTL.DISCORD_CHANNEL,
     )
-    mock_redis.set_json.assert_any_call(
+    bot._writes.set.assert_any_call(
         CacheKeys.discord_guild_channels(str(thread.guild.id)),
-        expected_channels,
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps(expected_channels),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
-    mock_redis.delete.assert_not_called()
+    bot._writes.delete.assert_not_called()
 
 
 async def test_on_thread_create_skips_thread_key_when_no_send_permission(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
+    bot: GameSchedulerBot,
 ) -> None:
     """on_thread_create skips writing discord:channel:{id} when bot can't post in the thread."""
     thread = _make_thread(3001, 111, send_messages_in_threads=False, guild_threads=[])
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_thread_create(thread)
+    await bot.on_thread_create(thread)
 
-    mock_redis.set_json.assert_called_once_with(
+    bot._writes.set.assert_called_once_with(
         CacheKeys.discord_guild_channels(str(thread.guild.id)),
-        [],
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps([]),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
-    mock_redis.delete.assert_called_once_with(CacheKeys.discord_channel(str(thread.id)))
+    bot._writes.delete.assert_called_once_with(CacheKeys.discord_channel(str(thread.id)))
 
 
-async def test_on_thread_join_writes_thread_and_list(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_thread_join_writes_thread_and_list(bot: GameSchedulerBot) -> None:
     """on_thread_join writes discord:channel:{id} and rewrites the full channel list."""
     thread = _make_thread(3002, 111)
     expected_channels = [{"id": str(thread.id), "name": thread.name, "type": thread.type.value}]
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_thread_join(thread)
+    await bot.on_thread_join(thread)
 
-    mock_redis.set_json.assert_any_call(
+    bot._writes.set.assert_any_call(
         CacheKeys.discord_channel(str(thread.id)),
-        {"name": thread.name},
-        CacheTTL.DISCORD_CHANNEL,
+        json.dumps({"name": thread.name}),
+        ex=CacheTTL.DISCORD_CHANNEL,
     )
-    mock_redis.set_json.assert_any_call(
+    bot._writes.set.assert_any_call(
         CacheKeys.discord_guild_channels(str(thread.guild.id)),
-        expected_channels,
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps(expected_channels),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
 
 
-async def test_on_thread_update_writes_thread_and_list(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_thread_update_writes_thread_and_list(bot: GameSchedulerBot) -> None:
     """on_thread_update writes discord:channel:{id} and rewrites the full channel list."""
     before = _make_thread(3001, 111, name="old-name", guild_threads=[])
     after = _make_thread(3001, 111, name="new-name")
     expected_channels = [{"id": str(after.id), "name": after.name, "type": after.type.value}]
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_thread_update(before, after)
+    await bot.on_thread_update(before, after)
 
-    mock_redis.set_json.assert_any_call(
+    bot._writes.set.assert_any_call(
         CacheKeys.discord_channel(str(after.id)),
-        {"name": after.name},
-        CacheTTL.DISCORD_CHANNEL,
+        json.dumps({"name": after.name}),
+        ex=CacheTTL.DISCORD_CHANNEL,
     )
-    mock_redis.set_json.assert_any_call(
+    bot._writes.set.assert_any_call(
         CacheKeys.discord_guild_channels(str(after.guild.id)),
-        expected_channels,
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps(expected_channels),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
 
 
-async def test_on_thread_update_removes_archived_thread(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_thread_update_removes_archived_thread(bot: GameSchedulerBot) -> None:
     """on_thread_update deletes discord:channel:{id} once a thread has been archived."""
     after = _make_thread(3001, 111, archived=True, guild_threads=[])
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_thread_update(after, after)
+    await bot.on_thread_update(after, after)
 
-    mock_redis.delete.assert_called_once_with(CacheKeys.discord_channel(str(after.id)))
-    mock_redis.set_json.assert_called_once_with(
+    bot._writes.delete.assert_called_once_with(CacheKeys.discord_channel(str(after.id)))
+    bot._writes.set.assert_called_once_with(
         CacheKeys.discord_guild_channels(str(after.guild.id)),
-        [],
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps([]),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
 
 
-async def test_on_thread_delete_removes_thread_and_rewrites_list(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_thread_delete_removes_thread_and_rewrites_list(bot: GameSchedulerBot) -> None:
     """on_thread_delete deletes discord:channel:{id} and rewrites the channel list."""
     remaining = _make_thread(3002, 111, name="other", guild_threads=[])
     thread = _make_thread(3001, 111, name="deleted", guild_threads=[remaining])
@@ -363,16 +318,13 @@ async def test_on_thread_delete_removes_thread_and_rewrites_list(
     expected_channels = [
         {"id": str(remaining.id), "name": remaining.name, "type": remaining.type.value}
     ]
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_thread_delete(thread)
+    await bot.on_thread_delete(thread)
 
-    mock_redis.delete.assert_called_once_with(CacheKeys.discord_channel(str(thread.id)))
-    mock_redis.set_json.assert_called_once_with(
+    bot._writes.delete.assert_called_once_with(CacheKeys.discord_channel(str(thread.id)))
+    bot._writes.set.assert_called_once_with(
         CacheKeys.discord_guild_channels(str(thread.guild.id)),
-        expected_channels,
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps(expected_channels),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
 
 
@@ -381,9 +333,7 @@ async def test_on_thread_delete_removes_thread_and_rewrites_list(
 # ---------------------------------------------------------------------------
 
 
-async def test_on_guild_role_create_writes_roles_list(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_guild_role_create_writes_roles_list(bot: GameSchedulerBot) -> None:
     """on_guild_role_create rewrites discord:guild_roles:{guild_id} from gateway state."""
     role = _make_role(2001, 111)
     expected_roles = [
@@ -396,22 +346,20 @@ async def test_on_guild_role_create_writes_roles_list(
             "permissions": role.permissions.value,
         }
     ]
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_guild_role_create(role)
+    await bot.on_guild_role_create(role)
 
-    mock_redis.set_json.assert_called_once_with(
+    bot._writes.set.assert_called_once_with(
         CacheKeys.discord_guild_roles(str(role.guild.id)),
-        expected_roles,
-        CacheTTL.DISCORD_GUILD_ROLES,
+        json.dumps(expected_roles),
+        ex=CacheTTL.DISCORD_GUILD_ROLES,
     )
-    mock_redis.delete.assert_not_called()
+    bot._writes.delete.assert_not_called()
+    bot._writes.invalidate.assert_called_once_with([
+        CacheKeys.discord_guild_roles(str(role.guild.id))
+    ])
 
 
-async def test_on_guild_role_update_writes_roles_list(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_guild_role_update_writes_roles_list(bot: GameSchedulerBot) -> None:
     """on_guild_role_update rewrites discord:guild_roles:{guild_id} from gateway state."""
     before = _make_role(2001, 111, "old-role")
     after = _make_role(2001, 111, "new-role")
@@ -425,22 +373,17 @@ async def test_on_guild_role_update_writes_roles_list(
             "permissions": after.permissions.value,
         }
     ]
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_guild_role_update(before, after)
+    await bot.on_guild_role_update(before, after)
 
-    mock_redis.set_json.assert_called_once_with(
+    bot._writes.set.assert_called_once_with(
         CacheKeys.discord_guild_roles(str(after.guild.id)),
-        expected_roles,
-        CacheTTL.DISCORD_GUILD_ROLES,
+        json.dumps(expected_roles),
+        ex=CacheTTL.DISCORD_GUILD_ROLES,
     )
-    mock_redis.delete.assert_not_called()
+    bot._writes.delete.assert_not_called()
 
 
-async def test_on_guild_role_delete_writes_roles_list(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_guild_role_delete_writes_roles_list(bot: GameSchedulerBot) -> None:
     """on_guild_role_delete rewrites discord:guild_roles:{guild_id} with the role removed."""
     remaining = _make_role(2002, 111, "remaining")
     role = _make_role(2001, 111, "deleted", guild_roles=[remaining])
@@ -454,17 +397,14 @@ async def test_on_guild_role_delete_writes_roles_list(
             "permissions": remaining.permissions.value,
         }
     ]
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_guild_role_delete(role)
+    await bot.on_guild_role_delete(role)
 
-    mock_redis.set_json.assert_called_once_with(
+    bot._writes.set.assert_called_once_with(
         CacheKeys.discord_guild_roles(str(role.guild.id)),
-        expected_roles,
-        CacheTTL.DISCORD_GUILD_ROLES,
+        json.dumps(expected_roles),
+        ex=CacheTTL.DISCORD_GUILD_ROLES,
     )
-    mock_redis.delete.assert_not_called()
+    bot._writes.delete.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -481,25 +421,20 @@ def _make_emoji(emoji_id: int, name: str, animated: bool = False) -> MagicMock:
 
 
 @pytest.mark.asyncio
-async def test_on_guild_emojis_update_writes_emoji_cache(
-    bot: GameSchedulerBot, mock_redis: AsyncMock
-) -> None:
+async def test_on_guild_emojis_update_writes_emoji_cache(bot: GameSchedulerBot) -> None:
     """on_guild_emojis_update rewrites discord:guild_emojis:{guild_id} with current list."""
     guild = MagicMock()
     guild.id = 111
     before = [_make_emoji(1, "wave")]
     after = [_make_emoji(1, "wave"), _make_emoji(2, "dance", animated=True)]
 
-    with patch(
-        "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
-    ):
-        await bot.on_guild_emojis_update(guild, before, after)
+    await bot.on_guild_emojis_update(guild, before, after)
 
-    mock_redis.set_json.assert_called_once_with(
+    bot._writes.set.assert_called_once_with(
         CacheKeys.discord_guild_emojis(str(guild.id)),
-        [
+        json.dumps([
             {"id": "1", "name": "wave", "animated": False},
             {"id": "2", "name": "dance", "animated": True},
-        ],
-        CacheTTL.DISCORD_GUILD_EMOJIS,
+        ]),
+        ex=CacheTTL.DISCORD_GUILD_EMOJIS,
     )
@@ -21,6 +21,7 @@
 
 """Unit tests for GameSchedulerBot.on_ready."""
 
+import json
 from contextlib import ExitStack
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
@@ -28,7 +29,9 @@ import discord
 import pytest
 
 from services.bot.bot import GameSchedulerBot
+from services.bot.write_batcher import GatewayWriteBatcher
 from shared.cache.keys import CacheKeys
+from shared.cache.l1 import INVALIDATE_ALL, INVALIDATION_CHANNEL
 from shared.cache.ttl import CacheTTL
 
 
@@ -43,10 +46,13 @@ def _make_bot() -> GameSchedulerBot:
     instance.api_cache = None
     instance._sweep_task = None
     instance._disconnected_at = None
+    instance._projection_gen = None
+    instance._writes = GatewayWriteBatcher()
     instance._refresh_listener_started = True
     instance._action_listener_started = True
     instance._announcement_loop_started = True
     instance._scheduler_loops_started = True
+    instance._notification_hub = MagicMock()
     return instance
 
 
@@ -95,14 +101,22 @@ def bot() -> GameSchedulerBot:
 @pytest.fixture
 def mock_redis() -> AsyncMock:
     redis = AsyncMock()
-    redis.set_json = AsyncMock(return_value=True)
-    mock_client = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    mock_client = MagicMock()
+    mock_client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    mock_client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
     mock_client.scan = AsyncMock(return_value=(0, []))
     mock_client.delete = AsyncMock()
     redis._client = mock_client
     return redis
 
 
+def _pipe(redis: AsyncMock) -> MagicMock:
+    """Return the pipeline the cache rebuild queued its writes on."""
+    return redis._client.pipeline.return_value.__aenter__.return_value
+
+
 @pytest.fixture
 def on_ready_env(bot, mock_redis):
     """Apply all external patches needed to call on_ready, yielding the mock guild.
@@ -249,7 +263,12 @@ async def test_on_ready_starts_message_refresh_listener(bot, mock_redis, on_read
         mock_listener_cls.return_value.start = AsyncMock()
         await bot.on_ready()
 
-    mock_listener_cls.assert_called_once_with(bot.config.database_url, bot._spawn_channel_worker)
+    mock_listener_cls.assert_called_once_with(
+        bot.config.database_url,
+        bot._spawn_channel_worker,
+        catch_up_cb=bot._recover_pending_workers,
+        hub=bot._notification_hub,
+    )
 
 
 async def test_on_ready_does_not_restart_message_refresh_listener(
@@ -276,7 +295,7 @@ async def test_on_ready_starts_announcement_loop(bot, mock_redis, on_ready_env)
         mock_loop_cls.return_value.start = AsyncMock()
         await bot.on_ready()
 
-    mock_loop_cls.assert_called_once_with(bot.config.database_url, bot)
+    mock_loop_cls.assert_called_once_with(bot.config.database_url, bot, hub=bot._notification_hub)
 
 
 async def test_on_ready_does_not_restart_announcement_loop(bot, mock_redis, on_ready_env) -> None:
@@ -291,10 +310,26 @@ async def test_on_ready_does_not_restart_announcement_loop(bot, mock_redis, on_r
     mock_loop_cls.assert_not_called()
 
 
+async def test_on_ready_starts_notification_hub_once(bot, mock_redis, on_ready_env) -> None:
+    """on_ready starts a single NotificationHub and reuses it on later on_ready calls."""
+    del bot._notification_hub
+    with (
+        patch("services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock),
+        patch("services.bot.bot.NotificationHub") as mock_hub_cls,
+    ):
+        mock_hub_cls.return_value.run = AsyncMock()
+        await bot.on_ready()
+        await bot.on_ready()
+
+    mock_hub_cls.assert_called_once_with(bot.config.database_url)
+    assert bot._notification_hub is mock_hub_cls.return_value
+    await bot._notification_hub_task
+
+
 # ---------------------------------------------------------------------------
 # Content tests — verify _rebuild_guild_channel_cache writes correct payloads.
 # repopulate_all is patched out so its own writes don't interfere with
-# the set_json assertions below.
+# the pipeline assertions below.
 # ---------------------------------------------------------------------------
 
 
@@ -304,10 +339,10 @@ async def test_on_ready_writes_guild_key(bot, mock_redis, on_ready_env) -> None:
     with patch("services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock):
         await bot.on_ready()
 
-    mock_redis.set_json.assert_any_call(
+    _pipe(mock_redis).set.assert_any_call(
         CacheKeys.discord_guild(str(guild.id)),
-        {"id": str(guild.id), "name": guild.name, "owner_id": str(guild.owner_id)},
-        CacheTTL.DISCORD_GUILD,
+        json.dumps({"id": str(guild.id), "name": guild.name, "owner_id": str(guild.owner_id)}),
+        ex=CacheTTL.DISCORD_GUILD,
     )
 
 
@@ -317,10 +352,10 @@ async def test_on_ready_writes_guild_key_with_owner_id(bot, mock_redis, on_ready
     with patch("services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock):
         await bot.on_ready()
 
-    mock_redis.set_json.assert_any_call(
+    _pipe(mock_redis).set.assert_any_call(
         CacheKeys.discord_guild(str(guild.id)),
-        {"id": str(guild.id), "name": guild.name, "owner_id": str(guild.owner_id)},
-        CacheTTL.DISCORD_GUILD,
+        json.dumps({"id": str(guild.id), "name": guild.name, "owner_id": str(guild.owner_id)}),
+        ex=CacheTTL.DISCORD_GUILD,
     )
 
 
@@ -331,10 +366,10 @@ async def test_on_ready_writes_guild_channels_key(bot, mock_redis, on_ready_env)
     with patch("services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock):
         await bot.on_ready()
 
-    mock_redis.set_json.assert_any_call(
+    _pipe(mock_redis).set.assert_any_call(
         CacheKeys.discord_guild_channels(str(guild.id)),
-        [{"id": str(ch.id), "name": ch.name, "type": ch.type.value}],
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps([{"id": str(ch.id), "name": ch.name, "type": ch.type.value}]),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
 
 
@@ -345,13 +380,21 @@ async def test_on_ready_writes_channel_key(bot, mock_redis, on_ready_env) -> Non
     with patch("services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock):
         await bot.on_ready()
 
-    mock_redis.set_json.assert_any_call(
+    _pipe(mock_redis).set.assert_any_call(
         CacheKeys.discord_channel(str(ch.id)),
-        {"name": ch.name},
-        CacheTTL.DISCORD_CHANNEL,
+        json.dumps({"name": ch.name}),
+        ex=CacheTTL.DISCORD_CHANNEL,
     )
 
 
+async def test_on_ready_publishes_full_l1_invalidation(bot, mock_redis, on_ready_env) -> None:
+    """on_ready tells other processes to drop every L1 entry after the rebuild."""
+    with patch("services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock):
+        await bot.on_ready()
+
+    mock_redis.publish.assert_any_await(INVALIDATION_CHANNEL, INVALIDATE_ALL)
+
+
 async def test_on_ready_writes_guild_roles_key_with_permissions(
     bot, mock_redis, on_ready_env
 ) -> None:
@@ -361,9 +404,9 @@ async def test_on_ready_writes_guild_roles_key_with_permissions(
     with patch("services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock):
         await bot.on_ready()
 
-    mock_redis.set_json.assert_any_call(
+    _pipe(mock_redis).set.assert_any_call(
         CacheKeys.discord_guild_roles(str(guild.id)),
-        [
+        json.dumps([
             {
                 "id": str(role.id),
                 "name": role.name,
@@ -372,8 +415,8 @@ async def test_on_ready_writes_guild_roles_key_with_permissions(
                 "managed": role.managed,
                 "permissions": role.permissions.value,
             }
-        ],
-        CacheTTL.DISCORD_GUILD_ROLES,
+        ]),
+        ex=CacheTTL.DISCORD_GUILD_ROLES,
     )
 
 
@@ -434,10 +477,12 @@ async def test_on_ready_excludes_non_postable_channels_from_guild_channels_key(
         )
         await bot.on_ready()
 
-    mock_redis.set_json.assert_any_call(
+    _pipe(mock_redis).set.assert_any_call(
         CacheKeys.discord_guild_channels(str(guild.id)),
-        [{"id": str(postable_ch.id), "name": postable_ch.name, "type": postable_ch.type.value}],
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        json.dumps([
+            {"id": str(postable_ch.id), "name": postable_ch.name, "type": postable_ch.type.value}
+        ]),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
 
 
@@ -513,18 +558,18 @@ async def test_on_ready_includes_active_threads_in_guild_channels_key(bot, mock_
         )
         await bot.on_ready()
 
-    mock_redis.set_json.assert_any_call(
+    _pipe(mock_redis).set.assert_any_call(
         CacheKeys.discord_guild_channels(str(guild.id)),
-        [
+        json.dumps([
             {"id": str(channel.id), "name": channel.name, "type": channel.type.value},
             {"id": str(thread.id), "name": thread.name, "type": thread.type.value},
-        ],
-        CacheTTL.DISCORD_GUILD_CHANNELS,
+        ]),
+        ex=CacheTTL.DISCORD_GUILD_CHANNELS,
     )
-    mock_redis.set_json.assert_any_call(
+    _pipe(mock_redis).set.assert_any_call(
         CacheKeys.discord_channel(str(thread.id)),
-        {"name": thread.name},
-        CacheTTL.DISCORD_CHANNEL,
+        json.dumps({"name": thread.name}),
+        ex=CacheTTL.DISCORD_CHANNEL,
     )
 
 
@@ -541,13 +586,32 @@ async def test_on_ready_writes_guild_emojis_key(bot, mock_redis, on_ready_env) -
     with patch("services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock):
         await bot.on_ready()
 
-    mock_redis.set_json.assert_any_call(
+    _pipe(mock_redis).set.assert_any_call(
         CacheKeys.discord_guild_emojis(str(guild.id)),
-        [{"id": "9001", "name": "wave", "animated": False}],
-        CacheTTL.DISCORD_GUILD_EMOJIS,
+        json.dumps([{"id": "9001", "name": "wave", "animated": False}]),
+        ex=CacheTTL.DISCORD_GUILD_EMOJIS,
     )
 
 
+async def test_rebuild_guild_channel_cache_pipelines_each_guild(bot, mock_redis) -> None:
+    """The rebuild sends one pipeline per guild and a single full L1 invalidation."""
+    guilds = [_make_guild(111, "One"), _make_guild(222, "Two")]
+    bot._writes = MagicMock(spec=GatewayWriteBatcher)
+
+    with (
+        patch.object(type(bot), "guilds", new_callable=PropertyMock, return_value=guilds),
+        patch("services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis),
+    ):
+        await bot._rebuild_guild_channel_cache()
+
+    bot._writes.flush.assert_awaited_once()
+    assert mock_redis._client.pipeline.call_count == 2
+    mock_redis._client.pipeline.assert_called_with(transaction=False)
+    assert _pipe(mock_redis).execute.await_count == 2
+    mock_redis.set_json.assert_not_called()
+    mock_redis.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, INVALIDATE_ALL)
+
+
 # ---------------------------------------------------------------------------
 # Direct tests for _restore_recurrence_confirmation_views
 # ---------------------------------------------------------------------------
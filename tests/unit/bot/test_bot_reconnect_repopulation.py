@@ -27,6 +27,7 @@ import discord
 import pytest
 
 from services.bot.bot import GameSchedulerBot
+from services.bot.write_batcher import GatewayWriteBatcher
 
 
 def _make_bot() -> GameSchedulerBot:
@@ -40,6 +41,9 @@ def _make_bot() -> GameSchedulerBot:
     instance.api_cache = None
     instance._sweep_task = None
     instance._disconnected_at = None
+    instance._projection_ready = False
+    instance._projection_gen = None
+    instance._writes = GatewayWriteBatcher()
     instance._refresh_listener_started = True
     return instance
 
@@ -71,14 +75,40 @@ class TestOnResumedRepopulation:
 
         mock_repopulate.assert_awaited_once_with(bot=bot, redis=mock_redis)
 
+    @pytest.mark.asyncio
+    async def test_on_resumed_flushes_writes_and_adopts_new_gen(self) -> None:
+        """Buffered writes land before the rebuild and the new generation is remembered."""
+        bot = _make_bot()
+        bot._projection_gen = "old"
+        bot._writes = MagicMock(spec=GatewayWriteBatcher)
+        order: list[str] = []
+        bot._writes.flush = AsyncMock(side_effect=lambda: order.append("flush"))
+
+        async def repopulate(**_kwargs: object) -> str:
+            order.append("repopulate")
+            return "new"
+
+        with (
+            patch("services.bot.bot.get_redis_client", new_callable=AsyncMock),
+            patch("services.bot.bot.guild_projection.repopulate_all", side_effect=repopulate),
+            patch.object(bot, "_recover_pending_workers", new_callable=AsyncMock),
+            patch.object(bot, "_trigger_sweep", new_callable=AsyncMock),
+            patch.object(bot, "_sweep_orphaned_embeds", new_callable=AsyncMock),
+        ):
+            await bot.on_resumed()
+
+        assert order == ["flush", "repopulate"]
+        assert bot._projection_gen == "new"
+
 
 class TestOnGuildAvailableRepopulation:
-    """on_guild_available triggers repopulate_all when a guild recovers from an outage."""
+    """on_guild_available rewrites only the recovered guild's projection."""
 
     @pytest.mark.asyncio
-    async def test_on_guild_available_triggers_repopulate_all(self) -> None:
-        """on_guild_available calls guild_projection.repopulate_all with bot and redis."""
+    async def test_on_guild_available_triggers_repopulate_guild(self) -> None:
+        """on_guild_available calls guild_projection.repopulate_guild for that guild only."""
         bot = _make_bot()
+        bot._projection_ready = True
         guild = MagicMock(spec=discord.Guild)
         guild.id = 111
         mock_redis = AsyncMock()
@@ -89,11 +119,111 @@ class TestOnGuildAvailableRepopulation:
                 new_callable=AsyncMock,
                 return_value=mock_redis,
             ),
+            patch(
+                "services.bot.bot.guild_projection.repopulate_guild",
+                new_callable=AsyncMock,
+                return_value=True,
+            ) as mock_repopulate_guild,
             patch(
                 "services.bot.bot.guild_projection.repopulate_all",
                 new_callable=AsyncMock,
-            ) as mock_repopulate,
+            ) as mock_repopulate_all,
         ):
             await bot.on_guild_available(guild)
 
-        mock_repopulate.assert_awaited_once_with(bot=bot, redis=mock_redis)
+        mock_repopulate_guild.assert_awaited_once_with(guild, redis=mock_redis)
+        mock_repopulate_all.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_on_guild_available_falls_back_to_repopulate_all_without_gen(self) -> None:
+        """When no generation exists, on_guild_available performs a full rebuild."""
+        bot = _make_bot()
+        bot._projection_ready = True
+        guild = MagicMock(spec=discord.Guild)
+        guild.id = 111
+        mock_redis = AsyncMock()
+
+        with (
+            patch(
+                "services.bot.bot.get_redis_client",
+                new_callable=AsyncMock,
+                return_value=mock_redis,
+            ),
+            patch(
+                "services.bot.bot.guild_projection.repopulate_guild",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            patch(
+                "services.bot.bot.guild_projection.repopulate_all",
+                new_callable=AsyncMock,
+            ) as mock_repopulate_all,
+        ):
+            await bot.on_guild_available(guild)
+
+        mock_repopulate_all.assert_awaited_once_with(bot=bot, redis=mock_redis)
+
+    @pytest.mark.asyncio
+    async def test_on_guild_available_deferred_before_initial_repopulation(self) -> None:
+        """Guild events during connect are skipped; on_ready's full rebuild covers them."""
+        bot = _make_bot()
+        guild = MagicMock(spec=discord.Guild)
+        guild.id = 111
+
+        with (
+            patch(
+                "services.bot.bot.get_redis_client",
+                new_callable=AsyncMock,
+            ) as mock_get_redis,
+            patch(
+                "services.bot.bot.guild_projection.repopulate_guild",
+                new_callable=AsyncMock,
+            ) as mock_repopulate_guild,
+            patch(
+                "services.bot.bot.guild_projection.repopulate_all",
+                new_callable=AsyncMock,
+            ) as mock_repopulate_all,
+        ):
+            await bot.on_guild_available(guild)
+
+        mock_get_redis.assert_not_awaited()
+        mock_repopulate_guild.assert_not_awaited()
+        mock_repopulate_all.assert_not_awaited()
+
+
+class TestProjectionReadyFlag:
+    """The projection-ready flag tracks whether a full rebuild has completed."""
+
+    @pytest.mark.asyncio
+    async def test_on_disconnect_clears_flag(self) -> None:
+        """on_disconnect marks the projection as needing a full rebuild."""
+        bot = _make_bot()
+        bot._projection_ready = True
+
+        with patch("services.bot.bot.logger"):
+            await bot.on_disconnect()
+
+        assert bot._projection_ready is False
+
+    @pytest.mark.asyncio
+    async def test_on_resumed_sets_flag(self) -> None:
+        """on_resumed marks the projection ready after its full rebuild."""
+        bot = _make_bot()
+
+        with (
+            patch(
+                "services.bot.bot.get_redis_client",
+                new_callable=AsyncMock,
+                return_value=AsyncMock(),
+            ),
+            patch(
+                "services.bot.bot.guild_projection.repopulate_all",
+                new_callable=AsyncMock,
+            ),
+            patch.object(bot, "_recover_pending_workers", new_callable=AsyncMock),
+            patch.object(bot, "_trigger_sweep", new_callable=AsyncMock),
+            patch.object(bot, "_sweep_orphaned_embeds", new_callable=AsyncMock),
+        ):
+            await bot.on_resumed()
+
+        assert bot._projection_ready is True
@@ -36,6 +36,7 @@ from services.bot.guild_projection import (
     write_user_guilds,
 )
 from shared.cache.keys import CacheKeys
+from shared.cache.member_record import decode_member_record
 from shared.cache.operations import read_projection_key
 
 
@@ -63,13 +64,13 @@ class TestWriteMember:
         )
 
         # Verify the key was set
-        redis.set_json.assert_called_once()
-        call_args = redis.set_json.call_args
+        redis.set.assert_called_once()
+        call_args = redis.set.call_args
         assert call_args[0][0] == CacheKeys.proj_member("gen123", "guild456", "user789")
         assert call_args[1]["ttl"] is None
 
         # Verify the data structure
-        data = call_args[0][1]
+        data = decode_member_record(call_args[0][1], "user789")
         assert "roles" in data
         assert "nick" in data
         assert "global_name" in data
@@ -95,8 +96,8 @@ class TestWriteMember:
             member=member,
         )
 
-        redis.set_json.assert_called_once()
-        data = redis.set_json.call_args[0][1]
+        redis.set.assert_called_once()
+        data = decode_member_record(redis.set.call_args[0][1], "user789")
         assert data["avatar_url"] is None
 
     @pytest.mark.asyncio
@@ -551,7 +552,7 @@ class TestGetUserRoles:
 
 
 class TestQueueMemberToPipe:
-    """Xfail tests for the synchronous _queue_member_to_pipe pipeline helper."""
+    """Tests for the synchronous _queue_member_to_pipe pipeline helper."""
 
     def test_sets_member_key_with_json_data(self):
         """_queue_member_to_pipe calls pipe.set with the correct member key and JSON payload."""
@@ -572,13 +573,13 @@ class TestQueueMemberToPipe:
         assert expected_key in set_keys
         matching = [call for call in pipe.set.call_args_list if call[0][0] == expected_key]
         assert len(matching) == 1
-        stored = json.loads(matching[0][0][1])
+        stored = decode_member_record(matching[0][0][1], "user1")
         assert stored["username"] == "username"
         assert stored["nick"] == "Nick"
         assert stored["avatar_url"] is None
 
-    def test_queues_zadd_for_each_name_variant(self):
-        """_queue_member_to_pipe calls pipe.zadd for each distinct lowercase name variant."""
+    def test_returns_entry_for_each_name_variant(self):
+        """_queue_member_to_pipe returns one usernames entry per distinct lowercase variant."""
         from services.bot.guild_projection import _queue_member_to_pipe  # noqa: PLC0415
 
         pipe = MagicMock()
@@ -589,16 +590,10 @@ class TestQueueMemberToPipe:
         member.name = "username"
         member.avatar = None
 
-        _queue_member_to_pipe(pipe, "gen1", "guild1", "user1", member)
+        entries = _queue_member_to_pipe(pipe, "gen1", "guild1", "user1", member)
 
-        usernames_key = CacheKeys.proj_usernames("gen1", "guild1")
-        zadd_calls = pipe.zadd.call_args_list
-        zadd_keys = [call[0][0] for call in zadd_calls]
-        assert all(k == usernames_key for k in zadd_keys)
-        all_entries = {next(iter(call[0][1].keys())) for call in zadd_calls}
-        assert "username\x00user1" in all_entries
-        assert "global name\x00user1" in all_entries
-        assert "nickname\x00user1" in all_entries
+        assert set(entries) == {"username\x00user1", "global name\x00user1", "nickname\x00user1"}
+        pipe.zadd.assert_not_called()
 
     def test_deduplicates_when_name_equals_username(self):
         """_queue_member_to_pipe deduplicates when global_name matches username."""
@@ -612,11 +607,9 @@ class TestQueueMemberToPipe:
         member.name = "sameuser"
         member.avatar = None
 
-        _queue_member_to_pipe(pipe, "gen1", "guild1", "user1", member)
+        entries = _queue_member_to_pipe(pipe, "gen1", "guild1", "user1", member)
 
-        zadd_calls = pipe.zadd.call_args_list
-        all_entries = {next(iter(call[0][1].keys())) for call in zadd_calls}
-        assert len([e for e in all_entries if e.split("\x00")[0] == "sameuser"]) == 1
+        assert entries == ["sameuser\x00user1"]
 
 
 class TestQueueUserGuildsToPipe:
@@ -740,3 +733,199 @@ class TestRepopulateAllUsesPipeline:
         assert len(gen_flip_calls) == 1
         pipe_set_keys = [call[0][0] for call in pipe.set.call_args_list]
         assert CacheKeys.proj_gen() not in pipe_set_keys
+
+
+class TestChunkedRebuild:
+    """repopulate_all streams writes in bounded pipeline chunks."""
+
+    @staticmethod
+    def _make_member(uid: int, name: str, nick: str | None = None) -> MagicMock:
+        member = MagicMock(spec=discord.Member)
+        member.id = uid
+        member.roles = []
+        member.nick = nick
+        member.global_name = None
+        member.name = name
+        member.avatar = None
+        return member
+
+    @staticmethod
+    def _make_redis():
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=None)
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        mock_client = MagicMock()
+        mock_client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        mock_client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_client.scan = AsyncMock(return_value=(0, []))
+        redis._client = mock_client
+        return redis, pipe
+
+    def _make_bot(self, guild_sizes: list[int]) -> MagicMock:
+        bot = MagicMock(spec=discord.Client)
+        guilds = []
+        for g, size in enumerate(guild_sizes):
+            guild = MagicMock(spec=discord.Guild)
+            guild.id = 100 + g
+            guild.name = f"Guild {g}"
+            guild.members = [self._make_member(1000 + i, f"user{i}", "nick") for i in range(size)]
+            guilds.append(guild)
+        bot.guilds = guilds
+        return bot
+
+    @pytest.mark.asyncio
+    async def test_flushes_every_k_commands(self):
+        """The pipeline is executed once per chunk rather than once for everything."""
+        redis, pipe = self._make_redis()
+        bot = self._make_bot([25])
+
+        with patch("services.bot.guild_projection._PIPELINE_FLUSH_COMMANDS", 10):
+            await repopulate_all(bot=bot, redis=redis)
+
+        assert pipe.execute.await_count > 1
+        assert pipe.set.call_count == 1 + 25 + 25
+
+    @pytest.mark.asyncio
+    async def test_zadd_batched_per_guild(self):
+        """Username entries go out as one multi-member ZADD per guild when under K."""
+        redis, pipe = self._make_redis()
+        bot = self._make_bot([3, 2])
+
+        await repopulate_all(bot=bot, redis=redis)
+
+        assert pipe.zadd.call_count == 2
+        first_key, first_entries = pipe.zadd.call_args_list[0][0]
+        assert first_key.endswith(":100")
+        assert len(first_entries) == 6
+        second_key, second_entries = pipe.zadd.call_args_list[1][0]
+        assert second_key.endswith(":101")
+        assert "user0\x001000" in second_entries
+
+    @pytest.mark.asyncio
+    async def test_user_guilds_aggregates_across_guilds(self):
+        """A member present in two guilds gets both guild ids in one user_guilds write."""
+        redis, pipe = self._make_redis()
+        bot = self._make_bot([2, 1])
+
+        await repopulate_all(bot=bot, redis=redis)
+
+        user_guild_sets = {
+            call[0][0]: json.loads(call[0][1])
+            for call in pipe.set.call_args_list
+            if call[0][0].startswith("proj:user_guilds:")
+        }
+        assert len(user_guild_sets) == 2
+        shared = next(v for k, v in user_guild_sets.items() if k.endswith(":1000"))
+        assert shared == ["100", "101"]
+
+    @pytest.mark.asyncio
+    async def test_yields_to_event_loop_between_chunks(self):
+        """Each flush is followed by an event-loop yield."""
+        redis, _pipe = self._make_redis()
+        bot = self._make_bot([25])
+
+        with (
+            patch("services.bot.guild_projection._PIPELINE_FLUSH_COMMANDS", 10),
+            patch(
+                "services.bot.guild_projection.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep,
+        ):
+            await repopulate_all(bot=bot, redis=redis)
+
+        assert mock_sleep.await_count >= 2
+        mock_sleep.assert_awaited_with(0)
+
+    @pytest.mark.asyncio
+    async def test_records_peak_memory_and_flush_gauges(self):
+        """Peak memory and pipeline flush count are exported with the other repopulation gauges."""
+        redis, _pipe = self._make_redis()
+        bot = self._make_bot([25])
+        rss_samples = iter([1000, 1500, 4000, 2500, 2000])
+
+        with (
+            patch("services.bot.guild_projection._PIPELINE_FLUSH_COMMANDS", 10),
+            patch(
+                "services.bot.guild_projection._current_rss_bytes",
+                side_effect=lambda: next(rss_samples, 2000),
+            ),
+            patch("services.bot.guild_projection.repopulation_peak_memory_gauge") as mock_mem,
+            patch("services.bot.guild_projection.repopulation_pipeline_flushes_gauge") as mock_fl,
+        ):
+            await repopulate_all(bot=bot, redis=redis)
+
+        mock_mem.set.assert_called_once_with(3000)
+        mock_fl.set.assert_called_once()
+        assert mock_fl.set.call_args[0][0] > 1
+
+    @pytest.mark.asyncio
+    async def test_peak_memory_reflects_this_rebuild_only(self):
+        """A rebuild after an earlier spike reports its own growth, not the spike."""
+        redis, _pipe = self._make_redis()
+        bot = self._make_bot([25])
+
+        with (
+            patch("services.bot.guild_projection._PIPELINE_FLUSH_COMMANDS", 10),
+            patch("services.bot.guild_projection._current_rss_bytes", return_value=5000),
+            patch("services.bot.guild_projection.repopulation_peak_memory_gauge") as mock_mem,
+        ):
+            await repopulate_all(bot=bot, redis=redis)
+
+        mock_mem.set.assert_called_once_with(0)
+
+    @pytest.mark.asyncio
+    async def test_peak_memory_skipped_without_rss(self):
+        """Where resident memory cannot be read, the gauge is not set."""
+        redis, _pipe = self._make_redis()
+        bot = self._make_bot([25])
+
+        with (
+            patch("services.bot.guild_projection._current_rss_bytes", return_value=None),
+            patch("services.bot.guild_projection.repopulation_peak_memory_gauge") as mock_mem,
+        ):
+            await repopulate_all(bot=bot, redis=redis)
+
+        mock_mem.set.assert_not_called()
+
+
+class TestEncodeMember:
+    """_encode_member writes the compact record when it round-trips exactly."""
+
+    @staticmethod
+    def _make_member(avatar: MagicMock | None) -> MagicMock:
+        member = MagicMock(spec=discord.Member)
+        member.id = 42
+        member.roles = [MagicMock(id=111), MagicMock(id=222)]
+        member.nick = "Nick"
+        member.global_name = "Global"
+        member.name = "user"
+        member.avatar = avatar
+        return member
+
+    def test_uses_compact_record_for_standard_avatar(self):
+        """A standard avatar hash is stored compactly and decodes to the original URL."""
+        from services.bot.guild_projection import _encode_member  # noqa: PLC0415
+
+        avatar_hash = "0123456789abcdef0123456789abcdef"
+        avatar = MagicMock()
+        avatar.key = avatar_hash
+        avatar.url = f"https://cdn.discordapp.com/avatars/42/{avatar_hash}.png?size=1024"
+
+        encoded = _encode_member(self._make_member(avatar))
+
+        assert not encoded.startswith("{")
+        decoded = decode_member_record(encoded, "42")
+        assert decoded["avatar_url"] == avatar.url
+        assert decoded["roles"] == ["111", "222"]
+
+    def test_falls_back_to_json_when_url_does_not_round_trip(self):
+        """An avatar URL that can't be rebuilt from its hash keeps the JSON layout."""
+        from services.bot.guild_projection import _encode_member  # noqa: PLC0415
+
+        avatar = MagicMock()
+        avatar.key = "0123456789abcdef0123456789abcdef"
+        avatar.url = "https://example.com/custom.png"
+
+        encoded = _encode_member(self._make_member(avatar))
+
+        assert json.loads(encoded)["avatar_url"] == "https://example.com/custom.png"
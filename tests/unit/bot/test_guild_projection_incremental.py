@@ -21,7 +21,6 @@
 
 """Unit tests for incremental projection update functions."""
 
-import json
 from contextlib import asynccontextmanager
 from unittest.mock import ANY, AsyncMock, MagicMock, PropertyMock, patch
 
@@ -30,13 +29,19 @@ import pytest
 
 from services.bot.bot import GameSchedulerBot
 from services.bot.guild_projection import (
+    _PATCH_USER_GUILDS_LUA,
+    _PIPELINE_FLUSH_COMMANDS,
     _user_global_variants,
     add_member,
+    remove_guild,
     remove_member,
+    repopulate_guild,
     update_member,
     update_user,
 )
+from services.bot.write_batcher import GatewayWriteBatcher
 from shared.cache.keys import CacheKeys
+from shared.cache.member_record import decode_member_record
 
 
 def _make_pipeline_mock() -> MagicMock:
@@ -102,7 +107,7 @@ class TestUpdateMember:
         pipe.set.assert_called_once()
         actual_key, actual_val = pipe.set.call_args[0]
         assert actual_key == expected_key
-        data = json.loads(actual_val)
+        data = decode_member_record(actual_val, "1001")
         role_ids = data["roles"]
         assert "9001" in role_ids
         assert "9002" in role_ids
@@ -187,15 +192,18 @@ def _make_bot() -> GameSchedulerBot:
     instance._sweep_task = None
     instance._disconnected_at = None
     instance._refresh_listener_started = True
+    instance._projection_ready = False
+    instance._projection_gen = None
+    instance._writes = GatewayWriteBatcher()
     return instance
 
 
 class TestOnMemberUpdateHandler:
-    """on_member_update calls update_member with the current gen."""
+    """on_member_update queues the member's writes with the current gen."""
 
     @pytest.mark.asyncio
     async def test_calls_update_member_with_current_gen(self) -> None:
-        """on_member_update fetches gen and delegates to guild_projection.update_member."""
+        """on_member_update fetches gen and queues the update on the write batcher."""
         bot = _make_bot()
         before = MagicMock(spec=discord.Member)
         after = MagicMock(spec=discord.Member)
@@ -206,13 +214,11 @@ class TestOnMemberUpdateHandler:
             patch(
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
-            patch(
-                "services.bot.bot.guild_projection.update_member", new_callable=AsyncMock
-            ) as mock_update,
+            patch("services.bot.bot.guild_projection.queue_member_update") as mock_update,
         ):
             await bot.on_member_update(before, after)
 
-        mock_update.assert_awaited_once_with("gen42", before, after, redis=mock_redis)
+        mock_update.assert_called_once_with(bot._writes, "gen42", before, after)
 
     @pytest.mark.asyncio
     async def test_returns_early_when_gen_is_none(self) -> None:
@@ -227,21 +233,19 @@ class TestOnMemberUpdateHandler:
             patch(
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
-            patch(
-                "services.bot.bot.guild_projection.update_member", new_callable=AsyncMock
-            ) as mock_update,
+            patch("services.bot.bot.guild_projection.queue_member_update") as mock_update,
         ):
             await bot.on_member_update(before, after)
 
-        mock_update.assert_not_awaited()
+        mock_update.assert_not_called()
 
 
 class TestOnUserUpdateHandler:
-    """on_user_update delegates to guild_projection.update_user with the current gen."""
+    """on_user_update queues the user's writes with the current gen."""
 
     @pytest.mark.asyncio
     async def test_calls_update_user_with_current_gen(self) -> None:
-        """on_user_update fetches gen and delegates to guild_projection.update_user."""
+        """on_user_update fetches gen and queues the update on the write batcher."""
         bot = _make_bot()
         before = MagicMock(spec=discord.User)
         after = MagicMock(spec=discord.User)
@@ -252,14 +256,12 @@ class TestOnUserUpdateHandler:
             patch(
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
-            patch(
-                "services.bot.bot.guild_projection.update_user", new_callable=AsyncMock
-            ) as mock_update,
+            patch("services.bot.bot.guild_projection.queue_user_update") as mock_update,
             patch.object(type(bot), "guilds", new_callable=PropertyMock, return_value=[]),
         ):
             await bot.on_user_update(before, after)
 
-        mock_update.assert_awaited_once_with("gen99", before, after, ANY, redis=mock_redis)
+        mock_update.assert_called_once_with(bot._writes, "gen99", before, after, ANY)
 
     @pytest.mark.asyncio
     async def test_returns_early_when_gen_is_none(self) -> None:
@@ -274,13 +276,11 @@ class TestOnUserUpdateHandler:
             patch(
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
-            patch(
-                "services.bot.bot.guild_projection.update_user", new_callable=AsyncMock
-            ) as mock_update,
+            patch("services.bot.bot.guild_projection.queue_user_update") as mock_update,
         ):
             await bot.on_user_update(before, after)
 
-        mock_update.assert_not_awaited()
+        mock_update.assert_not_called()
 
 
 class TestUserGlobalVariants:
@@ -455,7 +455,6 @@ class TestAddMember:
         """add_member sets the proj:member key with member data."""
         pipe = _make_pipeline_mock()
         redis = _make_redis_mock(pipe)
-        redis.get = AsyncMock(return_value=None)
 
         member = _make_member(1001, "alice", "Alice Smith", "ali", [9001])
 
@@ -465,30 +464,25 @@ class TestAddMember:
         assert CacheKeys.proj_member("gen1", "111", "1001") in set_keys
 
     @pytest.mark.asyncio
-    async def test_appends_guild_to_user_guilds(self) -> None:
-        """add_member appends the new guild_id to proj:user_guilds."""
-
+    async def test_patches_guild_into_user_guilds(self) -> None:
+        """add_member adds the guild to proj:user_guilds with the patch script, not a SET."""
         pipe = _make_pipeline_mock()
         redis = _make_redis_mock(pipe)
-        redis.get = AsyncMock(return_value=json.dumps(["999"]))
 
         member = _make_member(1001, "alice", "Alice Smith", "ali", [9001])
 
         await add_member("gen1", member, redis=redis)
 
-        set_calls = {call[0][0]: call[0][1] for call in pipe.set.call_args_list}
         guilds_key = CacheKeys.proj_user_guilds("gen1", "1001")
-        assert guilds_key in set_calls
-        guilds = json.loads(set_calls[guilds_key])
-        assert "111" in guilds
-        assert "999" in guilds
+        assert _user_guilds_patches(pipe) == {guilds_key: ("111", "1")}
+        assert guilds_key not in _set_calls(pipe)
+        redis.get.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_zadds_username_variants(self) -> None:
         """add_member ZADDs all username variants into the sorted set."""
         pipe = _make_pipeline_mock()
         redis = _make_redis_mock(pipe)
-        redis.get = AsyncMock(return_value=None)
 
         member = _make_member(1001, "alice", "Alice Smith", "ali", [9001])
 
@@ -508,7 +502,6 @@ class TestAddMember:
         """add_member always awaits pipe.execute()."""
         pipe = _make_pipeline_mock()
         redis = _make_redis_mock(pipe)
-        redis.get = AsyncMock(return_value=None)
 
         member = _make_member(1001, "alice", "Alice Smith", "ali", [9001])
 
@@ -526,7 +519,6 @@ class TestRemoveMember:
 
         pipe = _make_pipeline_mock()
         redis = _make_redis_mock(pipe)
-        redis.get = AsyncMock(return_value=json.dumps(["111"]))
 
         member = _make_member(1001, "alice", "Alice Smith", "ali", [9001])
 
@@ -536,23 +528,19 @@ class TestRemoveMember:
         assert CacheKeys.proj_member("gen1", "111", "1001") in deleted_keys
 
     @pytest.mark.asyncio
-    async def test_removes_guild_from_user_guilds(self) -> None:
-        """remove_member removes the guild_id from proj:user_guilds."""
-
+    async def test_patches_guild_out_of_user_guilds(self) -> None:
+        """remove_member removes the guild from proj:user_guilds with the patch script."""
         pipe = _make_pipeline_mock()
         redis = _make_redis_mock(pipe)
-        redis.get = AsyncMock(return_value=json.dumps(["111", "222"]))
 
         member = _make_member(1001, "alice", "Alice Smith", "ali", [9001])
 
         await remove_member("gen1", member, redis=redis)
 
-        set_calls = {call[0][0]: call[0][1] for call in pipe.set.call_args_list}
         guilds_key = CacheKeys.proj_user_guilds("gen1", "1001")
-        assert guilds_key in set_calls
-        guilds = json.loads(set_calls[guilds_key])
-        assert "111" not in guilds
-        assert "222" in guilds
+        assert _user_guilds_patches(pipe) == {guilds_key: ("111", "0")}
+        assert guilds_key not in _set_calls(pipe)
+        redis.get.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_zrems_username_variants(self) -> None:
@@ -560,7 +548,6 @@ class TestRemoveMember:
 
         pipe = _make_pipeline_mock()
         redis = _make_redis_mock(pipe)
-        redis.get = AsyncMock(return_value=json.dumps(["111"]))
 
         member = _make_member(1001, "alice", "Alice Smith", "ali", [9001])
 
@@ -581,7 +568,6 @@ class TestRemoveMember:
 
         pipe = _make_pipeline_mock()
         redis = _make_redis_mock(pipe)
-        redis.get = AsyncMock(return_value=json.dumps(["111"]))
 
         member = _make_member(1001, "alice", "Alice Smith", "ali", [9001])
 
@@ -591,11 +577,11 @@ class TestRemoveMember:
 
 
 class TestOnMemberAddHandler:
-    """on_member_add delegates to guild_projection.add_member with the current gen."""
+    """on_member_add queues the member's writes with the current gen."""
 
     @pytest.mark.asyncio
     async def test_calls_add_member_with_current_gen(self) -> None:
-        """on_member_add fetches gen and delegates to guild_projection.add_member."""
+        """on_member_add reads gen, then queues the add."""
         bot = _make_bot()
         member = MagicMock(spec=discord.Member)
         mock_redis = AsyncMock()
@@ -605,13 +591,11 @@ class TestOnMemberAddHandler:
             patch(
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
-            patch(
-                "services.bot.bot.guild_projection.add_member", new_callable=AsyncMock
-            ) as mock_add,
+            patch("services.bot.bot.guild_projection.queue_member_add") as mock_add,
         ):
             await bot.on_member_add(member)
 
-        mock_add.assert_awaited_once_with("gen7", member, redis=mock_redis)
+        mock_add.assert_called_once_with(bot._writes, "gen7", member)
 
     @pytest.mark.asyncio
     async def test_returns_early_when_gen_is_none(self) -> None:
@@ -625,21 +609,19 @@ class TestOnMemberAddHandler:
             patch(
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
-            patch(
-                "services.bot.bot.guild_projection.add_member", new_callable=AsyncMock
-            ) as mock_add,
+            patch("services.bot.bot.guild_projection.queue_member_add") as mock_add,
         ):
             await bot.on_member_add(member)
 
-        mock_add.assert_not_awaited()
+        mock_add.assert_not_called()
 
 
 class TestOnMemberRemoveHandler:
-    """on_member_remove delegates to guild_projection.remove_member with the current gen."""
+    """on_member_remove queues the member's writes with the current gen."""
 
     @pytest.mark.asyncio
     async def test_calls_remove_member_with_current_gen(self) -> None:
-        """on_member_remove fetches gen and delegates to guild_projection.remove_member."""
+        """on_member_remove reads gen, then queues the removal."""
         bot = _make_bot()
         member = MagicMock(spec=discord.Member)
         mock_redis = AsyncMock()
@@ -649,13 +631,11 @@ class TestOnMemberRemoveHandler:
             patch(
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
-            patch(
-                "services.bot.bot.guild_projection.remove_member", new_callable=AsyncMock
-            ) as mock_remove,
+            patch("services.bot.bot.guild_projection.queue_member_remove") as mock_remove,
         ):
             await bot.on_member_remove(member)
 
-        mock_remove.assert_awaited_once_with("gen8", member, redis=mock_redis)
+        mock_remove.assert_called_once_with(bot._writes, "gen8", member)
 
     @pytest.mark.asyncio
     async def test_returns_early_when_gen_is_none(self) -> None:
@@ -669,10 +649,271 @@ class TestOnMemberRemoveHandler:
             patch(
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
-            patch(
-                "services.bot.bot.guild_projection.remove_member", new_callable=AsyncMock
-            ) as mock_remove,
+            patch("services.bot.bot.guild_projection.queue_member_remove") as mock_remove,
         ):
             await bot.on_member_remove(member)
 
-        mock_remove.assert_not_awaited()
+        mock_remove.assert_not_called()
+
+
+class TestHandlerProjectionGen:
+    """Member handlers reuse the generation once the projection has been rebuilt."""
+
+    @pytest.mark.asyncio
+    async def test_gen_read_once_when_projection_ready(self) -> None:
+        """After a full rebuild the in-memory generation is reused without a Redis read."""
+        bot = _make_bot()
+        bot._projection_ready = True
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value="gen5")
+
+        with (
+            patch(
+                "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
+            ),
+            patch("services.bot.bot.guild_projection.queue_member_update") as mock_update,
+        ):
+            await bot.on_member_update(MagicMock(), MagicMock())
+            await bot.on_member_update(MagicMock(), MagicMock())
+
+        mock_redis.get.assert_awaited_once_with(CacheKeys.proj_gen())
+        assert [c.args[1] for c in mock_update.call_args_list] == ["gen5", "gen5"]
+
+    @pytest.mark.asyncio
+    async def test_gen_not_cached_before_projection_ready(self) -> None:
+        """Until the projection is rebuilt every event re-reads the generation pointer."""
+        bot = _make_bot()
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value="gen5")
+
+        with (
+            patch(
+                "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
+            ),
+            patch("services.bot.bot.guild_projection.queue_member_update"),
+        ):
+            await bot.on_member_update(MagicMock(), MagicMock())
+            await bot.on_member_update(MagicMock(), MagicMock())
+
+        assert mock_redis.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_member_adds_in_one_batch_patch_the_guild_list_in_order(self) -> None:
+        """Two joins before the batch flushes each patch the user's guild list in place."""
+        bot = _make_bot()
+        bot._projection_gen = "gen1"
+        pipe = _make_pipeline_mock()
+        mock_redis = _make_redis_mock(pipe)
+        first = _make_member(1001, "alice", None, None, [], guild_id=111)
+        second = _make_member(1001, "alice", None, None, [], guild_id=222)
+        guilds_key = CacheKeys.proj_user_guilds("gen1", "1001")
+
+        with (
+            patch(
+                "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
+            ),
+            patch(
+                "services.bot.write_batcher.get_redis_client",
+                new_callable=AsyncMock,
+                return_value=mock_redis,
+            ),
+        ):
+            await bot.on_member_add(first)
+            await bot.on_member_add(second)
+            await bot._writes.flush()
+
+        assert [c.args for c in pipe.eval.call_args_list] == [
+            (_PATCH_USER_GUILDS_LUA, 1, guilds_key, "111", "1"),
+            (_PATCH_USER_GUILDS_LUA, 1, guilds_key, "222", "1"),
+        ]
+        assert guilds_key not in _set_calls(pipe)
+        pipe.execute.assert_awaited_once()
+
+
+def _make_guild(guild_id: int, name: str, members: list[MagicMock]) -> MagicMock:
+    guild = MagicMock(spec=discord.Guild)
+    guild.id = guild_id
+    guild.name = name
+    guild.members = members
+    return guild
+
+
+def _make_guild_redis_mock(
+    pipe: MagicMock,
+    gen: str | None,
+    existing_entries: list[str],
+    user_guilds: dict[str, list[str]],
+) -> MagicMock:
+    """Return a mock RedisClient seeded with a gen, usernames entries and user_guilds lists."""
+    redis = _make_redis_mock(pipe)
+    redis.get = AsyncMock(return_value=gen)
+    redis._client.zrange = AsyncMock(return_value=existing_entries)
+    return redis
+
+
+def _set_calls(pipe: MagicMock) -> dict[str, str]:
+    return {call[0][0]: call[0][1] for call in pipe.set.call_args_list}
+
+
+def _user_guilds_patches(pipe: MagicMock) -> dict[str, tuple[str, str]]:
+    """Map each proj:user_guilds key passed to the patch script to (guild_id, op)."""
+    patches: dict[str, tuple[str, str]] = {}
+    for call in pipe.eval.call_args_list:
+        script, numkeys, *rest = call.args
+        assert script == _PATCH_USER_GUILDS_LUA
+        keys, guild_id, ops = rest[:numkeys], rest[numkeys], rest[numkeys + 1 :]
+        patches.update((key, (guild_id, op)) for key, op in zip(keys, ops, strict=True))
+    return patches
+
+
+class TestRepopulateGuild:
+    """repopulate_guild rewrites one guild in place within the current generation."""
+
+    @pytest.mark.asyncio
+    async def test_returns_false_without_gen(self) -> None:
+        """Without a generation pointer nothing is written and the caller must fall back."""
+        pipe = _make_pipeline_mock()
+        redis = _make_guild_redis_mock(pipe, None, [], {})
+        guild = _make_guild(111, "Guild", [_make_member(1001, "alice", None, None, [])])
+
+        assert await repopulate_guild(guild, redis=redis) is False
+
+        pipe.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_writes_members_into_current_gen(self) -> None:
+        """Member keys, guild name and a single batched ZADD target the current gen."""
+        pipe = _make_pipeline_mock()
+        redis = _make_guild_redis_mock(pipe, "gen1", [], {})
+        guild = _make_guild(
+            111,
+            "Guild",
+            [
+                _make_member(1001, "alice", "Alice", None, [9001]),
+                _make_member(1002, "bob", None, None, []),
+            ],
+        )
+
+        assert await repopulate_guild(guild, redis=redis) is True
+
+        sets = _set_calls(pipe)
+        assert CacheKeys.proj_member("gen1", "111", "1001") in sets
+        assert CacheKeys.proj_member("gen1", "111", "1002") in sets
+        assert sets[CacheKeys.proj_guild_name("gen1", "111")] == "Guild"
+        pipe.zadd.assert_called_once()
+        key, entries = pipe.zadd.call_args[0]
+        assert key == CacheKeys.proj_usernames("gen1", "111")
+        assert set(entries) == {"alice\x001001", "bob\x001002"}
+
+    @pytest.mark.asyncio
+    async def test_removes_stale_members_and_entries(self) -> None:
+        """Members no longer in the guild lose their member key and username entries."""
+        pipe = _make_pipeline_mock()
+        redis = _make_guild_redis_mock(
+            pipe,
+            "gen1",
+            ["alice\x001001", "ally\x001001", "gone\x001009"],
+            {"1009": ["111", "222"]},
+        )
+        guild = _make_guild(111, "Guild", [_make_member(1001, "alice", None, None, [])])
+
+        await repopulate_guild(guild, redis=redis)
+
+        pipe.zrem.assert_called_once()
+        removed = set(pipe.zrem.call_args[0][1:])
+        assert removed == {"ally\x001001", "gone\x001009"}
+        pipe.delete.assert_called_once_with(CacheKeys.proj_member("gen1", "111", "1009"))
+        assert _user_guilds_patches(pipe) == {
+            CacheKeys.proj_user_guilds("gen1", "1009"): ("111", "0"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_patches_user_guilds_only_for_new_members(self) -> None:
+        """Existing members are not re-read; new members get the guild appended."""
+        pipe = _make_pipeline_mock()
+        redis = _make_guild_redis_mock(
+            pipe,
+            "gen1",
+            ["alice\x001001"],
+            {"1002": ["222"]},
+        )
+        guild = _make_guild(
+            111,
+            "Guild",
+            [
+                _make_member(1001, "alice", None, None, []),
+                _make_member(1002, "bob", None, None, []),
+            ],
+        )
+
+        await repopulate_guild(guild, redis=redis)
+
+        assert _user_guilds_patches(pipe) == {
+            CacheKeys.proj_user_guilds("gen1", "1002"): ("111", "1"),
+        }
+        assert CacheKeys.proj_user_guilds("gen1", "1001") not in _set_calls(pipe)
+
+    @pytest.mark.asyncio
+    async def test_does_not_touch_gen_pointer(self) -> None:
+        """repopulate_guild never writes proj:gen."""
+        pipe = _make_pipeline_mock()
+        redis = _make_guild_redis_mock(pipe, "gen1", [], {})
+        redis.set = AsyncMock()
+        guild = _make_guild(111, "Guild", [_make_member(1001, "alice", None, None, [])])
+
+        await repopulate_guild(guild, redis=redis)
+
+        redis.set.assert_not_awaited()
+        assert CacheKeys.proj_gen() not in _set_calls(pipe)
+
+
+class TestRemoveGuild:
+    """remove_guild drops one guild from the current generation."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_guild_keys_and_patches_user_guilds(self) -> None:
+        """Member keys, usernames set and guild name are deleted; user_guilds lose the guild."""
+        pipe = _make_pipeline_mock()
+        redis = _make_guild_redis_mock(
+            pipe,
+            "gen1",
+            ["alice\x001001", "bob\x001002"],
+            {"1001": ["111"], "1002": ["111", "222"]},
+        )
+
+        await remove_guild("111", redis=redis)
+
+        deleted = {call[0][0] for call in pipe.delete.call_args_list}
+        assert deleted == {
+            CacheKeys.proj_member("gen1", "111", "1001"),
+            CacheKeys.proj_member("gen1", "111", "1002"),
+            CacheKeys.proj_usernames("gen1", "111"),
+            CacheKeys.proj_guild_name("gen1", "111"),
+        }
+        assert _user_guilds_patches(pipe) == {
+            CacheKeys.proj_user_guilds("gen1", "1001"): ("111", "0"),
+            CacheKeys.proj_user_guilds("gen1", "1002"): ("111", "0"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_patches_user_guilds_in_chunks(self) -> None:
+        """Large guilds are patched with several script calls in one pipeline."""
+        pipe = _make_pipeline_mock()
+        entries = [f"user{i}\x00{1000 + i}" for i in range(_PIPELINE_FLUSH_COMMANDS + 1)]
+        redis = _make_guild_redis_mock(pipe, "gen1", entries, {})
+
+        await remove_guild("111", redis=redis)
+
+        assert pipe.eval.call_count == 2
+        assert len(_user_guilds_patches(pipe)) == _PIPELINE_FLUSH_COMMANDS + 1
+
+    @pytest.mark.asyncio
+    async def test_noop_without_gen(self) -> None:
+        """Without a generation pointer there is nothing to remove."""
+        pipe = _make_pipeline_mock()
+        redis = _make_guild_redis_mock(pipe, None, [], {})
+
+        await remove_guild("111", redis=redis)
+
+        redis._client.zrange.assert_not_awaited()
+        pipe.execute.assert_not_awaited()
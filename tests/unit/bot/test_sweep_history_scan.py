@@ -0,0 +1,249 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the channel-history mode of the embed deletion sweep."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from services.bot.bot import SWEEP_HISTORY_PAGE_SIZE, GameSchedulerBot, SweepItem
+
+
+@pytest.fixture
+def bot() -> GameSchedulerBot:
+    cfg = MagicMock()
+    cfg.discord_bot_client_id = "123456789"
+    cfg.environment = "test"
+    cfg.embed_sweep_min_outage_seconds = 60
+    with patch("services.bot.bot.discord.Intents"):
+        instance = GameSchedulerBot.__new__(GameSchedulerBot)
+        instance.config = cfg
+        instance.button_handler = None
+        instance.event_handlers = None
+        instance.api_cache = None
+        instance._sweep_task = None
+        instance._disconnected_at = None
+    return instance
+
+
+@pytest.fixture
+def redis() -> AsyncMock:
+    redis = AsyncMock()
+    redis.claim_global_and_channel_slot = AsyncMock(return_value=0)
+    return redis
+
+
+def _channel(message_ids: list[int]) -> MagicMock:
+    """A text channel whose history() pages over message_ids like Discord does."""
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.id = 111
+    ordered = sorted(message_ids)
+
+    def history(
+        *, limit: int, after: discord.Object, oldest_first: bool
+    ) -> AsyncIterator[MagicMock]:
+        assert oldest_first
+
+        async def pages() -> AsyncIterator[MagicMock]:
+            for message_id in [m for m in ordered if m > after.id][:limit]:
+                yield MagicMock(id=message_id)
+
+        return pages()
+
+    channel.history = MagicMock(side_effect=history)
+    channel.fetch_message = AsyncMock()
+    return channel
+
+
+def _items(*message_ids: int) -> list[SweepItem]:
+    return [(datetime(2026, 1, 1, tzinfo=UTC), f"game-{m}", "111", str(m)) for m in message_ids]
+
+
+async def test_scan_cancels_games_missing_from_history(
+    bot: GameSchedulerBot, redis: AsyncMock
+) -> None:
+    """Tracked messages absent from the returned page are treated as deleted."""
+    channel = _channel([1000, 1001, 1003, 1004])
+
+    with (
+        patch.object(bot, "get_channel", return_value=channel),
+        patch.object(bot, "_cancel_missing_embed", new_callable=AsyncMock) as mock_cancel,
+    ):
+        leftover, calls = await bot._scan_channel_for_deleted_embeds(
+            _items(1000, 1002, 1004), redis
+        )
+
+    assert leftover == []
+    assert calls == 1
+    mock_cancel.assert_awaited_once_with("game-1002")
+    channel.fetch_message.assert_not_awaited()
+
+
+async def test_scan_pages_until_newest_tracked_message(
+    bot: GameSchedulerBot, redis: AsyncMock
+) -> None:
+    """Pages continue past full pages and stop once every tracked message is covered."""
+    message_ids = list(range(1000, 1000 + 5 * SWEEP_HISTORY_PAGE_SIZE))
+    channel = _channel(message_ids)
+    third_page = message_ids[2 * SWEEP_HISTORY_PAGE_SIZE :]
+
+    with (
+        patch.object(bot, "get_channel", return_value=channel),
+        patch.object(bot, "_cancel_missing_embed", new_callable=AsyncMock) as mock_cancel,
+    ):
+        leftover, calls = await bot._scan_channel_for_deleted_embeds(
+            _items(1000, 1150, third_page[0], third_page[5], third_page[10]), redis
+        )
+
+    assert leftover == []
+    assert calls == 3
+    assert redis.claim_global_and_channel_slot.await_count == 3
+    mock_cancel.assert_not_awaited()
+
+
+async def test_scan_stops_when_paging_costs_more_than_fetching(
+    bot: GameSchedulerBot, redis: AsyncMock
+) -> None:
+    """Games spread across many pages are handed back for fetch_message."""
+    message_ids = list(range(1000, 1000 + 10 * SWEEP_HISTORY_PAGE_SIZE))
+    channel = _channel(message_ids)
+
+    with (
+        patch.object(bot, "get_channel", return_value=channel),
+        patch.object(bot, "_cancel_missing_embed", new_callable=AsyncMock),
+    ):
+        leftover, calls = await bot._scan_channel_for_deleted_embeds(
+            _items(1000, message_ids[-1]), redis
+        )
+
+    assert calls == 1
+    assert [item[3] for item in leftover] == [str(message_ids[-1])]
+
+
+async def test_scan_without_history_access_falls_back_to_fetch(
+    bot: GameSchedulerBot, redis: AsyncMock
+) -> None:
+    """A Forbidden history read returns every game for fetch_message."""
+    channel = _channel([])
+    channel.history = MagicMock(side_effect=discord.Forbidden(MagicMock(), "Missing Access"))
+    items = _items(1000, 1001)
+
+    with patch.object(bot, "get_channel", return_value=channel):
+        leftover, calls = await bot._scan_channel_for_deleted_embeds(items, redis)
+
+    assert sorted(leftover) == sorted(items)
+    assert calls == 0
+
+
+async def test_scan_returns_none_for_uncached_channel(
+    bot: GameSchedulerBot, redis: AsyncMock
+) -> None:
+    """A channel missing from the gateway cache is reported as skipped, not clean."""
+    with patch.object(bot, "get_channel", return_value=None):
+        outcome = await bot._scan_channel_for_deleted_embeds(_items(1000, 1001), redis)
+
+    assert outcome is None
+    redis.claim_global_and_channel_slot.assert_not_awaited()
+
+
+def _games_db(*message_ids: int) -> MagicMock:
+    """A bypass session context whose query returns games in channel 111."""
+    games = []
+    for message_id in message_ids:
+        game = MagicMock()
+        game.id = f"game-{message_id}"
+        game.scheduled_at = datetime(2026, 1, 1, tzinfo=UTC)
+        game.channel.channel_id = "111"
+        game.message_id = str(message_id)
+        games.append(game)
+
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = games
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+    db_ctx = MagicMock()
+    db_ctx.__aenter__ = AsyncMock(return_value=db)
+    db_ctx.__aexit__ = AsyncMock(return_value=False)
+    return db_ctx
+
+
+async def test_sweep_uses_history_for_multi_game_channels(bot: GameSchedulerBot) -> None:
+    """Channels with several games are scanned and the calls saved are recorded."""
+    db_ctx = _games_db(1000, 1001, 1002)
+    scan = AsyncMock(return_value=([], 1))
+    mock_saved = MagicMock()
+    with (
+        patch("services.bot.bot.get_bypass_db_session", return_value=db_ctx),
+        patch("services.bot.bot.get_redis_client", AsyncMock(return_value=MagicMock())),
+        patch.object(bot, "_scan_channel_for_deleted_embeds", scan),
+        patch.object(bot, "_run_sweep_worker", new_callable=AsyncMock) as mock_worker,
+        patch("services.bot.bot.sweep_calls_saved_histogram", mock_saved),
+    ):
+        await bot._sweep_deleted_embeds("on_ready")
+
+    scan.assert_awaited_once()
+    assert len(scan.await_args.args[0]) == 3
+    mock_worker.assert_not_awaited()
+    mock_saved.record.assert_called_once_with(2, {"reason": "on_ready"})
+
+
+async def test_sweep_excludes_skipped_channels_from_calls_saved(bot: GameSchedulerBot) -> None:
+    """Games in a skipped channel are not counted as resolved by history."""
+    scan = AsyncMock(return_value=None)
+    mock_saved = MagicMock()
+    with (
+        patch("services.bot.bot.get_bypass_db_session", return_value=_games_db(1000, 1001, 1002)),
+        patch("services.bot.bot.get_redis_client", AsyncMock(return_value=MagicMock())),
+        patch.object(bot, "_scan_channel_for_deleted_embeds", scan),
+        patch.object(bot, "_run_sweep_worker", new_callable=AsyncMock) as mock_worker,
+        patch("services.bot.bot.sweep_calls_saved_histogram", mock_saved),
+    ):
+        await bot._sweep_deleted_embeds("on_ready")
+
+    mock_worker.assert_not_awaited()
+    mock_saved.record.assert_called_once_with(0, {"reason": "on_ready"})
+
+
+async def test_trigger_sweep_skipped_after_short_resumed_outage(bot: GameSchedulerBot) -> None:
+    """A resume shorter than the threshold skips the sweep and counts the skip."""
+    mock_skipped = MagicMock()
+    with (
+        patch.object(bot, "_sweep_deleted_embeds", new_callable=AsyncMock) as mock_sweep,
+        patch("services.bot.bot.sweep_skipped_counter", mock_skipped),
+    ):
+        await bot._trigger_sweep("on_resumed", 5.0)
+
+    assert bot._sweep_task is None
+    mock_sweep.assert_not_called()
+    mock_skipped.add.assert_called_once_with(1, {"reason": "on_resumed"})
+
+
+async def test_trigger_sweep_runs_after_long_resumed_outage(bot: GameSchedulerBot) -> None:
+    """A resume at or above the threshold still sweeps."""
+    with patch.object(bot, "_sweep_deleted_embeds", new_callable=AsyncMock) as mock_sweep:
+        await bot._trigger_sweep("on_resumed", 120.0)
+        await bot._sweep_task
+
+    mock_sweep.assert_awaited_once_with("on_resumed")
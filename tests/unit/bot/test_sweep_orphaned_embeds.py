@@ -25,13 +25,16 @@ Three behavioral cases:
   (a) no backup_metadata rows  -> skip sweep entirely (no channel.history calls)
   (b) rows present, game UUID absent from DB -> message.delete() is called
   (c) rows present, game UUID exists in DB  -> message.delete() is NOT called
+
+Plus batching (one DB query per history page), bulk deletion and resumability.
 """
 
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
+import pytest
 
 from services.bot.bot import GameSchedulerBot
 
@@ -108,9 +111,19 @@ def _make_message_with_join_button(game_id: str, author_id: int) -> MagicMock:
     message.author.id = author_id
     message.components = [action_row]
     message.delete = AsyncMock()
+    message.created_at = discord.utils.utcnow()
     return message
 
 
+def _redis(saved: list[str | None] | None = None) -> AsyncMock:
+    """Redis mock granting every rate-limit slot, with optional saved sweep positions."""
+    redis = AsyncMock()
+    redis.claim_global_and_channel_slot = AsyncMock(return_value=0)
+    redis.mget = AsyncMock(return_value=saved if saved is not None else [None])
+    redis.set = AsyncMock(return_value=True)
+    return redis
+
+
 def _channel_with_history(messages: list) -> MagicMock:
     """Return a mock TextChannel whose history() async-iterates over messages."""
 
@@ -166,10 +179,11 @@ async def test_orphaned_embed_is_deleted_when_game_missing_from_db() -> None:
             side_effect=[
                 _db_ctx_scalar(_make_backup_row(backed_up_at)),
                 _db_ctx_scalars_all([channel_cfg]),
-                _db_ctx_scalar(None),
+                _db_ctx_scalars_all([]),
             ],
         ),
         patch.object(bot, "get_channel", return_value=channel),
+        patch("services.bot.bot.get_redis_client", AsyncMock(return_value=_redis())),
     ):
         await bot._sweep_orphaned_embeds()
 
@@ -196,10 +210,11 @@ async def test_live_embed_is_not_deleted_when_game_exists_in_db() -> None:
             side_effect=[
                 _db_ctx_scalar(_make_backup_row(backed_up_at)),
                 _db_ctx_scalars_all([channel_cfg]),
-                _db_ctx_scalar(MagicMock()),
+                _db_ctx_scalars_all([uuid.UUID(game_id)]),
             ],
         ),
         patch.object(bot, "get_channel", return_value=channel),
+        patch("services.bot.bot.get_redis_client", AsyncMock(return_value=_redis())),
     ):
         await bot._sweep_orphaned_embeds()
 
@@ -316,6 +331,7 @@ async def test_channel_scan_exception_is_caught_per_channel() -> None:
             ],
         ),
         patch.object(bot, "get_channel", return_value=MagicMock(spec=discord.TextChannel)),
+        patch("services.bot.bot.get_redis_client", AsyncMock(return_value=_redis())),
         patch.object(
             bot, "_scan_channel_for_orphaned_embeds", new=AsyncMock(side_effect=RuntimeError)
         ),
@@ -373,7 +389,7 @@ async def test_message_from_other_author_is_skipped() -> None:
     cutoff = datetime(2026, 4, 1, 12, 0, 0, tzinfo=UTC)
 
     with patch.object(type(bot), "user", new_callable=lambda: property(lambda _: mock_user)):
-        await bot._scan_channel_for_orphaned_embeds(channel, cutoff)
+        await bot._scan_channel_for_orphaned_embeds(channel, cutoff, _redis())
 
     message.delete.assert_not_awaited()
 
@@ -402,14 +418,14 @@ async def test_message_without_join_game_button_is_skipped() -> None:
         patch.object(type(bot), "user", new_callable=lambda: property(lambda _: mock_user)),
         patch("services.bot.bot.get_bypass_db_session") as mock_db,
     ):
-        await bot._scan_channel_for_orphaned_embeds(channel, cutoff)
+        await bot._scan_channel_for_orphaned_embeds(channel, cutoff, _redis())
 
     mock_db.assert_not_called()
     message.delete.assert_not_awaited()
 
 
-async def test_db_exception_during_game_check_is_logged() -> None:
-    """DB exception during game UUID lookup is caught and logged per message."""
+async def test_db_exception_during_game_check_propagates() -> None:
+    """DB exception during the page's game UUID lookup propagates to the channel handler."""
     bot = _make_bot()
     game_id = str(uuid.uuid4())
     mock_user = MagicMock()
@@ -426,7 +442,197 @@ async def test_db_exception_during_game_check_is_logged() -> None:
     with (
         patch.object(type(bot), "user", new_callable=lambda: property(lambda _: mock_user)),
         patch("services.bot.bot.get_bypass_db_session", return_value=failing_ctx),
+        pytest.raises(RuntimeError, match="db error"),
     ):
-        await bot._scan_channel_for_orphaned_embeds(channel, cutoff)
+        await bot._scan_channel_for_orphaned_embeds(channel, cutoff, _redis())
 
     message.delete.assert_not_awaited()
+
+
+async def test_db_exception_during_game_check_leaves_progress_unchanged() -> None:
+    """A failed game lookup does not checkpoint the page, so a resumed sweep rescans it."""
+    bot = _make_bot()
+    mock_user = MagicMock()
+    mock_user.id = 42
+
+    message = _make_message_with_join_button(str(uuid.uuid4()), author_id=42)
+    message.id = 5555
+    channel = _channel_with_history([message])
+    channel.id = 111
+    redis = _redis()
+
+    failing_ctx = MagicMock()
+    failing_ctx.__aenter__ = AsyncMock(side_effect=RuntimeError("db error"))
+    failing_ctx.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch.object(type(bot), "user", new_callable=lambda: property(lambda _: mock_user)),
+        patch("services.bot.bot.get_bypass_db_session", return_value=failing_ctx),
+        pytest.raises(RuntimeError),
+    ):
+        await bot._scan_channel_for_orphaned_embeds(
+            channel, datetime(2026, 4, 1, tzinfo=UTC), redis, progress_key="progress"
+        )
+
+    redis.set.assert_not_awaited()
+    message.delete.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# Batching, bulk deletion and resumability
+# ---------------------------------------------------------------------------
+
+
+async def test_page_is_checked_with_one_query() -> None:
+    """All game IDs on a history page are looked up in a single IN query."""
+    bot = _make_bot()
+    mock_user = MagicMock()
+    mock_user.id = 42
+
+    live_id, orphan_a, orphan_b = (str(uuid.uuid4()) for _ in range(3))
+    messages = [
+        _make_message_with_join_button(g, author_id=42) for g in (live_id, orphan_a, orphan_b)
+    ]
+    channel = _channel_with_history(messages)
+    channel.id = 111
+    channel.delete_messages = AsyncMock()
+    session = MagicMock(return_value=_db_ctx_scalars_all([uuid.UUID(live_id)]))
+
+    with (
+        patch.object(type(bot), "user", new_callable=lambda: property(lambda _: mock_user)),
+        patch("services.bot.bot.get_bypass_db_session", session),
+    ):
+        await bot._scan_channel_for_orphaned_embeds(
+            channel, datetime(2026, 4, 1, tzinfo=UTC), _redis()
+        )
+
+    session.assert_called_once()
+    channel.delete_messages.assert_awaited_once_with([messages[1], messages[2]])
+    for message in messages:
+        message.delete.assert_not_awaited()
+
+
+async def test_old_orphans_are_deleted_individually() -> None:
+    """Messages too old for bulk delete fall back to one delete each."""
+    bot = _make_bot()
+    mock_user = MagicMock()
+    mock_user.id = 42
+
+    messages = [_make_message_with_join_button(str(uuid.uuid4()), author_id=42) for _ in range(2)]
+    for message in messages:
+        message.created_at = discord.utils.utcnow() - timedelta(days=20)
+    channel = _channel_with_history(messages)
+    channel.id = 111
+    channel.delete_messages = AsyncMock()
+    redis = _redis()
+
+    with (
+        patch.object(type(bot), "user", new_callable=lambda: property(lambda _: mock_user)),
+        patch("services.bot.bot.get_bypass_db_session", return_value=_db_ctx_scalars_all([])),
+    ):
+        await bot._scan_channel_for_orphaned_embeds(
+            channel, datetime(2026, 4, 1, tzinfo=UTC), redis
+        )
+
+    channel.delete_messages.assert_not_awaited()
+    for message in messages:
+        message.delete.assert_awaited_once()
+    # One slot for the history page, one per delete.
+    assert redis.claim_global_and_channel_slot.await_count == 3
+
+
+async def test_failed_bulk_delete_falls_back_and_keeps_progress() -> None:
+    """A rejected bulk delete is retried one message at a time and the page is checkpointed."""
+    bot = _make_bot()
+    mock_user = MagicMock()
+    mock_user.id = 42
+
+    messages = [_make_message_with_join_button(str(uuid.uuid4()), author_id=42) for _ in range(3)]
+    for message_id, message in enumerate(messages, start=1):
+        message.id = message_id
+    messages[1].delete.side_effect = discord.HTTPException(MagicMock(status=403), "forbidden")
+    channel = _channel_with_history(messages)
+    channel.id = 111
+    channel.delete_messages = AsyncMock(
+        side_effect=discord.HTTPException(MagicMock(status=400), "too old")
+    )
+    redis = _redis()
+
+    with (
+        patch.object(type(bot), "user", new_callable=lambda: property(lambda _: mock_user)),
+        patch("services.bot.bot.get_bypass_db_session", return_value=_db_ctx_scalars_all([])),
+    ):
+        await bot._scan_channel_for_orphaned_embeds(
+            channel, datetime(2026, 4, 1, tzinfo=UTC), redis, progress_key="progress"
+        )
+
+    channel.delete_messages.assert_awaited_once()
+    for message in messages:
+        message.delete.assert_awaited_once()
+    assert [c.args[:2] for c in redis.set.await_args_list] == [
+        ("progress", "3"),
+        ("progress", "done"),
+    ]
+
+
+async def test_scan_records_progress_and_completion() -> None:
+    """Each page's last message ID is saved, then the channel is marked done."""
+    bot = _make_bot()
+    mock_user = MagicMock()
+    mock_user.id = 42
+
+    message = MagicMock(spec=discord.Message)
+    message.id = 5555
+    message.author = MagicMock()
+    message.author.id = 99
+    channel = _channel_with_history([message])
+    channel.id = 111
+    redis = _redis()
+
+    with patch.object(type(bot), "user", new_callable=lambda: property(lambda _: mock_user)):
+        await bot._scan_channel_for_orphaned_embeds(
+            channel, datetime(2026, 4, 1, tzinfo=UTC), redis, progress_key="progress"
+        )
+
+    assert [c.args[:2] for c in redis.set.await_args_list] == [
+        ("progress", "5555"),
+        ("progress", "done"),
+    ]
+
+
+async def test_sweep_resumes_from_saved_position_and_skips_finished_channels() -> None:
+    """A restarted sweep continues after the saved message ID and skips done channels."""
+    bot = _make_bot()
+    mock_user = MagicMock()
+    mock_user.id = 42
+
+    resumed = MagicMock(spec=discord.TextChannel)
+    resumed.id = 111
+    finished = MagicMock(spec=discord.TextChannel)
+    finished.id = 222
+    backed_up_at = datetime(2026, 4, 1, 12, 0, 0, tzinfo=UTC)
+    redis = _redis(saved=["7777", "done"])
+
+    with (
+        patch.object(type(bot), "user", new_callable=lambda: property(lambda _: mock_user)),
+        patch(
+            "services.bot.bot.get_bypass_db_session",
+            side_effect=[
+                _db_ctx_scalar(_make_backup_row(backed_up_at)),
+                _db_ctx_scalars_all([_make_channel_cfg("111"), _make_channel_cfg("222")]),
+            ],
+        ),
+        patch.object(bot, "get_channel", side_effect=[resumed, finished]),
+        patch("services.bot.bot.get_redis_client", AsyncMock(return_value=redis)),
+        patch.object(bot, "_scan_channel_for_orphaned_embeds", new=AsyncMock()) as mock_scan,
+    ):
+        await bot._sweep_orphaned_embeds()
+
+    stamp = str(int(backed_up_at.timestamp()))
+    redis.mget.assert_awaited_once_with([
+        f"bot:orphan_sweep:{stamp}:111",
+        f"bot:orphan_sweep:{stamp}:222",
+    ])
+    mock_scan.assert_awaited_once()
+    assert mock_scan.await_args.args[0] is resumed
+    assert mock_scan.await_args.kwargs["resume_after"] == 7777
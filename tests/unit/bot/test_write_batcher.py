@@ -0,0 +1,164 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the gateway write-behind batcher."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.bot.write_batcher import GatewayWriteBatcher
+from shared.cache.l1 import INVALIDATION_CHANNEL
+
+
+@pytest.fixture
+def pipe() -> MagicMock:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    return pipe
+
+
+@pytest.fixture
+def mock_redis(pipe: MagicMock) -> MagicMock:
+    redis = MagicMock()
+    redis._client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    redis._client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    with patch(
+        "services.bot.write_batcher.get_redis_client", new_callable=AsyncMock, return_value=redis
+    ):
+        yield redis
+
+
+async def test_flush_sends_one_transaction_with_invalidation(
+    mock_redis: MagicMock, pipe: MagicMock
+) -> None:
+    """All queued writes and the L1 invalidation go out in a single MULTI/EXEC."""
+    writes = GatewayWriteBatcher()
+    writes.set("discord:channel:1", '{"name": "a"}')
+    writes.delete("discord:channel:2")
+    writes.invalidate(["discord:channel:1", "discord:channel:2"])
+
+    await writes.flush()
+
+    mock_redis._client.pipeline.assert_called_once_with(transaction=True)
+    pipe.set.assert_called_once_with("discord:channel:1", '{"name": "a"}', ex=None)
+    pipe.delete.assert_called_once_with("discord:channel:2")
+    pipe.publish.assert_called_once_with(
+        INVALIDATION_CHANNEL, json.dumps(["discord:channel:1", "discord:channel:2"])
+    )
+    pipe.execute.assert_awaited_once()
+
+
+async def test_last_write_to_a_key_wins(mock_redis: MagicMock, pipe: MagicMock) -> None:
+    """Repeated writes to one key collapse to the latest, including set-then-delete."""
+    writes = GatewayWriteBatcher()
+    writes.set("k1", "v1")
+    writes.set("k1", "v2", ex=30)
+    writes.set("k2", "v1")
+    writes.delete("k2")
+    writes.invalidate(["k1"])
+    writes.invalidate(["k1"])
+
+    await writes.flush()
+
+    pipe.set.assert_called_once_with("k1", "v2", ex=30)
+    pipe.delete.assert_called_once_with("k2")
+    pipe.publish.assert_called_once_with(INVALIDATION_CHANNEL, json.dumps(["k1"]))
+
+
+async def test_sorted_set_ops_coalesce_per_member(mock_redis: MagicMock, pipe: MagicMock) -> None:
+    """The last ZADD/ZREM per member wins and members are grouped per key."""
+    writes = GatewayWriteBatcher()
+    writes.zadd("z", {"a": 0, "b": 0})
+    writes.zrem("z", "a", "c")
+    writes.zadd("z", {"c": 0})
+
+    await writes.flush()
+
+    pipe.zadd.assert_called_once_with("z", {"b": 0, "c": 0})
+    pipe.zrem.assert_called_once_with("z", "a")
+
+
+async def test_first_write_schedules_delayed_flush(mock_redis: MagicMock, pipe: MagicMock) -> None:
+    """Writes queued within the delay window land in one pipeline without an explicit flush."""
+    writes = GatewayWriteBatcher(delay_seconds=0.01)
+    writes.set("k1", "v1")
+    writes.set("k2", "v2")
+
+    await asyncio.sleep(0.05)
+
+    mock_redis._client.pipeline.assert_called_once()
+    assert pipe.set.call_count == 2
+
+
+async def test_flush_with_nothing_queued_skips_redis(mock_redis: MagicMock) -> None:
+    """An empty flush makes no Redis call."""
+    await GatewayWriteBatcher().flush()
+
+    mock_redis._client.pipeline.assert_not_called()
+
+
+async def test_scripts_run_in_queue_order_after_plain_writes(
+    mock_redis: MagicMock, pipe: MagicMock
+) -> None:
+    """Queued EVALs are never coalesced and follow the batch's SET/DEL/ZADD commands."""
+    writes = GatewayWriteBatcher()
+    writes.eval("script", 1, "k1", "a", "1")
+    writes.set("k2", "v1")
+    writes.eval("script", 1, "k1", "b", "1")
+
+    await writes.flush()
+
+    assert [c.args for c in pipe.eval.call_args_list] == [
+        ("script", 1, "k1", "a", "1"),
+        ("script", 1, "k1", "b", "1"),
+    ]
+    assert [c[0] for c in pipe.method_calls if c[0] in {"set", "eval"}] == [
+        "set",
+        "eval",
+        "eval",
+    ]
+    pipe.execute.assert_awaited_once()
+
+
+async def test_failed_flush_is_logged_and_recorded(mock_redis: MagicMock, pipe: MagicMock) -> None:
+    """A Redis error is logged, labeled in the latency metric, and the batch is dropped."""
+    pipe.execute = AsyncMock(side_effect=ConnectionError("down"))
+    writes = GatewayWriteBatcher()
+    writes.set("k1", "v1")
+    writes.zadd("z", {"a": 0})
+
+    with (
+        patch("services.bot.write_batcher.write_batch_size_histogram") as size,
+        patch("services.bot.write_batcher.write_batch_flush_latency_histogram") as latency,
+        patch("services.bot.write_batcher.logger") as log,
+    ):
+        await writes.flush()
+
+    log.exception.assert_called_once()
+    size.record.assert_called_once_with(2)
+    assert latency.record.call_args.args[1] == {"outcome": "error"}
+
+    pipe.execute = AsyncMock(return_value=[])
+    await writes.flush()
+    pipe.execute.assert_not_awaited()
@@ -0,0 +1,186 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the in-process principal cache."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.api.auth import principal_cache
+from services.api.auth.principal_cache import INVALIDATION_CHANNEL, Principal, PrincipalCache
+from shared.cache.l1 import INVALIDATE_ALL
+
+
+def _principal(discord_id: str = "123") -> Principal:
+    user = MagicMock()
+    user.discord_id = discord_id
+    return Principal(session={"user_id": discord_id, "expires_at": 9999999999}, user=user)
+
+
+@pytest.fixture
+def cache() -> PrincipalCache:
+    cache = PrincipalCache(ttl_seconds=30)
+    cache.activate()
+    return cache
+
+
+class TestGetOrLoad:
+    async def test_inactive_cache_always_loads(self):
+        cache = PrincipalCache(ttl_seconds=30)
+        load = AsyncMock(return_value=_principal())
+
+        await cache.get_or_load("s1", load)
+        await cache.get_or_load("s1", load)
+
+        assert load.await_count == 2
+
+    async def test_zero_ttl_disables_cache(self):
+        cache = PrincipalCache(ttl_seconds=0)
+        cache.activate()
+        load = AsyncMock(return_value=_principal())
+
+        await cache.get_or_load("s1", load)
+        await cache.get_or_load("s1", load)
+
+        assert load.await_count == 2
+
+    async def test_hit_skips_load(self, cache):
+        principal = _principal()
+        load = AsyncMock(return_value=principal)
+
+        assert await cache.get_or_load("s1", load) is principal
+        assert await cache.get_or_load("s1", load) is principal
+
+        load.assert_awaited_once()
+
+    async def test_expired_entry_is_reloaded(self, cache):
+        load = AsyncMock(return_value=_principal())
+
+        with patch("services.api.auth.principal_cache.time.monotonic", side_effect=[0, 31, 31]):
+            await cache.get_or_load("s1", load)
+            await cache.get_or_load("s1", load)
+
+        assert load.await_count == 2
+
+    async def test_failed_load_is_not_cached(self, cache):
+        load = AsyncMock(side_effect=[RuntimeError("redis down"), _principal()])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("s1", load)
+        await cache.get_or_load("s1", load)
+
+        assert load.await_count == 2
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        cache = PrincipalCache(ttl_seconds=30, max_entries=2)
+        cache.activate()
+        load = AsyncMock(side_effect=_principal)
+
+        await cache.get_or_load("a", load)
+        await cache.get_or_load("b", load)
+        await cache.get_or_load("a", load)
+        await cache.get_or_load("c", load)
+        await cache.get_or_load("a", load)
+        await cache.get_or_load("b", load)
+
+        assert load.await_count == 4
+
+    async def test_invalidation_during_load_is_not_stored(self, cache):
+        async def load():
+            cache.invalidate(["s1"])
+            return _principal("stale")
+
+        assert (await cache.get_or_load("s1", load)).user.discord_id == "stale"
+
+        fresh = AsyncMock(return_value=_principal("fresh"))
+        assert (await cache.get_or_load("s1", fresh)).user.discord_id == "fresh"
+
+
+class TestInvalidation:
+    async def test_message_drops_listed_sessions(self, cache):
+        load = AsyncMock(side_effect=_principal)
+        await cache.get_or_load("s1", load)
+        await cache.get_or_load("s2", load)
+
+        cache.apply_message(json.dumps(["s1"]))
+        await cache.get_or_load("s1", load)
+        await cache.get_or_load("s2", load)
+
+        assert load.await_count == 3
+
+    @pytest.mark.parametrize("message", [INVALIDATE_ALL, "not json"])
+    async def test_invalidate_all_and_malformed_messages_clear(self, cache, message):
+        load = AsyncMock(return_value=_principal())
+        await cache.get_or_load("s1", load)
+
+        cache.apply_message(message)
+        await cache.get_or_load("s1", load)
+
+        assert load.await_count == 2
+
+    async def test_deactivate_drops_entries(self, cache):
+        load = AsyncMock(return_value=_principal())
+        await cache.get_or_load("s1", load)
+
+        cache.deactivate()
+        cache.active = True
+        await cache.get_or_load("s1", load)
+
+        assert load.await_count == 2
+
+
+class TestPublishInvalidation:
+    async def test_drops_local_entry_and_publishes_tokens(self, cache):
+        load = AsyncMock(return_value=_principal())
+        await cache.get_or_load("s1", load)
+        redis = AsyncMock()
+
+        with patch.object(principal_cache, "_principal_cache", cache):
+            await principal_cache.publish_invalidation(redis, ["s1"])
+        await cache.get_or_load("s1", load)
+
+        redis.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, json.dumps(["s1"]))
+        assert load.await_count == 2
+
+    async def test_no_tokens_publishes_nothing(self):
+        redis = AsyncMock()
+
+        await principal_cache.publish_invalidation(redis, [])
+
+        redis.publish.assert_not_awaited()
+
+
+class TestListenForInvalidations:
+    async def test_subscribes_process_cache_to_principal_channel(self, cache):
+        redis = AsyncMock()
+
+        with (
+            patch.object(principal_cache, "_principal_cache", cache),
+            patch(
+                "services.api.auth.principal_cache.l1.listen_for_invalidations",
+                new_callable=AsyncMock,
+            ) as listen,
+        ):
+            await principal_cache.listen_for_invalidations(redis)
+
+        listen.assert_awaited_once_with(redis, channel=INVALIDATION_CHANNEL, cache=cache)
@@ -27,6 +27,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from services.api.auth import roles
+from shared.cache.l1 import L1Cache
 from shared.utils.discord import DiscordPermissions
 
 
@@ -199,6 +200,35 @@ async def test_check_game_host_permission_no_permission(role_service):
     mock_check_manager.assert_called_once_with("user123", "guild456", mock_db)
 
 
+@pytest.mark.asyncio
+async def test_check_bot_manager_for_config_matches_manager_role(role_service):
+    """Test a user holding a configured Bot Manager role is a Bot Manager."""
+    guild_config = AsyncMock()
+    guild_config.bot_manager_role_ids = ["mgr"]
+
+    with patch.object(role_service, "has_permissions") as mock_has_permissions:
+        is_manager = await role_service.check_bot_manager_for_config(
+            "user123", "guild456", guild_config, ["member", "mgr"]
+        )
+
+    assert is_manager is True
+    mock_has_permissions.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_check_bot_manager_for_config_falls_back_to_manage_guild(role_service):
+    """Test an unconfigured guild falls back to the MANAGE_GUILD permission."""
+    with patch.object(role_service, "has_permissions", return_value=True) as mock_has_permissions:
+        is_manager = await role_service.check_bot_manager_for_config(
+            "user123", "guild456", None, []
+        )
+
+    assert is_manager is True
+    mock_has_permissions.assert_awaited_once_with(
+        "user123", "guild456", DiscordPermissions.MANAGE_GUILD
+    )
+
+
 @pytest.mark.asyncio
 async def test_invalidate_user_roles(role_service, mock_cache):
     """Test invalidating cached user roles."""
@@ -514,3 +544,29 @@ class TestHasPermissionsLocalBitfield:
             )
 
         assert result is True
+
+    @pytest.mark.asyncio
+    async def test_has_permissions_reuses_l1_role_index(
+        self, role_service: roles.RoleVerificationService, mock_cache: AsyncMock
+    ) -> None:
+        """With the L1 cache active, repeated checks read the guild roles from Redis once."""
+        mock_cache.get_json = AsyncMock(
+            side_effect=lambda key: self._GUILD_ROLES if "guild_roles" in key else {}
+        )
+        cache = L1Cache()
+        cache.activate()
+        with (
+            patch("services.api.auth.roles.l1._cache", cache),
+            patch.object(role_service, "_get_cache", return_value=mock_cache),
+            patch(
+                "services.api.auth.roles.member_projection.get_user_roles",
+                new_callable=AsyncMock,
+                return_value=["role_mgr"],
+            ),
+        ):
+            for _ in range(3):
+                assert await role_service.has_permissions(
+                    "user123", "guild456", DiscordPermissions.MANAGE_GUILD
+                )
+
+        assert mock_cache.get_json.await_count == 2
@@ -21,15 +21,17 @@
 
 """Unit tests for tokens module."""
 
+import json
 import uuid
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from services.api.auth import tokens
+from services.api.auth import principal_cache, tokens
 from shared.cache import ttl as cache_ttl
 from shared.cache.keys import CacheKeys
 from shared.cache.operations import CacheOperation
+from shared.cache.request_memo import request_memo
 
 BOT_TOKEN = "Bot.test.token"
 
@@ -270,6 +272,9 @@ async def test_refresh_user_tokens_updates_session_in_redis():
         await tokens.refresh_user_tokens(session_token, "new_access", 3600)
 
     assert captured_key["key"] == f"api:session:{session_token}"
+    mock_redis.publish.assert_awaited_once_with(
+        principal_cache.INVALIDATION_CHANNEL, json.dumps([session_token])
+    )
 
 
 @pytest.mark.asyncio
@@ -286,6 +291,9 @@ async def test_delete_user_tokens_deletes_session_key():
         await tokens.delete_user_tokens(session_token)
 
     mock_redis.delete.assert_called_once_with(f"api:session:{session_token}")
+    mock_redis.publish.assert_awaited_once_with(
+        principal_cache.INVALIDATION_CHANNEL, json.dumps([session_token])
+    )
 
 
 @pytest.mark.asyncio
@@ -364,3 +372,120 @@ async def test_get_calendar_export_token_returns_none_on_malformed_data():
         result = await tokens.get_calendar_export_token("tok")
 
     assert result is None
+
+
+async def test_get_session_reads_session_once_per_request_memo():
+    """Within one request scope the session is read once and handed out as copies."""
+    mock_cache_get = AsyncMock(return_value=_make_session())
+
+    with (
+        patch("services.api.auth.tokens.cache_get", mock_cache_get),
+        patch("services.api.auth.tokens.decrypt_token") as mock_decrypt,
+        request_memo() as memo,
+    ):
+        first = await tokens.get_session("memo-session")
+        second = await tokens.get_session("memo-session")
+
+    mock_cache_get.assert_awaited_once()
+    mock_decrypt.assert_not_called()
+    assert first == second
+    assert first is not second
+    assert first is not None
+    assert first["access_token"] == "plain_oauth_token"
+    assert memo.hits == 1
+
+
+async def test_get_user_tokens_decrypts_oauth_tokens():
+    """get_user_tokens decrypts both OAuth tokens on top of the memoized session."""
+    mock_cache_get = AsyncMock(return_value=_make_session())
+
+    with (
+        patch("services.api.auth.tokens.cache_get", mock_cache_get),
+        patch("services.api.auth.tokens.decrypt_token", side_effect=lambda t: f"dec:{t}"),
+        request_memo(),
+    ):
+        session = await tokens.get_session("memo-session")
+        token_data = await tokens.get_user_tokens("memo-session")
+
+    mock_cache_get.assert_awaited_once()
+    assert token_data is not None
+    assert token_data["access_token"] == "dec:plain_oauth_token"
+    assert token_data["refresh_token"] == "dec:plain_refresh"
+    assert session is not None
+    assert session["access_token"] == "plain_oauth_token"
+
+
+def test_encryption_key_is_derived_once_per_secret():
+    """The Fernet key is not re-derived from the JWT secret on every call."""
+    with patch("services.api.auth.tokens.config") as mock_cfg:
+        mock_cfg.get_api_config.return_value.jwt_secret = "derive-once-secret"
+        tokens._derive_encryption_key.cache_clear()
+        first = tokens.get_encryption_key()
+        second = tokens.get_encryption_key()
+
+    assert first == second
+    assert tokens._derive_encryption_key.cache_info().hits == 1
+
+
+async def test_refresh_user_tokens_forgets_memoized_session():
+    """A session refreshed inside a request is re-read by the next lookup."""
+    mock_cache_get = AsyncMock(return_value=_make_session())
+
+    with (
+        patch("services.api.auth.tokens.cache_get", mock_cache_get),
+        patch(
+            "services.api.auth.tokens.cache_client.get_redis_client",
+            new_callable=AsyncMock,
+            return_value=AsyncMock(),
+        ),
+        patch("services.api.auth.tokens.decrypt_token", return_value="plain"),
+        patch("services.api.auth.tokens.encrypt_token", return_value="enc"),
+        request_memo(),
+    ):
+        await tokens.get_user_tokens("memo-session")
+        await tokens.refresh_user_tokens("memo-session", "new_access", 3600)
+        await tokens.get_user_tokens("memo-session")
+
+    assert mock_cache_get.await_count == 3
+
+
+def test_get_fernet_is_reused_for_the_same_key():
+    """The Fernet instance is built once per encryption key."""
+    with patch("services.api.auth.tokens.get_encryption_key", return_value=b"A" * 43 + b"="):
+        first = tokens.get_fernet()
+        second = tokens.get_fernet()
+
+    assert first is second
+    assert tokens.decrypt_token(tokens.encrypt_token("secret")) == "secret"
+
+
+def test_calendar_feed_token_round_trips_user_and_guild():
+    """A minted feed token verifies back to its user and guild scope."""
+    user_id = str(uuid.uuid4())
+    guild_id = str(uuid.uuid4())
+
+    with patch("services.api.auth.tokens.config") as mock_cfg:
+        mock_cfg.get_api_config.return_value.jwt_secret = "feed-secret"
+        all_guilds = tokens.mint_calendar_feed_token(user_id)
+        one_guild = tokens.mint_calendar_feed_token(user_id, guild_id)
+
+        assert tokens.verify_calendar_feed_token(all_guilds) == (user_id, None)
+        assert tokens.verify_calendar_feed_token(one_guild) == (user_id, guild_id)
+
+
+def test_calendar_feed_token_rejects_tampering():
+    """Changing the user, scope or signature invalidates a feed token."""
+    user_id = str(uuid.uuid4())
+
+    with patch("services.api.auth.tokens.config") as mock_cfg:
+        mock_cfg.get_api_config.return_value.jwt_secret = "feed-secret"
+        token = tokens.mint_calendar_feed_token(user_id)
+        _, scope, signature = token.split("_")
+
+        assert tokens.verify_calendar_feed_token(f"{uuid.uuid4()}_{scope}_{signature}") is None
+        assert tokens.verify_calendar_feed_token(f"{user_id}_{uuid.uuid4()}_{signature}") is None
+        assert tokens.verify_calendar_feed_token(f"{user_id}_{scope}_{'0' * 32}") is None
+        assert tokens.verify_calendar_feed_token("not-a-token") is None
+
+        mock_cfg.get_api_config.return_value.jwt_secret = "rotated-secret"
+        assert tokens.verify_calendar_feed_token(token) is None
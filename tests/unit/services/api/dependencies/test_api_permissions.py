@@ -66,7 +66,7 @@ async def test_require_manage_guild_success(mock_current_user, mock_role_service
     mock_role_service.has_permissions.return_value = True
     mock_db = AsyncMock()
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         # Use a Discord snowflake format ID to skip UUID resolution
         result = await permissions.require_manage_guild(
             "123456789012345678",  # Discord snowflake format
@@ -84,7 +84,7 @@ async def test_require_manage_guild_no_session(mock_current_user, mock_role_serv
     """Test require_manage_guild with no session."""
     mock_db = AsyncMock()
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=None):
+    with patch("services.api.auth.tokens.get_session", return_value=None):
         with pytest.raises(HTTPException) as exc_info:
             await permissions.require_manage_guild(
                 "123456789012345678",
@@ -105,7 +105,7 @@ async def test_require_manage_guild_no_permission(
     mock_role_service.has_permissions.return_value = False
     mock_db = AsyncMock()
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         with pytest.raises(HTTPException) as exc_info:
             await permissions.require_manage_guild(
                 "123456789012345678",
@@ -124,7 +124,7 @@ async def test_require_manage_channels_success(mock_current_user, mock_role_serv
     mock_role_service.has_permissions.return_value = True
     mock_db = AsyncMock()
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         # Use a Discord snowflake format ID to skip UUID resolution
         result = await permissions.require_manage_channels(
             "123456789012345678",
@@ -145,7 +145,7 @@ async def test_require_manage_channels_no_permission(
     mock_role_service.has_permissions.return_value = False
     mock_db = AsyncMock()
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         with pytest.raises(HTTPException) as exc_info:
             await permissions.require_manage_channels(
                 "123456789012345678",
@@ -164,7 +164,7 @@ async def test_require_game_host_success(mock_current_user, mock_role_service, m
     mock_db = AsyncMock()
     mock_role_service.check_game_host_permission.return_value = True
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         result = await permissions.require_game_host(
             "guild456",
             "channel789",
@@ -187,7 +187,7 @@ async def test_require_game_host_no_permission(mock_current_user, mock_role_serv
     mock_db = AsyncMock()
     mock_role_service.check_game_host_permission.return_value = False
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         with pytest.raises(HTTPException) as exc_info:
             await permissions.require_game_host(
                 "guild456",
@@ -207,7 +207,7 @@ async def test_require_game_host_no_channel(mock_current_user, mock_role_service
     mock_db = AsyncMock()
     mock_role_service.check_game_host_permission.return_value = True
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         result = await permissions.require_game_host(
             "guild456",
             None,
@@ -229,7 +229,7 @@ async def test_require_administrator_success(mock_current_user, mock_role_servic
     """Test require_administrator with permission."""
     mock_role_service.has_permissions.return_value = True
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         result = await permissions.require_administrator(
             "guild456",
             mock_current_user,
@@ -247,7 +247,7 @@ async def test_require_administrator_no_permission(
     """Test require_administrator without permission."""
     mock_role_service.has_permissions.return_value = False
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         with pytest.raises(HTTPException) as exc_info:
             await permissions.require_administrator(
                 "guild456",
@@ -265,7 +265,7 @@ async def test_require_bot_manager_success(mock_current_user, mock_role_service,
     mock_role_service.check_bot_manager_permission.return_value = True
     mock_db = AsyncMock()
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         result = await permissions.require_bot_manager(
             "123456789012345678",
             mock_current_user,
@@ -285,7 +285,7 @@ async def test_require_bot_manager_no_permission(mock_current_user, mock_role_se
     mock_role_service.check_bot_manager_permission.return_value = False
     mock_db = AsyncMock()
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         with pytest.raises(HTTPException) as exc_info:
             await permissions.require_bot_manager(
                 "123456789012345678",
@@ -721,7 +721,7 @@ async def test_require_manage_channels_no_session(mock_current_user, mock_role_s
     """Test require_manage_channels with no session."""
     mock_db = AsyncMock()
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=None):
+    with patch("services.api.auth.tokens.get_session", return_value=None):
         with pytest.raises(HTTPException) as exc_info:
             await permissions.require_manage_channels(
                 "123456789012345678",
@@ -739,7 +739,7 @@ async def test_require_bot_manager_no_session(mock_current_user, mock_role_servi
     """Test require_bot_manager with no session."""
     mock_db = AsyncMock()
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=None):
+    with patch("services.api.auth.tokens.get_session", return_value=None):
         with pytest.raises(HTTPException) as exc_info:
             await permissions.require_bot_manager(
                 "123456789012345678",
@@ -757,7 +757,7 @@ async def test_require_game_host_no_session(mock_current_user, mock_role_service
     """Test require_game_host with no session."""
     mock_db = AsyncMock()
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=None):
+    with patch("services.api.auth.tokens.get_session", return_value=None):
         with pytest.raises(HTTPException) as exc_info:
             await permissions.require_game_host(
                 "guild456",
@@ -774,7 +774,7 @@ async def test_require_game_host_no_session(mock_current_user, mock_role_service
 @pytest.mark.asyncio
 async def test_require_administrator_no_session(mock_current_user, mock_role_service):
     """Test require_administrator with no session."""
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=None):
+    with patch("services.api.auth.tokens.get_session", return_value=None):
         with pytest.raises(HTTPException) as exc_info:
             await permissions.require_administrator(
                 "guild456",
@@ -893,7 +893,7 @@ async def test_can_manage_game_user_is_bot_manager():
             return_value=[{"id": "guild123"}],
         ),
         patch(
-            "services.api.auth.tokens.get_user_tokens",
+            "services.api.auth.tokens.get_session",
             return_value={"access_token": "test_token"},
         ),
     ):
@@ -928,7 +928,7 @@ async def test_can_manage_game_user_unauthorized():
             return_value=[{"id": "guild123"}],
         ),
         patch(
-            "services.api.auth.tokens.get_user_tokens",
+            "services.api.auth.tokens.get_session",
             return_value={"access_token": "test_token"},
         ),
     ):
@@ -962,7 +962,7 @@ async def test_can_manage_game_no_token():
             "services.api.dependencies.permissions.verify_guild_membership",
             return_value=[{"id": "guild123"}],
         ),
-        patch("services.api.auth.tokens.get_user_tokens", return_value=None),
+        patch("services.api.auth.tokens.get_session", return_value=None),
     ):
         result = await permissions.can_manage_game(
             "other_user",
@@ -1174,7 +1174,7 @@ async def test_require_permission_success(mock_current_user, mock_role_service,
     async def mock_permission_checker(user_id: str, guild_id: str, **kwargs) -> bool:
         return True
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         result = await permissions._require_permission(
             "123456789012345678",  # Discord snowflake format
             mock_permission_checker,
@@ -1197,7 +1197,7 @@ async def test_require_permission_failed_check(
         return False
 
     with (
-        patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens),
+        patch("services.api.auth.tokens.get_session", return_value=mock_tokens),
         caplog.at_level(logging.WARNING),
         pytest.raises(HTTPException) as exc_info,
     ):
@@ -1223,7 +1223,7 @@ async def test_require_permission_expired_token(mock_current_user, mock_role_ser
         return True
 
     with (
-        patch("services.api.auth.tokens.get_user_tokens", return_value=None),
+        patch("services.api.auth.tokens.get_session", return_value=None),
         pytest.raises(HTTPException) as exc_info,
     ):
         await permissions._require_permission(
@@ -1253,7 +1253,7 @@ async def test_require_permission_with_uuid_guild_id(
     mock_guild_config.guild_id = "999888777666555444"
 
     with (
-        patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens),
+        patch("services.api.auth.tokens.get_session", return_value=mock_tokens),
         patch(
             "services.api.database.queries.require_guild_by_id",
             return_value=mock_guild_config,
@@ -1282,7 +1282,7 @@ async def test_require_permission_with_checker_kwargs(
         assert kwargs["extra_param"] == "test_value"
         return True
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
         result = await permissions._require_permission(
             "123456789012345678",
             mock_permission_checker,
@@ -1307,7 +1307,7 @@ async def test_require_permission_checker_exception(
         raise ValueError(msg)
 
     with (
-        patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens),
+        patch("services.api.auth.tokens.get_session", return_value=mock_tokens),
         pytest.raises(ValueError) as exc_info,
     ):
         await permissions._require_permission(
@@ -1367,7 +1367,7 @@ async def test_require_permission_with_maintainer_token(mock_current_user, mock_
         msg = "Should not be called for maintainer"
         raise AssertionError(msg)
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=maintainer_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=maintainer_tokens):
         result = await permissions._require_permission(
             "123456789012345678",
             mock_checker,
@@ -1417,7 +1417,7 @@ async def test_require_game_host_with_maintainer_token(mock_current_user, mock_r
     mock_db = AsyncMock()
     maintainer_tokens = {"access_token": "test_token", "is_maintainer": True}
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=maintainer_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=maintainer_tokens):
         result = await permissions.require_game_host(
             "guild456",
             "channel789",
@@ -1447,7 +1447,7 @@ async def test_can_manage_game_with_maintainer_token():
             "services.api.dependencies.permissions.verify_guild_membership",
             return_value=[{"id": "guild123"}],
         ),
-        patch("services.api.auth.tokens.get_user_tokens", return_value=maintainer_tokens),
+        patch("services.api.auth.tokens.get_session", return_value=maintainer_tokens),
     ):
         result = await permissions.can_manage_game(
             "other_user",
@@ -1465,7 +1465,7 @@ async def test_require_administrator_with_maintainer_token(mock_current_user, mo
     """Test require_administrator bypasses the permission check when user is maintainer."""
     maintainer_tokens = {"access_token": "test_token", "is_maintainer": True}
 
-    with patch("services.api.auth.tokens.get_user_tokens", return_value=maintainer_tokens):
+    with patch("services.api.auth.tokens.get_session", return_value=maintainer_tokens):
         result = await permissions.require_administrator(
             "guild456",
             mock_current_user,
@@ -1473,3 +1473,161 @@ async def test_require_administrator_with_maintainer_token(mock_current_user, mo
         )
 
     assert result == mock_current_user
+
+
+def _batch_game(guild_id: str, host_id: str = "host1", allowed_roles=None) -> MagicMock:
+    game = MagicMock()
+    game.guild = MagicMock()
+    game.guild.guild_id = guild_id
+    game.host = MagicMock()
+    game.host.discord_id = host_id
+    game.allowed_player_role_ids = allowed_roles
+    return game
+
+
+@pytest.fixture
+def batch_projection():
+    """Patch the member projection so the user belongs to guild_a and guild_b."""
+    with (
+        patch(
+            "services.api.dependencies.permissions.member_projection.is_bot_fresh",
+            new_callable=AsyncMock,
+            return_value=True,
+        ) as mock_fresh,
+        patch(
+            "services.api.dependencies.permissions.member_projection.get_user_guilds",
+            new_callable=AsyncMock,
+            return_value=["guild_a", "guild_b"],
+        ) as mock_guilds,
+    ):
+        yield mock_fresh, mock_guilds
+
+
+@pytest.mark.asyncio
+async def test_batch_authorizer_filters_non_member_guilds(mock_current_user, batch_projection):
+    """BatchGameAuthorizer drops games in guilds the user is not a member of."""
+    role_service = AsyncMock()
+    games = [_batch_game("guild_a"), _batch_game("guild_x"), _batch_game("guild_b")]
+
+    authorizer = permissions.BatchGameAuthorizer(mock_current_user, role_service, redis=AsyncMock())
+    result = await authorizer.filter_games(games)
+
+    assert result == [games[0], games[2]]
+    role_service.get_user_role_ids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_authorizer_returns_nothing_when_bot_not_fresh(mock_current_user):
+    """BatchGameAuthorizer authorizes no games while the projection is stale."""
+    role_service = AsyncMock()
+
+    with patch(
+        "services.api.dependencies.permissions.member_projection.is_bot_fresh",
+        new_callable=AsyncMock,
+        return_value=False,
+    ):
+        authorizer = permissions.BatchGameAuthorizer(
+            mock_current_user, role_service, redis=AsyncMock()
+        )
+        result = await authorizer.filter_games([_batch_game("guild_a")])
+
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_batch_authorizer_applies_player_roles_with_host_exempt(
+    mock_current_user, batch_projection
+):
+    """Role-restricted games need a matching role unless the user hosts them."""
+    role_service = AsyncMock()
+    role_service.get_user_role_ids.return_value = ["role1"]
+    allowed = _batch_game("guild_a", allowed_roles=["role1"])
+    denied = _batch_game("guild_a", allowed_roles=["role2"])
+    hosted = _batch_game("guild_a", host_id="user123", allowed_roles=["role2"])
+
+    authorizer = permissions.BatchGameAuthorizer(mock_current_user, role_service, redis=AsyncMock())
+    result = await authorizer.filter_games([allowed, denied, hosted])
+
+    assert result == [allowed, hosted]
+    role_service.get_user_role_ids.assert_awaited_once_with("user123", "guild_a")
+
+
+@pytest.mark.asyncio
+async def test_batch_authorizer_shows_manage_required_games_to_bot_manager(
+    mock_current_user, batch_projection
+):
+    """Games needing manage access are kept only in guilds where the user is a Bot Manager."""
+    role_service = AsyncMock()
+    role_service.get_user_role_ids.return_value = []
+    role_service.check_bot_manager_for_config.side_effect = (
+        lambda _user, guild_id, _config, _roles: guild_id == "guild_a"
+    )
+    managed = _batch_game("guild_a")
+    unmanaged = _batch_game("guild_b")
+
+    with patch(
+        "services.api.dependencies.permissions.tokens.get_session",
+        new_callable=AsyncMock,
+        return_value={"is_maintainer": False},
+    ):
+        authorizer = permissions.BatchGameAuthorizer(
+            mock_current_user, role_service, redis=AsyncMock()
+        )
+        result = await authorizer.filter_games(
+            [managed, unmanaged], manage_required=lambda _g: True
+        )
+
+    assert result == [managed]
+
+
+@pytest.mark.asyncio
+async def test_batch_authorizer_maintainer_skips_bot_manager_checks(
+    mock_current_user, batch_projection
+):
+    """Maintainers see manage-required games without per-guild Bot Manager checks."""
+    role_service = AsyncMock()
+    games = [_batch_game("guild_a"), _batch_game("guild_b")]
+
+    with patch(
+        "services.api.dependencies.permissions.tokens.get_session",
+        new_callable=AsyncMock,
+        return_value={"is_maintainer": True},
+    ):
+        authorizer = permissions.BatchGameAuthorizer(
+            mock_current_user, role_service, redis=AsyncMock()
+        )
+        result = await authorizer.filter_games(games, manage_required=lambda _g: True)
+
+    assert result == games
+    role_service.check_bot_manager_for_config.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_authorizer_lookups_scale_with_guilds_not_games(
+    mock_current_user, batch_projection
+):
+    """A 25-game page across two guilds costs one lookup set per guild."""
+    mock_fresh, mock_guilds = batch_projection
+    role_service = AsyncMock()
+    role_service.get_user_role_ids.return_value = ["role1"]
+    role_service.check_bot_manager_for_config.return_value = True
+    games = [
+        _batch_game("guild_a" if i % 2 else "guild_b", allowed_roles=["role1"]) for i in range(25)
+    ]
+
+    with patch(
+        "services.api.dependencies.permissions.tokens.get_session",
+        new_callable=AsyncMock,
+        return_value={"is_maintainer": False},
+    ) as mock_get_tokens:
+        authorizer = permissions.BatchGameAuthorizer(
+            mock_current_user, role_service, redis=AsyncMock()
+        )
+        result = await authorizer.filter_games(games, manage_required=lambda _g: True)
+
+    assert result == games
+    assert mock_fresh.await_count == 1
+    assert mock_guilds.await_count == 1
+    assert mock_get_tokens.await_count == 1
+    assert role_service.get_user_role_ids.await_count == 2
+    assert role_service.check_bot_manager_for_config.await_count == 2
@@ -25,13 +25,19 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy.orm import Session, make_transient_to_detached
 
+from services.api.auth.principal_cache import PrincipalCache
 from services.api.dependencies.auth import get_current_user
+from shared.cache.keys import CacheKeys
+from shared.models.user import User
 
 
 @pytest.fixture
 def mock_db():
-    return AsyncMock()
+    db = AsyncMock()
+    db.expunge = MagicMock()
+    return db
 
 
 @pytest.fixture
@@ -60,7 +66,7 @@ class TestGetCurrentUser:
     async def test_raises_401_when_session_not_found(self, mock_db):
         """Raises 401 when session token has no corresponding Redis entry."""
         with patch(
-            "services.api.dependencies.auth.tokens.get_user_tokens",
+            "services.api.dependencies.auth.tokens.get_session",
             AsyncMock(return_value=None),
         ):
             with pytest.raises(HTTPException) as exc_info:
@@ -68,10 +74,14 @@ class TestGetCurrentUser:
         assert exc_info.value.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_raises_401_when_token_expired(self, mock_db):
+    async def test_raises_401_when_token_expired(self, mock_db, mock_user):
         """Raises 401 when session token has expired."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_user
+        mock_db.execute.return_value = mock_result
+
         with patch(
-            "services.api.dependencies.auth.tokens.get_user_tokens",
+            "services.api.dependencies.auth.tokens.get_session",
             AsyncMock(return_value=_VALID_TOKEN_DATA),
         ):
             with patch(
@@ -90,7 +100,7 @@ class TestGetCurrentUser:
         mock_db.execute.return_value = mock_result
 
         with patch(
-            "services.api.dependencies.auth.tokens.get_user_tokens",
+            "services.api.dependencies.auth.tokens.get_session",
             AsyncMock(return_value=_VALID_TOKEN_DATA),
         ):
             with patch(
@@ -109,7 +119,7 @@ class TestGetCurrentUser:
         mock_db.execute.return_value = mock_result
 
         with patch(
-            "services.api.dependencies.auth.tokens.get_user_tokens",
+            "services.api.dependencies.auth.tokens.get_session",
             AsyncMock(return_value=_VALID_TOKEN_DATA),
         ):
             with patch(
@@ -119,5 +129,94 @@ class TestGetCurrentUser:
                 result = await get_current_user(session_token="valid_token", db=mock_db)
 
         assert result.user == mock_user
-        assert result.access_token == "test_access_token"
         assert result.session_token == "valid_token"
+        mock_db.expunge.assert_called_once_with(mock_user)
+
+    @pytest.mark.asyncio
+    async def test_cached_principal_skips_redis_and_database(self, mock_db, mock_user):
+        """A second request for the same session is served from the principal cache."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_user
+        mock_db.execute.return_value = mock_result
+        cache = PrincipalCache(ttl_seconds=30)
+        cache.activate()
+        get_session = AsyncMock(return_value=_VALID_TOKEN_DATA)
+
+        with (
+            patch(
+                "services.api.dependencies.auth.principal_cache.get_principal_cache",
+                return_value=cache,
+            ),
+            patch("services.api.dependencies.auth.tokens.get_session", get_session),
+            patch(
+                "services.api.dependencies.auth.tokens.is_token_expired",
+                AsyncMock(return_value=False),
+            ),
+        ):
+            first = await get_current_user(session_token="valid_token", db=mock_db)
+            second = await get_current_user(session_token="valid_token", db=mock_db)
+
+        assert first.user is second.user is mock_user
+        get_session.assert_awaited_once()
+        mock_db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_user_survives_rollback_of_loading_request(self):
+        """A route error in the populating request does not break later cache hits."""
+        user = User(id="user-uuid", discord_id="123456789012345678")
+        make_transient_to_detached(user)
+        orm_session = Session()
+        orm_session.add(user)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = user
+        loading_db = AsyncMock()
+        loading_db.execute.return_value = mock_result
+        loading_db.expunge = orm_session.expunge
+        cache = PrincipalCache(ttl_seconds=30)
+        cache.activate()
+
+        with (
+            patch(
+                "services.api.dependencies.auth.principal_cache.get_principal_cache",
+                return_value=cache,
+            ),
+            patch(
+                "services.api.dependencies.auth.tokens.get_session",
+                AsyncMock(return_value=_VALID_TOKEN_DATA),
+            ),
+            patch(
+                "services.api.dependencies.auth.tokens.is_token_expired",
+                AsyncMock(return_value=False),
+            ),
+        ):
+            await get_current_user(session_token="valid_token", db=loading_db)
+            # The route raised: get_db() rolls back and closes the session,
+            # which expires every instance still attached to it.
+            orm_session.rollback()
+            orm_session.close()
+            second = await get_current_user(session_token="valid_token", db=AsyncMock())
+
+        assert second.user.discord_id == "123456789012345678"
+        assert second.user.id == "user-uuid"
+
+    @pytest.mark.asyncio
+    async def test_session_is_remembered_for_the_request(self, mock_db, mock_user):
+        """The resolved session is stored in the request memo for later lookups."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_user
+        mock_db.execute.return_value = mock_result
+
+        with (
+            patch(
+                "services.api.dependencies.auth.tokens.get_session",
+                AsyncMock(return_value=_VALID_TOKEN_DATA),
+            ),
+            patch(
+                "services.api.dependencies.auth.tokens.is_token_expired",
+                AsyncMock(return_value=False),
+            ),
+            patch("services.api.dependencies.auth.remember") as remember,
+        ):
+            await get_current_user(session_token="valid_token", db=mock_db)
+
+        remember.assert_called_once_with(CacheKeys.session("valid_token"), _VALID_TOKEN_DATA)
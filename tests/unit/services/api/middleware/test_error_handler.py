@@ -30,6 +30,7 @@ from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
 from services.api.middleware import error_handler
+from shared.services.image_processing import ImageProcessingUnavailableError
 
 
 @pytest.fixture
@@ -168,6 +169,19 @@ async def test_database_exception_handler_includes_details_in_debug_mode(mock_re
     mock_config.assert_called_once_with()
 
 
+@pytest.mark.asyncio
+async def test_image_processing_exception_handler_returns_503(mock_request):
+    """Test that a saturated image pool returns 503 with a retry hint."""
+    exc = ImageProcessingUnavailableError("Image processing is busy, please retry shortly")
+
+    with patch("services.api.middleware.error_handler.logger"):
+        response = await error_handler.image_processing_exception_handler(mock_request, exc)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "5"
+    assert "image_processing_unavailable" in response.body.decode()
+
+
 @pytest.mark.asyncio
 async def test_general_exception_handler_returns_500(mock_request):
     """Test that general exceptions return 500 status code."""
@@ -207,7 +221,7 @@ def test_configure_error_handlers_registers_all_handlers(mock_app):
     """Test that configure_error_handlers registers all exception handlers."""
     error_handler.configure_error_handlers(mock_app)
 
-    assert mock_app.add_exception_handler.call_count == 4
+    assert mock_app.add_exception_handler.call_count == 5
 
 
 def test_configure_error_handlers_registers_validation_errors(mock_app):
@@ -240,3 +254,11 @@ def test_configure_error_handlers_registers_general_errors(mock_app):
 
     calls = [call[0][0] for call in mock_app.add_exception_handler.call_args_list]
     assert Exception in calls
+
+
+def test_configure_error_handlers_registers_image_processing_errors(mock_app):
+    """Test that ImageProcessingUnavailableError handler is registered."""
+    error_handler.configure_error_handlers(mock_app)
+
+    calls = [call[0][0] for call in mock_app.add_exception_handler.call_args_list]
+    assert ImageProcessingUnavailableError in calls
@@ -0,0 +1,92 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the request-scoped memoization middleware."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.api.auth import tokens
+from services.api.middleware import request_memo
+from shared.cache.keys import CacheKeys
+from shared.cache.operations import read_projection_key
+from shared.data_access.round_trips import record_redis_round_trip, track_round_trips
+
+
+def _counting_redis(values: dict[str, str]) -> AsyncMock:
+    """Fake RedisClient whose reads count as round-trips like the real one."""
+
+    async def get(key):
+        record_redis_round_trip()
+        return values.get(key)
+
+    async def get_json(key):
+        raw = await get(key)
+        return json.loads(raw) if raw is not None else None
+
+    redis = AsyncMock()
+    redis.get = AsyncMock(side_effect=get)
+    redis.get_json = AsyncMock(side_effect=get_json)
+    return redis
+
+
+@pytest.mark.asyncio
+async def test_repeated_dependency_lookups_hit_redis_once_per_request():
+    """Session and projection lookups repeated by dependencies read Redis once each."""
+    session = {
+        "user_id": "u1",
+        "access_token": tokens.encrypt_token("access"),
+        "refresh_token": tokens.encrypt_token("refresh"),
+        "expires_at": "2099-01-01T00:00:00",
+    }
+    redis = _counting_redis({
+        CacheKeys.session("s1"): json.dumps(session),
+        CacheKeys.proj_gen(): "3",
+        CacheKeys.proj_user_guilds("3", "u1"): json.dumps(["g1"]),
+    })
+
+    async def app(scope, receive, send):
+        for _ in range(4):
+            assert await tokens.get_session("s1")
+            assert await read_projection_key(redis, CacheKeys.proj_user_guilds, "u1")
+
+    middleware = request_memo.RequestMemoMiddleware(app)
+
+    with (
+        patch("shared.cache.operations.get_redis_client", AsyncMock(return_value=redis)),
+        track_round_trips() as counts,
+    ):
+        await middleware({"type": "http"}, AsyncMock(), AsyncMock())
+
+    assert counts.redis == 3
+
+
+@pytest.mark.asyncio
+async def test_non_http_scopes_pass_through():
+    """Lifespan and websocket scopes run without a memo scope."""
+    app = AsyncMock()
+    middleware = request_memo.RequestMemoMiddleware(app)
+
+    await middleware({"type": "lifespan"}, AsyncMock(), AsyncMock())
+
+    app.assert_awaited_once()
@@ -0,0 +1,81 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the round-trip accounting middleware."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.api.middleware import round_trips
+from shared.data_access.round_trips import record_db_round_trip, record_redis_round_trip
+
+
+@pytest.mark.asyncio
+async def test_records_round_trips_per_route():
+    """Each HTTP request records its database and Redis counts under the matched route."""
+
+    async def app(scope, receive, send):
+        scope["route"] = SimpleNamespace(path="/api/v1/games")
+        record_db_round_trip()
+        record_db_round_trip()
+        record_redis_round_trip()
+
+    middleware = round_trips.RoundTripMiddleware(app)
+
+    with patch.object(round_trips, "request_round_trips_histogram") as mock_histogram:
+        await middleware({"type": "http"}, AsyncMock(), AsyncMock())
+
+    mock_histogram.record.assert_any_call(2, {"http.route": "/api/v1/games", "kind": "db"})
+    mock_histogram.record.assert_any_call(1, {"http.route": "/api/v1/games", "kind": "redis"})
+
+
+@pytest.mark.asyncio
+async def test_records_round_trips_when_app_raises():
+    """Counts are still recorded when the downstream app raises."""
+
+    async def app(scope, receive, send):
+        record_db_round_trip()
+        raise RuntimeError
+
+    middleware = round_trips.RoundTripMiddleware(app)
+
+    with (
+        patch.object(round_trips, "request_round_trips_histogram") as mock_histogram,
+        pytest.raises(RuntimeError),
+    ):
+        await middleware({"type": "http"}, AsyncMock(), AsyncMock())
+
+    mock_histogram.record.assert_any_call(1, {"http.route": "unmatched", "kind": "db"})
+
+
+@pytest.mark.asyncio
+async def test_non_http_scopes_pass_through():
+    """Lifespan and websocket scopes are not tracked."""
+    app = AsyncMock()
+    middleware = round_trips.RoundTripMiddleware(app)
+
+    with patch.object(round_trips, "request_round_trips_histogram") as mock_histogram:
+        await middleware({"type": "lifespan"}, AsyncMock(), AsyncMock())
+
+    app.assert_awaited_once()
+    mock_histogram.record.assert_not_called()
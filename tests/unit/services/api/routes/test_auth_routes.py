@@ -231,7 +231,7 @@ class TestGetUserInfo:
             "avatar": "abc123",
         }
         with patch(
-            "services.api.auth.tokens.get_user_tokens",
+            "services.api.auth.tokens.get_session",
             new_callable=AsyncMock,
             return_value=token_data,
         ):
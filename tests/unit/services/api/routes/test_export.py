@@ -71,7 +71,7 @@ def mock_game():
     return game
 
 
-def test_export_game_as_host_success(app, mock_user, mock_game, mock_get_user_tokens):
+def test_export_game_as_host_success(app, mock_user, mock_game, mock_get_session):
     """Test successful export of game as host."""
     mock_ical = b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nEND:VCALENDAR\r\n"
 
@@ -138,7 +138,7 @@ def test_export_game_as_host_success(app, mock_user, mock_game, mock_get_user_to
         app.dependency_overrides.clear()
 
 
-def test_export_game_not_found(app, mock_user, mock_get_user_tokens):
+def test_export_game_not_found(app, mock_user, mock_get_session):
     """Test export of non-existent game returns 404."""
     # Mock database session returning None
     mock_db = AsyncMock()
@@ -189,7 +189,7 @@ def test_export_game_not_found(app, mock_user, mock_get_user_tokens):
         app.dependency_overrides.clear()
 
 
-def test_export_game_permission_denied(app, mock_user, mock_game, mock_get_user_tokens):
+def test_export_game_permission_denied(app, mock_user, mock_game, mock_get_session):
     """Test export without permission returns 403."""
     # User is not host or participant
     mock_game.host_id = "different-user"
@@ -253,7 +253,7 @@ def test_export_game_permission_denied(app, mock_user, mock_game, mock_get_user_
         app.dependency_overrides.clear()
 
 
-def test_export_game_as_participant(app, mock_user, mock_game, mock_get_user_tokens):
+def test_export_game_as_participant(app, mock_user, mock_game, mock_get_session):
     """Test successful export as participant."""
     mock_ical = b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nEND:VCALENDAR\r\n"
 
@@ -328,7 +328,7 @@ def test_export_game_as_participant(app, mock_user, mock_game, mock_get_user_tok
         app.dependency_overrides.clear()
 
 
-def test_mint_calendar_token_as_host_success(app, mock_user, mock_game, mock_get_user_tokens):
+def test_mint_calendar_token_as_host_success(app, mock_user, mock_game, mock_get_session):
     """Test successful token mint as host."""
     # Mock database session
     mock_db = AsyncMock()
@@ -390,7 +390,7 @@ def test_mint_calendar_token_as_host_success(app, mock_user, mock_game, mock_get
         app.dependency_overrides.clear()
 
 
-def test_mint_calendar_token_not_found(app, mock_user, mock_get_user_tokens):
+def test_mint_calendar_token_not_found(app, mock_user, mock_get_session):
     """Test token mint for non-existent game returns 404."""
     # Mock database session returning None
     mock_db = AsyncMock()
@@ -441,7 +441,7 @@ def test_mint_calendar_token_not_found(app, mock_user, mock_get_user_tokens):
         app.dependency_overrides.clear()
 
 
-def test_mint_calendar_token_permission_denied(app, mock_user, mock_game, mock_get_user_tokens):
+def test_mint_calendar_token_permission_denied(app, mock_user, mock_game, mock_get_session):
     """Test token mint without permission returns 403."""
     # User is not host or participant
     mock_game.host_id = "different-user"
@@ -505,7 +505,7 @@ def test_mint_calendar_token_permission_denied(app, mock_user, mock_game, mock_g
         app.dependency_overrides.clear()
 
 
-def test_mint_calendar_token_as_participant(app, mock_user, mock_game, mock_get_user_tokens):
+def test_mint_calendar_token_as_participant(app, mock_user, mock_game, mock_get_session):
     """Test successful token mint as participant."""
     # User is participant but not host
     mock_game.host_id = "different-user"
@@ -578,6 +578,46 @@ def test_mint_calendar_token_as_participant(app, mock_user, mock_game, mock_get_
         app.dependency_overrides.clear()
 
 
+def test_mint_calendar_feed_token_success(app, mock_user, mock_get_session):
+    """Test the feed token is minted for the caller and optional guild."""
+
+    async def override_get_current_user():
+        return mock_user
+
+    app.dependency_overrides[auth_deps.get_current_user] = override_get_current_user
+    guild_id = "8f5bd0c6-3a43-4b8f-9f5e-2a1c0c3d4e5f"
+
+    try:
+        with patch(
+            "services.api.auth.tokens.mint_calendar_feed_token", return_value="feed-token"
+        ) as mock_mint:
+            client = TestClient(app)
+            response = client.post(f"/api/v1/export/feed/token?guild_id={guild_id}")
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == {"token": "feed-token"}
+            mock_mint.assert_called_once_with("user-123", guild_id)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_mint_calendar_feed_token_rejects_non_uuid_guild(app, mock_user, mock_get_session):
+    """Test a guild filter that is not a guild UUID returns 400."""
+
+    async def override_get_current_user():
+        return mock_user
+
+    app.dependency_overrides[auth_deps.get_current_user] = override_get_current_user
+
+    try:
+        client = TestClient(app)
+        response = client.post("/api/v1/export/feed/token?guild_id=987654321")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    finally:
+        app.dependency_overrides.clear()
+
+
 def test_generate_calendar_filename_basic():
     """Test filename generation with basic title."""
 
@@ -128,6 +128,8 @@ class TestGetGame:
         mock_game.host = MagicMock()
         mock_game.host.discord_id = "host-discord-123"
         mock_game_service.get_game.return_value = mock_game
+        shared_response = MagicMock()
+        shared_response.model_copy.return_value.model_dump_json.return_value = "{}"
 
         with (
             patch(
@@ -139,10 +141,10 @@ class TestGetGame:
                 side_effect=HTTPException(status_code=http_status.HTTP_403_FORBIDDEN),
             ),
             patch(
-                "services.api.routes.games._build_game_response",
+                "services.api.routes.games.game_response_cache.get_or_build",
                 new_callable=AsyncMock,
-                return_value=MagicMock(),
-            ) as mock_build,
+                return_value=shared_response,
+            ),
         ):
             await games_routes.get_game(
                 game_id="game-1",
@@ -151,10 +153,7 @@ class TestGetGame:
                 role_service=mock_role_service,
             )
 
-        mock_build.assert_called_once_with(
-            mock_game,
-            can_manage=False,
-        )
+        shared_response.model_copy.assert_called_once_with(update={"can_manage": False})
 
 
 class TestUpdateGame:
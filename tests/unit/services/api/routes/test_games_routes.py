@@ -21,6 +21,7 @@
 
 """Unit tests for game routes error handling."""
 
+import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -30,9 +31,11 @@ from starlette import status as http_status
 
 from services.api.routes import games as games_routes
 from services.api.schemas.clone_game import CarryoverOption, CloneGameRequest
+from services.api.services import games as games_service_module
 from services.api.services import participant_resolver as resolver_module
 from services.api.services.display_names import DisplayNameResolver
 from shared.schemas import game as game_schemas
+from shared.schemas import participant as participant_schemas
 
 
 @pytest.fixture
@@ -56,6 +59,20 @@ def sample_update_data():
     )
 
 
+def _authorize_all() -> AsyncMock:
+    """Stand-in for BatchGameAuthorizer.filter_games that authorizes every game."""
+    return AsyncMock(side_effect=lambda games, manage_required=None: list(games))
+
+
+def _authorize_unless_manage_required() -> AsyncMock:
+    """Stand-in for BatchGameAuthorizer.filter_games for a user who manages nothing."""
+    return AsyncMock(
+        side_effect=lambda games, manage_required=None: [
+            game for game in games if manage_required is None or not manage_required(game)
+        ]
+    )
+
+
 def test_handle_game_operation_errors_validation_error(sample_game_data):
     """Test handling ValidationError returns 422 with invalid mentions."""
     validation_error = resolver_module.ValidationError(
@@ -133,6 +150,31 @@ def test_handle_game_operation_errors_unexpected_type(sample_game_data):
     assert "RuntimeError" in exc_info.value.detail
 
 
+def _shared_game_response() -> game_schemas.GameResponse:
+    """Permission-independent GameResponse as held by the response cache."""
+    return game_schemas.GameResponse(
+        id="game-123",
+        title="Test Game",
+        scheduled_at="2026-06-01T18:00:00Z",
+        guild_id="g1",
+        channel_id="c1",
+        host=participant_schemas.ParticipantResponse(
+            id="host-1",
+            game_session_id="game-123",
+            joined_at="2026-05-30T00:00:00Z",
+            position_type=8000,
+            position=0,
+        ),
+        status="SCHEDULED",
+        signup_method="SELF_SIGNUP",
+        participant_count=0,
+        created_at="2026-05-30T00:00:00Z",
+        updated_at="2026-05-30T00:00:00Z",
+        display_status="SCHEDULED",
+        version=2,
+    )
+
+
 class TestGetGameCanManage:
     """Tests for can_manage logic in get_game route handler."""
 
@@ -150,16 +192,16 @@ class TestGetGameCanManage:
         user.access_token = "token"
         return user
 
-    @pytest.mark.asyncio
-    async def test_get_game_passes_can_manage_true_when_authorized(self):
-        """get_game passes can_manage=True to _build_game_response when user can manage."""
+    async def _get_game(self, can_manage: object, if_none_match: str | None = None):
         game = self._make_game()
-        current_user = self._make_current_user()
         game_service = MagicMock()
         game_service.get_game = AsyncMock(return_value=game)
         game_service.db = MagicMock()
-        role_service = MagicMock()
-        expected_response = MagicMock()
+        can_manage_patch = (
+            {"side_effect": can_manage}
+            if isinstance(can_manage, Exception)
+            else {"return_value": can_manage}
+        )
 
         with (
             patch(
@@ -169,105 +211,78 @@ class TestGetGameCanManage:
             patch(
                 "services.api.routes.games.permissions_deps.can_manage_game",
                 new_callable=AsyncMock,
-                return_value=True,
+                **can_manage_patch,
             ),
+            patch(
+                "services.api.routes.games.game_response_cache.get_or_build",
+                new_callable=AsyncMock,
+                return_value=_shared_game_response(),
+            ) as mock_get_or_build,
             patch(
                 "services.api.routes.games._build_game_response",
                 new_callable=AsyncMock,
-                return_value=expected_response,
             ) as mock_build,
         ):
             result = await games_routes.get_game(
                 game_id="game-123",
-                current_user=current_user,
+                current_user=self._make_current_user(),
                 game_service=game_service,
-                role_service=role_service,
+                role_service=MagicMock(),
+                if_none_match=if_none_match,
             )
+            build = mock_get_or_build.await_args.args[1]
+            await build()
 
-        mock_build.assert_called_once_with(
-            game,
-            can_manage=True,
-        )
-        assert result is expected_response
+        mock_get_or_build.assert_awaited_once()
+        assert mock_get_or_build.await_args.args[0] is game
+        mock_build.assert_awaited_once_with(game)
+        return result
 
     @pytest.mark.asyncio
-    async def test_get_game_passes_can_manage_false_when_not_authorized(self):
-        """get_game passes can_manage=False to _build_game_response when user cannot manage."""
-        game = self._make_game()
-        current_user = self._make_current_user()
-        game_service = MagicMock()
-        game_service.get_game = AsyncMock(return_value=game)
-        game_service.db = MagicMock()
-        role_service = MagicMock()
-        expected_response = MagicMock()
+    async def test_get_game_applies_can_manage_true_when_authorized(self):
+        """The cached response is built without permissions and can_manage is applied per user."""
+        result = await self._get_game(can_manage=True)
 
-        with (
-            patch(
-                "services.api.routes.games.permissions_deps.verify_game_access",
-                new_callable=AsyncMock,
-            ),
-            patch(
-                "services.api.routes.games.permissions_deps.can_manage_game",
-                new_callable=AsyncMock,
-                return_value=False,
-            ),
-            patch(
-                "services.api.routes.games._build_game_response",
-                new_callable=AsyncMock,
-                return_value=expected_response,
-            ) as mock_build,
-        ):
-            result = await games_routes.get_game(
-                game_id="game-123",
-                current_user=current_user,
-                game_service=game_service,
-                role_service=role_service,
-            )
+        assert result.status_code == http_status.HTTP_200_OK
+        assert json.loads(result.body)["can_manage"] is True
 
-        mock_build.assert_called_once_with(
-            game,
-            can_manage=False,
+    @pytest.mark.asyncio
+    async def test_get_game_applies_can_manage_false_when_not_authorized(self):
+        """can_manage is False in the body when the user cannot manage the game."""
+        result = await self._get_game(can_manage=False)
+
+        assert json.loads(result.body)["can_manage"] is False
+
+    @pytest.mark.asyncio
+    async def test_get_game_applies_can_manage_false_on_http_exception(self):
+        """can_manage is False when can_manage_game raises HTTPException."""
+        result = await self._get_game(
+            can_manage=HTTPException(status_code=http_status.HTTP_404_NOT_FOUND)
         )
-        assert result is expected_response
+
+        assert json.loads(result.body)["can_manage"] is False
 
     @pytest.mark.asyncio
-    async def test_get_game_passes_can_manage_false_on_http_exception(self):
-        """get_game passes can_manage=False when can_manage_game raises HTTPException."""
-        game = self._make_game()
-        current_user = self._make_current_user()
-        game_service = MagicMock()
-        game_service.get_game = AsyncMock(return_value=game)
-        game_service.db = MagicMock()
-        role_service = MagicMock()
-        expected_response = MagicMock()
+    async def test_get_game_sets_strong_etag_per_body(self):
+        """The ETag is strong and differs when the per-user can_manage flag differs."""
+        managed = await self._get_game(can_manage=True)
+        viewer = await self._get_game(can_manage=False)
 
-        with (
-            patch(
-                "services.api.routes.games.permissions_deps.verify_game_access",
-                new_callable=AsyncMock,
-            ),
-            patch(
-                "services.api.routes.games.permissions_deps.can_manage_game",
-                side_effect=HTTPException(status_code=http_status.HTTP_404_NOT_FOUND),
-            ),
-            patch(
-                "services.api.routes.games._build_game_response",
-                new_callable=AsyncMock,
-                return_value=expected_response,
-            ) as mock_build,
-        ):
-            result = await games_routes.get_game(
-                game_id="game-123",
-                current_user=current_user,
-                game_service=game_service,
-                role_service=role_service,
-            )
+        assert managed.headers["etag"].startswith('"')
+        assert managed.headers["etag"] != viewer.headers["etag"]
+        assert managed.headers["cache-control"] == "private, no-cache"
 
-        mock_build.assert_called_once_with(
-            game,
-            can_manage=False,
-        )
-        assert result is expected_response
+    @pytest.mark.asyncio
+    async def test_get_game_returns_304_when_if_none_match_matches(self):
+        """A matching If-None-Match gets an empty 304 carrying the same ETag."""
+        first = await self._get_game(can_manage=True)
+        etag = first.headers["etag"]
+
+        result = await self._get_game(can_manage=True, if_none_match=f'"other", W/{etag}')
+
+        assert result.status_code == http_status.HTTP_304_NOT_MODIFIED
+        assert result.body == b""
+        assert result.headers["etag"] == etag
 
 
 class TestListGamesResolvesParticipants:
@@ -290,8 +305,8 @@ class TestListGamesResolvesParticipants:
 
         with (
             patch(
-                "services.api.routes.games.permissions_deps.verify_game_access",
-                new_callable=AsyncMock,
+                "services.api.routes.games.permissions_deps.BatchGameAuthorizer.filter_games",
+                new=_authorize_all(),
             ),
             patch(
                 "services.api.routes.games._build_game_response",
@@ -354,8 +369,8 @@ class TestListGamesPrefetchedDisplayData:
 
         with (
             patch(
-                "services.api.routes.games.permissions_deps.verify_game_access",
-                new_callable=AsyncMock,
+                "services.api.routes.games.permissions_deps.BatchGameAuthorizer.filter_games",
+                new=_authorize_all(),
             ),
             patch(
                 "services.api.routes.games._build_game_response",
@@ -401,8 +416,8 @@ class TestListGamesPrefetchedDisplayData:
 
         with (
             patch(
-                "services.api.routes.games.permissions_deps.verify_game_access",
-                new_callable=AsyncMock,
+                "services.api.routes.games.permissions_deps.BatchGameAuthorizer.filter_games",
+                new=_authorize_all(),
             ),
             patch(
                 "services.api.routes.games._build_game_response",
@@ -450,8 +465,8 @@ class TestListGamesPrefetchedDisplayData:
 
         with (
             patch(
-                "services.api.routes.games.permissions_deps.verify_game_access",
-                new_callable=AsyncMock,
+                "services.api.routes.games.permissions_deps.BatchGameAuthorizer.filter_games",
+                new=_authorize_all(),
             ),
             patch(
                 "services.api.routes.games._build_game_response",
@@ -515,8 +530,8 @@ class TestListGamesUsesDisplayNameResolver:
 
         with (
             patch(
-                "services.api.routes.games.permissions_deps.verify_game_access",
-                new_callable=AsyncMock,
+                "services.api.routes.games.permissions_deps.BatchGameAuthorizer.filter_games",
+                new=_authorize_all(),
             ),
             patch(
                 "services.api.routes.games._build_game_response",
@@ -960,13 +975,8 @@ class TestListGamesPendingAnnouncementFilter:
 
         with (
             patch(
-                "services.api.routes.games.permissions_deps.verify_game_access",
-                new_callable=AsyncMock,
-            ),
-            patch(
-                "services.api.routes.games.permissions_deps.can_manage_game",
-                new_callable=AsyncMock,
-                return_value=False,
+                "services.api.routes.games.permissions_deps.BatchGameAuthorizer.filter_games",
+                new=_authorize_unless_manage_required(),
             ),
             patch(
                 "services.api.routes.games._build_game_response",
@@ -1015,13 +1025,8 @@ class TestListGamesPendingAnnouncementFilter:
 
         with (
             patch(
-                "services.api.routes.games.permissions_deps.verify_game_access",
-                new_callable=AsyncMock,
-            ),
-            patch(
-                "services.api.routes.games.permissions_deps.can_manage_game",
-                new_callable=AsyncMock,
-                return_value=True,
+                "services.api.routes.games.permissions_deps.BatchGameAuthorizer.filter_games",
+                new=_authorize_all(),
             ),
             patch(
                 "services.api.routes.games._build_game_response",
@@ -1049,3 +1054,89 @@ class TestListGamesPendingAnnouncementFilter:
             )
 
         assert len(captured_games) == 1
+
+
+class TestListGamesCursor:
+    """Tests for cursor paging in list_games."""
+
+    def _call(self, game_service, **kwargs):
+        current_user = MagicMock()
+        current_user.user.id = "user-db-id"
+        display_name_resolver = MagicMock()
+        display_name_resolver.resolve_display_names_and_avatars = AsyncMock(return_value={})
+        params = {
+            "guild_id": None,
+            "channel_id": None,
+            "status": None,
+            "role": None,
+            "limit": 2,
+            "offset": 0,
+            "cursor": None,
+            "include_total": True,
+        }
+        params.update(kwargs)
+        return games_routes.list_games(
+            **params,
+            current_user=current_user,
+            game_service=game_service,
+            role_service=MagicMock(),
+            display_name_resolver=display_name_resolver,
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_returns_400(self):
+        """A malformed cursor is rejected before querying."""
+        game_service = MagicMock()
+        game_service.list_games = AsyncMock()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await self._call(game_service, cursor="not-a-cursor!")
+
+        assert exc_info.value.status_code == http_status.HTTP_400_BAD_REQUEST
+        game_service.list_games.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_full_page_returns_cursor_after_last_unfiltered_game(self):
+        """next_cursor points past the last fetched game even if authorization hid it."""
+        visible = MagicMock(status="SCHEDULED", scheduled_at=datetime(2026, 6, 1), id="g1")
+        hidden = MagicMock(status="SCHEDULED", scheduled_at=datetime(2026, 6, 2), id="g2")
+        game_service = MagicMock()
+        game_service.list_games = AsyncMock(return_value=([visible, hidden], None))
+        cursor = games_service_module.GameListCursor(
+            status="SCHEDULED", scheduled_at=datetime(2026, 5, 1), game_id="g0"
+        )
+
+        with (
+            patch(
+                "services.api.routes.games.permissions_deps.BatchGameAuthorizer.filter_games",
+                new=AsyncMock(return_value=[visible]),
+            ),
+            patch(
+                "services.api.routes.games._build_game_response",
+                new=AsyncMock(return_value=MagicMock()),
+            ),
+            patch("services.api.routes.games.game_schemas.GameListResponse") as mock_response,
+        ):
+            await self._call(game_service, cursor=cursor.encode(), include_total=False)
+
+        assert game_service.list_games.await_args.kwargs["cursor"] == cursor
+        assert game_service.list_games.await_args.kwargs["include_total"] is False
+        next_cursor = mock_response.call_args.kwargs["next_cursor"]
+        assert games_service_module.GameListCursor.decode(next_cursor).game_id == "g2"
+
+    @pytest.mark.asyncio
+    async def test_short_page_has_no_cursor(self):
+        """A page shorter than limit is the last page."""
+        game_service = MagicMock()
+        game_service.list_games = AsyncMock(return_value=([], 0))
+
+        with (
+            patch(
+                "services.api.routes.games.permissions_deps.BatchGameAuthorizer.filter_games",
+                new=AsyncMock(return_value=[]),
+            ),
+            patch("services.api.routes.games.game_schemas.GameListResponse") as mock_response,
+        ):
+            await self._call(game_service)
+
+        assert mock_response.call_args.kwargs["next_cursor"] is None
@@ -25,6 +25,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from services.api.auth.principal_cache import INVALIDATION_CHANNEL
 from services.api.routes.maintainers import refresh_maintainers, toggle_maintainer_mode
 from shared.schemas.auth import CurrentUser
 
@@ -79,6 +80,7 @@ async def test_toggle_sets_is_maintainer_true(mock_redis):
     assert result == {"is_maintainer": True}
     saved_data = mock_redis.set_json.call_args[0][1]
     assert saved_data["is_maintainer"] is True
+    mock_redis.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, '["session-abc"]')
 
 
 @pytest.mark.asyncio
@@ -176,6 +178,7 @@ async def test_refresh_deletes_other_maintainer_sessions(mock_redis):
     deleted = [call[0][0] for call in mock_redis.delete.call_args_list]
     assert other_key in deleted
     assert caller_key not in deleted
+    mock_redis.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, '["other-elevated"]')
 
 
 @pytest.mark.asyncio
@@ -33,10 +33,12 @@ from services.api.routes.export import generate_calendar_filename
 from services.api.routes.public import (
     calendar_router,
     get_calendar_export,
+    get_calendar_feed,
     get_image,
     head_image,
     router,
 )
+from services.api.services.image_cache import ImageCache
 from shared.database import get_db
 from shared.models.game import GameSession
 from shared.models.game_image import GameImage
@@ -48,6 +50,14 @@ async def _bypass_session_cm(session):
     yield session
 
 
+@pytest.fixture(autouse=True)
+def image_cache():
+    """Give each test its own empty image cache."""
+    cache = ImageCache(max_bytes=1024 * 1024)
+    with patch("services.api.routes.public.get_image_cache", return_value=cache):
+        yield cache
+
+
 @pytest.fixture
 def mock_request():
     """Create a mock Request object."""
@@ -81,16 +91,81 @@ async def test_get_image_success(mock_request, mock_db, sample_image):
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = sample_image
     mock_db.execute.return_value = mock_result
+    mock_db.scalar.return_value = sample_image.image_data
 
     response = await get_image(mock_request, str(sample_image.id), mock_db)
 
     assert response.status_code == 200
     assert response.body == b"fake image data"
     assert response.media_type == "image/png"
-    assert response.headers["Cache-Control"] == "public, max-age=3600"
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert response.headers["ETag"] == '"abc123"'
     assert response.headers["Access-Control-Allow-Origin"] == "*"
 
 
+@pytest.mark.asyncio
+async def test_get_image_matching_etag_skips_blob(mock_request, mock_db, sample_image):
+    """A matching If-None-Match is answered with 304 from metadata alone."""
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = sample_image
+    mock_db.execute.return_value = mock_result
+
+    response = await get_image(mock_request, str(sample_image.id), mock_db, '"abc123"')
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"abc123"'
+    mock_db.scalar.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_image_served_from_cache(mock_request, mock_db, sample_image, image_cache):
+    """A second GET for the same image does not query the database."""
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = sample_image
+    mock_db.execute.return_value = mock_result
+    mock_db.scalar.return_value = sample_image.image_data
+
+    await get_image(mock_request, str(sample_image.id), mock_db)
+    response = await get_image(mock_request, f"{sample_image.id}.png", mock_db)
+
+    assert response.body == b"fake image data"
+    assert mock_db.execute.await_count == 1
+    assert mock_db.scalar.await_count == 1
+    assert image_cache.size == len(b"fake image data")
+
+
+@pytest.mark.asyncio
+async def test_get_image_serves_size_variant(mock_request, mock_db, sample_image, image_cache):
+    """?size= serves the stored variant under its own ETag and cache entry."""
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = sample_image
+    mock_db.execute.return_value = mock_result
+    mock_db.scalar.side_effect = ["image/png", b"thumb"]
+
+    response = await get_image(mock_request, str(sample_image.id), mock_db, None, size="thumbnail")
+
+    assert response.body == b"thumb"
+    assert response.headers["ETag"] == '"abc123-thumbnail"'
+    assert image_cache.get((sample_image.id, "thumbnail")) is not None
+    assert image_cache.get((sample_image.id, None)) is None
+
+
+@pytest.mark.asyncio
+async def test_get_image_missing_variant_falls_back_to_original(
+    mock_request, mock_db, sample_image
+):
+    """An image too small to need a variant is served as the original."""
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = sample_image
+    mock_db.execute.return_value = mock_result
+    mock_db.scalar.side_effect = [None, sample_image.image_data]
+
+    response = await get_image(mock_request, str(sample_image.id), mock_db, None, size="banner")
+
+    assert response.body == b"fake image data"
+    assert response.headers["ETag"] == '"abc123"'
+
+
 @pytest.mark.asyncio
 async def test_get_image_not_found(mock_request, mock_db):
     """Test image not found returns 404."""
@@ -127,8 +202,10 @@ async def test_head_image_success(mock_request, mock_db, sample_image):
     assert response.status_code == 200
     assert response.body == b""
     assert response.media_type == "image/png"
-    assert response.headers["Cache-Control"] == "public, max-age=3600"
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert response.headers["ETag"] == '"abc123"'
     assert response.headers["Access-Control-Allow-Origin"] == "*"
+    mock_db.scalar.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -165,6 +242,7 @@ def public_app(sample_image):
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = sample_image
     mock_db.execute.return_value = mock_result
+    mock_db.scalar.return_value = sample_image.image_data
 
     async def override_get_db():
         yield mock_db
@@ -187,6 +265,13 @@ def test_head_image_with_gif_extension_returns_200(public_app, sample_image):
     assert response.status_code == 200
 
 
+def test_get_image_with_unknown_size_returns_422(public_app, sample_image):
+    """Only the pre-rendered sizes are accepted."""
+    client = TestClient(public_app)
+    response = client.get(f"/api/v1/public/images/{sample_image.id}.gif?size=huge")
+    assert response.status_code == 422
+
+
 def test_get_image_with_invalid_uuid_returns_404(public_app):
     """GET with non-UUID path segment returns 404."""
     client = TestClient(public_app)
@@ -356,3 +441,134 @@ def test_get_calendar_export_via_test_client_returns_200(calendar_app, mock_db,
         response = client.get("/api/v1/public/calendar/tok123.ics")
 
     assert response.status_code == 200
+
+
+def _feed_game(
+    game_id: str = "game-123", updated_at: datetime = datetime(2025, 12, 1, 12, 0, 0, 500000)
+) -> GameSession:
+    return GameSession(
+        id=game_id,
+        title="Test Game",
+        scheduled_at=datetime(2025, 12, 15, 18, 0, 0),
+        updated_at=updated_at,
+    )
+
+
+async def _fake_stream(_games):
+    yield b"BEGIN:VCALENDAR\r\n"
+    yield b"END:VCALENDAR\r\n"
+
+
+def test_get_calendar_feed_streams_with_validators(calendar_app, mock_db):
+    """The feed streams iCal content with an ETag and no Last-Modified."""
+    with (
+        patch(
+            "services.api.auth.tokens.verify_calendar_feed_token",
+            return_value=("user-123", None),
+        ),
+        patch(
+            "services.api.routes.public.get_bypass_db_session",
+            return_value=_bypass_session_cm(mock_db),
+        ),
+        patch(
+            "services.api.services.calendar_export.CalendarExportService.load_feed_games",
+            new_callable=AsyncMock,
+            return_value=[_feed_game()],
+        ) as mock_load,
+        patch(
+            "services.api.services.calendar_export.CalendarExportService.stream_calendar",
+            side_effect=_fake_stream,
+        ),
+    ):
+        client = TestClient(calendar_app)
+        response = client.get("/api/v1/public/calendar/feed/tok.ics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/calendar")
+    assert response.content == b"BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n"
+    assert response.headers["ETag"].startswith('W/"')
+    assert "Last-Modified" not in response.headers
+    mock_load.assert_awaited_once_with("user-123", None)
+
+
+def test_get_calendar_feed_unchanged_returns_304(calendar_app, mock_db):
+    """A poll whose ETag still matches is answered without rendering."""
+    with (
+        patch(
+            "services.api.auth.tokens.verify_calendar_feed_token",
+            return_value=("user-123", None),
+        ),
+        patch(
+            "services.api.routes.public.get_bypass_db_session",
+            side_effect=lambda: _bypass_session_cm(mock_db),
+        ),
+        patch(
+            "services.api.services.calendar_export.CalendarExportService.load_feed_games",
+            new_callable=AsyncMock,
+            return_value=[_feed_game()],
+        ),
+        patch(
+            "services.api.services.calendar_export.CalendarExportService.stream_calendar",
+            side_effect=_fake_stream,
+        ) as mock_stream,
+    ):
+        client = TestClient(calendar_app)
+        first = client.get("/api/v1/public/calendar/feed/tok.ics")
+        response = client.get(
+            "/api/v1/public/calendar/feed/tok.ics",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == first.headers["ETag"]
+    assert mock_stream.call_count == 1
+
+
+def test_get_calendar_feed_joined_older_game_ignores_if_modified_since(calendar_app, mock_db):
+    """Joining a game updated earlier than the feed's newest game still refreshes the feed.
+
+    A join does not touch the game's updated_at, so an If-Modified-Since poll
+    must not be answered with 304.
+    """
+    newer = _feed_game()
+    older = _feed_game("game-456", datetime(2025, 11, 1, 12, 0, 0))
+    with (
+        patch(
+            "services.api.auth.tokens.verify_calendar_feed_token",
+            return_value=("user-123", None),
+        ),
+        patch(
+            "services.api.routes.public.get_bypass_db_session",
+            side_effect=lambda: _bypass_session_cm(mock_db),
+        ),
+        patch(
+            "services.api.services.calendar_export.CalendarExportService.load_feed_games",
+            new_callable=AsyncMock,
+            side_effect=[[newer], [older, newer]],
+        ),
+        patch(
+            "services.api.services.calendar_export.CalendarExportService.stream_calendar",
+            side_effect=_fake_stream,
+        ) as mock_stream,
+    ):
+        client = TestClient(calendar_app)
+        first = client.get("/api/v1/public/calendar/feed/tok.ics")
+        response = client.get(
+            "/api/v1/public/calendar/feed/tok.ics",
+            headers={"If-Modified-Since": "Mon, 01 Dec 2025 12:00:00 GMT"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert mock_stream.call_count == 2
+    assert mock_stream.call_args.args == ([older, newer],)
+
+
+@pytest.mark.asyncio
+async def test_get_calendar_feed_invalid_token_returns_404(mock_request):
+    """An unverifiable feed token returns 404."""
+    with patch("services.api.auth.tokens.verify_calendar_feed_token", return_value=None):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_calendar_feed(mock_request, "bogus.ics")
+
+    assert exc_info.value.status_code == HTTP_404_NOT_FOUND
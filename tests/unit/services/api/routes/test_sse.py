@@ -22,7 +22,7 @@
 """Tests for SSE endpoint."""
 
 import asyncio
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -35,6 +35,8 @@ def mock_sse_bridge():
     """Mock SSE bridge for testing."""
     bridge = Mock()
     bridge.connections = {}
+    bridge.register = AsyncMock()
+    bridge.keepalive_interval_seconds = 0.01
     return bridge
 
 
@@ -68,12 +70,10 @@ async def test_game_updates_creates_sse_connection(mock_sse_bridge, mock_current
         assert "cache-control" in response.headers
         assert response.headers["cache-control"] == "no-cache"
 
-        registered_clients = list(mock_sse_bridge.connections.keys())
-        assert len(registered_clients) == 1
-
-        client_id = registered_clients[0]
-        queue, session_token, discord_id = mock_sse_bridge.connections[client_id]
+        mock_sse_bridge.register.assert_awaited_once()
+        client_id, queue, session_token, discord_id = mock_sse_bridge.register.await_args.args
 
+        assert client_id.startswith("user123_")
         assert session_token == "session123"
         assert discord_id == "user123"
         assert isinstance(queue, asyncio.Queue)
@@ -88,3 +88,18 @@ async def test_game_updates_returns_streaming_response(mock_sse_bridge, mock_cur
         assert response.status_code == 200
         assert response.media_type == "text/event-stream"
         assert response.headers["x-accel-buffering"] == "no"
+
+
+@pytest.mark.asyncio
+async def test_game_updates_stream_ends_when_bridge_drops_client(
+    mock_sse_bridge, mock_current_user
+):
+    """A client removed by the bridge's session refresh stops at the next keepalive."""
+    with patch("services.api.routes.sse.get_sse_bridge", return_value=mock_sse_bridge):
+        response = await game_updates(mock_current_user)
+
+    chunks = [chunk async for chunk in response.body_iterator]
+
+    assert chunks == []
+    client_id = mock_sse_bridge.register.await_args.args[0]
+    mock_sse_bridge.unregister.assert_called_once_with(client_id)
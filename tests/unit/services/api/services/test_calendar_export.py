@@ -21,6 +21,7 @@
 
 """Tests for calendar export service."""
 
+import json
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -28,7 +29,13 @@ import pytest
 from icalendar import Calendar
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from services.api.services.calendar_export import CalendarExportService
+from services.api.services.calendar_export import (
+    CalendarExportService,
+    feed_etag,
+    feed_not_modified,
+)
+from shared.cache.keys import CacheKeys
+from shared.cache.ttl import CacheTTL
 from shared.models.channel import ChannelConfiguration
 from shared.models.game import GameSession
 from shared.models.guild import GuildConfiguration
@@ -112,8 +119,14 @@ async def test_export_game_as_host(
     mock_fetch_channel.return_value = "#game-channel"
     mock_fetch_guild.return_value = "Test Server"
     mock_redis_fn.return_value = AsyncMock()
-    mock_proj.get_member = AsyncMock(
-        return_value={"username": "TestUser", "global_name": "Test User", "nick": None}
+    mock_proj.get_members = AsyncMock(
+        return_value={
+            ("987654321", "123456789"): {
+                "username": "TestUser",
+                "global_name": "Test User",
+                "nick": None,
+            }
+        }
     )
 
     mock_result = MagicMock()
@@ -134,8 +147,8 @@ async def test_export_game_as_host(
     assert event.get("summary") == "Test Game Night"
 
     # Verify projection was called for host display name
-    mock_proj.get_member.assert_called_once_with(
-        "987654321", "123456789", redis=mock_redis_fn.return_value
+    mock_proj.get_members.assert_called_once_with(
+        [("987654321", "123456789")], redis=mock_redis_fn.return_value
     )
     mock_fetch_channel.assert_called_once_with("111222333")
     mock_fetch_guild.assert_called_once_with("987654321")
@@ -154,7 +167,7 @@ async def test_export_game_as_participant(
     mock_fetch_channel.return_value = "#game-channel"
     mock_fetch_guild.return_value = "Test Server"
     mock_redis_fn.return_value = AsyncMock()
-    mock_proj.get_member = AsyncMock(return_value=None)
+    mock_proj.get_members = AsyncMock(return_value={})
 
     # Create a participant
     participant = GameParticipant(
@@ -192,7 +205,7 @@ async def test_export_game_as_bot_manager(
     mock_fetch_channel.return_value = "#game-channel"
     mock_fetch_guild.return_value = "Test Server"
     mock_redis_fn.return_value = AsyncMock()
-    mock_proj.get_member = AsyncMock(return_value=None)
+    mock_proj.get_members = AsyncMock(return_value={})
 
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = mock_game
@@ -250,7 +263,7 @@ async def test_event_has_correct_duration(
     mock_fetch_channel.return_value = "#game-channel"
     mock_fetch_guild.return_value = "Test Server"
     mock_redis_fn.return_value = AsyncMock()
-    mock_proj.get_member = AsyncMock(return_value=None)
+    mock_proj.get_members = AsyncMock(return_value={})
 
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = mock_game
@@ -283,7 +296,7 @@ async def test_event_has_alarms(
     mock_fetch_channel.return_value = "#game-channel"
     mock_fetch_guild.return_value = "Test Server"
     mock_redis_fn.return_value = AsyncMock()
-    mock_proj.get_member = AsyncMock(return_value=None)
+    mock_proj.get_members = AsyncMock(return_value={})
 
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = mock_game
@@ -313,7 +326,7 @@ async def test_event_status_mapping(
     mock_fetch_channel.return_value = "#game-channel"
     mock_fetch_guild.return_value = "Test Server"
     mock_redis_fn.return_value = AsyncMock()
-    mock_proj.get_member = AsyncMock(return_value=None)
+    mock_proj.get_members = AsyncMock(return_value={})
 
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = mock_game
@@ -343,7 +356,7 @@ async def test_cancelled_game_status(
     mock_fetch_channel.return_value = "#game-channel"
     mock_fetch_guild.return_value = "Test Server"
     mock_redis_fn.return_value = AsyncMock()
-    mock_proj.get_member = AsyncMock(return_value=None)
+    mock_proj.get_members = AsyncMock(return_value={})
 
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = mock_game
@@ -395,7 +408,7 @@ async def test_host_display_name_from_projection(
     mock_db.execute = AsyncMock(return_value=mock_result)
 
     with patch("services.api.services.calendar_export.member_projection") as mock_proj:
-        mock_proj.get_member = AsyncMock(return_value=member_data)
+        mock_proj.get_members = AsyncMock(return_value={("987654321", "123456789"): member_data})
 
         with patch("services.api.services.calendar_export.get_redis_client") as mock_redis_fn:
             mock_redis = AsyncMock()
@@ -408,8 +421,124 @@ async def test_host_display_name_from_projection(
 
     assert ical_data is not None
     mock_redis_fn.assert_called_once_with()
-    mock_proj.get_member.assert_awaited_once_with("987654321", "123456789", redis=mock_redis)
+    mock_proj.get_members.assert_awaited_once_with([("987654321", "123456789")], redis=mock_redis)
     cal = Calendar.from_ical(ical_data)
     events = [c for c in cal.walk() if c.name == "VEVENT"]
     description = events[0].get("description")
     assert "Test User" in description or "testuser" in description
+
+
+async def _collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+@pytest.mark.asyncio
+@patch("services.api.services.calendar_export.get_redis_client")
+@patch("services.api.services.calendar_export.member_projection")
+@patch("services.api.services.calendar_export.fetch_guild_name_safe")
+@patch("services.api.services.calendar_export.fetch_channel_name_safe")
+async def test_stream_calendar_reuses_current_cached_events(
+    mock_fetch_channel, mock_fetch_guild, mock_proj, mock_redis_fn, mock_db, mock_game
+):
+    """Cached VEVENTs tagged with the current updated_at are streamed as stored."""
+    cached = "BEGIN:VEVENT\r\nUID:game-123@game-scheduler\r\nSUMMARY:Cached\r\nEND:VEVENT\r\n"
+    redis = AsyncMock()
+    redis.mget = AsyncMock(
+        return_value=[json.dumps({"updated_at": mock_game.updated_at.isoformat(), "ical": cached})]
+    )
+    mock_redis_fn.return_value = redis
+    mock_proj.get_members = AsyncMock()
+
+    service = CalendarExportService(mock_db)
+    ical_data = await _collect(service.stream_calendar([mock_game]))
+
+    events = [c for c in Calendar.from_ical(ical_data).walk() if c.name == "VEVENT"]
+    assert [str(e.get("summary")) for e in events] == ["Cached"]
+    redis.mget.assert_awaited_once_with([CacheKeys.calendar_event("game-123")])
+    redis.set_many.assert_not_awaited()
+    mock_proj.get_members.assert_not_awaited()
+    mock_fetch_guild.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("services.api.services.calendar_export.get_redis_client")
+@patch("services.api.services.calendar_export.member_projection")
+@patch("services.api.services.calendar_export.fetch_guild_name_safe")
+@patch("services.api.services.calendar_export.fetch_channel_name_safe")
+async def test_stream_calendar_renders_and_stores_stale_events(
+    mock_fetch_channel, mock_fetch_guild, mock_proj, mock_redis_fn, mock_db, mock_game
+):
+    """Missing or outdated VEVENTs are rendered with one bulk host read and cached."""
+    second = GameSession(
+        id="game-456",
+        title="Second Game",
+        scheduled_at=datetime(2025, 12, 16, 18, 0, 0),
+        status="SCHEDULED",
+        created_at=datetime(2025, 12, 1, 12, 0, 0),
+        updated_at=datetime(2025, 12, 2, 12, 0, 0),
+    )
+    second.host = mock_game.host
+    second.guild = mock_game.guild
+    second.channel = mock_game.channel
+    outdated = json.dumps({"updated_at": "2025-11-01T00:00:00", "ical": "stale"})
+    redis = AsyncMock()
+    redis.mget = AsyncMock(return_value=[None, outdated])
+    mock_redis_fn.return_value = redis
+    mock_fetch_channel.return_value = "game-channel"
+    mock_fetch_guild.return_value = "Test Server"
+    mock_proj.get_members = AsyncMock(
+        return_value={("987654321", "123456789"): {"nick": "Hosty", "username": "host"}}
+    )
+
+    service = CalendarExportService(mock_db)
+    ical_data = await _collect(service.stream_calendar([mock_game, second]))
+
+    events = [c for c in Calendar.from_ical(ical_data).walk() if c.name == "VEVENT"]
+    assert [str(e.get("summary")) for e in events] == ["Test Game Night", "Second Game"]
+    assert all("@Hosty" in str(e.get("description")) for e in events)
+    mock_proj.get_members.assert_awaited_once_with(
+        [("987654321", "123456789"), ("987654321", "123456789")], redis=redis
+    )
+    (stored,) = redis.set_many.await_args.args
+    assert set(stored) == {
+        CacheKeys.calendar_event("game-123"),
+        CacheKeys.calendar_event("game-456"),
+    }
+    assert json.loads(stored[CacheKeys.calendar_event("game-456")])["updated_at"] == (
+        "2025-12-02T12:00:00"
+    )
+    assert redis.set_many.await_args.kwargs == {"ttl": CacheTTL.CALENDAR_EVENT}
+
+
+@pytest.mark.asyncio
+async def test_load_feed_games_returns_query_results(mock_db, mock_game):
+    """The feed query's rows are returned in order."""
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [mock_game]
+    mock_db.execute = AsyncMock(return_value=mock_result)
+
+    service = CalendarExportService(mock_db)
+    games = await service.load_feed_games("user-123", "guild-123")
+
+    assert games == [mock_game]
+    mock_db.execute.assert_awaited_once()
+
+
+def test_feed_etag_tracks_membership_and_updates(mock_game):
+    """The feed ETag changes when a game changes or the scope differs."""
+    etag = feed_etag("user-123:None", [mock_game])
+
+    assert etag.startswith('W/"')
+    assert feed_etag("user-123:guild-123", [mock_game]) != etag
+    assert feed_etag("user-123:None", []) != etag
+    mock_game.updated_at = mock_game.updated_at + timedelta(seconds=1)
+    assert feed_etag("user-123:None", [mock_game]) != etag
+
+
+def test_feed_not_modified_matches_etag_only():
+    """Only If-None-Match can answer a feed poll with 304."""
+    assert feed_not_modified('W/"abc"', 'W/"abc"')
+    assert feed_not_modified('"abc"', 'W/"abc"')
+    assert feed_not_modified('"other", W/"abc"', 'W/"abc"')
+    assert not feed_not_modified('"other"', 'W/"abc"')
+    assert not feed_not_modified(None, 'W/"abc"')
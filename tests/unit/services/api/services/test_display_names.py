@@ -21,12 +21,14 @@
 
 """Unit tests for display name resolution service."""
 
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from services.api.services import display_names
 from shared.cache import client as cache_client
+from shared.cache.keys import CacheKeys
 
 
 @pytest.fixture
@@ -35,6 +37,26 @@ def mock_cache():
     return AsyncMock(spec=cache_client.RedisClient)
 
 
+def _serve(mock_cache, store: dict[str, str], gen: str = "gen1") -> None:
+    """Back the mock cache's GET/MGET with a dict of stored values."""
+    mock_cache.get.side_effect = lambda key: gen if key == CacheKeys.proj_gen() else store.get(key)
+    mock_cache.mget.side_effect = lambda keys: [store.get(key) for key in keys]
+
+
+def _member_key(guild_id: str, user_id: str, gen: str = "gen1") -> str:
+    return CacheKeys.proj_member(gen, guild_id, user_id)
+
+
+def _member(nick=None, global_name=None, username="base", avatar_url=None) -> str:
+    return json.dumps({
+        "roles": [],
+        "nick": nick,
+        "global_name": global_name,
+        "username": username,
+        "avatar_url": avatar_url,
+    })
+
+
 @pytest.fixture
 def resolver(mock_cache):
     """Display name resolver with mocked dependencies."""
@@ -45,30 +67,27 @@ def resolver(mock_cache):
 async def test_resolve_display_names_from_cache(resolver, mock_cache):
     """Test resolving display names from cache."""
     guild_id = "123456789"
-    user_ids = ["user1", "user2"]
+    _serve(
+        mock_cache,
+        {
+            CacheKeys.display_name("user1", guild_id): json.dumps("CachedName1"),
+            CacheKeys.display_name("user2", guild_id): json.dumps("CachedName2"),
+        },
+    )
 
-    with patch(
-        "services.api.services.display_names.cache_get",
-        new_callable=AsyncMock,
-        side_effect=["CachedName1", "CachedName2"],
-    ):
-        result = await resolver.resolve_display_names(guild_id, user_ids)
+    result = await resolver.resolve_display_names(guild_id, ["user1", "user2"])
 
     assert result == {"user1": "CachedName1", "user2": "CachedName2"}
+    mock_cache.set_many.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_resolve_single(resolver, mock_cache):
     """Test resolving single user display name."""
     guild_id = "123456789"
-    user_id = "user1"
+    _serve(mock_cache, {CacheKeys.display_name("user1", guild_id): json.dumps("CachedName1")})
 
-    with patch(
-        "services.api.services.display_names.cache_get",
-        new_callable=AsyncMock,
-        return_value="CachedName1",
-    ):
-        result = await resolver.resolve_single(guild_id, user_id)
+    result = await resolver.resolve_single(guild_id, "user1")
 
     assert result == "CachedName1"
 
@@ -135,60 +154,41 @@ def test_create_fallback_user_data_empty_list():
 
 
 @pytest.mark.asyncio
-async def test_check_cache_for_display_names_all_cached(resolver, mock_cache):
-    """Test checking cache when all user IDs are cached."""
-    guild_id = "guild123"
-    user_ids = ["user1", "user2"]
-
-    with patch(
-        "services.api.services.display_names.cache_get",
-        new_callable=AsyncMock,
-        side_effect=["CachedName1", "CachedName2"],
-    ):
-        result, uncached_ids = await resolver._check_cache_for_display_names(guild_id, user_ids)
-
-    assert result == {"user1": "CachedName1", "user2": "CachedName2"}
-    assert uncached_ids == []
-
-
-@pytest.mark.asyncio
-async def test_check_cache_for_display_names_none_cached(resolver, mock_cache):
-    """Test checking cache when no user IDs are cached."""
+async def test_read_cached_names_and_members_partially_cached(resolver, mock_cache):
+    """Cached names are returned; uncached users get their raw projection record."""
     guild_id = "guild123"
-    user_ids = ["user1", "user2"]
+    _serve(
+        mock_cache,
+        {
+            CacheKeys.display_name("user1", guild_id): json.dumps("CachedName1"),
+            _member_key(guild_id, "user1"): _member(username="one"),
+            _member_key(guild_id, "user2"): _member(username="two"),
+        },
+    )
 
-    with patch(
-        "services.api.services.display_names.cache_get",
-        new_callable=AsyncMock,
-        return_value=None,
-    ):
-        result, uncached_ids = await resolver._check_cache_for_display_names(guild_id, user_ids)
+    cached, uncached = await resolver._read_cached_names_and_members(
+        guild_id, ["user1", "user2", "user3"]
+    )
 
-    assert result == {}
-    assert uncached_ids == ["user1", "user2"]
+    assert cached == {"user1": "CachedName1"}
+    assert uncached == {"user2": _member(username="two"), "user3": None}
 
 
 @pytest.mark.asyncio
-async def test_check_cache_for_display_names_partially_cached(resolver, mock_cache):
-    """Test checking cache when some user IDs are cached."""
+async def test_read_cached_names_and_members_records_per_key_metrics(resolver, mock_cache):
+    """Display-name hits and misses are counted per key, not per batch."""
     guild_id = "guild123"
-    user_ids = ["user1", "user2", "user3"]
-
-    async def mock_cache_get(key, operation):
-        if "user1" in key:
-            return "CachedName1"
-        if "user3" in key:
-            return "CachedName3"
-        return None
+    _serve(
+        mock_cache,
+        {CacheKeys.display_name("user1", guild_id): json.dumps("CachedName1")},
+    )
 
-    with patch(
-        "services.api.services.display_names.cache_get",
-        side_effect=mock_cache_get,
-    ):
-        result, uncached_ids = await resolver._check_cache_for_display_names(guild_id, user_ids)
+    with patch("services.api.services.display_names.record_cache_lookups") as mock_record:
+        await resolver._read_cached_names_and_members(guild_id, ["user1", "user2", "user3"])
 
-    assert result == {"user1": "CachedName1", "user3": "CachedName3"}
-    assert uncached_ids == ["user2"]
+    operation, values, _elapsed = mock_record.call_args.args
+    assert operation == display_names.CacheOperation.DISPLAY_NAME
+    assert values == ["CachedName1", None, None]
 
 
 def test_create_fallback_display_names():
@@ -274,66 +274,68 @@ def test_check_cache_for_users_removed(resolver):
 
 
 @pytest.mark.asyncio
-async def test_fetch_display_names_from_projection(mock_cache):
-    """_fetch_and_cache_display_names reads from projection, not Discord REST."""
+async def test_resolve_and_cache_display_names_from_projection(mock_cache):
+    """Names come from projection records and are cached in one write."""
     resolver = display_names.DisplayNameResolver(mock_cache)
     guild_id = "guild123"
-    uncached_ids = ["user1", "user2"]
+    records = {
+        "user1": _member(nick="ProjNick1", global_name="Global1", username="user1base"),
+        "user2": _member(global_name="Global2", username="user2base"),
+        "user3": None,
+    }
 
-    def fake_get_member(gid, uid, *, redis):
-        if uid == "user1":
-            return {"nick": "ProjNick1", "global_name": "Global1", "username": "user1base"}
-        return {"nick": None, "global_name": "Global2", "username": "user2base"}
+    result = await resolver._resolve_and_cache_display_names(guild_id, records)
 
-    with patch(
-        "services.api.services.display_names.member_projection.get_member",
-        side_effect=fake_get_member,
-    ):
-        result = await resolver._fetch_and_cache_display_names(guild_id, uncached_ids)
-
-    assert result == {"user1": "ProjNick1", "user2": "Global2"}
+    assert result == {"user1": "ProjNick1", "user2": "Global2", "user3": "Unknown User"}
+    mock_cache.set_many.assert_awaited_once_with(
+        {
+            CacheKeys.display_name("user1", guild_id): json.dumps("ProjNick1"),
+            CacheKeys.display_name("user2", guild_id): json.dumps("Global2"),
+        },
+        ttl=display_names.cache_ttl.CacheTTL.DISPLAY_NAME,
+    )
 
 
 @pytest.mark.asyncio
-async def test_fetch_display_names_absent_member_from_projection(mock_cache):
-    """_fetch_and_cache_display_names returns 'Unknown User' for absent projection member."""
+async def test_resolve_display_names_round_trips_constant_for_50_users(mock_cache):
+    """A 50-player lookup costs one gen GET, one MGET and one pipelined write."""
     resolver = display_names.DisplayNameResolver(mock_cache)
     guild_id = "guild123"
-    uncached_ids = ["user1", "user2"]
+    user_ids = [f"user{i:04d}" for i in range(50)]
+    store = {_member_key(guild_id, uid): _member(username=uid) for uid in user_ids}
+    store.update({
+        CacheKeys.display_name(uid, guild_id): json.dumps(f"Cached{uid}") for uid in user_ids[:10]
+    })
+    _serve(mock_cache, store)
 
-    with patch(
-        "services.api.services.display_names.member_projection.get_member",
-        new=AsyncMock(return_value=None),
-    ):
-        result = await resolver._fetch_and_cache_display_names(guild_id, uncached_ids)
+    result = await resolver.resolve_display_names(guild_id, user_ids)
 
-    assert result == {"user1": "Unknown User", "user2": "Unknown User"}
+    assert result["user0000"] == "Cacheduser0000"
+    assert result["user0049"] == "user0049"
+    assert mock_cache.get.await_count == 1
+    assert mock_cache.mget.await_count == 1
+    assert mock_cache.set_many.await_count == 1
+    assert len(mock_cache.set_many.await_args.args[0]) == 40
 
 
 @pytest.mark.asyncio
 async def test_fetch_display_names_avatars_from_projection(mock_cache):
-    """_fetch_and_cache_display_names_avatars reads avatar_url from projection."""
+    """_fetch_display_names_avatars reads names and avatar_url from projection."""
     resolver = display_names.DisplayNameResolver(mock_cache)
     guild_id = "guild123"
-    uncached_ids = ["user1"]
-
-    member = {
-        "nick": "Nick1",
-        "global_name": "Global1",
-        "username": "base1",
-        "avatar_url": "https://cdn.discordapp.com/avatars/user1/hash.png?size=64",
-    }
+    avatar = "https://cdn.discordapp.com/avatars/user1/hash.png?size=64"
+    _serve(
+        mock_cache,
+        {_member_key(guild_id, "user1"): _member(nick="Nick1", avatar_url=avatar)},
+    )
 
-    with patch(
-        "services.api.services.display_names.member_projection.get_member",
-        new=AsyncMock(return_value=member),
-    ):
-        result = await resolver._fetch_and_cache_display_names_avatars(guild_id, uncached_ids)
+    result = await resolver._fetch_display_names_avatars(guild_id, ["user1", "user2"])
 
-    assert result["user1"]["display_name"] == "Nick1"
-    assert (
-        result["user1"]["avatar_url"] == "https://cdn.discordapp.com/avatars/user1/hash.png?size=64"
-    )
+    assert result == {
+        "user1": {"display_name": "Nick1", "avatar_url": avatar},
+        "user2": {"display_name": "Unknown User", "avatar_url": None},
+    }
+    mock_cache.mget.assert_awaited_once()
 
 
 def test_resolve_display_name_flat_dict():
@@ -344,40 +346,34 @@ def test_resolve_display_name_flat_dict():
 
 
 @pytest.mark.asyncio
-async def test_fetch_display_names_avatars_absent_member_from_projection(mock_cache):
-    """_fetch_and_cache_display_names_avatars returns Unknown User for absent member."""
+async def test_resolve_display_names_exception_returns_fallback(mock_cache):
+    """resolve_display_names falls back to User#<suffix> on read exception."""
     resolver = display_names.DisplayNameResolver(mock_cache)
-    guild_id = "guild123"
-    uncached_ids = ["user1"]
 
     with patch(
-        "services.api.services.display_names.member_projection.get_member",
-        new=AsyncMock(return_value=None),
+        "services.api.services.display_names.read_projection_keys",
+        side_effect=RuntimeError("redis down"),
     ):
-        result = await resolver._fetch_and_cache_display_names_avatars(guild_id, uncached_ids)
+        result = await resolver.resolve_display_names("guild1", ["user1234"])
 
-    assert result["user1"]["display_name"] == "Unknown User"
-    assert result["user1"]["avatar_url"] is None
+    assert result == {"user1234": "User#1234"}
 
 
 @pytest.mark.asyncio
-async def test_resolve_display_names_exception_returns_fallback(mock_cache):
-    """resolve_display_names falls back to User#<suffix> on fetch exception."""
+async def test_resolve_display_names_keeps_cached_names_when_resolve_fails(mock_cache):
+    """Only uncached users fall back when resolving projection records fails."""
     resolver = display_names.DisplayNameResolver(mock_cache)
+    _serve(
+        mock_cache,
+        {
+            CacheKeys.display_name("user1111", "guild1"): json.dumps("Cached"),
+            _member_key("guild1", "user2222"): "not-a-member-record",
+        },
+    )
 
-    with (
-        patch(
-            "services.api.services.display_names.cache_get",
-            new=AsyncMock(return_value=None),
-        ),
-        patch(
-            "services.api.services.display_names.member_projection.get_member",
-            side_effect=RuntimeError("redis down"),
-        ),
-    ):
-        result = await resolver.resolve_display_names("guild1", ["user1234"])
+    result = await resolver.resolve_display_names("guild1", ["user1111", "user2222"])
 
-    assert result == {"user1234": "User#1234"}
+    assert result == {"user1111": "Cached", "user2222": "User#2222"}
 
 
 @pytest.mark.asyncio
@@ -386,7 +382,7 @@ async def test_resolve_display_names_and_avatars_exception_returns_fallback(mock
     resolver = display_names.DisplayNameResolver(mock_cache)
 
     with patch(
-        "services.api.services.display_names.member_projection.get_member",
+        "services.api.services.display_names.read_projection_keys",
         side_effect=RuntimeError("redis down"),
     ):
         result = await resolver.resolve_display_names_and_avatars("guild1", ["user1234"])
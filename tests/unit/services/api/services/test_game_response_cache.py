@@ -0,0 +1,175 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the shared GameResponse cache."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.api.services import game_response_cache
+from shared.cache.keys import CacheKeys
+from shared.cache.ttl import CacheTTL
+from shared.schemas.game import GameResponse
+from shared.schemas.participant import ParticipantResponse
+
+_UPDATED_AT = datetime(2026, 10, 16, 12, 0, 0)
+
+
+def _game(version: int = 2) -> MagicMock:
+    game = MagicMock()
+    game.id = "game-1"
+    game.version = version
+    game.updated_at = _UPDATED_AT
+    return game
+
+
+def _response() -> GameResponse:
+    return GameResponse(
+        id="game-1",
+        title="Test Game",
+        scheduled_at="2026-06-01T18:00:00Z",
+        guild_id="g1",
+        channel_id="c1",
+        host=ParticipantResponse(
+            id="host-1",
+            game_session_id="game-1",
+            joined_at="2026-05-30T00:00:00Z",
+            position_type=8000,
+            position=0,
+        ),
+        status="SCHEDULED",
+        signup_method="SELF_SIGNUP",
+        participant_count=0,
+        created_at="2026-05-30T00:00:00Z",
+        updated_at="2026-05-30T00:00:00Z",
+        display_status="SCHEDULED",
+    )
+
+
+@pytest.fixture
+def mock_redis():
+    redis = AsyncMock()
+    redis.get_json = AsyncMock(return_value=None)
+    with patch(
+        "services.api.services.game_response_cache.cache_client.get_redis_client",
+        new=AsyncMock(return_value=redis),
+    ):
+        yield redis
+
+
+@pytest.mark.asyncio
+async def test_hit_with_matching_version_skips_build(mock_redis):
+    """A cached entry tagged with the game's current version is returned as-is."""
+    game = _game()
+    mock_redis.get_json.return_value = {
+        "version": game_response_cache.response_version(game),
+        "response": _response().model_dump(mode="json"),
+    }
+    build = AsyncMock()
+
+    result = await game_response_cache.get_or_build(game, build)
+
+    assert result == _response()
+    build.assert_not_awaited()
+    mock_redis.set_json.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_miss_builds_and_stores_tagged_response(mock_redis):
+    """A miss builds once and stores the response tagged with version and updated_at."""
+    game = _game()
+    build = AsyncMock(return_value=_response())
+
+    result = await game_response_cache.get_or_build(game, build)
+
+    assert result == _response()
+    build.assert_awaited_once()
+    mock_redis.set_json.assert_awaited_once_with(
+        CacheKeys.game_details("game-1"),
+        {
+            "version": f"2:{_UPDATED_AT.isoformat()}",
+            "response": _response().model_dump(mode="json"),
+        },
+        ttl=CacheTTL.GAME_DETAILS,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stale_version_is_rebuilt(mock_redis):
+    """An entry from an older game version is treated as a miss."""
+    mock_redis.get_json.return_value = {
+        "version": game_response_cache.response_version(_game(version=1)),
+        "response": _response().model_dump(mode="json"),
+    }
+    build = AsyncMock(return_value=_response())
+
+    await game_response_cache.get_or_build(_game(version=2), build)
+
+    build.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unreadable_entry_is_rebuilt(mock_redis):
+    """A cached body that no longer validates is discarded instead of failing the request."""
+    game = _game()
+    mock_redis.get_json.return_value = {
+        "version": game_response_cache.response_version(game),
+        "response": {"id": "game-1"},
+    }
+    build = AsyncMock(return_value=_response())
+
+    await game_response_cache.get_or_build(game, build)
+
+    build.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_deletes_game_key(mock_redis):
+    """invalidate() removes the game's entry."""
+    await game_response_cache.invalidate("game-1")
+
+    mock_redis.delete.assert_awaited_once_with(CacheKeys.game_details("game-1"))
+
+
+def test_strong_etag_is_quoted_and_body_dependent():
+    """ETags are strong (no W/ prefix) and change with the body."""
+    etag = game_response_cache.strong_etag(b"a")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag != game_response_cache.strong_etag(b"b")
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"x", "abc"', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    """If-None-Match uses weak comparison and accepts lists and the wildcard."""
+    assert game_response_cache.etag_matches(header, '"abc"') is expected
@@ -0,0 +1,137 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the game_updated SSE event builder."""
+
+import datetime
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.api.services.game_update_events import build_game_update_event
+from shared.models import game as game_model
+from shared.models import participant as participant_model
+from shared.models import user as user_model
+from shared.models.participant import ParticipantType
+
+_GUILD_UUID = "guild-uuid-1"
+_DISCORD_GUILD_ID = "999999999"
+
+
+def _game(max_players: int = 1, allowed_player_role_ids: list[str] | None = None):
+    game_id = str(uuid.uuid4())
+    now = datetime.datetime(2026, 10, 16, 12, 0, 0)
+    game = game_model.GameSession(
+        id=game_id,
+        title="Test Game",
+        scheduled_at=now,
+        max_players=max_players,
+        guild_id=_GUILD_UUID,
+        status="SCHEDULED",
+        signup_method="SELF_SIGNUP",
+        allowed_player_role_ids=allowed_player_role_ids,
+        updated_at=now,
+        version=4,
+    )
+    game.participants = [
+        participant_model.GameParticipant(
+            id=f"p{i}",
+            game_session_id=game_id,
+            user_id=f"u{i}",
+            joined_at=now + datetime.timedelta(minutes=i),
+            user=user_model.User(id=f"u{i}", discord_id=f"10{i}"),
+            position_type=ParticipantType.SELF_ADDED,
+            position=0,
+        )
+        for i in range(2)
+    ]
+    return game
+
+
+def _patches(game, resolver):
+    return (
+        patch(
+            "services.api.services.game_update_events._load_game",
+            new=AsyncMock(return_value=game),
+        ),
+        patch(
+            "services.api.services.game_update_events.display_names_module.get_display_name_resolver",
+            new=AsyncMock(return_value=resolver),
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_carries_participants_counts_and_version():
+    """An unrestricted game produces a full delta with resolved display names."""
+    game = _game(max_players=1)
+    resolver = AsyncMock()
+    resolver.resolve_display_names_and_avatars = AsyncMock(
+        return_value={"100": {"display_name": "Alice", "avatar_url": "https://a"}}
+    )
+    load_patch, resolver_patch = _patches(game, resolver)
+
+    with load_patch, resolver_patch:
+        event = await build_game_update_event(game.id, _GUILD_UUID, _DISCORD_GUILD_ID, 3)
+
+    resolver.resolve_display_names_and_avatars.assert_awaited_once_with(
+        _DISCORD_GUILD_ID, ["100", "101"]
+    )
+    assert event.version == 4
+    assert event.status == "SCHEDULED"
+    assert event.updated_at == "2026-10-16T12:00:00Z"
+    assert event.participant_count == 1
+    assert event.confirmed_participant_ids == ["p0"]
+    assert [p.id for p in event.participants] == ["p0", "p1"]
+    assert event.participants[0].display_name == "Alice"
+    assert event.participants[0].avatar_url == "https://a"
+
+
+@pytest.mark.asyncio
+async def test_role_restricted_game_omits_participants():
+    """Games limited to player roles make clients refetch through the checked endpoint."""
+    game = _game(allowed_player_role_ids=["role1"])
+    resolver = AsyncMock()
+    load_patch, resolver_patch = _patches(game, resolver)
+
+    with load_patch, resolver_patch:
+        event = await build_game_update_event(game.id, _GUILD_UUID, _DISCORD_GUILD_ID, 3)
+
+    assert event.model_dump(exclude_none=True) == {
+        "type": "game_updated",
+        "game_id": game.id,
+        "guild_id": _GUILD_UUID,
+        "version": 3,
+    }
+    resolver.resolve_display_names_and_avatars.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_missing_game_returns_minimal_event():
+    """A game deleted before the event is built still produces a notification."""
+    load_patch, resolver_patch = _patches(None, AsyncMock())
+
+    with load_patch, resolver_patch:
+        event = await build_game_update_event("gone", _GUILD_UUID, _DISCORD_GUILD_ID, None)
+
+    assert event.participants is None
+    assert event.version is None
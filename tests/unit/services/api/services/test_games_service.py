@@ -2396,6 +2396,7 @@ async def test_join_game_success(
         channel_id=sample_channel.id,
         max_players=5,
     )
+    mock_game.guild = sample_guild
     mock_game.channel = sample_channel
     mock_game.participants = []
 
@@ -2406,23 +2407,10 @@ async def test_join_game_success(
     existing_participant_result = MagicMock()
     existing_participant_result.scalar_one_or_none.return_value = None
 
-    # Mock guild/channel config existence checks
-    guild_result = MagicMock()
-    guild_result.scalar_one_or_none.return_value = sample_guild
-    channel_result = MagicMock()
-    channel_result.scalar_one_or_none.return_value = sample_channel
-
-    # Mock game reload after join (get_game uses scalar_one_or_none)
-    game_result2 = MagicMock()
-    game_result2.scalar_one_or_none.return_value = mock_game
-
     mock_db.execute = AsyncMock(
         side_effect=[
             game_result,
             existing_participant_result,
-            guild_result,
-            channel_result,
-            game_result2,  # get_game reload after participant added
             MagicMock(),  # _publish_game_updated: pg_insert into message_refresh_queue
             MagicMock(),  # _publish_game_updated: pg_notify
         ]
@@ -2504,6 +2492,7 @@ async def test_join_game_self_signup_succeeds_past_max_players(
     mock_game.participants = []
     mock_game.guild_id = sample_guild.id
     mock_game.channel_id = sample_channel.id
+    mock_game.guild = sample_guild
     mock_game.channel = sample_channel
 
     game_result = MagicMock()
@@ -2513,23 +2502,10 @@ async def test_join_game_self_signup_succeeds_past_max_players(
     existing_participant_result = MagicMock()
     existing_participant_result.scalar_one_or_none.return_value = None
 
-    # Mock guild/channel config existence checks
-    guild_result = MagicMock()
-    guild_result.scalar_one_or_none.return_value = sample_guild
-    channel_result = MagicMock()
-    channel_result.scalar_one_or_none.return_value = sample_channel
-
-    # Mock game reload after join (get_game uses scalar_one_or_none)
-    game_result2 = MagicMock()
-    game_result2.scalar_one_or_none.return_value = mock_game
-
     mock_db.execute = AsyncMock(
         side_effect=[
             game_result,
             existing_participant_result,
-            guild_result,
-            channel_result,
-            game_result2,  # get_game reload after participant added
             MagicMock(),  # _publish_game_updated: pg_insert into message_refresh_queue
             MagicMock(),  # _publish_game_updated: pg_notify
         ]
@@ -2564,6 +2540,8 @@ async def test_join_game_host_selected_rejects_self_join(
     mock_game.participants = []
     mock_game.guild_id = sample_guild.id
     mock_game.channel_id = sample_channel.id
+    mock_game.guild = sample_guild
+    mock_game.channel = sample_channel
 
     game_result = MagicMock()
     game_result.scalar_one_or_none.return_value = mock_game
@@ -2572,20 +2550,7 @@ async def test_join_game_host_selected_rejects_self_join(
     existing_participant_result = MagicMock()
     existing_participant_result.scalar_one_or_none.return_value = None
 
-    # Mock guild/channel config existence checks
-    guild_result = MagicMock()
-    guild_result.scalar_one_or_none.return_value = sample_guild
-    channel_result = MagicMock()
-    channel_result.scalar_one_or_none.return_value = sample_channel
-
-    mock_db.execute = AsyncMock(
-        side_effect=[
-            game_result,
-            existing_participant_result,
-            guild_result,
-            channel_result,
-        ]
-    )
+    mock_db.execute = AsyncMock(side_effect=[game_result, existing_participant_result])
 
     mock_participant_resolver.ensure_user_exists = AsyncMock(return_value=new_user)
 
@@ -2614,6 +2579,7 @@ async def test_join_game_host_selected_with_waitlist_self_join_succeeds(
         max_players=2,
         signup_method=SignupMethod.HOST_SELECTED_WITH_WAITLIST.value,
     )
+    mock_game.guild = sample_guild
     mock_game.channel = sample_channel
     mock_game.participants = []
 
@@ -2624,23 +2590,10 @@ async def test_join_game_host_selected_with_waitlist_self_join_succeeds(
     existing_participant_result = MagicMock()
     existing_participant_result.scalar_one_or_none.return_value = None
 
-    # Mock guild/channel config existence checks
-    guild_result = MagicMock()
-    guild_result.scalar_one_or_none.return_value = sample_guild
-    channel_result = MagicMock()
-    channel_result.scalar_one_or_none.return_value = sample_channel
-
-    # Mock game reload after join (get_game uses scalar_one_or_none)
-    game_result2 = MagicMock()
-    game_result2.scalar_one_or_none.return_value = mock_game
-
     mock_db.execute = AsyncMock(
         side_effect=[
             game_result,
             existing_participant_result,
-            guild_result,
-            channel_result,
-            game_result2,  # get_game reload after participant added
             MagicMock(),  # _publish_game_updated: pg_insert into message_refresh_queue
             MagicMock(),  # _publish_game_updated: pg_notify
         ]
@@ -0,0 +1,109 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the in-process public image cache."""
+
+import uuid
+from unittest.mock import patch
+
+from services.api.services.image_cache import CachedImage, ImageCache
+
+
+def _image(size: int, etag: str = '"hash"') -> CachedImage:
+    return CachedImage(etag=etag, mime_type="image/png", data=b"x" * size)
+
+
+def test_get_returns_stored_image():
+    """A stored image is returned by ID and counted towards the size."""
+    cache = ImageCache(max_bytes=800)
+    image_id = (uuid.uuid4(), None)
+    image = _image(100)
+
+    cache.put(image_id, image)
+
+    assert cache.get(image_id) is image
+    assert cache.get((uuid.uuid4(), None)) is None
+    assert cache.size == 100
+
+
+def test_evicts_least_recently_used_to_stay_within_budget():
+    """Adding past the byte budget evicts the least recently used images."""
+    cache = ImageCache(max_bytes=800)
+    image_ids = [(uuid.uuid4(), None) for _ in range(8)]
+    for image_id in image_ids:
+        cache.put(image_id, _image(100))
+    cache.get(image_ids[0])
+    newest = (uuid.uuid4(), None)
+
+    cache.put(newest, _image(100))
+
+    assert cache.get(image_ids[1]) is None
+    assert cache.get(image_ids[0]) is not None
+    assert cache.get(newest) is not None
+    assert cache.size == 800
+
+
+def test_skips_images_too_large_for_the_budget():
+    """An image over an eighth of the budget is served but never cached."""
+    cache = ImageCache(max_bytes=800)
+    image_id = (uuid.uuid4(), None)
+
+    cache.put(image_id, _image(101))
+
+    assert cache.get(image_id) is None
+    assert cache.size == 0
+
+
+def test_replacing_an_entry_keeps_size_accurate():
+    """Re-putting an ID replaces the old entry rather than double counting."""
+    cache = ImageCache(max_bytes=800)
+    image_id = (uuid.uuid4(), None)
+
+    cache.put(image_id, _image(100, '"a"'))
+    cache.put(image_id, _image(50, '"b"'))
+
+    cached = cache.get(image_id)
+    assert cached is not None
+    assert cached.etag == '"b"'
+    assert cache.size == 50
+
+
+def test_expired_entries_are_dropped():
+    """Entries older than max_age_seconds are re-read from the database."""
+    cache = ImageCache(max_bytes=800, max_age_seconds=60)
+    image_id = (uuid.uuid4(), None)
+
+    with patch("services.api.services.image_cache.time.monotonic", return_value=1000.0):
+        cache.put(image_id, _image(100))
+    with patch("services.api.services.image_cache.time.monotonic", return_value=1061.0):
+        assert cache.get(image_id) is None
+
+    assert cache.size == 0
+
+
+def test_zero_budget_disables_caching():
+    """A budget of zero stores nothing."""
+    cache = ImageCache(max_bytes=0)
+    image_id = (uuid.uuid4(), None)
+
+    cache.put(image_id, _image(1))
+
+    assert cache.get(image_id) is None
@@ -65,6 +65,8 @@ def test_api_config_loads_optional_defaults():
         assert cfg.environment == "development"
         assert cfg.debug is True
         assert cfg.log_level == "INFO"
+        assert cfg.image_cache_max_bytes == 64 * 1024 * 1024
+        assert cfg.principal_cache_ttl_seconds == 30
 
 
 def test_api_config_loads_from_environment():
@@ -82,6 +84,8 @@ def test_api_config_loads_from_environment():
         "JWT_EXPIRATION_HOURS": "48",
         "ENVIRONMENT": "production",
         "LOG_LEVEL": "DEBUG",
+        "IMAGE_CACHE_MAX_BYTES": "1048576",
+        "PRINCIPAL_CACHE_TTL_SECONDS": "5",
     }
 
     with patch.dict(os.environ, env_vars, clear=True):
@@ -100,6 +104,8 @@ def test_api_config_loads_from_environment():
         assert cfg.environment == "production"
         assert cfg.debug is False
         assert cfg.log_level == "DEBUG"
+        assert cfg.image_cache_max_bytes == 1048576
+        assert cfg.principal_cache_ttl_seconds == 5
 
 
 def test_get_api_config_returns_singleton():
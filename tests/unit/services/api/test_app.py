@@ -21,6 +21,7 @@
 
 """Tests for API application factory."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -139,6 +140,42 @@ async def test_lifespan_disconnects_redis(mock_get_redis_client, mock_redis_clie
     mock_redis_client.disconnect.assert_called_once_with()
 
 
+@pytest.mark.asyncio
+async def test_lifespan_starts_l1_invalidation_listener(mock_get_redis_client, mock_redis_client):
+    """Test that lifespan subscribes the L1 cache to invalidations with the shared client."""
+    application = app.create_app()
+
+    with (
+        patch(
+            "services.api.app.l1.listen_for_invalidations", new_callable=AsyncMock
+        ) as mock_listen,
+        patch("services.api.app.principal_cache.listen_for_invalidations", new_callable=AsyncMock),
+    ):
+        async with app.lifespan(application):
+            await asyncio.sleep(0)
+
+    mock_listen.assert_awaited_once_with(mock_redis_client)
+
+
+@pytest.mark.asyncio
+async def test_lifespan_starts_principal_invalidation_listener(
+    mock_get_redis_client, mock_redis_client
+):
+    """Test that lifespan subscribes the principal cache to invalidations."""
+    application = app.create_app()
+
+    with (
+        patch("services.api.app.l1.listen_for_invalidations", new_callable=AsyncMock),
+        patch(
+            "services.api.app.principal_cache.listen_for_invalidations", new_callable=AsyncMock
+        ) as mock_listen,
+    ):
+        async with app.lifespan(application):
+            await asyncio.sleep(0)
+
+    mock_listen.assert_awaited_once_with(mock_redis_client)
+
+
 def test_middleware_configured():
     """Test that CORS and error handler middleware are configured."""
     with (
@@ -45,7 +45,7 @@ def mock_current_user():
 
 
 @pytest.mark.asyncio
-async def test_get_db_with_user_guilds_sets_context(mock_current_user, mock_get_user_tokens):
+async def test_get_db_with_user_guilds_sets_context(mock_current_user, mock_get_session):
     """Enhanced dependency sets guild_ids in ContextVar."""
     mock_db_session = AsyncMock()
 
@@ -77,9 +77,7 @@ async def test_get_db_with_user_guilds_sets_context(mock_current_user, mock_get_
 
 
 @pytest.mark.asyncio
-async def test_get_db_with_user_guilds_clears_context_on_exit(
-    mock_current_user, mock_get_user_tokens
-):
+async def test_get_db_with_user_guilds_clears_context_on_exit(mock_current_user, mock_get_session):
     """Enhanced dependency clears ContextVar in finally block."""
     mock_db_session = AsyncMock()
 
@@ -107,7 +105,7 @@ async def test_get_db_with_user_guilds_clears_context_on_exit(
 
 @pytest.mark.asyncio
 async def test_get_db_with_user_guilds_clears_context_on_exception(
-    mock_current_user, mock_get_user_tokens
+    mock_current_user, mock_get_session
 ):
     """Enhanced dependency clears ContextVar even if exception raised."""
     mock_db_session = AsyncMock()
@@ -143,7 +141,7 @@ async def test_get_db_with_user_guilds_clears_context_on_exception(
 
 @pytest.mark.asyncio
 async def test_get_db_with_user_guilds_uses_projection_not_oauth(
-    mock_current_user, mock_get_user_tokens
+    mock_current_user, mock_get_session
 ):
     """get_db_with_user_guilds must use member_projection.get_user_guilds, not oauth2."""
     mock_db_session = MagicMock()
@@ -397,7 +397,7 @@ class TestGameManagementAuthorization:
         mock_role_service = AsyncMock()
         guild_id = "123456789012345678"
 
-        with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+        with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
             result = await permissions.can_manage_game(
                 mock_current_user.user.discord_id,  # Host is current user
                 guild_id,
@@ -418,7 +418,7 @@ class TestGameManagementAuthorization:
         mock_role_service.check_bot_manager_permission = AsyncMock(return_value=True)
         guild_id = "123456789012345678"
 
-        with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+        with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
             result = await permissions.can_manage_game(
                 "different_host",  # Not current user
                 guild_id,
@@ -439,7 +439,7 @@ class TestGameManagementAuthorization:
         mock_role_service.check_bot_manager_permission = AsyncMock(return_value=False)
         guild_id = "123456789012345678"
 
-        with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+        with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
             result = await permissions.can_manage_game(
                 "different_host",  # Not current user
                 guild_id,
@@ -497,7 +497,7 @@ class TestGameExportAuthorization:
         mock_role_service = AsyncMock()
         guild_id = "123456789012345678"
 
-        with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+        with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
             result = await permissions.can_export_game(
                 mock_current_user.user.id,  # Host is current user
                 [],
@@ -525,7 +525,7 @@ class TestGameExportAuthorization:
         mock_participant.user_id = mock_current_user.user.discord_id
         mock_participant.user = MagicMock()
 
-        with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+        with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
             result = await permissions.can_export_game(
                 "different_host",
                 [mock_participant],
@@ -549,7 +549,7 @@ class TestGameExportAuthorization:
         mock_role_service.check_bot_manager_permission = AsyncMock(return_value=True)
         guild_id = "123456789012345678"
 
-        with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+        with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
             result = await permissions.can_export_game(
                 "different_host",
                 [],
@@ -573,7 +573,7 @@ class TestGameExportAuthorization:
         mock_role_service.check_bot_manager_permission = AsyncMock(return_value=False)
         guild_id = "123456789012345678"
 
-        with patch("services.api.auth.tokens.get_user_tokens", return_value=mock_tokens):
+        with patch("services.api.auth.tokens.get_session", return_value=mock_tokens):
             result = await permissions.can_export_game(
                 "different_host",
                 [],
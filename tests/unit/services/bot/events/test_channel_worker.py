@@ -48,17 +48,15 @@ def handlers(mock_bot: MagicMock) -> EventHandlers:
     return EventHandlers(mock_bot)
 
 
-def _make_db_session(game: MagicMock | None, queue_row_game_id: str | None) -> MagicMock:
+def _make_db_session(queued_game_ids: list[str]) -> MagicMock:
     """Build a minimal async DB session mock.
 
-    ``queue_row_game_id``: the game_id string returned by the LIMIT 1 queue
-    query, or None to simulate an empty queue.
+    ``queued_game_ids``: the game_ids returned by the queue query; an empty
+    list simulates an empty queue.
     """
-    scalar_mock = MagicMock(return_value=queue_row_game_id)
-
     execute_mock = AsyncMock()
     result_mock = MagicMock()
-    result_mock.scalar_one_or_none = scalar_mock
+    result_mock.scalars.return_value.all.return_value = queued_game_ids
     execute_mock.return_value = result_mock
 
     session = AsyncMock()
@@ -89,7 +87,7 @@ class TestChannelWorkerNoRows:
     @pytest.mark.asyncio
     async def test_worker_exits_when_queue_empty(self, handlers: EventHandlers) -> None:
         """Worker returns immediately when no queue rows exist for the channel."""
-        db_cm = _make_db_session(game=None, queue_row_game_id=None)
+        db_cm = _make_db_session([])
 
         with (
             patch("services.bot.events.handlers.get_db_session", db_cm),
@@ -110,7 +108,7 @@ class TestChannelWorkerNoRows:
     @pytest.mark.asyncio
     async def test_worker_deregisters_itself_when_done(self, handlers: EventHandlers) -> None:
         """Worker removes itself from _channel_workers after draining the queue."""
-        db_cm = _make_db_session(game=None, queue_row_game_id=None)
+        db_cm = _make_db_session([])
         task_mock = MagicMock(spec=asyncio.Task)
         handlers._channel_workers[_CHANNEL_ID] = task_mock
 
@@ -141,8 +139,8 @@ class TestChannelWorkerRateLimitSlot:
             async def _execute(_stmt):
                 nonlocal call_count
                 result = MagicMock()
-                game_id_val = _GAME_ID if call_count == 0 else None
-                result.scalar_one_or_none = MagicMock(return_value=game_id_val)
+                queued = [_GAME_ID] if call_count == 0 else []
+                result.scalars.return_value.all.return_value = queued
                 call_count += 1
                 return result
 
@@ -165,7 +163,9 @@ class TestChannelWorkerRateLimitSlot:
                 new_callable=AsyncMock,
                 return_value=mock_redis,
             ),
-            patch.object(handlers, "_get_game_with_participants", return_value=mock_game),
+            patch.object(
+                handlers, "_get_games_with_participants", return_value={_GAME_ID: mock_game}
+            ),
             patch.object(
                 handlers,
                 "_get_channel_and_partial_message",
@@ -196,8 +196,8 @@ class TestChannelWorkerRateLimitSlot:
             async def _execute(_stmt):
                 nonlocal call_count
                 result = MagicMock()
-                game_id_val = _GAME_ID if call_count == 0 else None
-                result.scalar_one_or_none = MagicMock(return_value=game_id_val)
+                queued = [_GAME_ID] if call_count == 0 else []
+                result.scalars.return_value.all.return_value = queued
                 call_count += 1
                 return result
 
@@ -224,7 +224,9 @@ class TestChannelWorkerRateLimitSlot:
                 new_callable=AsyncMock,
                 return_value=mock_redis,
             ),
-            patch.object(handlers, "_get_game_with_participants", return_value=mock_game),
+            patch.object(
+                handlers, "_get_games_with_participants", return_value={_GAME_ID: mock_game}
+            ),
             patch.object(
                 handlers,
                 "_get_channel_and_partial_message",
@@ -260,8 +262,8 @@ class TestChannelWorkerSuccessfulEdit:
                 nonlocal call_count
                 executed_stmts.append(stmt)
                 result = MagicMock()
-                game_id_val = _GAME_ID if call_count == 0 else None
-                result.scalar_one_or_none = MagicMock(return_value=game_id_val)
+                queued = [_GAME_ID] if call_count == 0 else []
+                result.scalars.return_value.all.return_value = queued
                 call_count += 1
                 return result
 
@@ -282,7 +284,9 @@ class TestChannelWorkerSuccessfulEdit:
                 new_callable=AsyncMock,
                 return_value=mock_redis,
             ),
-            patch.object(handlers, "_get_game_with_participants", return_value=mock_game),
+            patch.object(
+                handlers, "_get_games_with_participants", return_value={_GAME_ID: mock_game}
+            ),
             patch.object(
                 handlers,
                 "_get_channel_and_partial_message",
@@ -317,8 +321,8 @@ class TestChannelWorker429Handling:
             async def _execute(_stmt):
                 nonlocal queue_call_count
                 result = MagicMock()
-                game_id_val = _GAME_ID if queue_call_count == 0 else None
-                result.scalar_one_or_none = MagicMock(return_value=game_id_val)
+                queued = [_GAME_ID] if queue_call_count == 0 else []
+                result.scalars.return_value.all.return_value = queued
                 queue_call_count += 1
                 return result
 
@@ -355,7 +359,9 @@ class TestChannelWorker429Handling:
                 new_callable=AsyncMock,
                 return_value=mock_redis,
             ),
-            patch.object(handlers, "_get_game_with_participants", return_value=mock_game),
+            patch.object(
+                handlers, "_get_games_with_participants", return_value={_GAME_ID: mock_game}
+            ),
             patch.object(
                 handlers,
                 "_get_channel_and_partial_message",
@@ -396,8 +402,8 @@ class TestChannelWorker429Handling:
             async def _execute(_stmt):
                 nonlocal call_count
                 result = MagicMock()
-                game_id_val = _GAME_ID if call_count == 0 else None
-                result.scalar_one_or_none = MagicMock(return_value=game_id_val)
+                queued = [_GAME_ID] if call_count == 0 else []
+                result.scalars.return_value.all.return_value = queued
                 call_count += 1
                 return result
 
@@ -423,7 +429,9 @@ class TestChannelWorker429Handling:
                 new_callable=AsyncMock,
                 return_value=mock_redis,
             ),
-            patch.object(handlers, "_get_game_with_participants", return_value=mock_game),
+            patch.object(
+                handlers, "_get_games_with_participants", return_value={_GAME_ID: mock_game}
+            ),
             patch.object(
                 handlers,
                 "_get_channel_and_partial_message",
@@ -455,10 +463,10 @@ class TestChannelWorkerMultiGame:
         mock_game_b.channel = MagicMock()
         mock_game_b.channel.channel_id = _CHANNEL_ID
 
-        # Queue returns game_id_a then game_id_b then None.
-        # The iterator only advances when scalar_one_or_none() is actually called,
-        # so delete() execute calls don't consume queue entries.
-        queue_iter = iter([game_id_a, game_id_b, None])
+        # The first pass sees both games; the second finds the queue empty.
+        # The iterator only advances when scalars().all() is actually called,
+        # so delete() execute calls don't consume queue snapshots.
+        queue_iter = iter([[game_id_a, game_id_b], []])
 
         @asynccontextmanager
         async def _db_cm():
@@ -466,7 +474,9 @@ class TestChannelWorkerMultiGame:
 
             async def _execute(_stmt):
                 result = MagicMock()
-                result.scalar_one_or_none = MagicMock(side_effect=lambda: next(queue_iter, None))
+                result.scalars.return_value.all = MagicMock(
+                    side_effect=lambda: next(queue_iter, [])
+                )
                 return result
 
             session.execute = _execute
@@ -484,9 +494,6 @@ class TestChannelWorkerMultiGame:
         async def _track_edit(msg, game):
             edited_games.append(game)
 
-        def _game_for_id(db, gid):
-            return mock_game_a if gid == game_id_a else mock_game_b
-
         with (
             patch("services.bot.events.handlers.get_db_session", _db_cm),
             patch(
@@ -494,7 +501,11 @@ class TestChannelWorkerMultiGame:
                 new_callable=AsyncMock,
                 return_value=mock_redis,
             ),
-            patch.object(handlers, "_get_game_with_participants", side_effect=_game_for_id),
+            patch.object(
+                handlers,
+                "_get_games_with_participants",
+                return_value={game_id_a: mock_game_a, game_id_b: mock_game_b},
+            ),
             patch.object(
                 handlers,
                 "_get_channel_and_partial_message",
@@ -515,7 +526,7 @@ class TestChannelWorkerMultiGame:
         # Simulated return values from claim_channel_rate_limit_slot per iteration.
         # Matches graduated spacing: n=0→0ms, n=1→1000ms, n=2→1000ms, n=3→1500ms.
         wait_ms_sequence = [0, 1000, 1000, 1500]
-        queue_iter = iter([*game_ids, None])
+        queue_iter = iter([game_ids, []])
 
         claim_call = 0
 
@@ -525,7 +536,9 @@ class TestChannelWorkerMultiGame:
 
             async def _execute(_stmt):
                 result = MagicMock()
-                result.scalar_one_or_none = MagicMock(side_effect=lambda: next(queue_iter, None))
+                result.scalars.return_value.all = MagicMock(
+                    side_effect=lambda: next(queue_iter, [])
+                )
                 return result
 
             session.execute = _execute
@@ -560,7 +573,11 @@ class TestChannelWorkerMultiGame:
                 new_callable=AsyncMock,
                 return_value=mock_redis,
             ),
-            patch.object(handlers, "_get_game_with_participants", return_value=mock_game),
+            patch.object(
+                handlers,
+                "_get_games_with_participants",
+                return_value=dict.fromkeys(game_ids, mock_game),
+            ),
             patch.object(
                 handlers,
                 "_get_channel_and_partial_message",
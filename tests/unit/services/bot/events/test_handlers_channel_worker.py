@@ -21,13 +21,13 @@
 
 """Unit tests for EventHandlers._channel_worker."""
 
-from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
-from services.bot.events.handlers import _MAX_EDIT_ATTEMPTS
+from services.bot.events.handlers import _MAX_EDIT_ATTEMPTS, _REFRESH_BATCH_SIZE
 
 
 class TestChannelWorker:
@@ -49,13 +49,13 @@ class TestChannelWorker:
         with (
             patch.object(
                 event_handlers,
-                "_fetch_next_queued_game",
-                new=AsyncMock(side_effect=[game_id, None]),
+                "_fetch_queued_games",
+                new=AsyncMock(side_effect=[[game_id], []]),
             ),
             patch.object(
                 event_handlers,
                 "_edit_with_backoff",
-                new=AsyncMock(return_value=datetime.now(tz=UTC)),
+                new=AsyncMock(return_value=True),
             ),
             patch(
                 "services.bot.events.handlers.get_redis_client",
@@ -63,6 +63,9 @@ class TestChannelWorker:
                     return_value=AsyncMock(claim_channel_rate_limit_slot=AsyncMock(return_value=0))
                 ),
             ),
+            patch.object(
+                event_handlers, "_get_games_with_participants", new=AsyncMock(return_value={})
+            ),
             patch("services.bot.events.handlers.get_db_session", return_value=db_ctx),
         ):
             await event_handlers._channel_worker("chan1")
@@ -76,21 +79,24 @@ class TestChannelWorker:
         game_id = str(uuid4())
         mock_db, db_ctx = self._make_db_ctx()
 
-        fetch_side_effects = [game_id] * _MAX_EDIT_ATTEMPTS + [None]
+        fetch_side_effects = [[game_id]] * _MAX_EDIT_ATTEMPTS + [[]]
 
         with (
             patch.object(
                 event_handlers,
-                "_fetch_next_queued_game",
+                "_fetch_queued_games",
                 new=AsyncMock(side_effect=fetch_side_effects),
             ),
-            patch.object(event_handlers, "_edit_with_backoff", new=AsyncMock(return_value=None)),
+            patch.object(event_handlers, "_edit_with_backoff", new=AsyncMock(return_value=False)),
             patch(
                 "services.bot.events.handlers.get_redis_client",
                 new=AsyncMock(
                     return_value=AsyncMock(claim_channel_rate_limit_slot=AsyncMock(return_value=0))
                 ),
             ),
+            patch.object(
+                event_handlers, "_get_games_with_participants", new=AsyncMock(return_value={})
+            ),
             patch("services.bot.events.handlers.get_db_session", return_value=db_ctx),
         ):
             await event_handlers._channel_worker("chan1")
@@ -104,18 +110,21 @@ class TestChannelWorker:
         game_id = str(uuid4())
         mock_db, db_ctx = self._make_db_ctx()
 
-        fetch_side_effects = [game_id] * _MAX_EDIT_ATTEMPTS + [None]
+        fetch_side_effects = [[game_id]] * _MAX_EDIT_ATTEMPTS + [[]]
         mock_fetch = AsyncMock(side_effect=fetch_side_effects)
 
         with (
-            patch.object(event_handlers, "_fetch_next_queued_game", new=mock_fetch),
-            patch.object(event_handlers, "_edit_with_backoff", new=AsyncMock(return_value=None)),
+            patch.object(event_handlers, "_fetch_queued_games", new=mock_fetch),
+            patch.object(event_handlers, "_edit_with_backoff", new=AsyncMock(return_value=False)),
             patch(
                 "services.bot.events.handlers.get_redis_client",
                 new=AsyncMock(
                     return_value=AsyncMock(claim_channel_rate_limit_slot=AsyncMock(return_value=0))
                 ),
             ),
+            patch.object(
+                event_handlers, "_get_games_with_participants", new=AsyncMock(return_value={})
+            ),
             patch("services.bot.events.handlers.get_db_session", return_value=db_ctx),
         ):
             await event_handlers._channel_worker("chan1")
@@ -131,8 +140,11 @@ class TestChannelWorker:
         with (
             patch.object(
                 event_handlers,
-                "_fetch_next_queued_game",
-                new=AsyncMock(return_value=None),
+                "_fetch_queued_games",
+                new=AsyncMock(return_value=[]),
+            ),
+            patch.object(
+                event_handlers, "_get_games_with_participants", new=AsyncMock(return_value={})
             ),
             patch("services.bot.events.handlers.get_db_session", return_value=db_ctx),
         ):
@@ -148,15 +160,15 @@ class TestChannelWorker:
         game_id_2 = str(uuid4())
         mock_db, db_ctx = self._make_db_ctx()
         mock_fetch = AsyncMock(
-            side_effect=[game_id_1, RuntimeError("transient DB error"), game_id_2, None]
+            side_effect=[[game_id_1], RuntimeError("transient DB error"), [game_id_2], []]
         )
 
         with (
-            patch.object(event_handlers, "_fetch_next_queued_game", new=mock_fetch),
+            patch.object(event_handlers, "_fetch_queued_games", new=mock_fetch),
             patch.object(
                 event_handlers,
                 "_edit_with_backoff",
-                new=AsyncMock(return_value=datetime.now(tz=UTC)),
+                new=AsyncMock(return_value=True),
             ),
             patch(
                 "services.bot.events.handlers.get_redis_client",
@@ -164,6 +176,9 @@ class TestChannelWorker:
                     return_value=AsyncMock(claim_channel_rate_limit_slot=AsyncMock(return_value=0))
                 ),
             ),
+            patch.object(
+                event_handlers, "_get_games_with_participants", new=AsyncMock(return_value={})
+            ),
             patch("services.bot.events.handlers.get_db_session", return_value=db_ctx),
             patch(
                 "services.bot.events.handlers.asyncio.sleep", new_callable=AsyncMock
@@ -183,8 +198,8 @@ class TestChannelWorker:
         with (
             patch.object(
                 event_handlers,
-                "_fetch_next_queued_game",
-                new=AsyncMock(side_effect=[RuntimeError("boom"), None]),
+                "_fetch_queued_games",
+                new=AsyncMock(side_effect=[RuntimeError("boom"), []]),
             ),
             patch(
                 "services.bot.events.handlers.asyncio.sleep", new_callable=AsyncMock
@@ -202,7 +217,7 @@ class TestChannelWorker:
         game_id_1 = str(uuid4())
         game_id_2 = str(uuid4())
         mock_db, db_ctx = self._make_db_ctx()
-        mock_fetch = AsyncMock(side_effect=[game_id_1, game_id_2, None])
+        mock_fetch = AsyncMock(side_effect=[[game_id_1], [game_id_2], []])
         mock_redis = AsyncMock(
             claim_channel_rate_limit_slot=AsyncMock(
                 side_effect=[RuntimeError("redis unavailable"), 0]
@@ -210,16 +225,19 @@ class TestChannelWorker:
         )
 
         with (
-            patch.object(event_handlers, "_fetch_next_queued_game", new=mock_fetch),
+            patch.object(event_handlers, "_fetch_queued_games", new=mock_fetch),
             patch.object(
                 event_handlers,
                 "_edit_with_backoff",
-                new=AsyncMock(return_value=datetime.now(tz=UTC)),
+                new=AsyncMock(return_value=True),
             ),
             patch(
                 "services.bot.events.handlers.get_redis_client",
                 new=AsyncMock(return_value=mock_redis),
             ),
+            patch.object(
+                event_handlers, "_get_games_with_participants", new=AsyncMock(return_value={})
+            ),
             patch("services.bot.events.handlers.get_db_session", return_value=db_ctx),
             patch(
                 "services.bot.events.handlers.asyncio.sleep", new_callable=AsyncMock
@@ -247,7 +265,7 @@ class TestChannelWorker:
         game_id_1 = str(uuid4())
         game_id_2 = str(uuid4())
         mock_db, db_ctx = self._make_db_ctx()
-        mock_fetch = AsyncMock(side_effect=[game_id_1, game_id_2, game_id_1, game_id_1, None])
+        mock_fetch = AsyncMock(side_effect=[[game_id_1], [game_id_2], [game_id_1], [game_id_1], []])
         mock_redis = AsyncMock(
             claim_channel_rate_limit_slot=AsyncMock(
                 side_effect=[0, RuntimeError("redis unavailable"), 0, 0]
@@ -255,12 +273,15 @@ class TestChannelWorker:
         )
 
         with (
-            patch.object(event_handlers, "_fetch_next_queued_game", new=mock_fetch),
-            patch.object(event_handlers, "_edit_with_backoff", new=AsyncMock(return_value=None)),
+            patch.object(event_handlers, "_fetch_queued_games", new=mock_fetch),
+            patch.object(event_handlers, "_edit_with_backoff", new=AsyncMock(return_value=False)),
             patch(
                 "services.bot.events.handlers.get_redis_client",
                 new=AsyncMock(return_value=mock_redis),
             ),
+            patch.object(
+                event_handlers, "_get_games_with_participants", new=AsyncMock(return_value={})
+            ),
             patch("services.bot.events.handlers.get_db_session", return_value=db_ctx),
             patch(
                 "services.bot.events.handlers.asyncio.sleep", new_callable=AsyncMock
@@ -282,3 +303,152 @@ class TestChannelWorker:
             "chan1",
         )
         assert "chan1" not in event_handlers._channel_workers
+
+
+def _compiled_sql(statement: object) -> str:
+    return str(
+        statement.compile(  # type: ignore[attr-defined]
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+class TestCoalescedDrain:
+    def _make_db_ctx(self):
+        mock_db = AsyncMock()
+        mock_db.execute = AsyncMock()
+        mock_db.commit = AsyncMock()
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=mock_db)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        return mock_db, ctx
+
+    @pytest.mark.asyncio
+    async def test_one_load_and_one_delete_per_pass(self, event_handlers):
+        """A pass loads every queued game at once and deletes the edited rows in one statement."""
+        game_ids = [str(uuid4()) for _ in range(3)]
+        games = {gid: MagicMock() for gid in game_ids}
+        mock_db, db_ctx = self._make_db_ctx()
+        mock_load = AsyncMock(return_value=games)
+        mock_edit = AsyncMock(return_value=True)
+
+        with (
+            patch.object(
+                event_handlers, "_fetch_queued_games", new=AsyncMock(side_effect=[game_ids, []])
+            ),
+            patch.object(event_handlers, "_get_games_with_participants", new=mock_load),
+            patch.object(event_handlers, "_edit_with_backoff", new=mock_edit),
+            patch(
+                "services.bot.events.handlers.get_redis_client",
+                new=AsyncMock(
+                    return_value=AsyncMock(claim_channel_rate_limit_slot=AsyncMock(return_value=0))
+                ),
+            ),
+            patch("services.bot.events.handlers.get_db_session", return_value=db_ctx),
+        ):
+            await event_handlers._channel_worker("chan1")
+
+        mock_load.assert_awaited_once_with(mock_db, game_ids)
+        assert [c.args[1:4] for c in mock_edit.await_args_list] == [
+            (gid, games[gid], 0) for gid in game_ids
+        ]
+        mock_db.execute.assert_awaited_once()
+        sql = _compiled_sql(mock_db.execute.await_args.args[0])
+        assert sql.startswith("DELETE FROM message_refresh_queue")
+        assert all(gid in sql for gid in game_ids)
+        assert "enqueued_at <=" in sql
+
+    @pytest.mark.asyncio
+    async def test_failed_edit_is_kept_for_retry(self, event_handlers):
+        """Only successfully edited games are deleted; a failed one stays queued."""
+        ok_id = str(uuid4())
+        failed_id = str(uuid4())
+        mock_db, db_ctx = self._make_db_ctx()
+
+        async def _edit(_channel, game_id, _game, _wait_ms):
+            return game_id == ok_id
+
+        with (
+            patch.object(
+                event_handlers,
+                "_fetch_queued_games",
+                new=AsyncMock(side_effect=[[ok_id, failed_id], []]),
+            ),
+            patch.object(
+                event_handlers, "_get_games_with_participants", new=AsyncMock(return_value={})
+            ),
+            patch.object(event_handlers, "_edit_with_backoff", side_effect=_edit),
+            patch(
+                "services.bot.events.handlers.get_redis_client",
+                new=AsyncMock(
+                    return_value=AsyncMock(claim_channel_rate_limit_slot=AsyncMock(return_value=0))
+                ),
+            ),
+            patch("services.bot.events.handlers.get_db_session", return_value=db_ctx),
+        ):
+            await event_handlers._channel_worker("chan1")
+
+        sql = _compiled_sql(mock_db.execute.await_args.args[0])
+        assert ok_id in sql
+        assert failed_id not in sql
+
+    @pytest.mark.asyncio
+    async def test_records_coalescing_metrics(self, event_handlers):
+        """Batch size and edit count are recorded with the channel_id label."""
+        game_ids = [str(uuid4()), str(uuid4())]
+        _mock_db, db_ctx = self._make_db_ctx()
+
+        with (
+            patch.object(
+                event_handlers, "_fetch_queued_games", new=AsyncMock(side_effect=[game_ids, []])
+            ),
+            patch.object(
+                event_handlers, "_get_games_with_participants", new=AsyncMock(return_value={})
+            ),
+            patch.object(event_handlers, "_edit_with_backoff", new=AsyncMock(return_value=True)),
+            patch(
+                "services.bot.events.handlers.get_redis_client",
+                new=AsyncMock(
+                    return_value=AsyncMock(claim_channel_rate_limit_slot=AsyncMock(return_value=0))
+                ),
+            ),
+            patch("services.bot.events.handlers.get_db_session", return_value=db_ctx),
+            patch(
+                "services.bot.events.handlers.message_refresh_batch_size_histogram"
+            ) as mock_histogram,
+            patch("services.bot.events.handlers.message_refresh_edits_counter") as mock_counter,
+        ):
+            await event_handlers._channel_worker("chan1")
+
+        mock_histogram.record.assert_called_once_with(2, {"channel_id": "chan1"})
+        assert mock_counter.add.call_count == 2
+        mock_counter.add.assert_called_with(1, {"channel_id": "chan1"})
+
+    @pytest.mark.asyncio
+    async def test_fetch_queued_games_orders_and_limits(self, event_handlers):
+        """The queue snapshot is one ordered, bounded query for the channel."""
+        mock_db, db_ctx = self._make_db_ctx()
+        mock_db.execute.return_value = MagicMock()
+        mock_db.execute.return_value.scalars.return_value.all.return_value = ["g1", "g2"]
+
+        with patch("services.bot.events.handlers.get_db_session", return_value=db_ctx):
+            result = await event_handlers._fetch_queued_games("chan1")
+
+        assert result == ["g1", "g2"]
+        sql = _compiled_sql(mock_db.execute.await_args.args[0])
+        assert "ORDER BY message_refresh_queue.enqueued_at" in sql
+        assert f"LIMIT {_REFRESH_BATCH_SIZE}" in sql
+
+    @pytest.mark.asyncio
+    async def test_get_games_with_participants_keys_by_id(self, event_handlers):
+        """Games loaded in one query are returned keyed by id."""
+        game_a = MagicMock(id="a")
+        game_b = MagicMock(id="b")
+        mock_db = AsyncMock()
+        mock_db.execute.return_value = MagicMock()
+        mock_db.execute.return_value.scalars.return_value.all.return_value = [game_a, game_b]
+
+        result = await event_handlers._get_games_with_participants(mock_db, ["a", "b"])
+
+        assert result == {"a": game_a, "b": game_b}
+        mock_db.execute.assert_awaited_once()
@@ -21,7 +21,6 @@
 
 """Unit tests for EventHandlers._edit_with_backoff."""
 
-from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
@@ -30,29 +29,28 @@ import pytest
 
 class TestEditWithBackoff:
     @pytest.mark.asyncio
-    async def test_returns_t_cut_on_success(self, event_handlers):
-        """Returns a datetime when _try_edit_game_message succeeds."""
+    async def test_returns_true_on_success(self, event_handlers):
+        """Returns True when _try_edit_game_message succeeds."""
         with patch.object(
             event_handlers, "_try_edit_game_message", new=AsyncMock(return_value=True)
         ):
-            result = await event_handlers._edit_with_backoff("chan1", "game1", 0)
+            result = await event_handlers._edit_with_backoff("chan1", "game1", MagicMock(), 0)
 
-        assert result is not None
-        assert isinstance(result, datetime)
+        assert result is True
 
     @pytest.mark.asyncio
-    async def test_returns_none_when_try_edit_returns_false(self, event_handlers):
-        """Returns None when _try_edit_game_message returns False (e.g. 404)."""
+    async def test_returns_false_when_try_edit_returns_false(self, event_handlers):
+        """Returns False when _try_edit_game_message returns False (e.g. 404)."""
         with patch.object(
             event_handlers, "_try_edit_game_message", new=AsyncMock(return_value=False)
         ):
-            result = await event_handlers._edit_with_backoff("chan1", "game1", 0)
+            result = await event_handlers._edit_with_backoff("chan1", "game1", MagicMock(), 0)
 
-        assert result is None
+        assert result is False
 
     @pytest.mark.asyncio
-    async def test_returns_none_on_non_429_http_exception(self, event_handlers):
-        """Returns None on non-retryable HTTP errors (e.g. 403, 500)."""
+    async def test_returns_false_on_non_429_http_exception(self, event_handlers):
+        """Returns False on non-retryable HTTP errors (e.g. 403, 500)."""
         resp = MagicMock()
         resp.status = 500
         resp.reason = "Internal Server Error"
@@ -63,9 +61,9 @@ class TestEditWithBackoff:
             "_try_edit_game_message",
             new=AsyncMock(side_effect=exc),
         ):
-            result = await event_handlers._edit_with_backoff("chan1", "game1", 0)
+            result = await event_handlers._edit_with_backoff("chan1", "game1", MagicMock(), 0)
 
-        assert result is None
+        assert result is False
 
     @pytest.mark.asyncio
     async def test_retries_on_429(self, event_handlers):
@@ -86,19 +84,19 @@ class TestEditWithBackoff:
             return True
 
         with patch.object(event_handlers, "_try_edit_game_message", side_effect=side_effect):
-            result = await event_handlers._edit_with_backoff("chan1", "game1", 0)
+            result = await event_handlers._edit_with_backoff("chan1", "game1", MagicMock(), 0)
 
-        assert result is not None
+        assert result is True
         assert call_count == 2
 
     @pytest.mark.asyncio
-    async def test_returns_none_on_unexpected_exception(self, event_handlers):
-        """Returns None on an unexpected non-Discord exception."""
+    async def test_returns_false_on_unexpected_exception(self, event_handlers):
+        """Returns False on an unexpected non-Discord exception."""
         with patch.object(
             event_handlers,
             "_try_edit_game_message",
             new=AsyncMock(side_effect=RuntimeError("unexpected")),
         ):
-            result = await event_handlers._edit_with_backoff("chan1", "game1", 0)
+            result = await event_handlers._edit_with_backoff("chan1", "game1", MagicMock(), 0)
 
-        assert result is None
+        assert result is False
@@ -21,12 +21,15 @@
 
 """Unit tests for EventHandlers game reminder methods."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
+from shared.cache.ttl import DISCORD_GLOBAL_RATE_LIMIT_BACKGROUND
 from shared.models import participant as participant_model
 from shared.models.base import utc_now
 from shared.models.game import GameSession
@@ -34,6 +37,18 @@ from shared.models.participant import ParticipantType
 from shared.models.user import User
 
 
+@pytest.fixture(autouse=True)
+def mock_dm_rate_limit():
+    """Skip the Redis-backed global token lease for reminder DMs."""
+    lease = MagicMock()
+    lease.acquire = AsyncMock()
+    with (
+        patch("services.bot.events.handlers.get_redis_client", new=AsyncMock()),
+        patch("services.bot.events.handlers.get_global_lease", return_value=lease) as get_lease,
+    ):
+        yield get_lease
+
+
 @pytest.mark.asyncio
 async def test_send_reminder_dm_participant(event_handlers):
     """Test sending reminder DM to a regular participant."""
@@ -599,6 +614,7 @@ async def test_send_participant_reminders_success(event_handlers):
             _reminder_minutes=0,
             is_waitlist=False,
             jump_url=None,
+            is_host=False,
         )
         mock_send.assert_any_await(
             user_discord_id="user2",
@@ -607,6 +623,7 @@ async def test_send_participant_reminders_success(event_handlers):
             _reminder_minutes=0,
             is_waitlist=False,
             jump_url=None,
+            is_host=False,
         )
 
 
@@ -712,3 +729,218 @@ async def test_send_host_reminder_handles_error(event_handlers):
             jump_url=None,
         )
     assert True  # verifies exception is caught without propagating
+
+
+def _reminder_participant(discord_id: str, hour: int) -> MagicMock:
+    user = User(id=str(uuid4()), discord_id=discord_id)
+    participant = MagicMock()
+    participant.user_id = user.id
+    participant.user = user
+    participant.position_type = ParticipantType.SELF_ADDED
+    participant.position = 0
+    participant.joined_at = datetime(2025, 11, 1, hour, 0, 0, tzinfo=UTC)
+    return participant
+
+
+@pytest.mark.asyncio
+async def test_handle_game_reminder_skips_delivered_recipients(event_handlers, sample_game):
+    """A retried reminder only DMs recipients without a delivery checkpoint."""
+    sample_game.host = User(id=str(uuid4()), discord_id="host123")
+    sample_game.participants = [
+        _reminder_participant("participant456", 10),
+        _reminder_participant("participant789", 11),
+    ]
+    sample_game.max_players = 10
+    sample_game.scheduled_at = datetime(2025, 12, 20, 18, 0, 0, tzinfo=UTC)
+    notification_id = str(uuid4())
+
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock()
+
+    with (
+        patch("services.bot.events.handlers.get_db_session", return_value=mock_db),
+        patch(
+            "services.bot.events.handlers.utc_now",
+            return_value=datetime(2025, 12, 13, 10, 0, 0, tzinfo=UTC),
+        ),
+        patch.object(
+            event_handlers, "_get_game_with_participants", new=AsyncMock(return_value=sample_game)
+        ),
+        patch.object(
+            event_handlers,
+            "_get_delivered_reminder_recipients",
+            new=AsyncMock(return_value={"participant456", "host123"}),
+        ) as mock_delivered,
+        patch.object(
+            event_handlers, "_send_reminder_dm", new=AsyncMock(return_value=True)
+        ) as mock_send,
+        patch.object(event_handlers, "_record_reminder_delivery", new=AsyncMock()) as mock_record,
+    ):
+        await event_handlers._handle_notification_due({
+            "game_id": sample_game.id,
+            "notification_type": "reminder",
+            "notification_id": notification_id,
+        })
+
+    mock_delivered.assert_awaited_once_with(mock_db, notification_id)
+    mock_send.assert_awaited_once()
+    assert mock_send.call_args.kwargs["user_discord_id"] == "participant789"
+    mock_record.assert_awaited_once_with(notification_id, "participant789")
+
+
+@pytest.mark.asyncio
+async def test_handle_game_reminder_releases_session_before_sending(event_handlers, sample_game):
+    """DMs are sent only after the DB session used to load the game has closed."""
+    sample_game.host = None
+    sample_game.participants = [_reminder_participant("participant456", 10)]
+    sample_game.max_players = 10
+    sample_game.scheduled_at = datetime(2025, 12, 20, 18, 0, 0, tzinfo=UTC)
+    events: list[str] = []
+
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+
+    async def _exit(*_args):
+        events.append("session_closed")
+
+    mock_db.__aexit__ = _exit
+
+    async def _send(**_kwargs):
+        events.append("dm_sent")
+        return True
+
+    with (
+        patch("services.bot.events.handlers.get_db_session", return_value=mock_db),
+        patch(
+            "services.bot.events.handlers.utc_now",
+            return_value=datetime(2025, 12, 13, 10, 0, 0, tzinfo=UTC),
+        ),
+        patch.object(
+            event_handlers, "_get_game_with_participants", new=AsyncMock(return_value=sample_game)
+        ),
+        patch.object(event_handlers, "_send_reminder_dm", side_effect=_send),
+    ):
+        await event_handlers._handle_notification_due({
+            "game_id": sample_game.id,
+            "notification_type": "reminder",
+        })
+
+    assert events == ["session_closed", "dm_sent"]
+
+
+@pytest.mark.asyncio
+async def test_handle_game_reminder_records_fan_out_metrics(event_handlers, sample_game):
+    """DM rate and time-to-last-DM are recorded once per reminder."""
+    sample_game.host = User(id=str(uuid4()), discord_id="host123")
+    sample_game.participants = [_reminder_participant("participant456", 10)]
+    sample_game.max_players = 10
+    sample_game.scheduled_at = datetime(2025, 12, 20, 18, 0, 0, tzinfo=UTC)
+
+    mock_db = MagicMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock()
+
+    with (
+        patch("services.bot.events.handlers.get_db_session", return_value=mock_db),
+        patch(
+            "services.bot.events.handlers.utc_now",
+            return_value=datetime(2025, 12, 13, 10, 0, 0, tzinfo=UTC),
+        ),
+        patch.object(
+            event_handlers, "_get_game_with_participants", new=AsyncMock(return_value=sample_game)
+        ),
+        patch.object(event_handlers, "_send_reminder_dm", new=AsyncMock(return_value=True)),
+        patch("services.bot.events.handlers.reminder_dm_rate_histogram") as mock_rate,
+        patch("services.bot.events.handlers.reminder_time_to_last_dm_histogram") as mock_elapsed,
+    ):
+        await event_handlers._handle_notification_due({
+            "game_id": sample_game.id,
+            "notification_type": "reminder",
+        })
+
+    mock_rate.record.assert_called_once()
+    assert mock_rate.record.call_args.args[0] > 0
+    mock_elapsed.record.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_send_participant_reminders_runs_concurrently(event_handlers):
+    """All participant DMs are in flight together instead of one after another."""
+    participants = [_reminder_participant(f"user{i}", 10 + i) for i in range(3)]
+    in_flight = 0
+    max_in_flight = 0
+    release = asyncio.Event()
+
+    async def _send(**_kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        if max_in_flight == len(participants):
+            release.set()
+        await release.wait()
+        in_flight -= 1
+        return True
+
+    with patch.object(event_handlers, "_send_reminder_dm", side_effect=_send):
+        sent = await asyncio.wait_for(
+            event_handlers._send_participant_reminders(
+                participants, "Test Game", 1234567890, is_waitlist=False, jump_url=None
+            ),
+            timeout=1,
+        )
+
+    assert sent == 3
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_deliver_reminder_dm_spends_global_token_and_records(
+    event_handlers, mock_dm_rate_limit
+):
+    """A sent DM spends one global token and is checkpointed."""
+    with (
+        patch.object(event_handlers, "_send_reminder_dm", new=AsyncMock(return_value=True)),
+        patch.object(event_handlers, "_record_reminder_delivery", new=AsyncMock()) as mock_record,
+    ):
+        sent = await event_handlers._deliver_reminder_dm(
+            "notif-1", "user1", "Test Game", 1234567890, 0, is_waitlist=False, jump_url=None
+        )
+
+    assert sent is True
+    mock_dm_rate_limit.assert_called_once_with(DISCORD_GLOBAL_RATE_LIMIT_BACKGROUND)
+    mock_dm_rate_limit.return_value.acquire.assert_awaited_once()
+    mock_record.assert_awaited_once_with("notif-1", "user1")
+
+
+@pytest.mark.asyncio
+async def test_deliver_reminder_dm_does_not_record_failed_dm(event_handlers):
+    """A DM that could not be delivered is left for the retry."""
+    with (
+        patch.object(event_handlers, "_send_reminder_dm", new=AsyncMock(return_value=False)),
+        patch.object(event_handlers, "_record_reminder_delivery", new=AsyncMock()) as mock_record,
+    ):
+        sent = await event_handlers._deliver_reminder_dm(
+            "notif-1", "user1", "Test Game", 1234567890, 0, is_waitlist=False, jump_url=None
+        )
+
+    assert sent is False
+    mock_record.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_record_reminder_delivery_is_idempotent(event_handlers):
+    """Checkpoints upsert with ON CONFLICT DO NOTHING so retries never fail on duplicates."""
+    mock_db = AsyncMock()
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=mock_db)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+
+    with patch("services.bot.events.handlers.get_db_session", return_value=ctx):
+        await event_handlers._record_reminder_delivery("notif-1", "user1")
+
+    stmt = mock_db.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO reminder_deliveries" in sql
+    assert "ON CONFLICT DO NOTHING" in sql
+    mock_db.commit.assert_awaited_once()
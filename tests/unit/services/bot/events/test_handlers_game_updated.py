@@ -51,6 +51,7 @@ async def test_handle_game_updated_inserts_queue_row(
             "services.bot.events.handlers.EventHandlers._get_game_with_participants",
             return_value=sample_game,
         ),
+        patch("services.bot.events.handlers.message_refresh_requests_counter") as mock_counter,
     ):
         mock_db_session.return_value.__aenter__ = AsyncMock(return_value=mock_db)
         mock_db_session.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -66,3 +67,4 @@ async def test_handle_game_updated_inserts_queue_row(
         if isinstance(call.args[0], MessageRefreshQueue)
     ]
     assert len(queue_rows_via_add) == 0
+    mock_counter.add.assert_called_once_with(1, {"channel_id": "123456789"})
@@ -23,6 +23,7 @@
 
 from datetime import UTC, datetime
 from unittest.mock import ANY, MagicMock, patch
+from urllib.parse import urlsplit
 
 import discord
 
@@ -2263,7 +2264,7 @@ class TestFormatGameAnnouncementMimeTypes:
                 thumbnail_id=self._thumbnail_uuid,
                 thumbnail_mime_type="image/gif",
             )
-        assert embed.thumbnail.url.endswith(".gif"), (
+        assert urlsplit(embed.thumbnail.url).path.endswith(".gif"), (
             f"Expected .gif extension, got: {embed.thumbnail.url}"
         )
 
@@ -2279,7 +2280,7 @@ class TestFormatGameAnnouncementMimeTypes:
                 thumbnail_id=self._thumbnail_uuid,
                 thumbnail_mime_type="image/png",
             )
-        assert embed.thumbnail.url.endswith(".png"), (
+        assert urlsplit(embed.thumbnail.url).path.endswith(".png"), (
             f"Expected .png extension, got: {embed.thumbnail.url}"
         )
 
@@ -2296,7 +2297,8 @@ class TestFormatGameAnnouncementMimeTypes:
                 thumbnail_mime_type=None,
             )
         assert not any(
-            embed.thumbnail.url.endswith(ext) for ext in (".gif", ".png", ".jpg", ".webp")
+            urlsplit(embed.thumbnail.url).path.endswith(ext)
+            for ext in (".gif", ".png", ".jpg", ".webp")
         ), f"Expected no extension, got: {embed.thumbnail.url}"
 
     def test_gif_banner_mime_type_appends_gif_extension(self):
@@ -2311,4 +2313,28 @@ class TestFormatGameAnnouncementMimeTypes:
                 banner_image_id=self._banner_uuid,
                 banner_image_mime_type="image/gif",
             )
-        assert embed.image.url.endswith(".gif"), f"Expected .gif extension, got: {embed.image.url}"
+        assert urlsplit(embed.image.url).path.endswith(".gif"), (
+            f"Expected .gif extension, got: {embed.image.url}"
+        )
+
+    def test_embed_images_request_display_sizes(self):
+        """Embeds ask for the pre-rendered thumbnail and banner variants."""
+        mock_config = MagicMock()
+        mock_config.backend_url = "http://api"
+        with (
+            patch("services.bot.formatters.game_message.get_config", return_value=mock_config),
+            patch("services.bot.formatters.game_message.GameView"),
+        ):
+            _content, embed, _view = self._call(
+                thumbnail_id=self._thumbnail_uuid,
+                thumbnail_mime_type="image/png",
+                banner_image_id=self._banner_uuid,
+                banner_image_mime_type="image/gif",
+            )
+        assert embed.thumbnail.url == (
+            f"http://api/api/v1/public/images/{self._thumbnail_uuid}.png?size=thumbnail"
+        )
+        assert (
+            embed.image.url
+            == f"http://api/api/v1/public/images/{self._banner_uuid}.gif?size=banner"
+        )
@@ -21,163 +21,103 @@
 
 """Unit tests for the join game bot handler."""
 
-import uuid
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
 
-from services.bot.handlers.join_game import _resolve_bot_role_position, _validate_join_game
-from shared.models.participant import ParticipantType
-from shared.models.signup_method import SignupMethod
+from services.bot.handlers.join_game import _interaction_role_ids, handle_join_game
+from shared.data_access.game_joins import JoinResult
 
+GAME_ID = "00000000-0000-0000-0000-000000000001"
 
-def _make_game(priority_role_ids: list[str] | None = None) -> MagicMock:
-    game = MagicMock()
-    game.template = MagicMock()
-    game.template.signup_priority_role_ids = priority_role_ids
-    return game
 
+def _member_interaction(guild_id: str, role_ids: list[str]) -> MagicMock:
+    roles = []
+    for role_id in role_ids:
+        role = MagicMock()
+        role.id = int(role_id)
+        roles.append(role)
 
-def _make_game_no_template() -> MagicMock:
-    game = MagicMock()
-    game.template = None
-    return game
+    interaction = MagicMock()
+    interaction.guild_id = int(guild_id)
+    interaction.user = MagicMock(spec=discord.Member)
+    interaction.user.id = 42
+    interaction.user.roles = roles
+    interaction.user.send = AsyncMock()
+    interaction.response.is_done = MagicMock(return_value=True)
+    return interaction
 
 
-def _make_role_checker() -> MagicMock:
-    checker = MagicMock()
-    checker.seed_user_roles = AsyncMock()
-    return checker
+def _patch_db() -> MagicMock:
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=AsyncMock())
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    return patch("services.bot.handlers.join_game.get_db_session", return_value=ctx)
 
 
-def _make_db_scalar_result(value):
-    """Return a mock db.execute() result with scalar_one_or_none() set."""
-    result = MagicMock()
-    result.scalar_one_or_none.return_value = value
-    return result
+class TestInteractionRoleIds:
+    """Tests for _interaction_role_ids."""
 
-
-class TestValidateJoinGame:
-    """Tests for _validate_join_game."""
-
-    @pytest.mark.asyncio
-    async def test_host_selected_rejects_self_join(self):
-        """HOST_SELECTED games reject self-joins server-side.
-
-        The Discord join button is disabled for HOST_SELECTED games, but that
-        is client-side only; the handler must reject it too in case the
-        button is bypassed (stale message, replayed interaction, etc.).
-        """
-        game = MagicMock()
-        game.status = "SCHEDULED"
-        game.signup_method = SignupMethod.HOST_SELECTED.value
-
-        db = AsyncMock()
-        db.execute = AsyncMock(side_effect=[_make_db_scalar_result(game)])
-
-        result = await _validate_join_game(db, uuid.uuid4(), "discord-user-id")
-
-        assert result["can_join"] is False
-        assert "does not accept self-signups" in result["error"]
-
-
-class TestResolveBotRolePosition:
-    """Tests for _resolve_bot_role_position."""
-
-    @pytest.mark.asyncio
-    async def test_no_priority_roles_returns_self_added(self):
-        """Empty priority list skips role resolution and returns SELF_ADDED."""
-        interaction = MagicMock()
-        game = _make_game(priority_role_ids=[])
-        result = await _resolve_bot_role_position(interaction, game, _make_role_checker())
-        assert result == (ParticipantType.SELF_ADDED, 32767)
-
-    @pytest.mark.asyncio
-    async def test_no_template_returns_self_added(self):
-        """Missing template returns SELF_ADDED without error."""
-        interaction = MagicMock()
-        result = await _resolve_bot_role_position(
-            interaction, _make_game_no_template(), _make_role_checker()
-        )
-        assert result == (ParticipantType.SELF_ADDED, 32767)
-
-    @pytest.mark.asyncio
-    async def test_non_member_interaction_returns_self_added(self):
-        """DM / non-guild interaction (User, not Member) returns SELF_ADDED."""
+    def test_non_member_interaction_has_no_roles(self):
+        """DM / non-guild interaction (User, not Member) yields no role IDs."""
         interaction = MagicMock()
-        interaction.user = MagicMock(spec=discord.User)  # not a Member
-        game = _make_game(priority_role_ids=["role_a"])
-        result = await _resolve_bot_role_position(interaction, game, _make_role_checker())
-        assert result == (ParticipantType.SELF_ADDED, 32767)
+        interaction.user = MagicMock(spec=discord.User)
+        assert _interaction_role_ids(interaction) == []
 
-    @pytest.mark.asyncio
-    async def test_member_with_matching_role_returns_role_matched(self):
-        """Guild member whose roles match the priority list gets ROLE_MATCHED."""
-        guild_id = "999"
-        role_a_id = "111"
-
-        mock_role = MagicMock()
-        mock_role.id = int(role_a_id)
-
-        interaction = MagicMock()
-        interaction.guild_id = int(guild_id)
-        interaction.user = MagicMock(spec=discord.Member)
-        interaction.user.id = 42
-        interaction.user.roles = [mock_role]
-
-        game = _make_game(priority_role_ids=[role_a_id])
-        checker = _make_role_checker()
+    def test_member_roles_are_returned_as_strings(self):
+        """Guild member role IDs come from the interaction payload."""
+        interaction = _member_interaction("999", ["111", "222"])
+        assert _interaction_role_ids(interaction) == ["111", "222"]
 
-        result = await _resolve_bot_role_position(interaction, game, checker)
-
-        assert result == (ParticipantType.ROLE_MATCHED, 0)
-        checker.seed_user_roles.assert_called_once_with("42", guild_id, [role_a_id])
-
-    @pytest.mark.asyncio
-    async def test_everyone_role_excluded_from_user_roles(self):
+    def test_everyone_role_excluded(self):
         """The @everyone pseudo-role (same id as guild) is excluded from role IDs."""
-        guild_id = "999"
-        role_a_id = "111"
+        interaction = _member_interaction("999", ["999", "111"])
+        assert _interaction_role_ids(interaction) == ["111"]
 
-        everyone_role = MagicMock()
-        everyone_role.id = int(guild_id)
 
-        real_role = MagicMock()
-        real_role.id = int(role_a_id)
-
-        interaction = MagicMock()
-        interaction.guild_id = int(guild_id)
-        interaction.user = MagicMock(spec=discord.Member)
-        interaction.user.id = 42
-        interaction.user.roles = [everyone_role, real_role]
-
-        game = _make_game(priority_role_ids=[role_a_id])
-        checker = _make_role_checker()
-
-        result = await _resolve_bot_role_position(interaction, game, checker)
-
-        assert result == (ParticipantType.ROLE_MATCHED, 0)
-        checker.seed_user_roles.assert_called_once_with("42", guild_id, [role_a_id])
+class TestHandleJoinGameRoles:
+    """Role handling around the single-statement join."""
 
     @pytest.mark.asyncio
-    async def test_member_with_no_matching_role_returns_self_added(self):
-        """Guild member whose roles don't match any priority role gets SELF_ADDED."""
-        guild_id = "999"
+    async def test_member_roles_passed_to_join(self):
+        """The joiner's roles are sent with the join so placement happens in SQL."""
+        interaction = _member_interaction("999", ["999", "111"])
+        join = AsyncMock(return_value=JoinResult(participant_id="p1"))
 
-        mock_role = MagicMock()
-        mock_role.id = 777
+        with _patch_db(), patch("services.bot.handlers.join_game.game_joins.join_game", join):
+            await handle_join_game(interaction, GAME_ID)
 
-        interaction = MagicMock()
-        interaction.guild_id = int(guild_id)
-        interaction.user = MagicMock(spec=discord.Member)
-        interaction.user.id = 42
-        interaction.user.roles = [mock_role]
-
-        game = _make_game(priority_role_ids=["111", "222"])
-        checker = _make_role_checker()
+        assert join.call_args.args[1:] == (GAME_ID, "42", ["111"])
 
-        result = await _resolve_bot_role_position(interaction, game, checker)
+    @pytest.mark.asyncio
+    async def test_roles_seeded_when_template_has_priority_roles(self):
+        """The role cache is warmed from the payload for priority-role games."""
+        interaction = _member_interaction("999", ["111"])
+        join = AsyncMock(return_value=JoinResult(participant_id="p1", has_priority_roles=True))
+        checker = MagicMock()
+        checker.seed_user_roles = AsyncMock()
+
+        with (
+            _patch_db(),
+            patch("services.bot.handlers.join_game.game_joins.join_game", join),
+            patch("services.bot.handlers.join_game.RoleChecker", return_value=checker),
+        ):
+            await handle_join_game(interaction, GAME_ID)
+
+        checker.seed_user_roles.assert_awaited_once_with("42", "999", ["111"])
 
-        assert result == (ParticipantType.SELF_ADDED, 32767)
-        checker.seed_user_roles.assert_called_once_with("42", "999", ["777"])
+    @pytest.mark.asyncio
+    async def test_roles_not_seeded_without_priority_roles(self):
+        """Games without priority roles skip the role cache write."""
+        interaction = _member_interaction("999", ["111"])
+        join = AsyncMock(return_value=JoinResult(participant_id="p1"))
+
+        with (
+            _patch_db(),
+            patch("services.bot.handlers.join_game.game_joins.join_game", join),
+            patch("services.bot.handlers.join_game.RoleChecker") as checker_cls,
+        ):
+            await handle_join_game(interaction, GAME_ID)
+
+        checker_cls.assert_not_called()
@@ -145,6 +145,7 @@ class TestGameSchedulerBot:
                             return_value=mock_redis,
                         ),
                         patch("services.bot.bot.Path") as mock_path,
+                        patch("services.bot.bot.NotificationHub.run", new_callable=AsyncMock),
                         patch("services.bot.bot.SchedulerLoop", return_value=mock_sl_instance),
                         patch("services.bot.bot.AnnouncementLoop", return_value=mock_al_instance),
                         patch(
@@ -206,6 +207,7 @@ class TestGameSchedulerBot:
                             return_value=mock_redis,
                         ),
                         patch("services.bot.bot.Path"),
+                        patch("services.bot.bot.NotificationHub.run", new_callable=AsyncMock),
                         patch("services.bot.bot.SchedulerLoop", return_value=mock_sl_instance),
                         patch("services.bot.bot.AnnouncementLoop", return_value=mock_al_instance),
                         patch(
@@ -269,6 +271,7 @@ class TestGameSchedulerBot:
                             return_value=mock_redis,
                         ),
                         patch("services.bot.bot.Path"),
+                        patch("services.bot.bot.NotificationHub.run", new_callable=AsyncMock),
                         patch("services.bot.bot.SchedulerLoop", return_value=mock_sl_instance),
                         patch("services.bot.bot.AnnouncementLoop", return_value=mock_al_instance),
                         patch(
@@ -495,8 +498,9 @@ class TestGameSchedulerBot:
 
     @pytest.mark.asyncio
     async def test_on_guild_join_event(self, bot_config: BotConfig) -> None:
-        """Test on_guild_join event handler syncs guild to database and repopulates projection."""
+        """Test on_guild_join event handler syncs guild to database and projects the guild."""
         bot = GameSchedulerBot(bot_config)
+        bot._projection_ready = True
         mock_guild = MagicMock(spec=discord.Guild)
         mock_guild.name = "Test Guild"
         mock_guild.id = 987654321
@@ -525,7 +529,9 @@ class TestGameSchedulerBot:
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
             patch(
-                "services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock
+                "services.bot.bot.guild_projection.repopulate_guild",
+                new_callable=AsyncMock,
+                return_value=True,
             ) as mock_repopulate,
         ):
             await bot.on_guild_join(mock_guild)
@@ -536,7 +542,7 @@ class TestGameSchedulerBot:
             mock_sync.assert_awaited_once_with(guild=mock_guild, db=mock_db)
             mock_db.commit.assert_awaited_once()
             mock_rebuild.assert_awaited_once()
-            mock_repopulate.assert_awaited_once_with(bot=bot, redis=mock_redis)
+            mock_repopulate.assert_awaited_once_with(mock_guild, redis=mock_redis)
 
     @pytest.mark.asyncio
     async def test_on_guild_join_sync_failure(self, bot_config: BotConfig) -> None:
@@ -563,7 +569,9 @@ class TestGameSchedulerBot:
                 bot, "_rebuild_guild_channel_cache", new_callable=AsyncMock
             ) as mock_rebuild,
             patch(
-                "services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock
+                "services.bot.bot.guild_projection.repopulate_guild",
+                new_callable=AsyncMock,
+                return_value=True,
             ) as mock_repopulate,
         ):
             await bot.on_guild_join(mock_guild)
@@ -601,7 +609,9 @@ class TestGameSchedulerBot:
                 bot, "_rebuild_guild_channel_cache", new_callable=AsyncMock
             ) as mock_rebuild,
             patch(
-                "services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock
+                "services.bot.bot.guild_projection.repopulate_guild",
+                new_callable=AsyncMock,
+                return_value=True,
             ) as mock_repopulate,
         ):
             await bot.on_guild_join(mock_guild)
@@ -613,8 +623,9 @@ class TestGameSchedulerBot:
 
     @pytest.mark.asyncio
     async def test_on_guild_join_empty_results(self, bot_config: BotConfig) -> None:
-        """Test on_guild_join still repopulates projection when guild already exists."""
+        """Test on_guild_join still projects the guild when it already exists."""
         bot = GameSchedulerBot(bot_config)
+        bot._projection_ready = True
         mock_guild = MagicMock(spec=discord.Guild)
         mock_guild.name = "Existing Guild"
         mock_guild.id = 111222333
@@ -643,7 +654,9 @@ class TestGameSchedulerBot:
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
             patch(
-                "services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock
+                "services.bot.bot.guild_projection.repopulate_guild",
+                new_callable=AsyncMock,
+                return_value=True,
             ) as mock_repopulate,
         ):
             await bot.on_guild_join(mock_guild)
@@ -652,11 +665,11 @@ class TestGameSchedulerBot:
             mock_db.commit.assert_awaited_once()
             mock_logger.error.assert_not_called()
             mock_rebuild.assert_awaited_once()
-            mock_repopulate.assert_awaited_once_with(bot=bot, redis=mock_redis)
+            mock_repopulate.assert_awaited_once_with(mock_guild, redis=mock_redis)
 
     @pytest.mark.asyncio
     async def test_on_guild_remove_event(self, bot_config: BotConfig) -> None:
-        """Test on_guild_remove logs guild information and repopulates projection."""
+        """Test on_guild_remove logs guild information and removes the guild projection."""
         bot = GameSchedulerBot(bot_config)
         mock_guild = MagicMock(spec=discord.Guild)
         mock_guild.name = "Test Guild"
@@ -670,15 +683,15 @@ class TestGameSchedulerBot:
                 "services.bot.bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis
             ),
             patch(
-                "services.bot.bot.guild_projection.repopulate_all", new_callable=AsyncMock
-            ) as mock_repopulate,
+                "services.bot.bot.guild_projection.remove_guild", new_callable=AsyncMock
+            ) as mock_remove,
         ):
             await bot.on_guild_remove(mock_guild)
 
             mock_logger.info.assert_called_once_with(
                 "Bot removed from guild: %s (ID: %s)", "Test Guild", 987654321
             )
-            mock_repopulate.assert_awaited_once_with(bot=bot, redis=mock_redis)
+            mock_remove.assert_awaited_once_with("987654321", redis=mock_redis)
 
     @pytest.mark.asyncio
     async def test_close(self, bot_config: BotConfig) -> None:
@@ -1265,6 +1278,7 @@ class TestGameSchedulerBot:
             patch("services.bot.bot.MessageRefreshListener", return_value=mock_listener_instance),
             patch("services.bot.bot.BotActionListener", return_value=mock_listener_instance),
             patch("services.bot.bot.AnnouncementLoop", return_value=mock_listener_instance),
+            patch("services.bot.bot.NotificationHub.run", new_callable=AsyncMock),
             patch("services.bot.bot.SchedulerLoop", return_value=mock_loop_instance) as mock_sl,
         ):
             await bot.on_ready()
@@ -1311,6 +1325,7 @@ class TestGameSchedulerBot:
             patch("services.bot.bot.MessageRefreshListener", return_value=mock_listener_instance),
             patch("services.bot.bot.BotActionListener", return_value=mock_listener_instance),
             patch("services.bot.bot.AnnouncementLoop", return_value=mock_listener_instance),
+            patch("services.bot.bot.NotificationHub.run", new_callable=AsyncMock),
             patch("services.bot.bot.SchedulerLoop", return_value=mock_loop_instance) as mock_sl,
         ):
             await bot.on_ready()
@@ -57,6 +57,7 @@ class TestBotConfig:
             assert config.redis_url == "redis://localhost:6379/0"
             assert config.log_level == "INFO"
             assert config.environment == "development"
+            assert config.embed_sweep_min_outage_seconds == 60
 
     def test_config_with_custom_values(self) -> None:
         """Test configuration with custom values for optional fields."""
@@ -76,8 +76,83 @@ class TestMessageRefreshListenerStart:
             _DB_URL,
             "message_refresh_queue_changed",
             listener._on_notify,
+            on_connected=listener._on_connected,
         )
 
+    @pytest.mark.asyncio
+    async def test_start_subscribes_to_hub_when_given(self, spawn_cb: MagicMock) -> None:
+        """With a hub, start() subscribes instead of opening its own connection."""
+        hub = MagicMock()
+        hub.subscribe = AsyncMock()
+        listener = MessageRefreshListener(_DB_URL, spawn_cb, hub=hub)
+
+        with patch(
+            "services.bot.message_refresh_listener.listen_with_reconnect",
+            new_callable=AsyncMock,
+        ) as mock_listen:
+            await listener.start()
+
+        mock_listen.assert_not_called()
+        hub.subscribe.assert_awaited_once_with(
+            "message_refresh_queue_changed",
+            listener._on_notify,
+            on_connected=listener._on_connected,
+        )
+
+
+class TestMessageRefreshListenerCatchUp:
+    """Verify every (re)connect runs the pending-row catch-up scan."""
+
+    @pytest.mark.asyncio
+    async def test_connect_runs_catch_up(self, spawn_cb: MagicMock) -> None:
+        """_on_connected runs catch_up_cb as a task."""
+        catch_up = AsyncMock()
+        listener = MessageRefreshListener(_DB_URL, spawn_cb, catch_up_cb=catch_up)
+
+        listener._on_connected(MagicMock())
+        assert listener._catch_up_task is not None
+        await listener._catch_up_task
+
+        catch_up.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_runs_catch_up_again(self, spawn_cb: MagicMock) -> None:
+        """A reconnect after the first scan finished scans again."""
+        catch_up = AsyncMock()
+        listener = MessageRefreshListener(_DB_URL, spawn_cb, catch_up_cb=catch_up)
+
+        for _ in range(2):
+            listener._on_connected(MagicMock())
+            assert listener._catch_up_task is not None
+            await listener._catch_up_task
+
+        assert catch_up.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_connect_while_scanning_does_not_start_second_scan(
+        self, spawn_cb: MagicMock
+    ) -> None:
+        """A reconnect during a running scan does not start another one."""
+        release = asyncio.Event()
+        catch_up = AsyncMock(side_effect=release.wait)
+        listener = MessageRefreshListener(_DB_URL, spawn_cb, catch_up_cb=catch_up)
+
+        listener._on_connected(MagicMock())
+        first = listener._catch_up_task
+        listener._on_connected(MagicMock())
+        assert listener._catch_up_task is first
+
+        release.set()
+        assert first is not None
+        await first
+        catch_up.assert_awaited_once()
+
+    def test_connect_without_catch_up_cb_is_noop(self, listener: MessageRefreshListener) -> None:
+        """Without a catch_up_cb, connecting schedules nothing."""
+        listener._on_connected(MagicMock())
+
+        assert listener._catch_up_task is None
+
 
 class TestMessageRefreshListenerOnNotify:
     """Verify _on_notify dispatches workers correctly."""
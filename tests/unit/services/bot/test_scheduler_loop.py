@@ -26,6 +26,7 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from services.bot.scheduler_loop import SchedulerLoop
 from shared.models import NotificationSchedule
@@ -80,68 +81,147 @@ def test_construction_stores_params() -> None:
     assert loop.max_timeout == 600
 
 
-@pytest.mark.asyncio
-async def test_process_item_writes_bot_action_queue_row() -> None:
-    """_process_item calls event_builder and adds the result to the DB session."""
-    queue_row = MagicMock()
-    builder = MagicMock(return_value=queue_row)
-    loop = _make_loop(event_builder=builder)
-
-    item = MagicMock()
-    item.sent = False
+def _make_batch_session(items: list[object]) -> AsyncMock:
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = items
 
     mock_session = AsyncMock()
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=False)
-    mock_session.add = MagicMock()
+    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.add_all = MagicMock()
+    return mock_session
+
+
+def _compiled_sql(statement: object) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_process_due_batch_writes_bot_action_queue_rows() -> None:
+    """_process_due_batch builds one queue row per claimed item and adds them together."""
+    queue_rows = [MagicMock(), MagicMock()]
+    builder = MagicMock(side_effect=queue_rows)
+    loop = _make_loop(event_builder=builder)
+    items = [MagicMock(id="a"), MagicMock(id="b")]
+    mock_session = _make_batch_session(items)
 
     with patch("services.bot.scheduler_loop.get_db_session", return_value=mock_session):
-        await loop._process_item(item)
+        claimed = await loop._process_due_batch()
 
-    builder.assert_called_once_with(item)
-    mock_session.add.assert_any_call(queue_row)
+    assert claimed == 2
+    assert builder.call_args_list == [((items[0],),), ((items[1],),)]
+    mock_session.add_all.assert_called_once_with(queue_rows)
 
 
 @pytest.mark.asyncio
-async def test_process_item_marks_status_field_true() -> None:
-    """_process_item sets the item's status_field attribute to True."""
-    loop = _make_loop(status_field="sent")
+async def test_process_due_batch_claims_with_skip_locked() -> None:
+    """The claim query locks due rows with SKIP LOCKED and is capped at batch_size."""
+    loop = _make_loop(batch_size=25)
+    mock_session = _make_batch_session([])
 
-    item = MagicMock()
-    item.sent = False
+    with patch("services.bot.scheduler_loop.get_db_session", return_value=mock_session):
+        await loop._process_due_batch()
 
-    mock_session = AsyncMock()
-    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session.__aexit__ = AsyncMock(return_value=False)
-    mock_session.add = MagicMock()
+    sql = _compiled_sql(mock_session.execute.await_args_list[0].args[0])
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "notification_schedule.notification_time <=" in sql
+    assert "LIMIT" in sql
+    assert mock_session.execute.await_args_list[0].args[0]._limit == 25
+
+
+@pytest.mark.asyncio
+async def test_process_due_batch_marks_claimed_ids_in_one_update() -> None:
+    """All claimed rows are flagged by a single UPDATE keyed on their primary keys."""
+    loop = _make_loop(status_field="sent")
+    items = [MagicMock(id="a"), MagicMock(id="b")]
+    mock_session = _make_batch_session(items)
 
     with patch("services.bot.scheduler_loop.get_db_session", return_value=mock_session):
-        await loop._process_item(item)
+        await loop._process_due_batch()
 
-    assert item.sent is True
+    assert mock_session.execute.await_count == 2
+    update_stmt = mock_session.execute.await_args_list[1].args[0]
+    sql = _compiled_sql(update_stmt)
+    assert sql.startswith("UPDATE notification_schedule SET sent=")
+    assert "notification_schedule.id IN" in sql
+    assert update_stmt.compile().params["id_1"] == ["a", "b"]
 
 
 @pytest.mark.asyncio
-async def test_process_item_commits_exactly_once() -> None:
-    """_process_item performs a single db.commit() for both the queue row and status mark."""
+async def test_process_due_batch_commits_exactly_once() -> None:
+    """Queue inserts and status updates for the whole batch share one commit."""
     loop = _make_loop()
+    mock_session = _make_batch_session([MagicMock(id="a"), MagicMock(id="b"), MagicMock(id="c")])
 
-    item = MagicMock()
+    with patch("services.bot.scheduler_loop.get_db_session", return_value=mock_session):
+        await loop._process_due_batch()
 
-    mock_session = AsyncMock()
-    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session.__aexit__ = AsyncMock(return_value=False)
-    mock_session.add = MagicMock()
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_process_due_batch_returns_zero_without_commit_when_nothing_due() -> None:
+    """An empty claim neither builds events nor commits."""
+    builder = MagicMock()
+    loop = _make_loop(event_builder=builder)
+    mock_session = _make_batch_session([])
 
     with patch("services.bot.scheduler_loop.get_db_session", return_value=mock_session):
-        await loop._process_item(item)
+        claimed = await loop._process_due_batch()
 
-    mock_session.commit.assert_awaited_once()
+    assert claimed == 0
+    builder.assert_not_called()
+    mock_session.add_all.assert_not_called()
+    mock_session.commit.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_run_skips_process_item_when_not_due() -> None:
-    """run() does not call _process_item when the next item's time_field is in the future."""
+async def test_process_due_batch_records_throughput_metrics() -> None:
+    """A non-empty batch records item count, batch size and duration per channel."""
+    loop = _make_loop()
+    mock_session = _make_batch_session([MagicMock(id="a"), MagicMock(id="b")])
+
+    with (
+        patch("services.bot.scheduler_loop.get_db_session", return_value=mock_session),
+        patch("services.bot.scheduler_loop.scheduler_items_processed_counter") as mock_counter,
+        patch("services.bot.scheduler_loop.scheduler_batch_size_histogram") as mock_size,
+        patch("services.bot.scheduler_loop.scheduler_batch_duration_histogram") as mock_duration,
+    ):
+        await loop._process_due_batch()
+
+    attributes = {"channel": _NOTIFY_CHANNEL}
+    mock_counter.add.assert_called_once_with(2, attributes)
+    mock_size.record.assert_called_once_with(2, attributes)
+    mock_duration.record.assert_called_once()
+    assert mock_duration.record.call_args.args[1] == attributes
+
+
+def test_wait_timeout_uses_max_timeout_without_items() -> None:
+    """With no pending rows the loop sleeps for max_timeout."""
+    loop = _make_loop(max_timeout=600)
+    assert loop._wait_timeout(None) == 600
+
+
+def test_wait_timeout_retries_soon_for_row_locked_elsewhere() -> None:
+    """A due row that the claim skipped is retried after the short retry delay."""
+    loop = _make_loop()
+    item = MagicMock()
+    item.notification_time = datetime.now(UTC).replace(tzinfo=None) - timedelta(seconds=1)
+    assert loop._wait_timeout(item) == pytest.approx(1.0)
+
+
+def test_wait_timeout_sleeps_until_future_item_is_due() -> None:
+    """A future row sets the wait to the time remaining until it is due."""
+    loop = _make_loop()
+    item = MagicMock()
+    item.notification_time = datetime.now(UTC).replace(tzinfo=None) + timedelta(minutes=5)
+    assert 290 < loop._wait_timeout(item) <= 300
+
+
+@pytest.mark.asyncio
+async def test_run_waits_for_future_item_after_empty_claim() -> None:
+    """run() peeks at the next row only after a claim finds nothing due."""
     loop = _make_loop()
 
     future_item = MagicMock()
@@ -152,45 +232,50 @@ async def test_run_skips_process_item_when_not_due() -> None:
             "services.bot.scheduler_loop.listen_with_reconnect",
             new=AsyncMock(side_effect=_blocks_forever),
         ),
-        patch.object(loop, "_get_next_due_item", new_callable=AsyncMock, return_value=future_item),
-        patch.object(loop, "_process_item", new_callable=AsyncMock) as mock_process,
+        patch.object(
+            loop, "_get_next_due_item", new_callable=AsyncMock, return_value=future_item
+        ) as mock_get_next,
+        patch.object(loop, "_process_due_batch", new_callable=AsyncMock, return_value=0),
     ):
         task = asyncio.create_task(loop.run())
         await asyncio.sleep(0)
+        await asyncio.sleep(0)
         task.cancel()
         try:
             await task
         except asyncio.CancelledError:
             pass
 
-    mock_process.assert_not_awaited()
+    mock_get_next.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_run_calls_process_item_when_due() -> None:
-    """run() calls _process_item when the next item's time_field is in the past."""
+async def test_run_keeps_claiming_while_batches_are_non_empty() -> None:
+    """run() claims again immediately after a non-empty batch without peeking or waiting."""
     loop = _make_loop()
-
-    past_item = MagicMock()
-    past_item.notification_time = datetime.now(UTC).replace(tzinfo=None) - timedelta(seconds=1)
+    real_sleep = asyncio.sleep
 
     with (
         patch(
             "services.bot.scheduler_loop.listen_with_reconnect",
             new=AsyncMock(side_effect=_blocks_forever),
         ),
-        patch.object(loop, "_get_next_due_item", new_callable=AsyncMock, return_value=past_item),
-        patch.object(loop, "_process_item", new_callable=AsyncMock) as mock_process,
+        patch.object(loop, "_get_next_due_item", new_callable=AsyncMock) as mock_get_next,
+        patch.object(
+            loop, "_process_due_batch", new_callable=AsyncMock, side_effect=[500, 500, 3, 0]
+        ) as mock_batch,
     ):
         task = asyncio.create_task(loop.run())
-        await asyncio.sleep(0)
+        for _ in range(6):
+            await real_sleep(0)
         task.cancel()
         try:
             await task
         except asyncio.CancelledError:
             pass
 
-    mock_process.assert_awaited_once_with(past_item)
+    assert mock_batch.await_count == 4
+    mock_get_next.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -204,7 +289,9 @@ async def test_run_handles_no_items() -> None:
             new=AsyncMock(side_effect=_blocks_forever),
         ),
         patch.object(loop, "_get_next_due_item", new_callable=AsyncMock, return_value=None),
-        patch.object(loop, "_process_item", new_callable=AsyncMock) as mock_process,
+        patch.object(
+            loop, "_process_due_batch", new_callable=AsyncMock, return_value=0
+        ) as mock_batch,
     ):
         task = asyncio.create_task(loop.run())
         await asyncio.sleep(0)
@@ -214,7 +301,7 @@ async def test_run_handles_no_items() -> None:
         except asyncio.CancelledError:
             pass
 
-    mock_process.assert_not_awaited()
+    mock_batch.assert_awaited_once()
 
 
 def test_on_notify_sets_notified_event() -> None:
@@ -258,7 +345,7 @@ async def test_run_clears_notified_after_waking() -> None:
             new=AsyncMock(side_effect=_blocks_forever),
         ),
         patch.object(loop, "_get_next_due_item", new_callable=AsyncMock, return_value=None),
-        patch.object(loop, "_process_item", new_callable=AsyncMock),
+        patch.object(loop, "_process_due_batch", new_callable=AsyncMock, return_value=0),
     ):
         task = asyncio.create_task(loop.run())
         # Three yields: first lets run() reach wait_for; second lets the inner
@@ -316,6 +403,7 @@ async def test_run_body_continues_after_exception_in_iteration() -> None:
             new=AsyncMock(side_effect=_blocks_forever),
         ),
         patch.object(loop, "_get_next_due_item", new=mock_get_next),
+        patch.object(loop, "_process_due_batch", new_callable=AsyncMock, return_value=0),
         patch("services.bot.scheduler_loop.logger") as mock_logger,
         patch("services.bot.scheduler_loop.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
     ):
@@ -365,6 +453,7 @@ async def test_run_survives_two_consecutive_exceptions_in_iteration() -> None:
             new=AsyncMock(side_effect=_blocks_forever),
         ),
         patch.object(loop, "_get_next_due_item", new=mock_get_next),
+        patch.object(loop, "_process_due_batch", new_callable=AsyncMock, return_value=0),
         patch("services.bot.scheduler_loop.logger") as mock_logger,
         patch("services.bot.scheduler_loop.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
     ):
@@ -382,3 +471,26 @@ async def test_run_survives_two_consecutive_exceptions_in_iteration() -> None:
     assert mock_logger.exception.call_count >= 2
     assert mock_sleep.await_count >= 2
     mock_sleep.assert_any_call(1.0)
+
+
+@pytest.mark.asyncio
+async def test_run_subscribes_to_hub_instead_of_connecting() -> None:
+    """With a hub, run() subscribes and each hub (re)connect wakes the loop."""
+    hub = MagicMock()
+    hub.subscribe = AsyncMock()
+    loop = _make_loop(hub=hub)
+
+    with (
+        patch(
+            "services.bot.scheduler_loop.listen_with_reconnect", new_callable=AsyncMock
+        ) as mock_listen,
+        patch.object(loop, "_run_loop", new_callable=AsyncMock) as mock_run_loop,
+    ):
+        await loop.run()
+
+    mock_listen.assert_not_called()
+    mock_run_loop.assert_awaited_once()
+    args, kwargs = hub.subscribe.await_args
+    assert args == (_NOTIFY_CHANNEL, loop._on_notify)
+    kwargs["on_connected"](MagicMock())
+    assert loop._notified.is_set()
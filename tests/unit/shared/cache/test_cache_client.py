@@ -65,7 +65,7 @@ async def redis_client(mock_redis, mock_pool):
     with (
         patch("shared.cache.client.ConnectionPool") as mock_pool_class,
         patch(
-            "shared.cache.client.Redis",
+            "shared.cache.client._RoundTripCountingRedis",
         ) as mock_redis_class,
     ):
         mock_pool_class.from_url.return_value = mock_pool
@@ -87,7 +87,7 @@ class TestRedisClient:
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
             patch(
-                "shared.cache.client.Redis",
+                "shared.cache.client._RoundTripCountingRedis",
             ) as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = mock_pool
@@ -207,6 +207,50 @@ class TestRedisClient:
             json.dumps(test_data),
         )
 
+    async def test_mget_success(self, redis_client, mock_redis):
+        """Test MGET returns values in key order."""
+        mock_redis.mget = AsyncMock(return_value=["a", None])
+
+        result = await redis_client.mget(["k1", "k2"])
+
+        assert result == ["a", None]
+        mock_redis.mget.assert_awaited_once_with(["k1", "k2"])
+
+    async def test_mget_empty_skips_redis(self, redis_client, mock_redis):
+        """Test MGET with no keys makes no call."""
+        mock_redis.mget = AsyncMock()
+
+        assert await redis_client.mget([]) == []
+        mock_redis.mget.assert_not_awaited()
+
+    async def test_mget_error_returns_misses(self, redis_client, mock_redis):
+        """Test MGET error handling returns None for every key."""
+        mock_redis.mget = AsyncMock(side_effect=Exception("Redis error"))
+
+        assert await redis_client.mget(["k1", "k2"]) == [None, None]
+
+    async def test_set_many_pipelines_mset_and_expire(self, redis_client, mock_redis):
+        """Test set_many queues MSET and one EXPIRE per key in a single pipeline."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        result = await redis_client.set_many({"k1": "v1", "k2": "v2"}, ttl=60)
+
+        assert result is True
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.mset.assert_called_once_with({"k1": "v1", "k2": "v2"})
+        assert pipe.expire.call_args_list == [(("k1", 60),), (("k2", 60),)]
+        pipe.execute.assert_awaited_once()
+
+    async def test_set_many_error_returns_false(self, redis_client, mock_redis):
+        """Test set_many error handling."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        assert await redis_client.set_many({"k1": "v1"}, ttl=60) is False
+
     async def test_set_json_serialization_error(self, redis_client):
         """Test JSON cache SET with non-serializable data."""
 
@@ -283,11 +327,34 @@ class TestRedisClient:
 
         assert result == -2
 
+    async def test_publish_success(self, redis_client, mock_redis):
+        """publish() forwards to PUBLISH and returns the receiver count."""
+        mock_redis.publish = AsyncMock(return_value=2)
+
+        result = await redis_client.publish("channel", "message")
+
+        assert result == 2
+        mock_redis.publish.assert_awaited_once_with("channel", "message")
+
+    async def test_publish_error_returns_zero(self, redis_client, mock_redis):
+        """publish() logs and returns 0 when Redis raises."""
+        mock_redis.publish = AsyncMock(side_effect=Exception("Connection error"))
+
+        result = await redis_client.publish("channel", "message")
+
+        assert result == 0
+
+    async def test_pubsub_returns_client_pubsub(self, redis_client, mock_redis):
+        """pubsub() returns a PubSub from the underlying client."""
+        mock_redis.pubsub = MagicMock(return_value="pubsub")
+
+        assert await redis_client.pubsub() == "pubsub"
+
     async def test_get_auto_connects(self, mock_redis, mock_pool):
         """get() triggers connect() automatically when client not initialized."""
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = mock_pool
             mock_redis_class.return_value = mock_redis
@@ -309,7 +376,7 @@ class TestRedisClient:
         """set() triggers connect() automatically when client not initialized."""
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = mock_pool
             mock_redis_class.return_value = mock_redis
@@ -330,7 +397,7 @@ class TestRedisClient:
         """delete() triggers connect() automatically when client not initialized."""
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = mock_pool
             mock_redis_class.return_value = mock_redis
@@ -360,7 +427,7 @@ class TestRedisClient:
         """exists() triggers connect() automatically when client not initialized."""
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = mock_pool
             mock_redis_class.return_value = mock_redis
@@ -382,7 +449,7 @@ class TestRedisClient:
         """expire() triggers connect() automatically when client not initialized."""
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = mock_pool
             mock_redis_class.return_value = mock_redis
@@ -412,7 +479,7 @@ class TestRedisClient:
         """ttl() triggers connect() automatically when client not initialized."""
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = mock_pool
             mock_redis_class.return_value = mock_redis
@@ -47,7 +47,7 @@ class TestClaimChannelRateLimitSlot:
     async def client_and_mock(self, mock_redis: AsyncMock):
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = AsyncMock()
             mock_redis_class.return_value = mock_redis
@@ -156,7 +156,7 @@ class TestClaimChannelRateLimitSlot:
         """Method establishes connection if not yet connected."""
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = AsyncMock()
             mock_redis_class.return_value = mock_redis
@@ -19,7 +19,7 @@
 # SOFTWARE.
 
 
-"""Unit tests for RedisClient.claim_global_and_channel_slot."""
+"""Unit tests for RedisClient global rate-limit claims and leases."""
 
 from unittest.mock import ANY, AsyncMock, patch
 
@@ -27,6 +27,7 @@ import pytest
 import redis
 
 from shared.cache.client import (
+    _GLOBAL_LEASE_LUA,
     _REDIS_ERROR_BACKOFF_BASE_MS,
     _REDIS_ERROR_BACKOFF_JITTER_MS,
     RedisClient,
@@ -48,7 +49,7 @@ class TestClaimGlobalAndChannelSlot:
     async def client_and_mock(self, mock_redis: AsyncMock):
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = AsyncMock()
             mock_redis_class.return_value = mock_redis
@@ -147,7 +148,7 @@ class TestClaimGlobalAndChannelSlot:
         """claim_global_and_channel_slot establishes connection if not yet connected."""
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = AsyncMock()
             mock_redis_class.return_value = mock_redis
@@ -217,7 +218,7 @@ class TestClaimGlobalSlot:
     async def client_and_mock(self, mock_redis: AsyncMock):
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = AsyncMock()
             mock_redis_class.return_value = mock_redis
@@ -291,7 +292,7 @@ class TestClaimGlobalSlot:
         """claim_global_slot establishes connection if not yet connected."""
         with (
             patch("shared.cache.client.ConnectionPool") as mock_pool_class,
-            patch("shared.cache.client.Redis") as mock_redis_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
         ):
             mock_pool_class.from_url.return_value = AsyncMock()
             mock_redis_class.return_value = mock_redis
@@ -370,3 +371,79 @@ class TestClaimGlobalSlot:
 
         with pytest.raises(redis.exceptions.NoPermissionError):
             await client.claim_global_slot()
+
+
+class TestLeaseGlobalSlots:
+    """Verify leasing a block of global rate-limit tokens."""
+
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        mock = AsyncMock()
+        mock.ping = AsyncMock()
+        mock.eval = AsyncMock(return_value=[5, 0])
+        mock.aclose = AsyncMock()
+        return mock
+
+    @pytest.fixture
+    async def client_and_mock(self, mock_redis: AsyncMock):
+        with (
+            patch("shared.cache.client.ConnectionPool") as mock_pool_class,
+            patch("shared.cache.client._RoundTripCountingRedis") as mock_redis_class,
+        ):
+            mock_pool_class.from_url.return_value = AsyncMock()
+            mock_redis_class.return_value = mock_redis
+            client = RedisClient("redis://localhost:6379/0")
+            await client.connect()
+            yield client, mock_redis
+            await client.disconnect()
+
+    async def test_returns_granted_count(self, client_and_mock: tuple) -> None:
+        client, mock_redis = client_and_mock
+        mock_redis.eval.return_value = [3, 0]
+
+        result = await client.lease_global_slots(5)
+
+        assert result == (3, 0)
+
+    async def test_returns_wait_when_exhausted(self, client_and_mock: tuple) -> None:
+        client, mock_redis = client_and_mock
+        mock_redis.eval.return_value = [0, 120]
+
+        result = await client.lease_global_slots(5)
+
+        assert result == (0, 120)
+
+    async def test_passes_key_count_and_budget(self, client_and_mock: tuple) -> None:
+        client, mock_redis = client_and_mock
+
+        await client.lease_global_slots(5, global_max=45)
+
+        script, numkeys, key, _now_ms, count, global_max = mock_redis.eval.call_args.args
+        assert script == _GLOBAL_LEASE_LUA
+        assert numkeys == 1
+        assert key == "discord:global_rate_limit"
+        assert (count, global_max) == ("5", "45")
+
+    async def test_eval_error_returns_jittered_backoff(self, client_and_mock: tuple) -> None:
+        client, mock_redis = client_and_mock
+        mock_redis.eval.side_effect = ConnectionError("Redis down")
+
+        granted, wait_ms = await client.lease_global_slots(5)
+
+        assert granted == 0
+        assert (
+            _REDIS_ERROR_BACKOFF_BASE_MS
+            <= wait_ms
+            <= _REDIS_ERROR_BACKOFF_BASE_MS + _REDIS_ERROR_BACKOFF_JITTER_MS
+        )
+
+    async def test_no_permission_error_is_reraised(self, client_and_mock: tuple) -> None:
+        client, mock_redis = client_and_mock
+        mock_redis.eval.side_effect = redis.exceptions.NoPermissionError("NOPERM")
+
+        with pytest.raises(redis.exceptions.NoPermissionError):
+            await client.lease_global_slots(5)
+
+    def test_global_scripts_read_oldest_score_not_member(self) -> None:
+        """Leased members are "<ts>-<seq>", so the oldest timestamp must come from the score."""
+        assert "'WITHSCORES')[2]" in _GLOBAL_LEASE_LUA
@@ -101,3 +101,13 @@ class TestCacheKeys:
         """Test calendar export token cache key generation."""
         key = CacheKeys.calendar_export_token("abc123")
         assert key == "api:calendar_export:abc123"
+
+    def test_calendar_event_key(self):
+        """Test cached calendar VEVENT key generation."""
+        key = CacheKeys.calendar_event("game-1")
+        assert key == "api:calendar_event:game-1"
+
+    def test_orphan_sweep_progress_key(self):
+        """Test orphaned-embed sweep progress key generation."""
+        key = CacheKeys.orphan_sweep_progress("1775044800", "111")
+        assert key == "bot:orphan_sweep:1775044800:111"
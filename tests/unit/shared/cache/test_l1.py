@@ -0,0 +1,204 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the in-process L1 cache and its pub/sub invalidation."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shared.cache import l1
+from shared.cache.l1 import INVALIDATE_ALL, INVALIDATION_CHANNEL, L1Cache
+
+
+def _index(roles: list[dict]) -> dict[str, int]:
+    return {r["id"]: r["permissions"] for r in roles}
+
+
+@pytest.fixture
+def cache() -> L1Cache:
+    cache = L1Cache()
+    cache.activate()
+    return cache
+
+
+class TestGetOrLoad:
+    async def test_inactive_cache_always_loads(self):
+        cache = L1Cache()
+        load = AsyncMock(return_value={"name": "general"})
+
+        await cache.get_or_load("k", load)
+        await cache.get_or_load("k", load)
+
+        assert load.await_count == 2
+
+    async def test_inactive_cache_applies_derive(self):
+        cache = L1Cache()
+        load = AsyncMock(return_value=[{"id": "1", "permissions": 8}])
+
+        assert await cache.get_or_load("k", load, _index) == {"1": 8}
+
+    async def test_hit_skips_load(self, cache):
+        load = AsyncMock(return_value={"name": "general"})
+
+        first = await cache.get_or_load("k", load)
+        second = await cache.get_or_load("k", load)
+
+        assert first == second == {"name": "general"}
+        load.assert_awaited_once()
+
+    async def test_missing_value_is_not_cached(self, cache):
+        load = AsyncMock(return_value=None)
+
+        assert await cache.get_or_load("k", load) is None
+        assert await cache.get_or_load("k", load) is None
+        assert load.await_count == 2
+
+    async def test_empty_value_is_cached(self, cache):
+        load = AsyncMock(return_value=[])
+
+        await cache.get_or_load("k", load)
+        await cache.get_or_load("k", load)
+
+        load.assert_awaited_once()
+
+    async def test_derived_view_is_cached_separately(self, cache):
+        roles = [{"id": "1", "permissions": 8}]
+        load = AsyncMock(return_value=roles)
+
+        assert await cache.get_or_load("k", load) == roles
+        assert await cache.get_or_load("k", load, _index) == {"1": 8}
+        assert await cache.get_or_load("k", load, _index) == {"1": 8}
+        assert load.await_count == 2
+
+    async def test_invalidation_during_load_is_not_stored(self, cache):
+        async def load():
+            cache.invalidate(["k"])
+            return {"name": "stale"}
+
+        assert await cache.get_or_load("k", load) == {"name": "stale"}
+
+        fresh = AsyncMock(return_value={"name": "fresh"})
+        assert await cache.get_or_load("k", fresh) == {"name": "fresh"}
+
+
+class TestInvalidation:
+    async def test_invalidate_drops_key_and_views(self, cache):
+        load = AsyncMock(return_value=[{"id": "1", "permissions": 8}])
+        await cache.get_or_load("k", load)
+        await cache.get_or_load("k", load, _index)
+
+        cache.invalidate(["k"])
+        await cache.get_or_load("k", load)
+        await cache.get_or_load("k", load, _index)
+
+        assert load.await_count == 4
+
+    async def test_invalidate_leaves_other_keys(self, cache):
+        load = AsyncMock(return_value={"name": "general"})
+        await cache.get_or_load("a", load)
+        await cache.get_or_load("b", load)
+
+        cache.apply_message(json.dumps(["a"]))
+        await cache.get_or_load("a", load)
+        await cache.get_or_load("b", load)
+
+        assert load.await_count == 3
+
+    async def test_invalidate_all_message_clears(self, cache):
+        load = AsyncMock(return_value={"name": "general"})
+        await cache.get_or_load("a", load)
+
+        cache.apply_message(INVALIDATE_ALL)
+        await cache.get_or_load("a", load)
+
+        assert load.await_count == 2
+
+    async def test_malformed_message_clears(self, cache):
+        load = AsyncMock(return_value={"name": "general"})
+        await cache.get_or_load("a", load)
+
+        cache.apply_message("not json")
+        await cache.get_or_load("a", load)
+
+        assert load.await_count == 2
+
+    async def test_deactivate_drops_entries(self, cache):
+        load = AsyncMock(return_value={"name": "general"})
+        await cache.get_or_load("a", load)
+
+        cache.deactivate()
+        cache.active = True
+        await cache.get_or_load("a", load)
+
+        assert load.await_count == 2
+
+
+class TestPublishInvalidation:
+    async def test_publishes_key_list(self):
+        redis = AsyncMock()
+
+        await l1.publish_invalidation(redis, ["a", "b"])
+
+        redis.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, json.dumps(["a", "b"]))
+
+    async def test_publishes_invalidate_all_without_keys(self):
+        redis = AsyncMock()
+
+        await l1.publish_invalidation(redis)
+
+        redis.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, INVALIDATE_ALL)
+
+
+class TestListenForInvalidations:
+    async def test_activates_on_subscribe_and_deactivates_on_loss(self):
+        cache = L1Cache()
+        seen_active: list[bool] = []
+
+        async def listen():
+            yield {"type": "subscribe", "data": 1}
+            seen_active.append(cache.active)
+            yield {"type": "message", "data": json.dumps(["a"])}
+            msg = "lost"
+            raise ConnectionError(msg)
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.listen = listen
+        pubsub.aclose = AsyncMock()
+        redis = AsyncMock()
+        redis.pubsub = AsyncMock(return_value=pubsub)
+
+        with (
+            patch.object(l1, "_cache", cache),
+            patch.object(cache, "apply_message", wraps=cache.apply_message) as apply,
+            patch("shared.cache.l1.asyncio.sleep", side_effect=asyncio.CancelledError),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await l1.listen_for_invalidations(redis)
+
+        pubsub.subscribe.assert_awaited_once_with(INVALIDATION_CHANNEL)
+        assert seen_active == [True]
+        apply.assert_called_once_with(json.dumps(["a"]))
+        assert cache.active is False
+        pubsub.aclose.assert_awaited_once()
@@ -0,0 +1,139 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the compact projection member record encoding."""
+
+import base64
+import json
+import struct
+
+import pytest
+
+from shared.cache.member_record import (
+    MEMBER_RECORD_VERSION,
+    avatar_url,
+    decode_member_record,
+    encode_member_record,
+)
+
+_HASH = "0123456789abcdef0123456789abcdef"
+
+
+def _encode(**overrides: object) -> str:
+    fields: dict[str, object] = {
+        "role_ids": [111111111111111111, 222222222222222222],
+        "nick": "Nick",
+        "global_name": "Global Näme",
+        "username": "user",
+        "avatar_hash": _HASH,
+    }
+    fields.update(overrides)
+    encoded = encode_member_record(**fields)
+    assert encoded is not None
+    return encoded
+
+
+class TestEncodeMemberRecord:
+    """encode_member_record produces a compact, versioned record."""
+
+    def test_round_trip_matches_json_shape(self):
+        """Decoding yields the same dict the JSON layout stored."""
+        decoded = decode_member_record(_encode(), "42")
+
+        assert decoded == {
+            "roles": ["111111111111111111", "222222222222222222"],
+            "nick": "Nick",
+            "global_name": "Global Näme",
+            "username": "user",
+            "avatar_url": f"https://cdn.discordapp.com/avatars/42/{_HASH}.png?size=1024",
+        }
+
+    def test_animated_avatar_round_trips(self):
+        """An a_-prefixed hash is restored with the gif extension."""
+        decoded = decode_member_record(_encode(avatar_hash=f"a_{_HASH}"), "42")
+
+        assert decoded["avatar_url"] == (
+            f"https://cdn.discordapp.com/avatars/42/a_{_HASH}.gif?size=1024"
+        )
+
+    def test_none_fields_round_trip(self):
+        """None nick, global_name and avatar survive encoding."""
+        decoded = decode_member_record(
+            _encode(nick=None, global_name=None, avatar_hash=None, role_ids=[]), "42"
+        )
+
+        assert decoded["nick"] is None
+        assert decoded["global_name"] is None
+        assert decoded["avatar_url"] is None
+        assert decoded["roles"] == []
+
+    def test_smaller_than_json(self):
+        """The compact record is smaller than the JSON layout for the same member."""
+        compact = _encode()
+        legacy = json.dumps(decode_member_record(compact, "123456789012345678"))
+
+        assert len(compact) < len(legacy)
+
+    def test_non_hex_avatar_hash_is_not_encodable(self):
+        """Hashes that cannot be packed return None so callers fall back to JSON."""
+        assert (
+            encode_member_record(
+                role_ids=[], nick=None, global_name=None, username="u", avatar_hash="not-a-hash"
+            )
+            is None
+        )
+
+    def test_record_starts_with_version(self):
+        """The first packed byte is the record version."""
+        raw = base64.b64decode(_encode())
+
+        assert raw[0] == MEMBER_RECORD_VERSION
+
+
+class TestDecodeMemberRecord:
+    """decode_member_record reads both layouts."""
+
+    def test_decodes_legacy_json(self):
+        """JSON records written before the compact format are returned unchanged."""
+        legacy = {
+            "roles": ["1"],
+            "nick": None,
+            "global_name": "G",
+            "username": "u",
+            "avatar_url": "https://example.com/a.png",
+        }
+
+        assert decode_member_record(json.dumps(legacy), "42") == legacy
+
+    def test_rejects_unknown_version(self):
+        """A record from a newer writer raises instead of being misread."""
+        raw = base64.b64encode(struct.pack(">BB", MEMBER_RECORD_VERSION + 1, 0)).decode()
+
+        with pytest.raises(ValueError, match="Unsupported member record version"):
+            decode_member_record(raw, "42")
+
+
+class TestAvatarUrl:
+    """avatar_url mirrors discord.py's avatar asset URL."""
+
+    def test_none_hash(self):
+        """No hash means no URL."""
+        assert avatar_url("42", None) is None
@@ -19,12 +19,12 @@
 # SOFTWARE.
 
 
-"""Unit tests for CacheOperation StrEnum and cache_get helper."""
+"""Unit tests for CacheOperation StrEnum and cache_get / record_cache_lookups helpers."""
 
 from enum import StrEnum
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from shared.cache.operations import CacheOperation, cache_get
+from shared.cache.operations import CacheOperation, cache_get, record_cache_lookups
 
 _EXPECTED_OPERATIONS = {
     "fetch_guild",
@@ -41,6 +41,8 @@ _EXPECTED_OPERATIONS = {
     "user_roles_bot",
     "guild_roles_bot",
     "calendar_export_token_lookup",
+    "calendar_event",
+    "game_response",
 }
 
 
@@ -156,3 +158,37 @@ async def test_cache_get_passes_operation_label_to_all_metrics() -> None:
     hist_labels = mock_histogram.record.call_args.args[1]
     assert miss_labels["operation"] == CacheOperation.GUILD_ROLES_BOT
     assert hist_labels["operation"] == CacheOperation.GUILD_ROLES_BOT
+
+
+def test_record_cache_lookups_counts_each_key() -> None:
+    mock_hit = MagicMock()
+    mock_miss = MagicMock()
+    mock_histogram = MagicMock()
+
+    with (
+        patch("shared.cache.operations._hit_counter", mock_hit),
+        patch("shared.cache.operations._miss_counter", mock_miss),
+        patch("shared.cache.operations._duration_histogram", mock_histogram),
+    ):
+        record_cache_lookups(CacheOperation.DISPLAY_NAME, ["a", None, "b", None, None], 0.01)
+
+    mock_hit.add.assert_called_once_with(2, {"operation": CacheOperation.DISPLAY_NAME})
+    mock_miss.add.assert_called_once_with(3, {"operation": CacheOperation.DISPLAY_NAME})
+    mock_histogram.record.assert_called_once_with(
+        0.01, {"operation": CacheOperation.DISPLAY_NAME, "result": "miss"}
+    )
+
+
+def test_record_cache_lookups_all_hits_skips_miss_counter() -> None:
+    mock_miss = MagicMock()
+    mock_histogram = MagicMock()
+
+    with (
+        patch("shared.cache.operations._hit_counter", MagicMock()),
+        patch("shared.cache.operations._miss_counter", mock_miss),
+        patch("shared.cache.operations._duration_histogram", mock_histogram),
+    ):
+        record_cache_lookups(CacheOperation.DISPLAY_NAME, ["a"], 0.01)
+
+    mock_miss.add.assert_not_called()
+    assert mock_histogram.record.call_args.args[1]["result"] == "hit"
@@ -28,11 +28,14 @@ from unittest.mock import AsyncMock
 import pytest
 
 from shared.cache.keys import CacheKeys
-from shared.cache.operations import _MAX_GEN_RETRIES, read_projection_key
+from shared.cache.member_record import encode_member_record
+from shared.cache.operations import _MAX_GEN_RETRIES, read_projection_key, read_projection_keys
 from shared.cache.projection import (
     get_member,
+    get_members,
     get_user_guilds,
     get_user_roles,
+    get_users_guilds,
     is_bot_fresh,
 )
 
@@ -95,6 +98,76 @@ class TestReadProjectionKey:
         assert result is None
 
 
+class TestReadProjectionKeys:
+    """Test suite for the bulk read_projection_keys function."""
+
+    @pytest.mark.asyncio
+    async def test_reads_gen_once_and_mgets_all_keys(self):
+        """All projection keys and extra keys are fetched in one MGET."""
+        redis = _make_redis(get_return="gen1")
+        redis.mget = AsyncMock(return_value=["m1", "m2", "extra"])
+
+        values, extra = await read_projection_keys(
+            redis,
+            CacheKeys.proj_member,
+            [("guild1", "user1"), ("guild1", "user2")],
+            extra_keys=["other:key"],
+        )
+
+        assert values == ["m1", "m2"]
+        assert extra == ["extra"]
+        redis.get.assert_awaited_once_with(CacheKeys.proj_gen())
+        redis.mget.assert_awaited_once_with([
+            "proj:member:gen1:guild1:user1",
+            "proj:member:gen1:guild1:user2",
+            "other:key",
+        ])
+
+    @pytest.mark.asyncio
+    async def test_stable_gen_misses_return_none(self):
+        """Misses under a stable gen are re-checked with one GET and not refetched."""
+        redis = _make_redis(get_return="gen1")
+        redis.mget = AsyncMock(return_value=["m1", None])
+
+        values, _ = await read_projection_keys(
+            redis, CacheKeys.proj_member, [("guild1", "user1"), ("guild1", "user2")]
+        )
+
+        assert values == ["m1", None]
+        assert redis.get.await_count == 2
+        redis.mget.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_gen_rotation_refetches_only_misses(self):
+        """After a gen flip only the missing keys are re-read under the new gen."""
+        redis = _make_redis()
+        redis.get = AsyncMock(side_effect=["gen1", "gen2"])
+        redis.mget = AsyncMock(side_effect=[["m1", None, "x"], ["m2"]])
+
+        values, extra = await read_projection_keys(
+            redis,
+            CacheKeys.proj_member,
+            [("guild1", "user1"), ("guild1", "user2")],
+            extra_keys=["other:key"],
+        )
+
+        assert values == ["m1", "m2"]
+        assert extra == ["x"]
+        assert redis.mget.await_args_list[1].args[0] == ["proj:member:gen2:guild1:user2"]
+
+    @pytest.mark.asyncio
+    async def test_max_retries_exhausted_returns_none(self):
+        """Gives up after _MAX_GEN_RETRIES reads while the gen keeps rotating."""
+        redis = _make_redis()
+        redis.get = AsyncMock(side_effect=[f"gen{i}" for i in range(_MAX_GEN_RETRIES + 1)])
+        redis.mget = AsyncMock(return_value=[None])
+
+        values, _ = await read_projection_keys(redis, CacheKeys.proj_member, [("g", "u")])
+
+        assert values == [None]
+        assert redis.mget.await_count == _MAX_GEN_RETRIES
+
+
 class TestGetUserGuilds:
     """Test suite for get_user_guilds function."""
 
@@ -120,6 +193,32 @@ class TestGetUserGuilds:
         assert result is None
 
 
+class TestGetUsersGuilds:
+    """Test suite for the bulk get_users_guilds function."""
+
+    @pytest.mark.asyncio
+    async def test_reads_all_users_in_one_mget(self):
+        """Duplicate user IDs are fetched once and absent users map to None."""
+        redis = _make_redis(get_return="gen1")
+        redis.mget = AsyncMock(return_value=[json.dumps(["guild1"]), None])
+
+        result = await get_users_guilds(["user1", "user2", "user1"], redis=redis)
+
+        assert result == {"user1": ["guild1"], "user2": None}
+        redis.mget.assert_awaited_once_with([
+            "proj:user_guilds:gen1:user1",
+            "proj:user_guilds:gen1:user2",
+        ])
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_redis(self):
+        """No user IDs means no Redis calls."""
+        redis = _make_redis()
+
+        assert await get_users_guilds([], redis=redis) == {}
+        redis.get.assert_not_awaited()
+
+
 class TestGetMember:
     """Test suite for get_member function."""
 
@@ -140,6 +239,29 @@ class TestGetMember:
 
         assert result == member_data
 
+    @pytest.mark.asyncio
+    async def test_decodes_compact_member_record(self):
+        """Compact records are decoded to the same dict shape as JSON records."""
+        redis = _make_redis()
+        raw = encode_member_record(
+            role_ids=[123],
+            nick=None,
+            global_name="Test User",
+            username="testuser",
+            avatar_hash=None,
+        )
+        redis.get = AsyncMock(side_effect=["gen123", raw, "gen123"])
+
+        result = await get_member("guild1", "123456", redis=redis)
+
+        assert result == {
+            "roles": ["123"],
+            "nick": None,
+            "global_name": "Test User",
+            "username": "testuser",
+            "avatar_url": None,
+        }
+
     @pytest.mark.asyncio
     async def test_returns_none_when_absent(self):
         """Returns None when member has no projection entry."""
@@ -151,6 +273,41 @@ class TestGetMember:
         assert result is None
 
 
+class TestGetMembers:
+    """Test suite for the bulk get_members function."""
+
+    @pytest.mark.asyncio
+    async def test_reads_all_pairs_in_one_mget(self):
+        """Duplicate pairs are fetched once and absent members map to None."""
+        redis = _make_redis(get_return="gen1")
+        member_data = {
+            "roles": [],
+            "nick": "Nick",
+            "global_name": None,
+            "username": "u1",
+            "avatar_url": None,
+        }
+        redis.mget = AsyncMock(return_value=[json.dumps(member_data), None])
+
+        result = await get_members(
+            [("guild1", "user1"), ("guild2", "user2"), ("guild1", "user1")], redis=redis
+        )
+
+        assert result == {("guild1", "user1"): member_data, ("guild2", "user2"): None}
+        redis.mget.assert_awaited_once_with([
+            "proj:member:gen1:guild1:user1",
+            "proj:member:gen1:guild2:user2",
+        ])
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_redis(self):
+        """No pairs means no Redis calls."""
+        redis = _make_redis()
+
+        assert await get_members([], redis=redis) == {}
+        redis.get.assert_not_awaited()
+
+
 class TestGetUserRoles:
     """Test suite for get_user_roles function."""
 
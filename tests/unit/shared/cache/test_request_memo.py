@@ -0,0 +1,144 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for request-scoped memoization and its projection read sites."""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+from shared.cache.keys import CacheKeys
+from shared.cache.operations import read_projection_key
+from shared.cache.projection import get_user_guilds, is_bot_fresh
+from shared.cache.request_memo import forget, memoize, remember, request_memo
+
+
+async def test_memoize_outside_scope_calls_through():
+    load = AsyncMock(return_value="v")
+
+    await memoize("k", load)
+    await memoize("k", load)
+
+    assert load.await_count == 2
+
+
+async def test_memoize_reuses_value_and_counts_hits():
+    load = AsyncMock(return_value="v")
+
+    with request_memo() as memo:
+        assert await memoize("k", load) == "v"
+        assert await memoize("k", load) == "v"
+
+    load.assert_awaited_once()
+    assert memo.hits == 1
+
+
+async def test_memoize_remembers_none():
+    load = AsyncMock(return_value=None)
+
+    with request_memo():
+        await memoize("k", load)
+        await memoize("k", load)
+
+    load.assert_awaited_once()
+
+
+async def test_scopes_do_not_share_values():
+    load = AsyncMock(return_value="v")
+
+    with request_memo():
+        await memoize("k", load)
+    with request_memo():
+        await memoize("k", load)
+
+    assert load.await_count == 2
+
+
+async def test_forget_and_remember():
+    load = AsyncMock(return_value="old")
+
+    with request_memo():
+        await memoize("k", load)
+        forget("k")
+        await memoize("k", load)
+        remember("k", "new")
+        assert await memoize("k", load) == "new"
+
+    assert load.await_count == 2
+
+
+def _redis(values: dict[str, str]) -> AsyncMock:
+    redis = AsyncMock()
+    redis.get = AsyncMock(side_effect=values.get)
+    return redis
+
+
+async def test_projection_reads_share_gen_within_request():
+    redis = _redis({
+        CacheKeys.proj_gen(): "7",
+        CacheKeys.proj_user_guilds("7", "u1"): json.dumps(["g1"]),
+        CacheKeys.proj_user_guilds("7", "u2"): json.dumps(["g2"]),
+    })
+
+    with request_memo():
+        assert await get_user_guilds("u1", redis=redis) == ["g1"]
+        assert await get_user_guilds("u1", redis=redis) == ["g1"]
+        assert await get_user_guilds("u2", redis=redis) == ["g2"]
+
+    keys_read = [call.args[0] for call in redis.get.await_args_list]
+    assert keys_read == [
+        CacheKeys.proj_gen(),
+        CacheKeys.proj_user_guilds("7", "u1"),
+        CacheKeys.proj_user_guilds("7", "u2"),
+    ]
+
+
+async def test_projection_miss_rereads_gen_and_remembers_rotation():
+    values = {
+        CacheKeys.proj_gen(): "8",
+        CacheKeys.proj_user_guilds("8", "u1"): json.dumps(["g1"]),
+        CacheKeys.proj_user_guilds("8", "u2"): json.dumps(["g2"]),
+    }
+    redis = _redis(values)
+
+    with request_memo():
+        remember(CacheKeys.proj_gen(), "7")
+        raw = await read_projection_key(redis, CacheKeys.proj_user_guilds, "u1")
+        await read_projection_key(redis, CacheKeys.proj_user_guilds, "u2")
+
+    assert raw == json.dumps(["g1"])
+    keys_read = [call.args[0] for call in redis.get.await_args_list]
+    assert keys_read == [
+        CacheKeys.proj_user_guilds("7", "u1"),
+        CacheKeys.proj_gen(),
+        CacheKeys.proj_user_guilds("8", "u1"),
+        CacheKeys.proj_user_guilds("8", "u2"),
+    ]
+
+
+async def test_is_bot_fresh_reads_heartbeat_once_per_request():
+    redis = _redis({CacheKeys.bot_last_seen(): datetime.now(UTC).isoformat()})
+
+    with request_memo():
+        assert await is_bot_fresh(redis=redis)
+        assert await is_bot_fresh(redis=redis)
+
+    redis.get.assert_awaited_once_with(CacheKeys.bot_last_seen())
@@ -54,3 +54,11 @@ class TestCacheTTL:
     def test_calendar_export_token_ttl(self):
         """Test calendar export token TTL is 5 minutes."""
         assert CacheTTL.CALENDAR_EXPORT_TOKEN == 300
+
+    def test_calendar_event_ttl(self):
+        """Test cached calendar VEVENT TTL is 1 hour."""
+        assert CacheTTL.CALENDAR_EVENT == 3600
+
+    def test_orphan_sweep_progress_ttl(self):
+        """Test orphaned-embed sweep progress TTL is 24 hours."""
+        assert CacheTTL.ORPHAN_SWEEP_PROGRESS == 86400
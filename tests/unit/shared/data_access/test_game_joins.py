@@ -0,0 +1,186 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the single-statement join."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shared.data_access import game_joins
+from shared.utils.status_transitions import GameStatus
+
+
+def _row(**overrides) -> SimpleNamespace:
+    values = {
+        "status": "SCHEDULED",
+        "signup_method": "SELF_SIGNUP",
+        "max_players": 4,
+        "confirmed_count": 2,
+        "waitlist_count": 0,
+        "has_priority_roles": False,
+        "participant_id": "participant-1",
+        "lost_user_race": False,
+        "notified": 1,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _db(row: SimpleNamespace | None) -> AsyncMock:
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    db = AsyncMock()
+    db.execute.return_value = result
+    return db
+
+
+async def test_join_runs_one_statement_with_bound_parameters():
+    db = _db(_row())
+
+    await game_joins.join_game(db, "game-1", "42", ["111", "222"])
+
+    db.execute.assert_awaited_once()
+    stmt, params = db.execute.call_args.args
+    sql = str(stmt)
+    assert "FOR UPDATE OF g" in sql
+    assert "message_refresh_queue" in sql
+    assert "game_updated_sse" in sql
+    assert params["game_id"] == "game-1"
+    assert params["discord_id"] == "42"
+    assert params["user_role_ids"] == ["111", "222"]
+    assert params["delay_seconds"] == 60
+    assert params["scheduled_status"] == GameStatus.SCHEDULED.value
+
+
+async def test_successful_join_reports_count_including_new_participant():
+    db = _db(_row(confirmed_count=4, waitlist_count=1, has_priority_roles=True))
+
+    result = await game_joins.join_game(db, "game-1", "42", [])
+
+    assert result.joined
+    assert result.error is None
+    assert result.participant_id == "participant-1"
+    assert result.participant_count == 6
+    assert result.max_players == 4
+    assert result.has_priority_roles is True
+
+
+async def test_existing_participant_is_not_an_error():
+    db = _db(_row(participant_id=None))
+
+    result = await game_joins.join_game(db, "game-1", "42", [])
+
+    assert result.error is None
+    assert not result.joined
+
+
+async def test_join_reruns_once_after_losing_the_new_user_race():
+    lost = MagicMock()
+    lost.one_or_none.return_value = _row(participant_id=None, lost_user_race=True)
+    joined = MagicMock()
+    joined.one_or_none.return_value = _row()
+    db = AsyncMock()
+    db.execute.side_effect = [lost, joined]
+
+    result = await game_joins.join_game(db, "game-1", "42", [])
+
+    assert db.execute.await_count == 2
+    assert result.joined
+
+
+class _UsersTable:
+    """Models the users unique index across concurrent join transactions.
+
+    A statement sees users committed before it started.  Inserting a
+    discord_id another open transaction has inserted waits for that
+    transaction to commit and then conflicts, returning no row.
+    """
+
+    def __init__(self) -> None:
+        self.committed: set[str] = set()
+        self.inserting: dict[str, asyncio.Event] = {}
+
+    def session(self) -> AsyncMock:
+        inserted: list[str] = []
+
+        async def execute(_stmt, params):
+            discord_id = params["discord_id"]
+            visible = discord_id in self.committed
+            if not visible:
+                if discord_id in self.inserting:
+                    await self.inserting[discord_id].wait()
+                    result = MagicMock()
+                    result.one_or_none.return_value = _row(participant_id=None, lost_user_race=True)
+                    return result
+                self.inserting[discord_id] = asyncio.Event()
+                inserted.append(discord_id)
+            await asyncio.sleep(0)
+            result = MagicMock()
+            result.one_or_none.return_value = _row(participant_id=f"in-{params['game_id']}")
+            return result
+
+        async def commit():
+            for discord_id in inserted:
+                self.committed.add(discord_id)
+                self.inserting.pop(discord_id).set()
+
+        db = AsyncMock()
+        db.execute.side_effect = execute
+        db.commit.side_effect = commit
+        return db
+
+
+async def test_concurrent_joins_by_one_new_user_both_land():
+    users = _UsersTable()
+
+    async def join(game_id: str) -> game_joins.JoinResult:
+        db = users.session()
+        result = await game_joins.join_game(db, game_id, "42", [])
+        await db.commit()
+        return result
+
+    first, second = await asyncio.gather(join("game-1"), join("game-2"))
+
+    assert first.participant_id == "in-game-1"
+    assert second.participant_id == "in-game-2"
+
+
+@pytest.mark.parametrize(
+    ("row", "error"),
+    [
+        (None, "Game not found"),
+        (_row(status="COMPLETED", participant_id=None), "already started or is completed"),
+        (
+            _row(signup_method="HOST_SELECTED", participant_id=None),
+            "does not accept self-signups",
+        ),
+    ],
+)
+async def test_rejected_join_returns_error(row, error):
+    db = _db(row)
+
+    result = await game_joins.join_game(db, "game-1", "42", [])
+
+    assert error in (result.error or "")
+    assert not result.joined
@@ -0,0 +1,129 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for per-request round-trip counting."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from sqlalchemy import create_engine, text
+
+from shared.cache.client import _RoundTripCountingRedis
+from shared.data_access.round_trips import (
+    record_db_round_trip,
+    record_redis_round_trip,
+    track_round_trips,
+)
+
+
+def test_track_round_trips_counts_within_scope():
+    """Recorded round-trips accumulate on the scope's counter."""
+    with track_round_trips() as counts:
+        record_db_round_trip()
+        record_db_round_trip()
+        record_redis_round_trip()
+
+    assert counts.db == 2
+    assert counts.redis == 1
+    assert counts.total == 3
+
+
+def test_record_outside_scope_is_noop():
+    """Recording without an active scope does not touch a previous counter."""
+    with track_round_trips() as counts:
+        pass
+
+    record_db_round_trip()
+    record_redis_round_trip()
+
+    assert counts.total == 0
+
+
+def test_nested_scope_restores_outer_counter():
+    """An inner scope counts separately and the outer scope resumes afterwards."""
+    with track_round_trips() as outer:
+        record_db_round_trip()
+        with track_round_trips() as inner:
+            record_db_round_trip()
+        record_redis_round_trip()
+
+    assert inner.db == 1
+    assert outer.db == 1
+    assert outer.redis == 1
+
+
+@pytest.mark.asyncio
+async def test_tasks_started_in_scope_share_counter():
+    """Work gathered inside the scope is counted against it."""
+
+    async def lookup() -> None:
+        record_redis_round_trip()
+
+    with track_round_trips() as counts:
+        await asyncio.gather(*(lookup() for _ in range(5)))
+
+    assert counts.redis == 5
+
+
+def test_engine_statements_are_counted():
+    """Every statement executed on a SQLAlchemy engine counts as a database round-trip."""
+    engine = create_engine("sqlite://")
+
+    with track_round_trips() as counts, engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+
+    assert counts.db == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_commands_are_counted():
+    """Commands issued through the cache client's Redis class count as Redis round-trips."""
+    client = _RoundTripCountingRedis()
+
+    with (
+        patch.object(Redis, "execute_command", new_callable=AsyncMock, return_value="v"),
+        track_round_trips() as counts,
+    ):
+        await client.get("a")
+        await client.get("b")
+
+    assert counts.redis == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_execute_counts_once():
+    """A pipelined batch of commands counts as a single Redis round-trip."""
+    client = _RoundTripCountingRedis()
+
+    with (
+        patch.object(Pipeline, "execute", new_callable=AsyncMock, return_value=[True, True]),
+        track_round_trips() as counts,
+    ):
+        pipe = client.pipeline(transaction=False)
+        pipe.set("a", "1")
+        pipe.expire("a", 60)
+        await pipe.execute()
+
+    assert counts.redis == 1
@@ -30,8 +30,10 @@ import pytest
 
 import shared.discord.client as discord_client_module
 from shared.cache.keys import CacheKeys
+from shared.cache.l1 import L1Cache
 from shared.cache.operations import CacheOperation
 from shared.cache.ttl import CacheTTL
+from shared.discord import rate_limit
 from shared.discord.client import (
     DiscordAPIClient,
     DiscordAPIError,
@@ -42,6 +44,12 @@ from shared.discord.client import (
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_global_leases(monkeypatch):
+    """Give each test its own process-wide global token leases."""
+    monkeypatch.setattr(rate_limit, "_leases", {})
+
+
 @pytest.fixture
 def discord_client():
     """Create Discord API client for testing."""
@@ -58,7 +66,7 @@ def mock_redis():
     redis = AsyncMock()
     redis.get = AsyncMock(return_value=None)
     redis.set = AsyncMock()
-    redis.claim_global_slot = AsyncMock(return_value=0)
+    redis.lease_global_slots = AsyncMock(return_value=(5, 0))
     redis.claim_global_and_channel_slot = AsyncMock(return_value=0)
     return redis
 
@@ -534,9 +542,8 @@ class TestMakeAPIRequestRateLimit:
     async def test_global_slot_claimed_before_http_when_no_channel(
         self, mock_get_redis, discord_client, mock_redis
     ):
-        """When no channel_id, claim_global_slot is awaited before the HTTP call."""
+        """When no channel_id, a global token block is leased before the HTTP call."""
         mock_get_redis.return_value = mock_redis
-        mock_redis.claim_global_slot = AsyncMock(return_value=0)
         discord_client._session = self._make_mock_session({"id": "1"})
 
         await discord_client._make_api_request(
@@ -546,7 +553,27 @@ class TestMakeAPIRequestRateLimit:
             headers={"Authorization": "Bot token"},
         )
 
-        mock_redis.claim_global_slot.assert_awaited_once()
+        mock_redis.lease_global_slots.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("shared.cache.client.get_redis_client")
+    async def test_global_requests_spend_leased_block_locally(
+        self, mock_get_redis, discord_client, mock_redis
+    ):
+        """Requests without channel_id share one leased block instead of a Redis call each."""
+        mock_get_redis.return_value = mock_redis
+        discord_client._session = self._make_mock_session({"id": "1"})
+
+        for _ in range(5):
+            await discord_client._make_api_request(
+                method="GET",
+                url="https://discord.com/api/v10/users/1",
+                operation_name="test_op",
+                headers={"Authorization": "Bot token"},
+            )
+
+        mock_redis.lease_global_slots.assert_awaited_once_with(5, global_max=25)
+        assert discord_client._session.request.call_count == 5
 
     @pytest.mark.asyncio
     @patch("shared.cache.client.get_redis_client")
@@ -578,7 +605,7 @@ class TestMakeAPIRequestRateLimit:
     ):
         """When rate limiter returns > 0, asyncio.sleep is called with wait_s before HTTP."""
         mock_get_redis.return_value = mock_redis
-        mock_redis.claim_global_slot = AsyncMock(side_effect=[40, 0])
+        mock_redis.lease_global_slots = AsyncMock(side_effect=[(0, 40), (5, 0)])
         discord_client._session = self._make_mock_session({"id": "1"})
 
         await discord_client._make_api_request(
@@ -594,9 +621,8 @@ class TestMakeAPIRequestRateLimit:
     @pytest.mark.asyncio
     @patch("shared.cache.client.get_redis_client")
     async def test_accepts_global_max_kwarg(self, mock_get_redis, discord_client, mock_redis):
-        """_make_api_request accepts global_max and forwards it to the rate-limit claim call."""
+        """_make_api_request accepts global_max and forwards it to the rate-limit lease call."""
         mock_get_redis.return_value = mock_redis
-        mock_redis.claim_global_slot = AsyncMock(return_value=0)
         discord_client._session = self._make_mock_session({"id": "1"})
 
         await discord_client._make_api_request(
@@ -607,7 +633,7 @@ class TestMakeAPIRequestRateLimit:
             global_max=45,
         )
 
-        mock_redis.claim_global_slot.assert_awaited_once_with(global_max=45)
+        mock_redis.lease_global_slots.assert_awaited_once_with(5, global_max=45)
 
 
 class TestOAuth2Methods:
@@ -788,6 +814,50 @@ class TestCachedResourceMethods:
             mock_redis.set.assert_not_called()
         mock_get_redis.assert_called_once_with()
 
+    @pytest.mark.asyncio
+    async def test_fetch_channel_served_from_active_l1(self, discord_client, mock_redis):
+        """With the L1 cache active, a repeated fetch does not touch Redis."""
+        mock_redis.get = AsyncMock(return_value=json.dumps({"name": "general"}))
+        cache = L1Cache()
+        cache.activate()
+
+        with (
+            patch("shared.discord.client.l1._cache", cache),
+            patch(
+                "shared.discord.client.cache_client.get_redis_client",
+                new=AsyncMock(return_value=mock_redis),
+            ),
+        ):
+            first = await discord_client.fetch_channel(channel_id="channel123")
+            second = await discord_client.fetch_channel(channel_id="channel123")
+
+        assert first == second == {"name": "general"}
+        mock_redis.get.assert_awaited_once_with("discord:channel:channel123")
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_bypasses_l1(self, discord_client, mock_redis):
+        """TTL-bound read-through keys are never held in the L1 cache."""
+        mock_redis.get = AsyncMock(return_value=json.dumps({"id": "app"}))
+        cache = L1Cache()
+        cache.activate()
+
+        with (
+            patch("shared.discord.client.l1._cache", cache),
+            patch(
+                "shared.discord.client.cache_client.get_redis_client",
+                new=AsyncMock(return_value=mock_redis),
+            ),
+        ):
+            for _ in range(2):
+                await discord_client._get_or_fetch(
+                    cache_key="key:1",
+                    cache_ttl=300,
+                    fetch_fn=AsyncMock(),
+                    operation=CacheOperation.GET_APPLICATION_INFO,
+                )
+
+        assert mock_redis.get.await_count == 2
+
 
 class TestLoggingMethods:
     """Test logging helper methods."""
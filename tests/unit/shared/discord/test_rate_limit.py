@@ -0,0 +1,123 @@
+# Copyright 2025-2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for GlobalTokenLease."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shared.discord import rate_limit
+from shared.discord.rate_limit import GlobalTokenLease, get_global_lease
+
+
+def _make_redis(*leases: tuple[int, int]) -> MagicMock:
+    redis = MagicMock()
+    redis.lease_global_slots = AsyncMock(side_effect=list(leases))
+    return redis
+
+
+@pytest.mark.asyncio
+async def test_spends_leased_block_before_leasing_again() -> None:
+    """One Redis lease covers block_size acquisitions."""
+    lease = GlobalTokenLease(global_max=25, block_size=5)
+    redis = _make_redis((5, 0), (5, 0))
+
+    for _ in range(6):
+        await lease.acquire(redis)
+
+    assert redis.lease_global_slots.await_count == 2
+    redis.lease_global_slots.assert_awaited_with(5, global_max=25)
+
+
+@pytest.mark.asyncio
+async def test_partial_grant_is_spent_then_released() -> None:
+    """A lease granting fewer tokens than requested is used as-is."""
+    lease = GlobalTokenLease(global_max=25, block_size=5)
+    redis = _make_redis((2, 0), (5, 0))
+
+    for _ in range(3):
+        await lease.acquire(redis)
+
+    assert redis.lease_global_slots.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_tokens_are_discarded() -> None:
+    """Tokens left over after the 1s window are not spent late."""
+    lease = GlobalTokenLease(global_max=25, block_size=5)
+    redis = _make_redis((5, 0), (5, 0))
+
+    with patch(
+        "shared.discord.rate_limit.time.monotonic", side_effect=[100.0, 100.0, 101.5, 101.5, 101.5]
+    ):
+        await lease.acquire(redis)
+        await lease.acquire(redis)
+
+    assert redis.lease_global_slots.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_sleeps_for_redis_wait_when_budget_exhausted() -> None:
+    """An exhausted budget sleeps for the Redis-provided wait, then leases again."""
+    lease = GlobalTokenLease(global_max=25)
+    redis = _make_redis((0, 40), (5, 0))
+
+    with patch("shared.discord.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await lease.acquire(redis)
+
+    mock_sleep.assert_awaited_once_with(pytest.approx(0.04))
+    assert redis.lease_global_slots.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_queue_locally_instead_of_polling_redis() -> None:
+    """While one caller waits on an exhausted budget, the others do not hit Redis."""
+    lease = GlobalTokenLease(global_max=25, block_size=5)
+    release = asyncio.Event()
+    calls = 0
+
+    async def lease_global_slots(_count: int, *, global_max: int) -> tuple[int, int]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 5, 0
+
+    redis = MagicMock()
+    redis.lease_global_slots = lease_global_slots
+
+    tasks = [asyncio.create_task(lease.acquire(redis)) for _ in range(5)]
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert calls == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert calls == 1
+
+
+def test_get_global_lease_is_shared_per_budget(monkeypatch):
+    """Callers asking for the same budget share one lease; other budgets get their own."""
+    monkeypatch.setattr(rate_limit, "_leases", {})
+    assert get_global_lease(25) is get_global_lease(25)
+    assert get_global_lease(45) is not get_global_lease(25)
+    assert get_global_lease(45).global_max == 45
@@ -0,0 +1,49 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for ReminderDelivery model."""
+
+from sqlalchemy import inspect
+
+from shared.models import ReminderDelivery
+
+
+class TestReminderDeliveryModel:
+    """Test suite for ReminderDelivery model."""
+
+    def test_tablename(self):
+        """ORM model maps to the correct table name."""
+        assert ReminderDelivery.__tablename__ == "reminder_deliveries"
+
+    def test_primary_key_is_notification_and_recipient(self):
+        """One checkpoint row per (notification_id, discord_id)."""
+        table = inspect(ReminderDelivery).mapper.local_table
+        pk_column_names = {col.name for col in table.primary_key.columns}
+
+        assert pk_column_names == {"notification_id", "discord_id"}
+
+    def test_notification_id_fk_cascades(self):
+        """Checkpoints are removed with their notification_schedule row."""
+        table = inspect(ReminderDelivery).mapper.local_table
+        fk = next(iter(table.columns["notification_id"].foreign_keys))
+
+        assert fk.column.table.name == "notification_schedule"
+        assert fk.column.name == "id"
+        assert fk.ondelete == "CASCADE"
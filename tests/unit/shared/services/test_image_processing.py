@@ -0,0 +1,148 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the image processing pool and variant rendering."""
+
+import asyncio
+import io
+import time
+
+import pytest
+from PIL import Image
+
+from shared.services import image_processing
+from shared.services.image_processing import (
+    ImageProcessingPool,
+    ImageProcessingUnavailableError,
+    process_image,
+)
+
+
+def _make_image_bytes(width: int, height: int, image_format: str = "PNG") -> bytes:
+    """Create real encoded image bytes of the given size."""
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), color="red").save(buf, format=image_format)
+    return buf.getvalue()
+
+
+def _size_of(data: bytes) -> tuple[int, int]:
+    with Image.open(io.BytesIO(data)) as img:
+        return img.size
+
+
+@pytest.fixture
+def pool():
+    """A single-worker pool torn down after the test."""
+    pool = ImageProcessingPool(workers=1, max_pending=1, timeout_seconds=10.0)
+    yield pool
+    pool.shutdown()
+
+
+def test_process_image_small_image_has_no_variants():
+    """An image inside every box is stored as-is with nothing to pre-render."""
+    data = _make_image_bytes(100, 100)
+
+    result = process_image(data, "image/png")
+
+    assert result.data == data
+    assert result.variants == {}
+
+
+def test_process_image_renders_only_variants_smaller_than_image():
+    """An 800x600 image already fits the banner box, so only a thumbnail is rendered."""
+    data = _make_image_bytes(800, 600)
+
+    result = process_image(data, "image/png")
+
+    assert result.data == data
+    assert set(result.variants) == {"thumbnail"}
+    assert _size_of(result.variants["thumbnail"]) == (160, 120)
+
+
+def test_process_image_variants_keep_aspect_ratio_and_format():
+    """Variants fit their boxes without distortion and keep the upload's format."""
+    data = _make_image_bytes(2000, 1000, image_format="JPEG")
+
+    result = process_image(data, "image/jpeg")
+
+    assert _size_of(result.variants["banner"]) == (800, 400)
+    assert _size_of(result.variants["thumbnail"]) == (160, 80)
+    with Image.open(io.BytesIO(result.variants["banner"])) as img:
+        assert img.format == "JPEG"
+
+
+def test_process_image_undecodable_data_is_returned_unchanged():
+    """Bytes Pillow cannot read are passed through without variants."""
+    result = process_image(b"not an image", "image/png")
+
+    assert result.data == b"not an image"
+    assert result.variants == {}
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_job_in_worker_process(pool):
+    """Jobs run in the pool and their result is returned to the caller."""
+    data = _make_image_bytes(400, 400)
+
+    result = await pool.run(process_image, data, "image/png")
+
+    assert set(result.variants) == {"thumbnail"}
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_job_when_saturated(pool):
+    """With every slot taken, a new job is refused immediately."""
+    await pool.run(time.sleep, 0)  # warm up the worker process
+
+    pool.timeout_seconds = 0.1
+    with pytest.raises(ImageProcessingUnavailableError, match="timed out"):
+        await pool.run(time.sleep, 1.0)
+
+    # The abandoned job still holds the only slot until the worker finishes it.
+    with pytest.raises(ImageProcessingUnavailableError, match="busy"):
+        await pool.run(time.sleep, 0)
+
+
+@pytest.mark.asyncio
+async def test_pool_releases_slot_after_abandoned_job_finishes(pool):
+    """Once a timed-out job completes in the worker its slot is reusable."""
+    pool.timeout_seconds = 0.1
+    with pytest.raises(ImageProcessingUnavailableError):
+        await pool.run(time.sleep, 0.5)
+
+    pool.timeout_seconds = 10.0
+    deadline = time.monotonic() + 10.0
+    while True:
+        try:
+            await pool.run(time.sleep, 0)
+            break
+        except ImageProcessingUnavailableError:
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.05)
+
+
+def test_get_image_pool_returns_singleton(monkeypatch):
+    """get_image_pool() creates the pool once and reuses it."""
+    monkeypatch.setattr(image_processing, "_image_pool", None)
+
+    first = image_processing.get_image_pool()
+
+    assert image_processing.get_image_pool() is first
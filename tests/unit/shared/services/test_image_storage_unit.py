@@ -31,7 +31,7 @@ from PIL import Image
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.models.game_image import GameImage
-from shared.services import image_storage
+from shared.services import image_processing, image_storage
 
 
 def _make_image_bytes(width: int, height: int, image_format: str = "PNG") -> bytes:
@@ -52,6 +52,15 @@ def _make_animated_gif_bytes(width: int, height: int, num_frames: int = 3) -> by
     return buf.getvalue()
 
 
+@pytest.fixture(autouse=True)
+def inline_image_pool():
+    """Run image processing jobs inline instead of in worker processes."""
+    pool = MagicMock()
+    pool.run = AsyncMock(side_effect=lambda fn, *args: fn(*args))
+    with patch.object(image_storage, "get_image_pool", return_value=pool):
+        yield pool
+
+
 @pytest.fixture
 def mock_session():
     """Create a mock AsyncSession."""
@@ -309,8 +318,8 @@ async def test_store_image_downscales_oversized_image(mock_session):
 
     stored_image = mock_session.add.call_args[0][0]
     with Image.open(io.BytesIO(stored_image.image_data)) as img:
-        assert img.width <= image_storage.MAX_IMAGE_DIMENSION
-        assert img.height <= image_storage.MAX_IMAGE_DIMENSION
+        assert img.width <= image_processing.MAX_IMAGE_DIMENSION
+        assert img.height <= image_processing.MAX_IMAGE_DIMENSION
         # Aspect ratio (5000:3000 == 5:3) must be preserved
         assert abs(img.width / img.height - 5000 / 3000) < 0.01
 
@@ -355,8 +364,8 @@ async def test_store_image_downscales_animated_gif_preserving_frames(mock_sessio
 
     stored_image = mock_session.add.call_args[0][0]
     with Image.open(io.BytesIO(stored_image.image_data)) as img:
-        assert img.width <= image_storage.MAX_IMAGE_DIMENSION
-        assert img.height <= image_storage.MAX_IMAGE_DIMENSION
+        assert img.width <= image_processing.MAX_IMAGE_DIMENSION
+        assert img.height <= image_processing.MAX_IMAGE_DIMENSION
         assert img.n_frames == 3
 
 
@@ -377,3 +386,45 @@ async def test_increment_image_ref_uses_for_update(mock_session):
     mock_session.execute.assert_called_once()
     call_args = mock_session.execute.call_args[0][0]
     assert "for update" in str(call_args).lower()
+
+
+@pytest.mark.asyncio
+async def test_store_image_renders_display_variants(mock_session, inline_image_pool):
+    """A new image larger than the display boxes is stored with its variants."""
+    large = _make_image_bytes(1600, 1200, image_format="PNG")
+
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none = MagicMock(return_value=None)
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    await image_storage.store_image(mock_session, large, "image/png")
+
+    inline_image_pool.run.assert_awaited_once_with(
+        image_processing.process_image, large, "image/png"
+    )
+    stored_image = mock_session.add.call_args[0][0]
+    variants = {v.variant: v for v in stored_image.variants}
+    assert set(variants) == {"thumbnail", "banner"}
+    for name, variant in variants.items():
+        box = image_processing.IMAGE_VARIANT_BOXES[name]
+        assert variant.mime_type == "image/png"
+        with Image.open(io.BytesIO(variant.image_data)) as img:
+            assert img.width <= box[0]
+            assert img.height <= box[1]
+
+
+@pytest.mark.asyncio
+async def test_store_image_existing_bytes_skip_processing(mock_session, inline_image_pool):
+    """Bytes that already match a stored image never reach the processing pool."""
+    existing_image = MagicMock(spec=GameImage)
+    existing_image.id = UUID("00000000-0000-0000-0000-000000000001")
+    existing_image.reference_count = 1
+
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none = MagicMock(return_value=existing_image)
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    await image_storage.store_image(mock_session, _make_image_bytes(1600, 1200), "image/png")
+
+    inline_image_pool.run.assert_not_awaited()
+    assert existing_image.reference_count == 2
@@ -0,0 +1,91 @@
+# Copyright 2026 Bret McKee
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the game image variant backfill."""
+
+import io
+
+from PIL import Image
+from sqlalchemy import create_engine, text
+
+from shared.utils.image_variant_backfill import backfill_image_variants
+
+
+def _png(width: int, height: int) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _connection_with_images(images: dict[str, bytes]):
+    engine = create_engine("sqlite://")
+    connection = engine.connect()
+    connection.execute(
+        text("CREATE TABLE game_images (id TEXT PRIMARY KEY, image_data BLOB, mime_type TEXT)")
+    )
+    connection.execute(
+        text(
+            "CREATE TABLE game_image_variants "
+            "(image_id TEXT, variant TEXT, image_data BLOB, mime_type TEXT, "
+            "PRIMARY KEY (image_id, variant))"
+        )
+    )
+    for image_id, data in images.items():
+        connection.execute(
+            text("INSERT INTO game_images VALUES (:id, :data, 'image/png')"),
+            {"id": image_id, "data": data},
+        )
+    return connection
+
+
+def _variants(connection) -> dict[str, set[str]]:
+    rows = connection.execute(text("SELECT image_id, variant FROM game_image_variants"))
+    result: dict[str, set[str]] = {}
+    for image_id, variant in rows:
+        result.setdefault(image_id, set()).add(variant)
+    return result
+
+
+def test_backfill_renders_variants_only_for_images_larger_than_the_box():
+    connection = _connection_with_images({
+        "large": _png(1200, 900),
+        "medium": _png(400, 300),
+        "small": _png(100, 100),
+    })
+
+    inserted = backfill_image_variants(connection)
+
+    assert inserted == 3
+    assert _variants(connection) == {"large": {"thumbnail", "banner"}, "medium": {"thumbnail"}}
+    banner = connection.execute(
+        text("SELECT image_data FROM game_image_variants WHERE variant = 'banner'")
+    ).scalar_one()
+    assert Image.open(io.BytesIO(banner)).size == (800, 600)
+
+
+def test_backfill_skips_images_that_already_have_variants():
+    connection = _connection_with_images({"large": _png(1200, 900)})
+    connection.execute(
+        text("INSERT INTO game_image_variants VALUES ('large', 'thumbnail', x'00', 'image/png')")
+    )
+
+    assert backfill_image_variants(connection) == 0
+    assert _variants(connection) == {"large": {"thumbnail"}}